@@ -42,6 +42,11 @@ primaryProcessor = 'CTL001'   # Primary Control Processor
 techMatrixSize = (8,4)        # (inputs, outputs) - size of the virtual matrix to display in Tech Menu
 camSwitcher = 'DEC001'        # ID of hardware device to switch between cameras
 primaryDSP = 'DSP001'         # Primary DSP for audio control
+logLevel = 'info'             # Minimum log level written to the program log
+   # 'debug', 'info', 'warning', or 'error'
+logAsync = True               # Write the program log from a background thread with rate limiting
+connectWorkers = 8            # Max hardware connections opened at once during startup
+connectDeadline = 30          # Max wait for hardware connections during startup, seconds
 
 # Icon Map
 #     0 - no source
@@ -4,8 +4,151 @@ if TYPE_CHECKING: # pragma: no cover
 
 from extronlib.interface import EthernetClientInterface
 import re
+from collections.abc import Mapping
 from extronlib.system import ProgramLog
 
+from hardware.receiveDispatch import ReceiveDispatcher
+from hardware.statusStore import StatusStore, ResponseFingerprints
+
+def _Str(group):
+    return lambda m: str(m.group(group), 'UTF-8')
+
+def _Int(group):
+    return lambda m: int(m.group(group))
+
+def _Flag(group):
+    return lambda m: bool(int(m.group(group)))
+
+def _On(group):
+    return lambda m: m.group(group) == b'on'
+
+def _Tuple(*fields):
+    return lambda m: tuple(fn(m) for fn in fields)
+
+def _Dict(fields):
+    return lambda m: {key: fn(m) for key, fn in fields.items()}
+
+class DeviceStatusRecord(Mapping):
+    """Read only DeviceStatus value decoded from a getStatus reply.
+
+    Fields are decoded from the reply match the first time they are read and
+    cached, so a poll only pays for the fields its consumers use. Stream is
+    decoded up front and is also available as an attribute for tie resolution.
+    Records compare equal when their raw replies are identical.
+    """
+    __slots__ = ('Stream', '__match', '__fields', '__decoded')
+
+    def __init__(self, match, fields, streamGroup=None) -> None:
+        self.__match = match
+        self.__fields = fields
+        self.__decoded = {}
+        if streamGroup is None:
+            self.Stream = None
+        else:
+            self.Stream = int(match.group(streamGroup))
+            self.__decoded['Stream'] = self.Stream
+
+    @property
+    def Raw(self) -> bytes:
+        return self.__match.group(0)
+
+    def __getitem__(self, key):
+        try:
+            return self.__decoded[key]
+        except KeyError:
+            value = self.__fields[key](self.__match)
+            self.__decoded[key] = value
+            return value
+
+    def __iter__(self):
+        return iter(self.__fields)
+
+    def __len__(self):
+        return len(self.__fields)
+
+    def __eq__(self, other):
+        if isinstance(other, DeviceStatusRecord):
+            return self.__fields is other.__fields and self.Raw == other.Raw
+        return Mapping.__eq__(self, other)
+
+    def __repr__(self):
+        return 'DeviceStatusRecord({})'.format(dict(self))
+
+_NetworkFields = \
+    {
+        'MAC': _Str(3),
+        'IP': _Str(4),
+        'Netmask': _Str(5),
+        'Gateway': _Str(6),
+        'IPMode': _Str(8),
+        'IPTrailMode': _Flag(7)
+    }
+
+_FirmwareFields = \
+    {
+        'Version': _Str(10),
+        'Date': _Str(11),
+        'WebVersion': _Str(12),
+        'Update': _Dict({
+            'Updating': _Flag(13),
+            'Tries': _Int(14),
+            'Fails': _Int(15)
+        })
+    }
+
+_CommonStatusFields = \
+    {
+        'Name': _Str(2),
+        'SerialNumber': _Str(1),
+        'DeviceNetwork': _Dict(_NetworkFields),
+        'ID': _Str(9),
+        'Firmware': _Dict(_FirmwareFields),
+        'MulticastTraffic': _Tuple(_On(16), _On(17))
+    }
+
+def _StatusFields(**fields):
+    statusFields = dict(_CommonStatusFields)
+    statusFields.update(fields)
+    return statusFields
+
+DecoderStatusFields = _StatusFields(**{
+    'P1Disabled': lambda m: m.group(20) != b'yes',
+    'NActEventDelay': _Dict({'connect': _Int(21), 'disconnect': _Int(22)}),
+    'UserMulticast': _On(23),
+    'UserMulticastAddr': _Str(24),
+    'LiveAudioInLocalPlay': _On(26),
+    'YUVOut': _On(27),
+    'FrameHold': _On(28),
+    'VidOffOnNoStream': _On(29),
+    'Mode': _Str(30)
+})
+
+EncoderStatusFields = _StatusFields(**{
+    'P1Disabled': lambda m: m.group(20) != b'yes',
+    'NActEventDelay': _Dict({'connect': _Int(21), 'disconnect': _Int(22)}),
+    'UserMulticast': _On(23),
+    'UserMulticastAddr': _Str(24),
+    'Stream': _Int(25),
+    'AudioSampleRate': _Int(26),
+    'HDMIAudioMode': _Str(27),
+    'VideoDetectionMode': _Str(28),
+    'Mode': _Str(30),
+    'LineInVol': _Tuple(_Int(31), _Int(32)),
+    'LiveAudioInHostPlay': _On(33)
+})
+
+WallPlateEncoderStatusFields = _StatusFields(**{
+    'P1Disabled': lambda m: m.group(23) != b'yes',
+    'NActEventDelay': _Dict({'connect': _Int(24), 'disconnect': _Int(25)}),
+    'UserMulticast': _On(26),
+    'UserMulticastAddr': _Str(27),
+    'Stream': _Int(30),
+    'AudioSampleRate': _Int(31),
+    'HDMIAudioMode': _Str(32),
+    'VideoDetectionMode': _Str(33),
+    'LineInVol': _Tuple(_Int(37), _Int(38))
+})
+
 class DeviceClass:
     def __init__(self):
 
@@ -14,9 +157,9 @@ class DeviceClass:
         self.DefaultResponseTimeout = 0.3
         self.Subscription = {}
         self.ReceiveData = self.__ReceiveData
-        self.__receiveBuffer = b''
         self.__maxBufferSize = 4096
-        self.__matchStringDict = {}
+        # status replies contain the individual status lines, matches must overlap
+        self.__Dispatcher = ReceiveDispatcher(self.__maxBufferSize, overlap=True)
         self.counter = 0
         self.connectionFlag = True
         self.initializationChk = True
@@ -42,6 +185,9 @@ class DeviceClass:
             'SerialConfig': {'Parameters': ['Baud', 'DataBits', 'Parity', 'Stop'], 'Status': {}},
             'HDMIStatus': {'Status': {}},
             }  
+        self.StatusStore = StatusStore(self.Commands)
+        # getStatus replies are parsed only when they differ from the last reply
+        self.ResponseFingerprints = ResponseFingerprints()
         
         if self.Unidirectional == 'False':
             pass
@@ -203,6 +349,8 @@ class DeviceClass:
         self.__UpdateHelper('DeviceStatus', 'getStatus{}'.format(self.__lineEnding), value, qualifier)
     
     def __CallbackDeviceStatus_Dec(self, match, tag):
+        if self.__ResponseUnchanged('DeviceStatus', match.group(0)):
+            return
         #1# SVSI_RXGEN2:(\w+)
         #2# NAME:(.+)
         #3# MAC:([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})
@@ -233,48 +381,11 @@ class DeviceClass:
         #28# FRAMEHOLD:(on|off)
         #29# VIDOFFNOSTRM:(on|off)
         #30# MODE:(.*?)
-        statusDict = {
-            'Name': str(match.group(2), 'UTF-8'),
-            'SerialNumber': str(match.group(1), 'UTF-8'),
-            'DeviceNetwork': {
-                'MAC': str(match.group(3), 'UTF-8'),
-                'IP': str(match.group(4), 'UTF-8'),
-                'Netmask': str(match.group(5), 'UTF-8'),
-                'Gateway': str(match.group(6), 'UTF-8'),
-                'IPMode': str(match.group(8), 'UTF-8'),
-                'IPTrailMode': bool(int(match.group(7)))
-            },
-            'ID': str(match.group(9), 'UTF-8'),
-            'Firmware': {
-                'Version': str(match.group(10), 'UTF-8'),
-                'Date': str(match.group(11), 'UTF-8'),
-                'WebVersion': str(match.group(12), 'UTF-8'),
-                'Update': {
-                    'Updating': bool(int(match.group(13))),
-                    'Tries': int(match.group(14)),
-                    'Fails': int(match.group(15))
-                }
-            },
-            'MulticastTraffic': (
-                (True if str(match.group(16), 'UTF-8') == 'on' else False),
-                (True if str(match.group(17), 'UTF-8') == 'on' else False)
-            ),
-            "P1Disabled": (False if str(match.group(20), 'UTF-8') == 'yes' else True),
-            'NActEventDelay': {
-                'connect': int(match.group(21)),
-                'disconnect': int(match.group(22))
-            },
-            'UserMulticast': (True if str(match.group(23), 'UTF-8') == 'on' else False),
-            'UserMulticastAddr': str(match.group(24), 'UTF-8'),
-            'LiveAudioInLocalPlay': (True if str(match.group(26), 'UTF-8') == 'on' else False),
-            'YUVOut': (True if str(match.group(27), 'UTF-8') == 'on' else False),
-            'FrameHold': (True if str(match.group(28), 'UTF-8') == 'on' else False),
-            'VidOffOnNoStream': (True if str(match.group(29), 'UTF-8') == 'on' else False),
-            'Mode': str(match.group(30), 'UTF-8')
-        }
-        self.WriteStatus('DeviceStatus', statusDict)
+        self.WriteStatus('DeviceStatus', DeviceStatusRecord(match, DecoderStatusFields))
     
     def __CallbackDeviceStatus_Enc(self, match, tag):
+        if self.__ResponseUnchanged('DeviceStatus', match.group(0)):
+            return
         #1# SVSI_TXGEN2:(\w+)
         #2# NAME:(.+)
         #3# MAC:([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})
@@ -308,50 +419,11 @@ class DeviceClass:
         #31# LINEINVOL_L:(\d{1,3})
         #32# LINEINVOL_R:(\d{1,3})
         #33# LIVEAUDIOHP:(on|off)
-        statusDict = {
-            'Name': str(match.group(2), 'UTF-8'),
-            'SerialNumber': str(match.group(1), 'UTF-8'),
-            'DeviceNetwork': {
-                'MAC': str(match.group(3), 'UTF-8'),
-                'IP': str(match.group(4), 'UTF-8'),
-                'Netmask': str(match.group(5), 'UTF-8'),
-                'Gateway': str(match.group(6), 'UTF-8'),
-                'IPMode': str(match.group(8), 'UTF-8'),
-                'IPTrailMode': bool(int(match.group(7)))
-            },
-            'ID': str(match.group(9), 'UTF-8'),
-            'Firmware': {
-                'Version': str(match.group(10), 'UTF-8'),
-                'Date': str(match.group(11), 'UTF-8'),
-                'WebVersion': str(match.group(12), 'UTF-8'),
-                'Update': {
-                    'Updating': bool(int(match.group(13))),
-                    'Tries': int(match.group(14)),
-                    'Fails': int(match.group(15))
-                }
-            },
-            'MulticastTraffic': (
-                (True if str(match.group(16), 'UTF-8') == 'on' else False),
-                (True if str(match.group(17), 'UTF-8') == 'on' else False)
-            ),
-            "P1Disabled": (False if str(match.group(20), 'UTF-8') == 'yes' else True),
-            'NActEventDelay': {
-                'connect': int(match.group(21)),
-                'disconnect': int(match.group(22))
-            },
-            'UserMulticast': (True if str(match.group(23), 'UTF-8') == 'on' else False),
-            'UserMulticastAddr': str(match.group(24), 'UTF-8'),
-            'Stream': int(match.group(25)),
-            'AudioSampleRate': int(match.group(26)),
-            'HDMIAudioMode': str(match.group(27), 'UTF-8'),
-            'VideoDetectionMode': str(match.group(28), 'UTF-8'),
-            'Mode': str(match.group(30), 'UTF-8'),
-            'LineInVol': (int(match.group(31)), int(match.group(32))),
-            'LiveAudioInHostPlay': (True if str(match.group(33), 'UTF-8') == 'on' else False)
-        }
-        self.WriteStatus('DeviceStatus', statusDict)
+        self.WriteStatus('DeviceStatus', DeviceStatusRecord(match, EncoderStatusFields, streamGroup=25))
     
     def __CallbackDeviceStatus_WPEnc(self, match, tag):
+        if self.__ResponseUnchanged('DeviceStatus', match.group(0)):
+            return
         #1# SVSI_TXGEN2:([\w\-]+)
         #2# NAME:(.+)
         #3# MAC:([0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2}:[0-9A-Fa-f]{2})
@@ -391,46 +463,7 @@ class DeviceClass:
         #37# LINEINVOL_L:(\d{1,3})
         #38# LINEINVOL_R:(\d{1,3})
         
-        statusDict = {
-            'Name': str(match.group(2), 'UTF-8'),
-            'SerialNumber': str(match.group(1), 'UTF-8'),
-            'DeviceNetwork': {
-                'MAC': str(match.group(3), 'UTF-8'),
-                'IP': str(match.group(4), 'UTF-8'),
-                'Netmask': str(match.group(5), 'UTF-8'),
-                'Gateway': str(match.group(6), 'UTF-8'),
-                'IPMode': str(match.group(8), 'UTF-8'),
-                'IPTrailMode': bool(int(match.group(7)))
-            },
-            'ID': str(match.group(9), 'UTF-8'),
-            'Firmware': {
-                'Version': str(match.group(10), 'UTF-8'),
-                'Date': str(match.group(11), 'UTF-8'),
-                'WebVersion': str(match.group(12), 'UTF-8'),
-                'Update': {
-                    'Updating': bool(int(match.group(13))),
-                    'Tries': int(match.group(14)),
-                    'Fails': int(match.group(15))
-                }
-            },
-            'MulticastTraffic': (
-                (True if str(match.group(16), 'UTF-8') == 'on' else False),
-                (True if str(match.group(17), 'UTF-8') == 'on' else False)
-            ),
-            "P1Disabled": (False if str(match.group(23), 'UTF-8') == 'yes' else True),
-            'NActEventDelay': {
-                'connect': int(match.group(24)),
-                'disconnect': int(match.group(25))
-            },
-            'UserMulticast': (True if str(match.group(26), 'UTF-8') == 'on' else False),
-            'UserMulticastAddr': str(match.group(27), 'UTF-8'),
-            'Stream': int(match.group(30)),
-            'AudioSampleRate': int(match.group(31)),
-            'HDMIAudioMode': str(match.group(32), 'UTF-8'),
-            'VideoDetectionMode': str(match.group(33), 'UTF-8'),
-            'LineInVol': (int(match.group(37)), int(match.group(38)))
-        }
-        self.WriteStatus('DeviceStatus', statusDict)
+        self.WriteStatus('DeviceStatus', DeviceStatusRecord(match, WallPlateEncoderStatusFields, streamGroup=30))
     
     def UpdateNetStatus(self, value, qualifier):
         self.__UpdateHelper('NetStatus', 'getNetStatus{}'.format(self.__lineEnding), value, qualifier)
@@ -747,6 +780,15 @@ class DeviceClass:
 
             self.Send(commandstring)
 
+    def __ResponseUnchanged(self, command, response):
+        if self.ResponseFingerprints.Unchanged(command, response):
+            # skipping WriteStatus, keep its connection handling
+            self.counter = 0
+            if not self.connectionFlag:
+                self.OnConnected()
+            return True
+        return False
+
     def __MatchError(self, match, tag):
         self.counter = 0
 
@@ -766,6 +808,7 @@ class DeviceClass:
         # ProgramLog('On Disconnect: Counter {}, ConnCount {}, ConnFlag {}'.format(self.counter, self.connectionCounter, self.connectionFlag))
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.ResponseFingerprints.Reset()
 
     ######################################################    
     # RECOMMENDED not to modify the code below this point
@@ -794,119 +837,37 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ' + command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ' + command)
 
     def __ReceiveData(self, interface, data):
         self.counter = 0
         # Handle incoming data
-        self.__receiveBuffer += data
-        index = 0    # Start of possible good data
-        
-        # ProgramLog('SVSI N2300 Buffer Length: {}'.format(len(self.__receiveBuffer)), 'info')
-        
-        #check incoming data if it matched any expected data from device module
-        for regexString, CurrentMatch in self.__matchStringDict.items():
-            result = re.search(regexString, self.__receiveBuffer)
-            #ProgramLog("Regex String: {}".format(regexString))
-            if result:
-                #ProgramLog("Callback: {}".format(CurrentMatch['callback']))
-                if result.end() > index:
-                    index = result.end() # increase index to track the end of the further match
-                CurrentMatch['callback'](result, CurrentMatch['para'])
-            else:
-                # ProgramLog('Regex String Mismatch:\n  {}\n  {}'.format(regexString, self.__receiveBuffer))
-                pass
-                    
-        if index: 
-            # Clear out any data that has already been matched.
-            self.__receiveBuffer = self.__receiveBuffer[index:]
-        else:
-            # In rare cases, the buffer could be filled with garbage quickly.
-            # Make sure the buffer is capped.  Max buffer size set in init.
-            self.__receiveBuffer = self.__receiveBuffer[-self.__maxBufferSize:]
+        self.__Dispatcher.Receive(data)
 
     # Add regular expression so that it can be check on incoming data from device.
     def AddMatchString(self, regex_string, callback, arg):
-        if regex_string not in self.__matchStringDict:
-            self.__matchStringDict[regex_string] = {'callback': callback, 'para':arg}
+        self.__Dispatcher.AddMatchString(regex_string, callback, arg)
 
     def MissingCredentialsLog(self, credential_type):
         if isinstance(self, EthernetClientInterface):
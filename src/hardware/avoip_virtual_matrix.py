@@ -20,10 +20,13 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING: # pragma: no cover
     from uofi_gui import GUIController
 
-from extronlib.system import ProgramLog
+from extronlib.system import ProgramLog, Wait
+import threading
+import functools
 
 from uofi_gui.systemHardware import VirtualDeviceInterface
 import utilityFunctions
+from hardware.statusStore import StatusStore
 
 class DeviceClass:
     def __init__(self):
@@ -44,6 +47,18 @@ class DeviceClass:
         self.VirtualInputDevices = {}
         self.VirtualOutputDevices = {}
         
+        # stream number -> MatrixInput, maintained from encoder DeviceStatus
+        self.StreamIndex = {}
+        self.__InputStreams = {}
+        # MatrixOutput -> {MatrixInput: tie type} last written to InputTieStatus
+        self.__OutputInputTies = {}
+        
+        # seconds to wait for further ties before refreshing tie status
+        self.RefreshDelay = 0.25
+        self.__RefreshLock = threading.Lock()
+        self.__PendingRefresh = set()
+        self.__RefreshWait = None
+        
         self.Model = None
         self.Models = {
             'AMX SVSi N2300': self.amx_svsi_n2300
@@ -54,10 +69,12 @@ class DeviceClass:
             'InputSignalStatus': {'Parameters': ['Input'], 'Status': {}},
             'InputTieStatus': {'Parameters': ['Input', 'Output'], 'Status': {}},
             'MatrixTieCommand': {'Parameters': ['Input', 'Output', 'Tie Type'], 'Status': {}},
+            'MatrixTieBatchCommand': {'Status': {}},
             'OutputTieStatus': {'Parameters': ['Output', 'Tie Type'], 'Status': {}},
             'Standby': {'Parameters': ['Input'], 'Status': {}},
             'VideoMute': {'Parameters': ['Output'], 'Status': {}},
         }
+        self.StatusStore = StatusStore(self.Commands)
         
         self.UpdateInputTieStatus = self.UpdateAllMatrixTie
         self.UpdateOutputTieStatus = self.UpdateAllMatrixTie
@@ -92,76 +109,117 @@ class DeviceClass:
 ## -----------------------------------------------------------------------------
     def UpdateAllMatrixTie(self, value=None, qualifier=None):
         # ProgramLog('Matrix Size: {}'.format(self.MatrixSize), 'info')
+        if qualifier is not None and 'Output' in qualifier:
+            self.__RefreshOutputTies([qualifier['Output']])
+        else:
+            self.__RefreshOutputTies()
+                
+        self.__ConnectHelper()
+    
+    def __RefreshOutputTies(self, outputs=None):
+        if outputs is None:
+            OutputHwList = list(self.VirtualOutputDevices.values())
+        else:
+            OutputHwList = [self.VirtualOutputDevices[o] for o in outputs if o in self.VirtualOutputDevices]
         
         # run UpdateStream for each piece of output hardware
-        for OutputHw in self.VirtualOutputDevices.values():
+        for OutputHw in OutputHwList:
             OutputHw.interface.Update('Stream', None) # This will query both Stream and AudioStream
         
         # this seems duplicitive, but allows all updates to process before attempting to read the updated status
-        for OutputHw in self.VirtualOutputDevices.values():
-            if OutputHw.Model == 'NMX-ATC-N4321':
-                StreamTuple = (None,
-                               OutputHw.interface.ReadStatus('Stream', {'Instance': 'Tx'}))
-            else:
-                StreamTuple = (OutputHw.interface.ReadStatus('Stream'),
-                               OutputHw.interface.ReadStatus('AudioStream'))
-            # utilityFunctions.Log('Output {} ({}) StreamTuple = {}'.format(OutputHw.MatrixOutput, OutputHw.Name, StreamTuple), 'info')
-            # If elements 0 & 1 of StreamTuple match, tie type must be Audio/Video
-            # if StreamTuple[1] == 0 audio follows video and tie type must be Audio/Video
-            if StreamTuple != (None, None):
-                if StreamTuple[0] == StreamTuple[1] or StreamTuple[1] == 0: # Audio/Video
-                    mInput = 0
-                    for InputHw in self.VirtualInputDevices.values():
-                        devStatus = InputHw.interface.ReadStatus('DeviceStatus')
-                        if devStatus is not None:
-                            # utilityFunctions.Log('{} Enc Stream {} ({})'.format(InputHw.Name, devStatus['Stream'], (devStatus['Stream'] == StreamTuple[0])))
-                            if InputHw.Model == 'NMX-ATC-N4321':
-                                inputStream = devStatus['Transmit']['Stream']
-                            else:
-                                inputStream = devStatus['Stream']
-                            
-                            mInput = None
-                            if inputStream == StreamTuple[0]:
-                                mInput = InputHw.MatrixInput
-                                self.WriteStatus('InputTieStatus', 'Audio/Video', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
-                            else:
-                                self.WriteStatus('InputTieStatus', 'Untied', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
-                        else:
-                            utilityFunctions.Log('Device Status for {} is undefined'.format(InputHw.Name))
-                    self.WriteStatus('OutputTieStatus', mInput, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio/Video'})
-                    self.WriteStatus('OutputTieStatus', mInput, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Video'})
-                    self.WriteStatus('OutputTieStatus', mInput, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio'})
-                else: # individual audio and video
-                    mInputA = 0
-                    mInputV = 0
-                    for InputHw in self.VirtualInputDevices.values():
-                        devStatus = InputHw.interface.ReadStatus('DeviceStatus')
-                        if devStatus is not None:
-                            # utilityFunctions.Log('{} Enc Stream {} ({}/{})'.format(InputHw.Name, devStatus['Stream'], (devStatus['Stream'] == StreamTuple[0]), (devStatus['Stream'] == StreamTuple[1])))
-                            if InputHw.Model == 'NMX-ATC-N4321':
-                                inputStream = devStatus['Transmit']['Stream']
-                            else:
-                                inputStream = devStatus['Stream']
-                            
-                            mInputV = None
-                            mInputA = None
-                            if inputStream == StreamTuple[0]:
-                                mInputV = InputHw.MatrixInput
-                                self.WriteStatus('InputTieStatus', 'Video', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
-                            elif inputStream == StreamTuple[1]:
-                                mInputA = InputHw.MatrixInput
-                                self.WriteStatus('InputTieStatus', 'Audio', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
-                            else:
-                                self.WriteStatus('InputTieStatus', 'Untied', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
-                        else:
-                            utilityFunctions.Log('Device Status for {} is undefined'.format(InputHw.Name))
-                    self.WriteStatus('OutputTieStatus', 0, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio/Video'})
-                    self.WriteStatus('OutputTieStatus', mInputV, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Video'})
-                    self.WriteStatus('OutputTieStatus', mInputA, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio'})
-            else:
-                utilityFunctions.Log('Stream info for {} is undefined'.format(OutputHw.Name), 'error')
-                
-        self.__ConnectHelper()
+        for OutputHw in OutputHwList:
+            self.__RefreshOutputTie(OutputHw)
+    
+    def __RefreshOutputTie(self, OutputHw):
+        if OutputHw.Model == 'NMX-ATC-N4321':
+            StreamTuple = (None,
+                           OutputHw.interface.ReadStatus('Stream', {'Instance': 'Tx'}))
+        else:
+            StreamTuple = (OutputHw.interface.ReadStatus('Stream'),
+                           OutputHw.interface.ReadStatus('AudioStream'))
+        # utilityFunctions.Log('Output {} ({}) StreamTuple = {}'.format(OutputHw.MatrixOutput, OutputHw.Name, StreamTuple), 'info')
+        # If elements 0 & 1 of StreamTuple match, tie type must be Audio/Video
+        # if StreamTuple[1] == 0 audio follows video and tie type must be Audio/Video
+        if StreamTuple != (None, None):
+            if StreamTuple[0] == StreamTuple[1] or StreamTuple[1] == 0: # Audio/Video
+                mInput = self.__GetInputByStream(StreamTuple[0])
+                self.__WriteInputTies(OutputHw.MatrixOutput, {mInput: 'Audio/Video'})
+                self.WriteStatus('OutputTieStatus', mInput, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio/Video'})
+                self.WriteStatus('OutputTieStatus', mInput, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Video'})
+                self.WriteStatus('OutputTieStatus', mInput, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio'})
+                self.__ReportTies(OutputHw.MatrixOutput, mInput, mInput)
+            else: # individual audio and video
+                mInputV = self.__GetInputByStream(StreamTuple[0])
+                mInputA = self.__GetInputByStream(StreamTuple[1])
+                self.__WriteInputTies(OutputHw.MatrixOutput, {mInputA: 'Audio', mInputV: 'Video'})
+                self.WriteStatus('OutputTieStatus', 0, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio/Video'})
+                self.WriteStatus('OutputTieStatus', mInputV, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Video'})
+                self.WriteStatus('OutputTieStatus', mInputA, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio'})
+                self.__ReportTies(OutputHw.MatrixOutput, mInputV, mInputA)
+        else:
+            utilityFunctions.Log('Stream info for {} is undefined'.format(OutputHw.Name), 'error')
+    
+    def __ReportTies(self, output, videoInput, audioInput):
+        # OutputTieStatus only notifies on change, the room's route state is
+        # given every refresh so routes recorded for failed ties are corrected
+        routeCtl = getattr(self.GUIHost, 'RouteCtl', None)
+        if routeCtl is not None and routeCtl.Hardware.interface is self:
+            routeCtl.TieFeedback(output, 'Video', videoInput)
+            routeCtl.TieFeedback(output, 'Audio', audioInput)
+    
+    def __GetInputByStream(self, stream):
+        if stream == 0:
+            return 0
+        return self.StreamIndex.get(stream)
+    
+    def __WriteInputTies(self, output, ties):
+        # only inputs whose tie to this output changed are written, the first
+        # refresh of an output marks every other input as untied
+        if output in self.__OutputInputTies:
+            prevTies = self.__OutputInputTies[output]
+        else:
+            prevTies = {mInput: None for mInput in self.VirtualInputDevices}
+        ties = {mInput: tieType for mInput, tieType in ties.items() if mInput not in [0, None]}
+        
+        for mInput in prevTies:
+            if mInput not in ties:
+                self.WriteStatus('InputTieStatus', 'Untied', {'Input': mInput, 'Output': output})
+        for mInput, tieType in ties.items():
+            if prevTies.get(mInput) != tieType:
+                self.WriteStatus('InputTieStatus', tieType, {'Input': mInput, 'Output': output})
+        
+        self.__OutputInputTies[output] = ties
+    
+    def __GetSubscription(self, interface, command):
+        if hasattr(interface, 'StatusStore'):
+            return interface.StatusStore.Subscription(command)
+        # drivers using the nested subscription template
+        return interface.Subscription.get(command, {}).get('method', {}).get('callback')
+    
+    def __GetInputStream(self, InputHw):
+        if InputHw.MatrixInput in self.__InputStreams:
+            return self.__InputStreams[InputHw.MatrixInput]
+        return self.__IndexInputStream(InputHw, InputHw.interface.ReadStatus('DeviceStatus'))
+    
+    def __IndexInputStream(self, InputHw, devStatus):
+        if devStatus is None:
+            utilityFunctions.Log('Device Status for {} is undefined'.format(InputHw.Name))
+            return None
+        
+        if InputHw.Model == 'NMX-ATC-N4321':
+            stream = devStatus['Transmit']['Stream']
+        elif hasattr(devStatus, 'Stream'):
+            # N2300 status records decode the stream without decoding the rest
+            stream = devStatus.Stream
+        else:
+            stream = devStatus['Stream']
+        
+        prevStream = self.__InputStreams.get(InputHw.MatrixInput)
+        if prevStream != stream and self.StreamIndex.get(prevStream) == InputHw.MatrixInput:
+            del self.StreamIndex[prevStream]
+        self.__InputStreams[InputHw.MatrixInput] = stream
+        self.StreamIndex[stream] = InputHw.MatrixInput
+        return stream
 
     def UpdateInputSignalStatus(self, value, qualifier):
         if qualifier is not None and 'Input' in qualifier:
@@ -184,72 +242,52 @@ class DeviceClass:
             self.__ConnectHelper()
             
     def FeedbackInputSignalStatusHandler(self, command, value, qualifier, hardware=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
-        for TP in self.GUIHost.TPs:
-            srcObj = TP.SrcCtl.GetSourceByInput(qualifier['Input'])
-            if value == 'Active':
-                srcObj.ClearAlert()
-            elif value == 'Not Active':
-                srcObj.AppendAlert()
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}', 'debug', fmtArgs=(hardware.Name, command, value, qualifier))
+        if value in ['Active', 'Not Active']:
+            # alerts are shared by all panels, handled once for the room
+            self.GUIHost.AlertCtl.InputSignal(qualifier['Input'], value == 'Active')
+
+    def BuildStreamIndex(self):
+        self.StreamIndex.clear()
+        self.__InputStreams.clear()
+        for InputHw in self.VirtualInputDevices.values():
+            # encoder DeviceStatus may also be subscribed in the system
+            # settings, chain to that callback instead of replacing it
+            chained = self.__GetSubscription(InputHw.interface, 'DeviceStatus')
+            if isinstance(chained, functools.partial) and chained.func == self.FeedbackDeviceStatusHandler:
+                # already chained by an earlier BuildStreamIndex
+                chained = chained.keywords.get('chained')
+            InputHw.interface.SubscribeStatus('DeviceStatus',
+                                              None,
+                                              functools.partial(self.FeedbackDeviceStatusHandler, hardware=InputHw, chained=chained))
+            devStatus = InputHw.interface.ReadStatus('DeviceStatus')
+            if devStatus is not None:
+                self.__IndexInputStream(InputHw, devStatus)
+
+    def FeedbackDeviceStatusHandler(self, command, value, qualifier, hardware=None, chained=None):
+        # keeps StreamIndex current as encoder DeviceStatus changes
+        self.__IndexInputStream(hardware, value)
+        if chained is not None:
+            chained(command, value, qualifier)
 
     def SetMatrixTieCommand(self, value, qualifier):
         # Value: None
         # Qualifier: 'Input', 'Output', 'Tie Type' = ('Audio' or 'Video' or 'Audio/Video')
-        
-        # utilityFunctions.Log('Set Matrix Tie - Input: {}, Output: {}, Tie Type: {}'.format(qualifier['Input'], qualifier['Output'], qualifier['Tie Type']))
-        
-        # SVSi hardware
-        if self.Model == 'AMX SVSi N2300':
-            # Get SVSi stream number from device with MatrixInput attribute matching provided Input value
-            if qualifier['Input'] == 0:
-                Stream = 0
-            elif qualifier['Input'] in self.VirtualInputDevices:
-                # utilityFunctions.Log('Getting Stream from Encoder')
-                inputHw = self.VirtualInputDevices[qualifier['Input']]
-                devStatus = inputHw.interface.ReadStatus('DeviceStatus')
-                if devStatus is not None:
-                    if inputHw.Model == 'NMX-ATC-N4321':
-                        Stream = devStatus['Transmit']['Stream']
-                    else:
-                        Stream = devStatus['Stream']
-                else:
-                    Stream = 9999
-            else:
-                #TODO: determine handling for non-existent encoders in the virtual matrix
-                Stream = 9999
-            
-            # Get Output device with MatrixOutput attribute matching provided Output value
-            if qualifier['Output'] in self.VirtualOutputDevices:
-                Output = self.VirtualOutputDevices[qualifier['Output']]
-            
-                # Use tie type to send commands to output device to switch
-                if qualifier['Tie Type'] == 'Audio/Video':
-                    if Output.Model == 'NMX-ATC-N4321':
-                        Output.interface.Set('Stream', Stream, {'Instance': 'Rx'})
-                    else:
-                        Output.interface.Set('Stream', Stream)
-                        Output.interface.Set('AudioStream', Stream)
-                elif qualifier['Tie Type'] == 'Video':
-                    if Output.Model != 'NMX-ATC-N4321':
-                        if Output.interface.ReadStatus('AudioStream') == 0:
-                            # If audio is following video, grab the current video stream,
-                            # then set audio stream to previous stream and video stream
-                            # to the new stream
-                            PrevStream = Output.interface.ReadStatus('Stream')
-                            Output.interface.Set('AudioStream', PrevStream)
-                        Output.interface.Set('Stream', Stream)
-                elif qualifier['Tie Type'] == 'Audio':
-                    if Output.Model == 'NMX-ATC-N4321':
-                        Output.interface.Set('Stream', Stream, {'Instance': 'Rx'})
-                    else:
-                        Output.interface.Set('AudioStream', Stream)
-            else:
-                self.Discard('Invalid Output provided.')
-                return
-        else:
-            pass
-        
-        self.UpdateAllMatrixTie()
+        output = self.__ApplyTie(qualifier)
+        if output is not None:
+            self.__RequestRefresh([output])
+        self.__ConnectHelper()
+    
+    def SetMatrixTieBatchCommand(self, value, qualifier):
+        # Value: list of MatrixTieCommand qualifiers
+        # Qualifier: None
+        outputs = set()
+        for tie in value:
+            output = self.__ApplyTie(tie)
+            if output is not None:
+                outputs.add(output)
+        if len(outputs) > 0:
+            self.__RequestRefresh(outputs)
         self.__ConnectHelper()
         
     def UpdateStandby(self, value, qualifier):
@@ -322,13 +360,89 @@ class DeviceClass:
         self.__ConnectHelper()
     
     def FeedbackOutputTieStatusHandler(self, command, value, qualifier, hardware=None):
-        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
+        utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}', 'debug', fmtArgs=(hardware.Name, command, value, qualifier))
         # utilityFunctions.Log('Tie: {}\n    {} -> {}'.format(qualifier['Tie Type'], qualifier['Output'], value))
+        if hasattr(self.GUIHost, 'RouteCtl') and self.GUIHost.RouteCtl.Hardware is hardware:
+            self.GUIHost.RouteCtl.TieFeedback(qualifier['Output'], qualifier['Tie Type'], value)
     
 ## -----------------------------------------------------------------------------
 ## End Command & Callback Functions
 ## -----------------------------------------------------------------------------
 
+    def __ApplyTie(self, qualifier):
+        # Value: None
+        # Qualifier: 'Input', 'Output', 'Tie Type' = ('Audio' or 'Video' or 'Audio/Video')
+        
+        # utilityFunctions.Log('Set Matrix Tie - Input: {}, Output: {}, Tie Type: {}'.format(qualifier['Input'], qualifier['Output'], qualifier['Tie Type']))
+        
+        # SVSi hardware
+        if self.Model == 'AMX SVSi N2300':
+            # Get SVSi stream number from device with MatrixInput attribute matching provided Input value
+            if qualifier['Input'] == 0:
+                Stream = 0
+            elif qualifier['Input'] in self.VirtualInputDevices:
+                # utilityFunctions.Log('Getting Stream from Encoder')
+                Stream = self.__GetInputStream(self.VirtualInputDevices[qualifier['Input']])
+                if Stream is None:
+                    Stream = 9999
+            else:
+                #TODO: determine handling for non-existent encoders in the virtual matrix
+                Stream = 9999
+            
+            # Get Output device with MatrixOutput attribute matching provided Output value
+            if qualifier['Output'] in self.VirtualOutputDevices:
+                Output = self.VirtualOutputDevices[qualifier['Output']]
+            
+                # Use tie type to send commands to output device to switch
+                if qualifier['Tie Type'] == 'Audio/Video':
+                    if Output.Model == 'NMX-ATC-N4321':
+                        Output.interface.Set('Stream', Stream, {'Instance': 'Rx'})
+                    else:
+                        Output.interface.Set('Stream', Stream)
+                        Output.interface.Set('AudioStream', Stream)
+                elif qualifier['Tie Type'] == 'Video':
+                    if Output.Model != 'NMX-ATC-N4321':
+                        if Output.interface.ReadStatus('AudioStream') == 0:
+                            # If audio is following video, grab the current video stream,
+                            # then set audio stream to previous stream and video stream
+                            # to the new stream
+                            PrevStream = Output.interface.ReadStatus('Stream')
+                            Output.interface.Set('AudioStream', PrevStream)
+                        Output.interface.Set('Stream', Stream)
+                elif qualifier['Tie Type'] == 'Audio':
+                    if Output.Model == 'NMX-ATC-N4321':
+                        Output.interface.Set('Stream', Stream, {'Instance': 'Rx'})
+                    else:
+                        Output.interface.Set('AudioStream', Stream)
+            else:
+                self.Discard('Invalid Output provided.')
+                return None
+            
+            return qualifier['Output']
+        
+        return None
+
+    def __RequestRefresh(self, outputs):
+        # Ties arriving within RefreshDelay of each other share one refresh
+        # limited to the outputs they touched
+        with self.__RefreshLock:
+            self.__PendingRefresh.update(outputs)
+            if self.__RefreshWait is not None:
+                return
+            if self.RefreshDelay > 0:
+                self.__RefreshWait = Wait(self.RefreshDelay, self.__FlushRefresh)
+                return
+        self.__FlushRefresh()
+    
+    def __FlushRefresh(self):
+        with self.__RefreshLock:
+            outputs = list(self.__PendingRefresh)
+            self.__PendingRefresh.clear()
+            self.__RefreshWait = None
+        
+        if len(outputs) > 0:
+            self.__RefreshOutputTies(outputs)
+
     def __ConnectHelper(self):
         if self.initializationChk:
             self.OnConnected()
@@ -378,42 +492,13 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ' + command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
@@ -421,41 +506,13 @@ class DeviceClass:
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ' + command)
 
@@ -480,6 +537,10 @@ class VirtualDeviceClass(VirtualDeviceInterface, DeviceClass):
             else:
                 self.Models[Model]()
 
+    def FindAssociatedHardware(self):
+        VirtualDeviceInterface.FindAssociatedHardware(self)
+        self.BuildStreamIndex()
+
     def Error(self, message):
         portInfo = 'VirtualDeviceClass - Virtual Matrix Interface'
         print('Module: {}'.format(__name__), portInfo, 'Error Message: {}'.format(message[0]), sep='\r\n')
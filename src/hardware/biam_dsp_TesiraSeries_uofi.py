@@ -4,22 +4,33 @@ if TYPE_CHECKING: # pragma: no cover
 
 from extronlib.interface import SerialInterface, EthernetClientInterface
 from re import compile, findall, search
-from extronlib.system import ProgramLog, Wait
+from extronlib.system import ProgramLog
 from decimal import Decimal, ROUND_HALF_UP
-import copy
 
 import utilityFunctions
+from hardware.receiveDispatch import ReceiveDispatcher
+from hardware.statusStore import StatusStore
+from hardware.commandPipeline import CommandPipeline
+
+# instance tag at the start of an echoed command line, quoted if it contains
+# spaces. Anchoring to the line start lets the search skip the rest of a line.
+TAG_PATTERN = '(?m)^"?((?<=")[^"\\r\\n]+(?=")|[^\\s"]+)"?'
+
+VERBOSE_COMMAND = 'SESSION set verbose true\n'
+IGNORED_ERRORS = ['ALREADY_SUBSCRIBED', 'NOT_SUBSCRIBED']
 
 class DeviceClass:
-    def __init__(self):
+    def __init__(self, PipelineWindow=4):
 
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.Subscription = {}
         self.ReceiveData = self.__ReceiveData
-        self.__receiveBuffer = b''
         self.__maxBufferSize = 4096
-        self.__matchStringDict = {}
+        self.__Dispatcher = ReceiveDispatcher(self.__maxBufferSize)
+        self.__ReplyBuffer = b''
+        # commands are sent in order with at most PipelineWindow awaiting a reply
+        self.Pipeline = CommandPipeline(lambda data: self.Send(data), PipelineWindow)
         self.counter = 0
         self.connectionFlag = True
         self.initializationChk = True
@@ -82,6 +93,7 @@ class DeviceClass:
             'SpeedDial': {'Parameters': ['Instance Tag', 'Line', 'Call Appearance'], 'Status': {}},
             'SpeedDialEntryName': {'Parameters': ['Instance Tag', 'Line', 'Entry'], 'Status': {}},
             'SpeedDialEntryNumber': {'Parameters': ['Instance Tag', 'Line', 'Entry'], 'Status': {}},
+            'SubscriptionStatus': {'Parameters': ['Command', 'Instance Tag'], 'Status': {}},
             'TICallerID': {'Parameters': ['Instance Tag'], 'Status': {}},
             'TICallStatus': {'Parameters': ['Instance Tag'], 'Status': {}},
             'TIHook': {'Parameters': ['Instance Tag', 'Line', 'Number'], 'Status': {}},
@@ -100,11 +112,33 @@ class DeviceClass:
             'VoIPTransmitLevel': {'Parameters': ['Instance Tag', 'Line'], 'Status': {}},
             'VoIPTransmitMute': {'Parameters': ['Instance Tag', 'Line'], 'Status': {}},
         }
+        self.StatusStore = StatusStore(self.Commands)
 
         self.InitialStatusList = []
-        self.MatchstringList = []
+        self.__UpdateMatches = {}   # reply format: {instance tag: match callback}
         self.SUBSCRIPTION_RESPONSE_TIME = 100
         self.VerboseDisabled = True
+
+        # Commands updated by a subscription labeled '<Command>_<Instance Tag>'.
+        # One subscription publishes every channel of the instance tag, so these
+        # need not be polled per channel once the subscription is confirmed.
+        self.SubscribeCommands = {
+            'AECPhantomPower': 'phantomPowers',
+            'Bluetooth': 'enable',
+            'BluetoothConnectedDeviceName': 'connectedDeviceName',
+            'BluetoothDiscovery': 'discoverable',
+            'BluetoothUSBConnectionStatus': 'connected',
+            'BluetoothUSBStreamingStatus': 'streaming',
+            'FineLevelControl': 'levels',
+            'LevelControl': 'levels',
+            'LogicMeter': 'states',
+            'MuteControl': 'mutes',
+            'SourceSelectorSourceSelection': 'sourceSelection',
+            'TICallStatus': 'callState',
+            'TILineInUse': 'lineInUse',
+            'VoIPCallStatus': 'callState',
+        }
+        self.__Subscribed = set()
         # if 'Serial' not in self.ConnectionType:
         #     self.deviceUsername = 'default'
         #     self.devicePassword = None
@@ -146,10 +180,25 @@ class DeviceClass:
 ## End Feedback Callback Functions
 ## -----------------------------------------------------------------------------
 
+    def __AddUpdateMatch(self, tag, reply, callback):
+        # Update replies are matched by one pattern per reply format for every
+        # instance tag, the tag is read from the reply and looked up here
+        tags = self.__UpdateMatches.get(reply)
+        if tags is None:
+            tags = {}
+            self.__UpdateMatches[reply] = tags
+            self.AddMatchString(compile('{0} {1}'.format(TAG_PATTERN, reply).encode()), self.__MatchUpdate, tags)
+        tags[tag.strip('"')] = callback
+
+    def __MatchUpdate(self, match, tags):
+        callback = tags.get(match.group(1).decode())
+        if callback is not None:
+            callback(match, None)
+
     def __MatchError(self, match, tag):
         self.counter = 0
         errorMessage = match.group(1).decode().replace('ERR ', '')
-        if errorMessage not in ['ALREADY_SUBSCRIBED', 'NOT_SUBSCRIBED']:
+        if errorMessage not in IGNORED_ERRORS:
             self.Error([errorMessage])
 
     def __MatchVerboseMode(self, match, tag):
@@ -173,6 +222,10 @@ class DeviceClass:
         label = match.group(1).decode()
         data = [label[:label.index('_')],label[label.index('_')+1:]]
         paramsList = data[1].split('_')
+        if data[0] in self.SubscribeCommands and (data[0], data[1]) not in self.__Subscribed:
+            # the first publish confirms the subscription
+            self.__Subscribed.add((data[0], data[1]))
+            self.WriteStatus('SubscriptionStatus', 'Subscribed', {'Command': data[0], 'Instance Tag': data[1]})
         if data[0] in ['AECPhantomPower','LogicMeter','MuteControl']:
             stateIndex = 1 if data[0] == 'LogicMeter' else 0
             chnl = 1
@@ -313,14 +366,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('AECEnable',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 24:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get aecEnable (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchAECEnable, None)
+            self.__AddUpdateMatch(tag, 'get aecEnable (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchAECEnable)
             self.__UpdateHelper('AECEnable', '{0} get aecEnable {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateAECEnable')
@@ -351,14 +401,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('AECGain',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 24:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get gain (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n'.format(tag).encode()), self.__MatchAECGain, None)
+            self.__AddUpdateMatch(tag, 'get gain (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchAECGain)
             self.__UpdateHelper('AECGain', '{0} get gain {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateAECGain')
@@ -419,14 +466,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         line = qualifier['Line']
-        cmdTag = '{}_{}'.format('AutoAnswer',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if line in ['1','2', 'None']:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get autoAnswer ?(\d+)?\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchAutoAnswer, None)
+            self.__AddUpdateMatch(tag, 'get autoAnswer ?(\d+)?\r\n\+OK \"value\":(true|false)\r\n', self.__MatchAutoAnswer)
 
             if line in ['1','2']:
                 self.__UpdateHelper('AutoAnswer', '{0} get autoAnswer {1}\n'.format(tag, line), value, qualifier)
@@ -500,14 +544,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         input_ = qualifier['Input']
-        cmdTag = '{}_{}'.format('AutoMixerCombinerInputGroup',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(input_) <= 32:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get inputGroup (\d+)\r\n\+OK \"value\":([-\d. ]+)\r\n'.format(tag).encode()), self.__MatchAutoMixerCombinerInputGroup, None)
+            self.__AddUpdateMatch(tag, 'get inputGroup (\d+)\r\n\+OK \"value\":([-\d. ]+)\r\n', self.__MatchAutoMixerCombinerInputGroup)
             self.__UpdateHelper('AutoMixerCombinerInputGroup', '{0} get inputGroup {1}\n'.format(tag, input_), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateAutoMixerCombinerInputGroup')
@@ -542,14 +583,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('AVBInputLevel', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 60:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get level (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n'.format(tag).encode()), self.__MatchAVBInputLevel, None)
+            self.__AddUpdateMatch(tag, 'get level (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchAVBInputLevel)
             self.__UpdateHelper('AVBInputLevel', '{0} get level {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateAVBInputLevel')
@@ -579,14 +617,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('AVBInputMute', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 60:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get mute (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchAVBInputMute, None)
+            self.__AddUpdateMatch(tag, 'get mute (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchAVBInputMute)
             self.__UpdateHelper('AVBInputMute', '{0} get mute {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateAVBInputMute')
@@ -616,14 +651,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('AVBOutputLevel', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 60:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get level (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n'.format(tag).encode()), self.__MatchAVBOutputLevel, None)
+            self.__AddUpdateMatch(tag, 'get level (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchAVBOutputLevel)
             self.__UpdateHelper('AVBOutputLevel', '{0} get level {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateAVBOutputLevel')
@@ -653,14 +685,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('AVBOutputMute', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 60:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get mute (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchAVBOutputMute, None)
+            self.__AddUpdateMatch(tag, 'get mute (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchAVBOutputMute)
             self.__UpdateHelper('AVBOutputMute', '{0} get mute {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateAVBOutputMute')
@@ -707,13 +736,10 @@ class DeviceClass:
     def UpdateBluetoothDeviceName(self, value, qualifier):
 
         tag = qualifier['Instance Tag']
-        cmdTag = '{}_{}'.format('BluetoothDeviceName', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
-        if cmdTag not in self.MatchstringList:
-            self.MatchstringList.append(cmdTag)
-            self.AddMatchString(compile('({0}) get deviceName\r\n\+OK \"value\":"([\S ]+)?"\r\n'.format(tag).encode()), self.__MatchBluetoothDeviceName, None)
+        self.__AddUpdateMatch(tag, 'get deviceName\r\n\+OK \"value\":"([\S ]+)?"\r\n', self.__MatchBluetoothDeviceName)
         self.__UpdateHelper('BluetoothDeviceName', '{0} get deviceName\n'.format(tag), value, qualifier)
 
     def __MatchBluetoothDeviceName(self, match, tag):
@@ -770,14 +796,11 @@ class DeviceClass:
         tag = qualifier['Instance Tag']
         Input = qualifier['Input']
         Output = qualifier['Output']
-        cmdTag = '{}_{}'.format('CrosspointLevel',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(Input) <= 256 and 1 <= int(Output) <= 256:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get crosspointLevel (\d+) (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n'.format(tag).encode()), self.__MatchCrosspointLevel, None)
+            self.__AddUpdateMatch(tag, 'get crosspointLevel (\d+) (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchCrosspointLevel)
             self.__UpdateHelper('CrosspointLevel', '{0} get crosspointLevel {1} {2}\n'.format(tag, Input, Output), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateCrosspointLevel')
@@ -814,14 +837,11 @@ class DeviceClass:
         tag = qualifier['Instance Tag']
         Input = qualifier['Input']
         Output = qualifier['Output']
-        cmdTag = '{}_{}'.format('CrosspointState',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(Input) <= 256 and 1 <= int(Output) <= 256:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get crosspointLevelState (\d+) (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchCrosspointState, None)
+            self.__AddUpdateMatch(tag, 'get crosspointLevelState (\d+) (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchCrosspointState)
             self.__UpdateHelper('CrosspointState', '{0} get crosspointLevelState {1} {2}\n'.format(tag, Input, Output), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateCrosspointState')
@@ -867,14 +887,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         line = qualifier['Line']
-        cmdTag = '{}_{}'.format('DoNotDisturb',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if line in ['1', '2']:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get dndEnable (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchDoNotDisturb, None)
+            self.__AddUpdateMatch(tag, 'get dndEnable (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchDoNotDisturb)
             self.__UpdateHelper('DoNotDisturb', '{0} get dndEnable {1}\n'.format(tag, line), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateDoNotDisturb')
@@ -953,14 +970,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         band = qualifier['Band']
-        cmdTag = '{}_{}'.format('GraphicEqualizerBandGain', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(band) <= 31:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get gain (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n'.format(tag).encode()), self.__MatchGraphicEqualizerBandGain, None)
+            self.__AddUpdateMatch(tag, 'get gain (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchGraphicEqualizerBandGain)
             self.__UpdateHelper('GraphicEqualizerBandGain', '{0} get gain {1}\n'.format(tag, band), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateGraphicEqualizerBandGain')
@@ -989,14 +1003,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('InputLevel', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 256:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get inputLevel (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n'.format(tag).encode()), self.__MatchInputLevel, None)
+            self.__AddUpdateMatch(tag, 'get inputLevel (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchInputLevel)
             self.__UpdateHelper('InputLevel', '{0} get inputLevel {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateInputLevel')
@@ -1030,14 +1041,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('InputMute', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 256:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get inputMute (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchInputMute, None)
+            self.__AddUpdateMatch(tag, 'get inputMute (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchInputMute)
             self.__UpdateHelper('InputMute', '{0} get inputMute {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateInputMute')
@@ -1054,14 +1062,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         line = qualifier['Line']
-        cmdTag = '{}_{}'.format('LastDialed', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if line in ['1', '2', 'None']:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get lastNum ?(\d+)?\r\n\+OK \"value\":(\"\"|\"[\S ]+\")\r\n'.format(tag).encode()), self.__MatchLastDialed, None)
+            self.__AddUpdateMatch(tag, 'get lastNum ?(\d+)?\r\n\+OK \"value\":(\"\"|\"[\S ]+\")\r\n', self.__MatchLastDialed)
             if line in ['1','2']:
                 self.__UpdateHelper('LastDialed', '{0} get lastNum {1}\n'.format(tag, line), value, qualifier)
             else:
@@ -1115,14 +1120,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('LogicInputOutput', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 16:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append('LogicInputOutput')
-                self.AddMatchString(compile('({0}) get invert (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchLogicInputOutput, None)
+            self.__AddUpdateMatch(tag, 'get invert (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchLogicInputOutput)
             self.__UpdateHelper('LogicInputOutput', '{0} get invert {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateLogicInputOutput')
@@ -1158,14 +1160,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('LogicState', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 32:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get state (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchLogicState, None)
+            self.__AddUpdateMatch(tag, 'get state (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchLogicState)
             self.__UpdateHelper('LogicState', '{0} get state {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateLogicState')
@@ -1250,14 +1249,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('OutputLevel', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 256:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get outputLevel (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n'.format(tag).encode()), self.__MatchOutputLevel, None)
+            self.__AddUpdateMatch(tag, 'get outputLevel (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchOutputLevel)
             self.__UpdateHelper('OutputLevel', '{0} get outputLevel {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateOutputLevel')
@@ -1290,14 +1286,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         chnl = qualifier['Channel']
-        cmdTag = '{}_{}'.format('OutputMute', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(chnl) <= 256:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get outputMute (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchOutputMute, None)
+            self.__AddUpdateMatch(tag, 'get outputMute (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchOutputMute)
             self.__UpdateHelper('OutputMute', '{0} get outputMute {1}\n'.format(tag, chnl), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateOutputMute')
@@ -1315,14 +1308,11 @@ class DeviceClass:
         tag = qualifier['Instance Tag']
         line = qualifier['Line']
         entry = qualifier['Entry']
-        cmdTag = '{}_{}'.format('SpeedDialEntryName',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if line in ['1', '2'] and 1 <= int(entry) <= 16:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get speedDialLabel (\d+) (\d+)\r\n\+OK \"value\":(\"\"|\"[\+\-\d\w. ]+\")\r\n'.format(tag).encode()), self.__MatchSpeedDialEntryName, None)
+            self.__AddUpdateMatch(tag, 'get speedDialLabel (\d+) (\d+)\r\n\+OK \"value\":(\"\"|\"[\+\-\d\w. ]+\")\r\n', self.__MatchSpeedDialEntryName)
             SpeedDialEntryNameCmdString = '{0} get speedDialLabel {1} {2}\n'.format(tag, line, entry)
             self.__UpdateHelper('SpeedDialEntryName', SpeedDialEntryNameCmdString, value, qualifier)
         else:
@@ -1342,14 +1332,11 @@ class DeviceClass:
         tag = qualifier['Instance Tag']
         line = qualifier['Line']
         entry = qualifier['Entry']
-        cmdTag = '{}_{}'.format('SpeedDialEntryNumber',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if line in ['1', '2'] and 1 <= int(entry) <= 16:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get speedDialNum (\d+) (\d+)\r\n\+OK \"value\":(\"\"|\"[\+\-\d\w. ]+\")\r\n'.format(tag).encode()), self.__MatchSpeedDialEntryNumber, None)
+            self.__AddUpdateMatch(tag, 'get speedDialNum (\d+) (\d+)\r\n\+OK \"value\":(\"\"|\"[\+\-\d\w. ]+\")\r\n', self.__MatchSpeedDialEntryNumber)
             SpeedDialEntryNumberCmdString = '{0} get speedDialNum {1} {2}\n'.format(tag, line, entry)
             self.__UpdateHelper('SpeedDialEntryNumber', SpeedDialEntryNumberCmdString, value, qualifier)
         else:
@@ -1415,14 +1402,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         room = qualifier['Room']
-        cmdTag = '{}_{}'.format('RoomCombinerGroup', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(room) <= 32:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get group (\d+)\r\n\+OK \"value\":(\d+)\r\n'.format(tag).encode()), self.__MatchRoomCombinerGroup, None)
+            self.__AddUpdateMatch(tag, 'get group (\d+)\r\n\+OK \"value\":(\d+)\r\n', self.__MatchRoomCombinerGroup)
             self.__UpdateHelper('RoomCombinerGroup', '{0} get group {1}\n'.format(tag, room), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateRoomCombinerGroup')
@@ -1457,14 +1441,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         room = qualifier['Room']
-        cmdTag = '{}_{}'.format('RoomCombinerInputLevel',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(room) <= 32:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get levelIn (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n'.format(tag).encode()), self.__MatchRoomCombinerInputLevel, None)
+            self.__AddUpdateMatch(tag, 'get levelIn (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchRoomCombinerInputLevel)
             RoomCombinerInputLevelCmdString = '{0} get levelIn {1}\n'.format(tag, room)
             self.__UpdateHelper('RoomCombinerInputLevel', RoomCombinerInputLevelCmdString, value, qualifier)
         else:
@@ -1500,14 +1481,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         room = qualifier['Room']
-        cmdTag = '{}_{}'.format('RoomCombinerInputMute', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(room) <= 32:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get muteIn (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchRoomCombinerInputMute, None)
+            self.__AddUpdateMatch(tag, 'get muteIn (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchRoomCombinerInputMute)
             RoomCombinerInputMuteCmdString = '{0} get muteIn {1}\n'.format(tag, room)
             self.__UpdateHelper('RoomCombinerInputMute', RoomCombinerInputMuteCmdString, value, qualifier)
         else:
@@ -1572,14 +1550,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         room = qualifier['Room']
-        cmdTag = '{}_{}'.format('RoomCombinerOutputMute', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(room) <= 32:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get muteOut (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchRoomCombinerOutputMute, None)
+            self.__AddUpdateMatch(tag, 'get muteOut (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchRoomCombinerOutputMute)
             RoomCombinerOutputMuteCmdString = '{0} get muteOut {1}\n'.format(tag, room)
             self.__UpdateHelper('RoomCombinerOutputMute', RoomCombinerOutputMuteCmdString, value, qualifier)
         else:
@@ -1615,14 +1590,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         room = qualifier['Room']
-        cmdTag = '{}_{}'.format('RoomCombinerSourceLevel', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(room) <= 32:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get levelSource (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n'.format(tag).encode()), self.__MatchRoomCombinerSourceLevel, None)
+            self.__AddUpdateMatch(tag, 'get levelSource (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchRoomCombinerSourceLevel)
             RoomCombinerSourceLevelCmdString = '{0} get levelSource {1}\n'.format(tag, room)
             self.__UpdateHelper('RoomCombinerSourceLevel', RoomCombinerSourceLevelCmdString, value, qualifier)
         else:
@@ -1657,14 +1629,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         room = qualifier['Room']
-        cmdTag = '{}_{}'.format('RoomCombinerSourceMute', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(room) <= 32:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get muteSource (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchRoomCombinerSourceMute, None)
+            self.__AddUpdateMatch(tag, 'get muteSource (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchRoomCombinerSourceMute)
             RoomCombinerSourceMuteCmdString = '{0} get muteSource {1}\n'.format(tag, room)
             self.__UpdateHelper('RoomCombinerSourceMute', RoomCombinerSourceMuteCmdString, value, qualifier)
         else:
@@ -1703,14 +1672,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         room = qualifier['Room']
-        cmdTag = '{}_{}'.format('RoomCombinerSourceSelection', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(room) <= 32:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get sourceSelection (\d+)\r\n\+OK \"value\":([\d]+)\r\n'.format(tag).encode()), self.__MatchRoomCombinerSourceSelection, None)
+            self.__AddUpdateMatch(tag, 'get sourceSelection (\d+)\r\n\+OK \"value\":([\d]+)\r\n', self.__MatchRoomCombinerSourceSelection)
             RoomCombinerSourceSelectionCmdString = '{0} get sourceSelection {1}\n'.format(tag, room)
             self.__UpdateHelper('RoomCombinerSourceSelection', RoomCombinerSourceSelectionCmdString, value, qualifier)
         else:
@@ -1746,14 +1712,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         wall = qualifier['Wall']
-        cmdTag = '{}_{}'.format('RoomCombinerWall', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(wall) <= 46:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get wallState (\d+)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchRoomCombinerWall, None)
+            self.__AddUpdateMatch(tag, 'get wallState (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchRoomCombinerWall)
             self.__UpdateHelper('RoomCombinerWall', '{0} get wallState {1}\n'.format(tag, wall), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateRoomCombinerWall')
@@ -1783,14 +1746,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         Output = qualifier['Output']
-        cmdTag = '{}_{}'.format('RouterControl', tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if 1 <= int(Output) <= 256:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get input (\d+)\r\n\+OK \"value\":([\d]+)\r\n'.format(tag).encode()), self.__MatchRouterControl, None)
+            self.__AddUpdateMatch(tag, 'get input (\d+)\r\n\+OK \"value\":([\d]+)\r\n', self.__MatchRouterControl)
             self.__UpdateHelper('RouterControl', '{0} get input {1}\n'.format(tag, Output), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateRouterControl')
@@ -1916,13 +1876,10 @@ class DeviceClass:
     def UpdateTIReceiveLevel(self, value, qualifier):
 
         tag = qualifier['Instance Tag']
-        cmdTag = '{}_{}'.format('TIReceiveLevel',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
-        if cmdTag not in self.MatchstringList:
-            self.MatchstringList.append(cmdTag)
-            self.AddMatchString(compile('({0}) get level\r\n\+OK \"value\":([-\d\.]+)\r\n'.format(tag).encode()), self.__MatchTIReceiveLevel, None)
+        self.__AddUpdateMatch(tag, 'get level\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchTIReceiveLevel)
         self.__UpdateHelper('TIReceiveLevel', '{0} get level\n'.format(tag), value, qualifier)
 
     def __MatchTIReceiveLevel(self, match, tag):
@@ -1950,13 +1907,10 @@ class DeviceClass:
     def UpdateTIReceiveMute(self, value, qualifier):
 
         tag = qualifier['Instance Tag']
-        cmdTag = '{}_{}'.format('TIReceiveMute',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
-        if cmdTag not in self.MatchstringList:
-            self.MatchstringList.append(cmdTag)
-            self.AddMatchString(compile('({0}) get mute\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchTIReceiveMute, None)
+        self.__AddUpdateMatch(tag, 'get mute\r\n\+OK \"value\":(true|false)\r\n', self.__MatchTIReceiveMute)
         self.__UpdateHelper('TIReceiveMute', '{0} get mute\n'.format(tag), value, qualifier)
 
     def __MatchTIReceiveMute(self, match, tag):
@@ -1981,13 +1935,10 @@ class DeviceClass:
     def UpdateTITransmitLevel(self, value, qualifier):
 
         tag = qualifier['Instance Tag']
-        cmdTag = '{}_{}'.format('TITransmitLevel',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
-        if cmdTag not in self.MatchstringList:
-            self.MatchstringList.append(cmdTag)
-            self.AddMatchString(compile('({0}) get level\r\n\+OK \"value\":([-\d\.]+)\r\n'.format(tag).encode()), self.__MatchTITransmitLevel, None)
+        self.__AddUpdateMatch(tag, 'get level\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchTITransmitLevel)
         self.__UpdateHelper('TITransmitLevel', '{0} get level\n'.format(tag), value, qualifier)
 
     def __MatchTITransmitLevel(self, match, tag):
@@ -2015,13 +1966,10 @@ class DeviceClass:
     def UpdateTITransmitMute(self, value, qualifier):
 
         tag = qualifier['Instance Tag']
-        cmdTag = '{}_{}'.format('TITransmitMute',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
-        if cmdTag not in self.MatchstringList:
-            self.MatchstringList.append(cmdTag)
-            self.AddMatchString(compile('({0}) get mute\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchTITransmitMute, None)
+        self.__AddUpdateMatch(tag, 'get mute\r\n\+OK \"value\":(true|false)\r\n', self.__MatchTITransmitMute)
         self.__UpdateHelper('TITransmitMute', '{0} get mute\n'.format(tag), value, qualifier)
 
     def __MatchTITransmitMute(self, match, tag):
@@ -2103,14 +2051,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         line = qualifier['Line']
-        cmdTag = '{}_{}'.format('VoIPReceiveLevel',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if line in ['1', '2']:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get level (\d)\r\n\+OK \"value\":([-\d\.]+)\r\n'.format(tag).encode()), self.__MatchVoIPReceiveLevel, None)
+            self.__AddUpdateMatch(tag, 'get level (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchVoIPReceiveLevel)
             self.__UpdateHelper('VoIPReceiveLevel', '{0} get level {1}\n'.format(tag, line), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateVoIPReceiveLevel')
@@ -2143,14 +2088,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         line = qualifier['Line']
-        cmdTag = '{}_{}'.format('VoIPReceiveMute',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if line in ['1', '2']:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get mute (\d)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchVoIPReceiveMute, None)
+            self.__AddUpdateMatch(tag, 'get mute (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchVoIPReceiveMute)
             self.__UpdateHelper('VoIPReceiveMute', '{0} get mute {1}\n'.format(tag, line), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateVoIPReceiveMute')
@@ -2180,14 +2122,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         line = qualifier['Line']
-        cmdTag = '{}_{}'.format('VoIPTransmitLevel',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if line in ['1', '2']:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get level (\d)\r\n\+OK \"value\":([-\d\.]+)\r\n'.format(tag).encode()), self.__MatchVoIPTransmitLevel, None)
+            self.__AddUpdateMatch(tag, 'get level (\d+)\r\n\+OK \"value\":([-\d.]+)\r\n', self.__MatchVoIPTransmitLevel)
             self.__UpdateHelper('VoIPTransmitLevel', '{0} get level {1}\n'.format(tag, line), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateVoIPTransmitLevel')
@@ -2217,14 +2156,11 @@ class DeviceClass:
 
         tag = qualifier['Instance Tag']
         line = qualifier['Line']
-        cmdTag = '{}_{}'.format('VoIPTransmitMute',tag)
         if ' ' in tag:
             tag = '\"' + tag + '\"'
 
         if line in ['1', '2']:
-            if cmdTag not in self.MatchstringList:
-                self.MatchstringList.append(cmdTag)
-                self.AddMatchString(compile('({0}) get mute (\d)\r\n\+OK \"value\":(true|false)\r\n'.format(tag).encode()), self.__MatchVoIPTransmitMute, None)
+            self.__AddUpdateMatch(tag, 'get mute (\d+)\r\n\+OK \"value\":(true|false)\r\n', self.__MatchVoIPTransmitMute)
             self.__UpdateHelper('VoIPTransmitMute', '{0} get mute {1}\n'.format(tag, line), value, qualifier)
         else:
             self.Discard('Invalid Command for UpdateVoIPTransmitMute')
@@ -2240,14 +2176,7 @@ class DeviceClass:
     def __SetHelper(self, command, commandstring, value, qualifier):
 
         self.Debug = True
-        if self.VerboseDisabled and self.Unidirectional == 'False':
-            @Wait(1)
-            def SendVerbose():
-                if self.VerboseDisabled:
-                    self.Send('SESSION set verbose true\n')
-                self.Send(commandstring)
-        else:
-            self.Send(commandstring)
+        self.__QueueCommand(command, commandstring)
 
     def __UpdateHelper(self, command, commandstring, value, qualifier):
 
@@ -2262,14 +2191,7 @@ class DeviceClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            if self.VerboseDisabled:
-                @Wait(1)
-                def SendVerbose():
-                    if self.VerboseDisabled:
-                        self.Send('SESSION set verbose true\n')
-                    self.Send(commandstring)
-            else:
-                self.Send(commandstring)
+            self.__QueueCommand(command, commandstring, merge=True)
 
     def _UpdateSubscribeHelper(self, command, commandstring, tag, label, qualifier):
 
@@ -2284,28 +2206,26 @@ class DeviceClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            if self.VerboseDisabled:
-                @Wait(1)
-                def SendVerbose():
-                    if self.VerboseDisabled:
-                        self.Send('SESSION set verbose true\n')
-                    if label not in self.InitialStatusList:
-                        self.InitialStatusList.append(label)
+            if label not in self.InitialStatusList:
+                self.InitialStatusList.append(label)
 
-                        unsubscribe = '"{0}" unsubscribe {1} "{2}"\n'.format(tag, commandstring, label)
-                        self.Send(unsubscribe)
+                unsubscribe = '"{0}" unsubscribe {1} "{2}"\n'.format(tag, commandstring, label)
+                self.__QueueCommand(command, unsubscribe)
 
-                    subscribe = '"{0}" subscribe {1} "{2}" {3}\n'.format(tag, commandstring, label, self.SUBSCRIPTION_RESPONSE_TIME)
-                    self.Send(subscribe)
-            else:
-                if label not in self.InitialStatusList:
-                    self.InitialStatusList.append(label)
+            subscribe = '"{0}" subscribe {1} "{2}" {3}\n'.format(tag, commandstring, label, self.SUBSCRIPTION_RESPONSE_TIME)
+            self.__QueueCommand(command, subscribe, merge=True)
 
-                    unsubscribe = '"{0}" unsubscribe {1} "{2}"\n'.format(tag, commandstring, label)
-                    self.Send(unsubscribe)
+    def __QueueCommand(self, command, commandstring, merge=False):
 
-                subscribe = '"{0}" subscribe {1} "{2}" {3}\n'.format(tag, commandstring, label, self.SUBSCRIPTION_RESPONSE_TIME)
-                self.Send(subscribe)
+        if self.Unidirectional == 'True':
+            # nothing is replied, so there is nothing to pace the queue
+            self.Send(commandstring)
+        else:
+            if self.VerboseDisabled and not self.Pipeline.Pending(VERBOSE_COMMAND):
+                # the reply patterns need the command echoed, verbose mode is
+                # set ahead of anything already queued
+                self.Pipeline.Queue('VerboseMode', VERBOSE_COMMAND, key=VERBOSE_COMMAND, barrier=True)
+            self.Pipeline.Queue(command, commandstring, key=commandstring if merge else None)
 
     def OnConnected(self):
         self.connectionFlag = True
@@ -2313,10 +2233,16 @@ class DeviceClass:
         self.counter = 0
 
     def OnDisconnected(self):
+        # subscriptions do not survive the session, report them lost before
+        # the connection so fallback polling is in place when it goes down
+        for command, tag in list(self.__Subscribed):
+            self.WriteStatus('SubscriptionStatus', 'Not Subscribed', {'Command': command, 'Instance Tag': tag})
+        self.__Subscribed.clear()
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
         self.InitialStatusList.clear()
         self.VerboseDisabled = True
+        self.Pipeline.Clear()
 
     ######################################################
     # RECOMMENDED not to modify the code below this point
@@ -2357,117 +2283,48 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method': {}}
-
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             print(command, 'does not exist in the module')
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription:
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag and command != 'ConnectionStatus': 
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    return None
-        try:
-            return Status['Live']
-        except:
-            return None
+        return self.StatusStore.Read(command, qualifier)
 
     def __ReceiveData(self, interface, data):
-        # Handle incoming data
-        self.__receiveBuffer += data
-        index = 0    # Start of possible good data
-        # check incoming data if it matched any expected data from device module
-        tempList = copy.copy(self.__matchStringDict)
-        for regexString, CurrentMatch in tempList.items():
-            while True:
-                result = search(regexString, self.__receiveBuffer)
-                if result:
-                    index = result.start()
-                    CurrentMatch['callback'](result, CurrentMatch['para'])
-                    self.__receiveBuffer = self.__receiveBuffer[:result.start()] + self.__receiveBuffer[result.end():]
-                else:
-                    break
-                    
-        if index: 
-            # Clear out any junk data that came in before any good matches.
-            self.__receiveBuffer = self.__receiveBuffer[index:]
-        else:
-            # In rare cases, the buffer could be filled with garbage quickly.
-            # Make sure the buffer is capped.  Max buffer size set in init.
-            self.__receiveBuffer = self.__receiveBuffer[-self.__maxBufferSize:]
+        # Handle incoming data, all match strings are scanned in a single pass
+        self.__Dispatcher.Receive(data)
+
+        # every command is answered, in order, by one +OK or -ERR line
+        lines = (self.__ReplyBuffer + data).split(b'\n')
+        self.__ReplyBuffer = lines.pop()[-self.__maxBufferSize:]
+        for line in lines:
+            if line.startswith(b'+OK'):
+                self.Pipeline.Reply(True, line.strip().decode('utf-8', 'replace'))
+            elif line.startswith(b'-'):
+                error = line.strip().decode('utf-8', 'replace')[1:].replace('ERR ', '')
+                self.Pipeline.Reply(error in IGNORED_ERRORS, error)
 
     # Add regular expression so that it can be check on incoming data from device.
     def AddMatchString(self, regex_string, callback, arg):
-        if regex_string not in self.__matchStringDict:
-            self.__matchStringDict[regex_string] = {'callback': callback, 'para':arg}
+        self.__Dispatcher.AddMatchString(regex_string, callback, arg)
 
 class SerialClass(SerialInterface, DeviceClass):
-    def __init__(self, Host, Port, Baud=115200, Data=8, Parity='None', Stop=1, FlowControl='Off', CharDelay=0, Mode='RS232', Model=None):
+    def __init__(self, Host, Port, Baud=115200, Data=8, Parity='None', Stop=1, FlowControl='Off', CharDelay=0, Mode='RS232', Model=None, PipelineWindow=4):
         SerialInterface.__init__(self, Host, Port, Baud, Data, Parity, Stop, FlowControl, CharDelay, Mode)
         self.ConnectionType = 'Serial'
-        DeviceClass.__init__(self)
+        DeviceClass.__init__(self, PipelineWindow)
         # Check if Model belongs to a subclass
         if len(self.Models) > 0:
             if Model not in self.Models:
@@ -2483,10 +2340,10 @@ class SerialClass(SerialInterface, DeviceClass):
         self.Error([message])
 
 class SerialOverEthernetClass(EthernetClientInterface, DeviceClass):
-    def __init__(self, Hostname, IPPort, Protocol='TCP', ServicePort=0, Model=None):
+    def __init__(self, Hostname, IPPort, Protocol='TCP', ServicePort=0, Model=None, PipelineWindow=4):
         EthernetClientInterface.__init__(self, Hostname, IPPort, Protocol, ServicePort)
         self.ConnectionType = 'Serial'
-        DeviceClass.__init__(self)
+        DeviceClass.__init__(self, PipelineWindow)
         # Check if Model belongs to a subclass
         if len(self.Models) > 0:
             if Model not in self.Models:
@@ -2507,11 +2364,11 @@ class SerialOverEthernetClass(EthernetClientInterface, DeviceClass):
 
 class SSHClass(EthernetClientInterface, DeviceClass):
 
-    def __init__(self, GUIHost: 'GUIController', Hostname, IPPort, Protocol='SSH', ServicePort=0, Credentials=(None), Model=None):
+    def __init__(self, GUIHost: 'GUIController', Hostname, IPPort, Protocol='SSH', ServicePort=0, Credentials=(None), Model=None, PipelineWindow=4):
         EthernetClientInterface.__init__(self, Hostname, IPPort, Protocol, ServicePort, Credentials)
         self.ConnectionType = 'Ethernet'
         self.GUIHost = GUIHost
-        DeviceClass.__init__(self)
+        DeviceClass.__init__(self, PipelineWindow)
         # Check if Model belongs to a subclass
         if len(self.Models) > 0:
             if Model not in self.Models:
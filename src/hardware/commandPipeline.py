@@ -0,0 +1,287 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import Callable, Dict
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+from collections import deque
+import threading
+import time
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log, ScheduledTimer
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class _PipelineItem:
+    __slots__ = ('Command', 'Data', 'Key', 'Callback', 'Barrier', 'Queued', 'Sent')
+
+    def __init__(self, command: str, data: str, key: str, callback: Callable, barrier: bool) -> None:
+        self.Command = command
+        self.Data = data
+        self.Key = key
+        self.Callback = callback
+        self.Barrier = barrier
+        self.Queued = time.monotonic()
+        self.Sent = None
+
+class CommandPipeline:
+    def __init__(self, send: Callable[[str], None], window: int=4, timeout: float=2) -> None:
+        """Ordered send queue for request/reply protocols which answer every
+        command in the order received, eg. Biamp TTP.
+
+        Up to window commands are sent before their replies are received.
+        Replies are matched to requests in order by calling Reply for each
+        reply line, which records per command latency and errors and sends the
+        next queued commands. Queued commands with a merge key are not queued
+        a second time, so repeated polls of the same status are sent once.
+
+        Replies carry no command ID, so after a command is dropped on timeout
+        the next reply received within a further timeout is taken to be its
+        late reply and is discarded, keeping later replies matched to their
+        commands.
+
+        Args:
+            send (Callable[[str], None]): sends a command to the device
+            window (int, optional): maximum commands awaiting a reply. Defaults to 4.
+            timeout (float, optional): seconds to wait for a reply before a
+                command is dropped from the window. Defaults to 2.
+        """
+        self.Window = window
+        self.Timeout = timeout
+
+        self.Sent = 0
+        self.Replies = 0
+        self.Errors = 0
+        self.Timeouts = 0
+        self.Merged = 0
+        self.Unmatched = 0
+
+        self.__Send = send
+        self.__Queue = deque()
+        self.__InFlight = deque()
+        self.__Keys = {}    # merge key: queued item
+        self.__Stats = {}   # command: [sent, errors, timeouts, merged, latency total, latency max]
+        self.__Lock = threading.RLock()
+        self.__Late = 0     # late replies expected from expired commands
+        self.__LateDeadline = 0
+
+        # checked at a fraction of the timeout so commands expire close to it
+        self.__TimeoutTimer = ScheduledTimer(timeout / 4, self.__TimeoutHandler)
+        self.__TimeoutTimer.Stop()
+
+    @property
+    def QueueDepth(self) -> int:
+        return len(self.__Queue)
+
+    @property
+    def InFlight(self) -> int:
+        return len(self.__InFlight)
+
+    @property
+    def Stats(self) -> Dict[str, Dict]:
+        """Per command statistics. Latency is measured from the time a
+        command is sent to the time its reply is received."""
+        with self.__Lock:
+            stats = {}
+            for command, (sent, errors, timeouts, merged, total, peak) in self.__Stats.items():
+                replies = sent - timeouts
+                stats[command] = {
+                    'sent': sent,
+                    'errors': errors,
+                    'timeouts': timeouts,
+                    'merged': merged,
+                    'avg_latency': total / replies if replies > 0 else 0,
+                    'max_latency': peak
+                }
+            return stats
+
+    # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __TimeoutHandler(self, timer: 'ScheduledTimer', count: int) -> None:
+        self.Expire()
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __CommandStats(self, command: str) -> list:
+        stats = self.__Stats.get(command)
+        if stats is None:
+            stats = [0, 0, 0, 0, 0, 0]
+            self.__Stats[command] = stats
+        return stats
+
+    def __ExpireLate(self, now: float) -> None:
+        # called with self.__Lock held
+        if self.__Late > 0 and now > self.__LateDeadline:
+            # the expired commands are not going to be answered
+            self.__Late = 0
+
+    def __LateReply(self, now: float) -> bool:
+        # called with self.__Lock held
+        self.__ExpireLate(now)
+        if self.__Late == 0:
+            return False
+        self.__Late -= 1
+        return True
+
+    def __Pump(self) -> None:
+        # called with self.__Lock held
+        while len(self.__Queue) > 0 and len(self.__InFlight) < self.Window:
+            if len(self.__InFlight) > 0 and (self.__InFlight[-1].Barrier or self.__Queue[0].Barrier):
+                # barriers are sent alone
+                break
+            item = self.__Queue.popleft()
+            if item.Key is not None:
+                self.__Keys.pop(item.Key, None)
+            item.Sent = time.monotonic()
+            self.__InFlight.append(item)
+            self.Sent += 1
+            self.__CommandStats(item.Command)[0] += 1
+            self.__Send(item.Data)
+
+        if len(self.__InFlight) == 0:
+            self.__TimeoutTimer.Stop()
+        elif self.__TimeoutTimer.State != 'Running':
+            self.__TimeoutTimer.Restart()
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Queue(self, command: str, data: str, key: str=None, callback: Callable=None, barrier: bool=False) -> bool:
+        """Queues a command, sending it immediately if the window is open
+
+        Args:
+            command (str): command name used for statistics
+            data (str): the data to send
+            key (str, optional): merge key, a command is not queued if a queued
+                command has the same key. Defaults to None.
+            callback (Callable, optional): called with (ok, reply) when the
+                reply is received, or (False, None) on timeout. Defaults to None.
+            barrier (bool, optional): queue ahead of all waiting commands and
+                send only once all sent commands are answered, nothing else is
+                sent until it is answered. Defaults to False.
+
+        Returns:
+            bool: False if the command was merged with a queued command
+        """
+        with self.__Lock:
+            if key is not None and key in self.__Keys:
+                self.Merged += 1
+                self.__CommandStats(command)[3] += 1
+                return False
+            item = _PipelineItem(command, data, key, callback, barrier)
+            if key is not None:
+                self.__Keys[key] = item
+            if barrier:
+                self.__Queue.appendleft(item)
+            else:
+                self.__Queue.append(item)
+            self.__Pump()
+        return True
+
+    def Pending(self, key: str) -> bool:
+        """Returns True if a command with the merge key is queued or awaiting
+        a reply"""
+        with self.__Lock:
+            return key in self.__Keys or any(item.Key == key for item in self.__InFlight)
+
+    def Reply(self, ok: bool, reply: str=None) -> None:
+        """Matches a reply to the oldest command awaiting a reply
+
+        Args:
+            ok (bool): True for a successful reply
+            reply (str, optional): the reply text. Defaults to None.
+        """
+        with self.__Lock:
+            if self.__LateReply(time.monotonic()) or len(self.__InFlight) == 0:
+                # eg. the reply to a command dropped on timeout
+                self.Unmatched += 1
+                return
+            item = self.__InFlight.popleft()
+            self.Replies += 1
+            latency = time.monotonic() - item.Sent
+            stats = self.__CommandStats(item.Command)
+            stats[4] += latency
+            if latency > stats[5]:
+                stats[5] = latency
+            if not ok:
+                self.Errors += 1
+                stats[1] += 1
+            self.__Pump()
+        if item.Callback is not None:
+            item.Callback(ok, reply)
+
+    def Expire(self, now: float=None) -> int:
+        """Drops commands which have waited longer than the timeout for a reply
+
+        Args:
+            now (float, optional): time.monotonic time to expire commands at.
+                Defaults to the current time.
+
+        Returns:
+            int: the number of commands dropped
+        """
+        if now is None:
+            now = time.monotonic()
+        expired = []
+        with self.__Lock:
+            while len(self.__InFlight) > 0 and now - self.__InFlight[0].Sent >= self.Timeout:
+                item = self.__InFlight.popleft()
+                self.Timeouts += 1
+                self.__CommandStats(item.Command)[2] += 1
+                expired.append(item)
+            self.__ExpireLate(now)
+            if len(expired) > 0:
+                self.__Late += len(expired)
+                self.__LateDeadline = now + self.Timeout
+            self.__Pump()
+        for item in expired:
+            Log('No reply to {} ({})', 'warning', fmtArgs=(item.Command, item.Data.strip()))
+            if item.Callback is not None:
+                item.Callback(False, None)
+        return len(expired)
+
+    def Clear(self) -> int:
+        """Drops all queued commands and commands awaiting a reply, eg. when
+        the connection is lost
+
+        Returns:
+            int: the number of commands dropped
+        """
+        with self.__Lock:
+            count = len(self.__Queue) + len(self.__InFlight)
+            self.__Queue.clear()
+            self.__InFlight.clear()
+            self.__Keys.clear()
+            self.__Late = 0
+            self.__TimeoutTimer.Stop()
+        return count
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
@@ -0,0 +1,271 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import Dict, List, Tuple, Union
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+from bisect import bisect_left
+import http.client
+import ssl
+import threading
+import time
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+# upper bounds, in ms, of the latency histogram buckets
+LATENCY_BUCKETS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# methods which may safely be sent a second time
+IDEMPOTENT_METHODS = ['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE']
+
+# errors raised before any of the response is received, as when the host has
+# closed an idle connection. RemoteDisconnected is a ConnectionResetError.
+STALE_CONNECTION_ERRORS = (ConnectionResetError, BrokenPipeError)
+
+class HTTPResult:
+    def __init__(self, status: int, msg: str, headers: List[Tuple[str, str]], body: bytes) -> None:
+        """A completed response. Mirrors the parts of http.client.HTTPResponse
+        the drivers use, with the body already read so the connection can be
+        reused."""
+        self.status = status
+        self.msg = msg
+        self.headers = headers
+        self.__Body = body
+
+    def read(self) -> bytes:
+        return self.__Body
+
+class _SessionHTTPSConnection(http.client.HTTPSConnection):
+    # HTTPSConnection which resumes the previous TLS session of its client
+    def __init__(self, host: str, port: int, timeout: float, context: ssl.SSLContext, client: 'HTTPClient') -> None:
+        http.client.HTTPSConnection.__init__(self, host, port, timeout=timeout, context=context)
+        self.__Client = client
+
+    def connect(self) -> None:
+        http.client.HTTPConnection.connect(self)
+        kwargs = {'server_hostname': self.host if ssl.HAS_SNI else None}
+        if self.__Client.TLSSession is not None:
+            kwargs['session'] = self.__Client.TLSSession
+        self.sock = self._context.wrap_socket(self.sock, **kwargs)
+        # SSLSession is not available before Python 3.6
+        if getattr(self.sock, 'session_reused', False):
+            self.__Client.TLSResumed += 1
+
+class HTTPClient:
+    def __init__(self, protocol: str, host: str, port: Union[int, str]=None, connect_timeout: float=3, read_timeout: float=10, max_idle: int=2, context: ssl.SSLContext=None) -> None:
+        """Keep-alive HTTP/1.1 client for a single host.
+
+        Idle connections are kept and reused for later requests, so polling
+        a device does not open a new TCP connection, or negotiate a new TLS
+        session, for every request. New HTTPS connections resume the TLS
+        session of the previous connection. Cookies set by the host are
+        returned with later requests.
+
+        Args:
+            protocol (str): 'http' or 'https'
+            host (str): host name or IP address
+            port (Union[int, str], optional): Defaults to 80 or 443.
+            connect_timeout (float, optional): seconds to wait for a connection. Defaults to 3.
+            read_timeout (float, optional): seconds to wait for a response. Defaults to 10.
+            max_idle (int, optional): maximum idle connections kept. Defaults to 2.
+            context (ssl.SSLContext, optional): TLS context for https. Defaults
+                to ssl.create_default_context().
+        """
+        self.Protocol = protocol.lower()
+        if self.Protocol not in ['http', 'https']:
+            raise ValueError('Protocol must be http or https')
+        self.Host = host
+        self.Port = int(port) if port is not None else (443 if self.Protocol == 'https' else 80)
+        self.ConnectTimeout = connect_timeout
+        self.ReadTimeout = read_timeout
+        self.MaxIdle = max_idle
+        self.Context = context if context is not None else ssl.create_default_context()
+
+        self.Requests = 0
+        self.Errors = 0
+        self.Connects = 0
+        self.Reuses = 0
+        self.TLSResumed = 0
+        self.TLSSession = None
+        self.Cookies = {}
+
+        self.__Idle = []
+        self.__Lock = threading.Lock()
+        self.__Latency = {} # name: [count, errors, latency total, latency max, histogram counts]
+
+    @property
+    def Stats(self) -> Dict[str, Dict]:
+        """Per request name counts and latency histograms. Histogram keys are
+        the upper bound of each bucket in ms, '>10000' counts slower requests."""
+        with self.__Lock:
+            stats = {}
+            for name, (count, errors, total, peak, histogram) in self.__Latency.items():
+                buckets = ['<={}'.format(bound) for bound in LATENCY_BUCKETS] + ['>{}'.format(LATENCY_BUCKETS[-1])]
+                stats[name] = {
+                    'count': count,
+                    'errors': errors,
+                    'avg_latency': total / count if count > 0 else 0,
+                    'max_latency': peak,
+                    'histogram': dict(zip(buckets, histogram))
+                }
+            return stats
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Connection(self, fresh: bool=False) -> Tuple[http.client.HTTPConnection, bool]:
+        with self.__Lock:
+            if len(self.__Idle) > 0 and not fresh:
+                self.Reuses += 1
+                return self.__Idle.pop(), True
+            self.Connects += 1
+        if self.Protocol == 'https':
+            conn = _SessionHTTPSConnection(self.Host, self.Port, self.ConnectTimeout, self.Context, self)
+        else:
+            conn = http.client.HTTPConnection(self.Host, self.Port, timeout=self.ConnectTimeout)
+        return conn, False
+
+    def __Release(self, conn: http.client.HTTPConnection) -> None:
+        with self.__Lock:
+            if len(self.__Idle) < self.MaxIdle:
+                self.__Idle.append(conn)
+                return
+        conn.close()
+
+    def __Record(self, name: str, latency: float, failed: bool) -> None:
+        with self.__Lock:
+            stats = self.__Latency.get(name)
+            if stats is None:
+                stats = [0, 0, 0, 0, [0] * (len(LATENCY_BUCKETS) + 1)]
+                self.__Latency[name] = stats
+            stats[0] += 1
+            if failed:
+                stats[1] += 1
+            stats[2] += latency
+            if latency > stats[3]:
+                stats[3] = latency
+            stats[4][bisect_left(LATENCY_BUCKETS, latency * 1000)] += 1
+
+    def __Send(self, conn: http.client.HTTPConnection, method: str, path: str, body: bytes, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        if conn.sock is None:
+            conn.connect()
+            conn.sock.settimeout(self.ReadTimeout)
+        conn.request(method, path, body=body, headers=headers)
+        return conn.getresponse()
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Request(self, method: str, path: str, body: bytes=None, headers: Dict[str, str]=None, name: str=None) -> HTTPResult:
+        """Sends a request on an idle connection, or a new connection if none
+        are idle. An idempotent request which fails on a reused connection
+        before any response is received, eg. because the host has since closed
+        it, is retried once on a new connection. Timeouts are not retried.
+
+        Args:
+            method (str): HTTP method
+            path (str): request path, including any query string
+            body (bytes, optional): request body. Defaults to None.
+            headers (Dict[str, str], optional): Defaults to None.
+            name (str, optional): name the latency is recorded under. Defaults to path.
+
+        Raises:
+            OSError: if the host cannot be reached or does not respond in time
+            http.client.HTTPException: if the response is not valid HTTP
+
+        Returns:
+            HTTPResult: the response
+        """
+        headers = dict(headers) if headers is not None else {}
+        if len(self.Cookies) > 0:
+            headers['Cookie'] = '; '.join('{}={}'.format(key, val) for key, val in self.Cookies.items())
+
+        self.Requests += 1
+        start = time.monotonic()
+        retry = method.upper() in IDEMPOTENT_METHODS
+        conn, reused = self.__Connection()
+        while True:
+            try:
+                res = self.__Send(conn, method, path, body, headers)
+                result = HTTPResult(res.status, res.reason, res.getheaders(), res.read())
+                if self.Protocol == 'https':
+                    # kept once data is read, TLS 1.3 session tickets arrive after the handshake
+                    self.TLSSession = getattr(conn.sock, 'session', self.TLSSession)
+            except (OSError, http.client.HTTPException) as err:
+                conn.close()
+                if reused and retry and isinstance(err, STALE_CONNECTION_ERRORS):
+                    conn, reused = self.__Connection(fresh=True)
+                    continue
+                self.Errors += 1
+                self.__Record(name or path, time.monotonic() - start, True)
+                raise
+            break
+        self.__Record(name or path, time.monotonic() - start, False)
+
+        for key, val in result.headers:
+            if key.lower() == 'set-cookie':
+                cookie = val.split(';', 1)[0].split('=', 1)
+                if len(cookie) == 2:
+                    self.Cookies[cookie[0].strip()] = cookie[1].strip()
+
+        if res.will_close:
+            conn.close()
+        else:
+            self.__Release(conn)
+        return result
+
+    def Close(self) -> None:
+        """Closes idle connections"""
+        with self.__Lock:
+            idle = self.__Idle
+            self.__Idle = []
+        for conn in idle:
+            conn.close()
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+_Clients = {}
+_ClientsLock = threading.Lock()
+
+def GetHTTPClient(protocol: str, host: str, port: Union[int, str]=None, **kwargs) -> HTTPClient:
+    """Returns the shared HTTPClient for a host, creating it on first use.
+    Keyword arguments are passed to HTTPClient when it is created.
+    """
+    protocol = protocol.lower()
+    if port is None:
+        port = 443 if protocol == 'https' else 80
+    key = (protocol, host, int(port))
+    with _ClientsLock:
+        client = _Clients.get(key)
+        if client is None:
+            client = HTTPClient(protocol, host, port, **kwargs)
+            _Clients[key] = client
+    return client
+
+## End Function Definitions ----------------------------------------------------
@@ -22,7 +22,8 @@ if TYPE_CHECKING: # pragma: no cover
     from uofi_gui.uiObjects import ExUIDevice
     from uofi_gui.systemHardware import SystemHardwareController
 
-from urllib import request, error, parse
+from urllib import parse
+from http.client import HTTPException
 import ssl
 import re
 import base64
@@ -31,6 +32,8 @@ from extronlib.system import Wait, ProgramLog
 import traceback
 
 import utilityFunctions
+from hardware.statusStore import ResponseFingerprints
+from hardware.httpClient import GetHTTPClient
 
 def PodFeedbackHelper(touchpanel: 'ExUIDevice', hardware: str, blank_on_fail = True) -> None:
     utilityFunctions.Log('Feedback TP: {} ({})'.format(touchpanel.Id, touchpanel))
@@ -79,10 +82,8 @@ class DeviceClass:
         self._ctx.check_hostname = False
         self._ctx.verify_mode = ssl.CERT_NONE
 
-        if protocol.lower() == 'http':
-            self.Opener = request.build_opener(request.HTTPHandler()) 
-        elif protocol.lower() == 'https':
-            self.Opener = request.build_opener(request.HTTPSHandler(context=self._ctx)) 
+        # connections are shared with any other driver for this pod and kept open between polls
+        self.HTTP = GetHTTPClient(protocol, host, port, context=self._ctx)
         
         self.Subscription = {}
         self.counter = 0
@@ -104,6 +105,9 @@ class DeviceClass:
             'Sleep': { 'Status': {}},
             'Wake': { 'Status': {}}
         }       
+        # /api/config and /api/stats replies are parsed only when they differ
+        # from the last reply of the same command
+        self.ResponseFingerprints = ResponseFingerprints()
         
         
 ## -----------------------------------------------------------------------------
@@ -120,6 +124,10 @@ class DeviceClass:
         api_path = '/api/config'
         res = self.__UpdateHelper('PodStatus', value, qualifier, url=api_path, method='GET', data=None)
         if res:
+            if self.ResponseFingerprints.Unchanged('PodStatus', res):
+                # skipping WriteStatus, keep its connection handling
+                self.counter = 0
+                return
             try:
                 dataObj = json.loads(res)
                 # clean up unnecessary keys
@@ -134,17 +142,23 @@ class DeviceClass:
                     dataObj.pop(key)
                 
                 self.WriteStatus('PodStatus', dataObj, qualifier)
-            except (KeyError, IndexError):
+            except (KeyError, IndexError, ValueError):
+                self.ResponseFingerprints.Reset('PodStatus')
                 self.Error(['PodStatus: Invalid/unexpected response'])
     
     def UpdateUsageStatistics(self, value, qualifier):
         api_path = '/api/stats'
         res = self.__UpdateHelper('UsageStatistics', value, qualifier, url=api_path, method='GET', data=None)
         if res:
+            if self.ResponseFingerprints.Unchanged('UsageStatistics', res):
+                # skipping WriteStatus, keep its connection handling
+                self.counter = 0
+                return
             try:
                 dataObj = json.loads(res)
                 self.WriteStatus('UsageStatistics', dataObj, qualifier)
-            except (KeyError, IndexError):
+            except (KeyError, IndexError, ValueError):
+                self.ResponseFingerprints.Reset('UsageStatistics')
                 self.Error(['UsageStatistics: Invalid/unexpected response'])
     
     def SetClearPosts(self, value, qualifier):
@@ -199,7 +213,7 @@ class DeviceClass:
 
         headers = {}
         
-        call_url = '{0}{1}'.format(self.RootURL.rstrip('/'), url)
+        path = url
         
         if data is None:
             data = {}
@@ -208,7 +222,7 @@ class DeviceClass:
         
         if self.authentication is not None:
             if method == 'GET':
-                call_url = '{url}?{params}'.format(url = call_url, params = self.authentication['GET'])
+                path = '{url}?{params}'.format(url = path, params = self.authentication['GET'])
             elif method == 'POST':
                 tmp_data = data
                 data = self.authentication['POST']
@@ -216,21 +230,17 @@ class DeviceClass:
             else:
                 self.Error(['Method ({}) not supported'.format(method)])
                 
-        if method == 'GET':
-            my_request = request.Request(call_url, headers=headers)
-        elif method == 'POST':
+        call_data = None
+        if method == 'POST':
             call_data = parse.urlencode(data).encode()
-            my_request = request.Request(call_url, data=call_data, headers=headers)
-                
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+
         try:
-            res = self.Opener.open(my_request, timeout=10)  # open() returns a http.client.HTTPResponse object if successful
-        except error.HTTPError as err:  # includes HTTP status codes 101, 300-505
-            self.Error(['{0} {1} - {2}'.format(command, err.code, err.reason)])
+            res = self.HTTP.Request(method, path, body=call_data, headers=headers, name=command)  # Request() returns a HTTPResult object if successful
+        except (OSError, HTTPException) as err:  # received if can't reach the server (times out) or the response is invalid
+            self.Error(['{0} {1}'.format(command, err)])
             res = ''
-        except error.URLError as err:  # received if can't reach the server (times out)
-            self.Error(['{0} {1}'.format(command, err.reason)])
-            res = ''
-        except Exception as err:  # includes HTTP status code 100 and any invalid status code
+        except Exception as err:
             res = ''
         else:
             if res.status not in (200, 202):
@@ -252,7 +262,7 @@ class DeviceClass:
         
         headers = {}
         
-        call_url = '{0}{1}'.format(self.RootURL.rstrip('/'), url)
+        path = url
         
         if data is None:
             data = {}
@@ -261,7 +271,7 @@ class DeviceClass:
         
         if self.authentication is not None:
             if method == 'GET':
-                call_url = '{url}?{params}'.format(url = call_url, params = self.authentication['GET'])
+                path = '{url}?{params}'.format(url = path, params = self.authentication['GET'])
             elif method == 'POST':
                 tmp_data = data
                 data = self.authentication['POST']
@@ -269,21 +279,17 @@ class DeviceClass:
             else:
                 self.Error(['Method ({}) not supported'.format(method)])
                 
-        if method == 'GET':
-            my_request = request.Request(call_url, headers=headers)
-        elif method == 'POST':
+        call_data = None
+        if method == 'POST':
             call_data = parse.urlencode(data).encode()
-            my_request = request.Request(call_url, data=call_data, headers=headers)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
 
         try:
-            res = self.Opener.open(my_request, timeout=10)  # open() returns a http.client.HTTPResponse object if successful
-        except error.HTTPError as err:  # includes HTTP status codes 101, 300-505
-            self.Error(['{0} {1} - {2}'.format(command, err.code, err.reason)])
-            res = ''
-        except error.URLError as err:  # received if can't reach the server (times out)
-            self.Error(['{0} {1}'.format(command, err.reason)])
+            res = self.HTTP.Request(method, path, body=call_data, headers=headers, name=command)  # Request() returns a HTTPResult object if successful
+        except (OSError, HTTPException) as err:  # received if can't reach the server (times out) or the response is invalid
+            self.Error(['{0} {1}'.format(command, err)])
             res = ''
-        except Exception as err:  # includes HTTP status code 100 and any invalid status code
+        except Exception as err:
             res = ''
         else:
             if res.status not in (200, 202):
@@ -301,6 +307,7 @@ class DeviceClass:
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.ResponseFingerprints.Reset()
     
     ######################################################    
     # RECOMMENDED not to modify the code below this point
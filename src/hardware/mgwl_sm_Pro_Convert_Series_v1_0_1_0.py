@@ -4,12 +4,13 @@ if TYPE_CHECKING: # pragma: no cover
 
 from extronlib.system import Wait, ProgramLog
 import base64
-import urllib.error
-import urllib.request
+from http.client import HTTPException
 import hashlib
 import json
 from extronlib import Version
 
+from hardware.httpClient import GetHTTPClient
+
 class DeviceClass:
     def __init__(self, ipAddress, port, deviceUsername, devicePassword):
 
@@ -18,7 +19,8 @@ class DeviceClass:
         self.DefaultResponseTimeout = 0.3
         
         self.RootURL = 'http://{0}:{1}/'.format(ipAddress, port)
-        self.Opener = urllib.request.build_opener(urllib.request.HTTPBasicAuthHandler()) 
+        # connections are kept open between polls, the client also keeps the login session cookie
+        self.HTTP = GetHTTPClient('http', ipAddress, port)
 
         self.Subscription = {}
         self.counter = 0
@@ -61,11 +63,8 @@ class DeviceClass:
             print('Invalid Number of Source Preset Lists Results Parameter.')
 
     def SetLogin(self, value, qualifier):
-        opener = self.Opener
-        opener.add_handler(urllib.request.HTTPCookieProcessor())
         url = 'mwapi?method=login&id={0}&pass={1}'.format(self.deviceUsername, hashlib.md5(self.devicePassword.encode()).hexdigest())
-        my_request = urllib.request.Request(''.join([self.RootURL, url]), headers={'Content-Type': 'application/json'}, method='GET')
-        response = opener.open(my_request, timeout=10)
+        response = self.HTTP.Request('GET', '/' + url, headers={'Content-Type': 'application/json'}, name='Login')
         if response:
             res = json.loads(response.read().decode())
             if res['status'] != 0:
@@ -162,17 +161,12 @@ class DeviceClass:
 
         self.Debug = True
 
-        my_request = urllib.request.Request(''.join([self.RootURL, url]), data=data, headers={'Content-Type': 'application/json'}, method='GET') # create Request object
-
         try:
-            res = self.Opener.open(my_request, timeout=10) # open() returns a http.client.HTTPResponse object if successful
-        except urllib.error.HTTPError as err: # includes HTTP status codes 101, 300-505
-            self.Error(['{0} {1} - {2}'.format(command, err.code, err.reason)])
+            res = self.HTTP.Request('GET', '/' + url, body=data, headers={'Content-Type': 'application/json'}, name=command) # Request() returns a HTTPResult object if successful
+        except (OSError, HTTPException) as err: # received if can't reach the server (times out) or the response is invalid
+            self.Error(['{0} {1}'.format(command, err)])
             res = ''
-        except urllib.error.URLError as err: # received if can't reach the server (times out)
-            self.Error(['{0} {1}'.format(command, err.reason)])
-            res = ''
-        except Exception as err: # includes HTTP status code 100 and any invalid status code
+        except Exception as err:
             res = ''
         else:
             if res.status not in (200, 202):
@@ -192,17 +186,14 @@ class DeviceClass:
         if self.counter > self.connectionCounter and self.connectionFlag:
             self.OnDisconnected()
 
-        my_request = urllib.request.Request(''.join([self.RootURL, url]), data=data, headers={'Content-Type': 'application/json'}) # create Request object
+        method = 'GET' if data is None else 'POST'
 
         try:
-            res = self.Opener.open(my_request, timeout=10) # open() returns a http.client.HTTPResponse object if successful
-        except urllib.error.HTTPError as err: # includes HTTP status codes 101, 300-505
-            self.Error(['{0} {1} - {2}'.format(command, err.code, err.reason)])
-            res = ''
-        except urllib.error.URLError as err: # received if can't reach the server (times out)
-            self.Error(['{0} {1}'.format(command, err.reason)])
+            res = self.HTTP.Request(method, '/' + url, body=data, headers={'Content-Type': 'application/json'}, name=command) # Request() returns a HTTPResult object if successful
+        except (OSError, HTTPException) as err: # received if can't reach the server (times out) or the response is invalid
+            self.Error(['{0} {1}'.format(command, err)])
             res = ''
-        except Exception as err: # includes HTTP status code 100 and any invalid status code
+        except Exception as err:
             res = ''
         else:
             if res.status not in (200, 202):
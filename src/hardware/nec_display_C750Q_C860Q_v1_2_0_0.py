@@ -8,6 +8,8 @@ import re
 from binascii import hexlify
 
 import utilityFunctions
+from hardware.statusStore import StatusStore
+from hardware.transactionQueue import TransactionQueue, PortName
 
 class DeviceClass:
     def __init__(self):
@@ -15,6 +17,8 @@ class DeviceClass:
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
+        self.ReceiveData = self.__ReceiveData
         self.Subscription = {}
         self.counter = 0
         self.connectionFlag = True
@@ -31,6 +35,7 @@ class DeviceClass:
             'Power': { 'Status': {}},
             'Volume': { 'Status': {}},
         }
+        self.StatusStore = StatusStore(self.Commands)
 
     @property
     def DeviceID(self):
@@ -72,6 +77,8 @@ class DeviceClass:
         utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
         for TP in self.GUIHost.TPs:
             TP.DispCtl.DisplayPowerFeedback(hardware.Id, value)
+        if hasattr(self.GUIHost, 'ActCtl'):
+            self.GUIHost.ActCtl.DisplayPowerFeedback(hardware.Id, value)
         
     def VolumeStatusHandler(self, command, value, qualifier, hardware=None):
         utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
@@ -283,7 +290,7 @@ class DeviceClass:
         if self.Unidirectional == 'True' or self._DeviceID == 0x2A or (0x31 <= self._DeviceID <= 0x3A):
             self.Send(commandstring)
         else:
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag='\r')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag='\r').Result()
             if not res:
                 self.Error(['{}: Invalid/unexpected response'.format(command)])
             else:
@@ -303,7 +310,7 @@ class DeviceClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag='\r')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag='\r').Result()
             if not res:
                 return ''
             else:
@@ -319,6 +326,7 @@ class DeviceClass:
 
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
 
     ######################################################    
     # RECOMMENDED not to modify the code below this point
@@ -328,7 +336,7 @@ class DeviceClass:
     def Set(self, command, value, qualifier=None):
         method = getattr(self, 'Set%s' % command, None)
         if method is not None and callable(method):
-            method(value, qualifier)
+            self.Transactions.Submit(method, value, qualifier, priority=True)
         else:
             raise AttributeError(command + 'does not support Set.')
 
@@ -337,10 +345,14 @@ class DeviceClass:
     def Update(self, command, qualifier=None):
         method = getattr(self, 'Update%s' % command, None)
         if method is not None and callable(method):
-            method(None, qualifier)
+            self.Transactions.Submit(method, None, qualifier)
         else:
             raise AttributeError(command + 'does not support Update.')
 
+    # Passes replies to the command waiting on them
+    def __ReceiveData(self, interface, data):
+        self.Transactions.Receive(data)
+
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
     # have the update method.
@@ -348,83 +360,26 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ' + command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ' + command)
 
@@ -7,6 +7,8 @@ from struct import pack
 from binascii import hexlify
 
 import utilityFunctions
+from hardware.statusStore import StatusStore
+from hardware.transactionQueue import TransactionQueue, PortName
 
 class DeviceEthernetClass:
 
@@ -15,6 +17,8 @@ class DeviceEthernetClass:
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
+        self.ReceiveData = self.__ReceiveData
         self.Subscription = {}
         self.counter = 0
         self.connectionFlag = True
@@ -56,6 +60,7 @@ class DeviceEthernetClass:
             'VideoMute': {'Status': {}},
             'Volume': {'Status': {}},
         }
+        self.StatusStore = StatusStore(self.Commands)
 
 
     @property
@@ -82,6 +87,8 @@ class DeviceEthernetClass:
         utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
         for TP in self.GUIHost.TPs:
             TP.DispCtl.DisplayPowerFeedback(hardware.Id, value)
+        if hasattr(self.GUIHost, 'ActCtl'):
+            self.GUIHost.ActCtl.DisplayPowerFeedback(hardware.Id, value)
         
     def VolumeStatusHandler(self, command, value, qualifier, hardware=None):
         utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
@@ -1180,7 +1187,7 @@ class DeviceEthernetClass:
         if self.Unidirectional == 'True':
             self.Send(commandstring)
         else:
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\r').Result()
             if not res:
                 self.Error(['{0} : Invalid/Unexpected Response'.format(command)])
             else:
@@ -1199,7 +1206,7 @@ class DeviceEthernetClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\r').Result()
             if not res:
                 return ''
             else:
@@ -1214,6 +1221,7 @@ class DeviceEthernetClass:
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
 
 
     ######################################################
@@ -1224,7 +1232,7 @@ class DeviceEthernetClass:
     def Set(self, command, value, qualifier=None):
         method = getattr(self, 'Set%s' % command, None)
         if method is not None and callable(method):
-            method(value, qualifier)
+            self.Transactions.Submit(method, value, qualifier, priority=True)
         else:
             raise AttributeError(command, 'does not support Set.')
 
@@ -1232,10 +1240,14 @@ class DeviceEthernetClass:
     def Update(self, command, qualifier=None):
         method = getattr(self, 'Update%s' % command, None)
         if method is not None and callable(method):
-            method(None, qualifier)
+            self.Transactions.Submit(method, None, qualifier)
         else:
             raise AttributeError(command, 'does not support Update.')
 
+    # Passes replies to the command waiting on them
+    def __ReceiveData(self, interface, data):
+        self.Transactions.Receive(data)
+
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
     # have the update method.
@@ -1243,83 +1255,26 @@ class DeviceEthernetClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ', command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ', command)
 
@@ -1331,6 +1286,8 @@ class DeviceSerialClass:
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
+        self.ReceiveData = self.__ReceiveData
         self.Subscription = {}
         self.counter = 0
         self.connectionFlag = True
@@ -1373,6 +1330,7 @@ class DeviceSerialClass:
             'VideoMute': {'Parameters': ['Device ID'], 'Status': {}},
             'Volume': {'Parameters': ['Device ID'], 'Status': {}},
         }
+        self.StatusStore = StatusStore(self.Commands)
 
     @property
     def DeviceID(self):
@@ -2686,7 +2644,7 @@ class DeviceSerialClass:
         if self.Unidirectional == 'True' or 'Broadcast' in [qualifier['Device ID']]:
             self.Send(commandstring)
         else:
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\r').Result()
             if not res:
                 self.Error(['{0} : Invalid/Unexpected Response'.format(command)])
             else:
@@ -2706,7 +2664,7 @@ class DeviceSerialClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\r').Result()
             if not res:
                 return ''
             else:
@@ -2721,6 +2679,7 @@ class DeviceSerialClass:
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
 
     ######################################################
     # RECOMMENDED not to modify the code below this point
@@ -2730,7 +2689,7 @@ class DeviceSerialClass:
     def Set(self, command, value, qualifier=None):
         method = getattr(self, 'Set%s' % command, None)
         if method is not None and callable(method):
-            method(value, qualifier)
+            self.Transactions.Submit(method, value, qualifier, priority=True)
         else:
             raise AttributeError(command, 'does not support Set.')
 
@@ -2739,10 +2698,14 @@ class DeviceSerialClass:
     def Update(self, command, qualifier=None):
         method = getattr(self, 'Update%s' % command, None)
         if method is not None and callable(method):
-            method(None, qualifier)
+            self.Transactions.Submit(method, None, qualifier)
         else:
             raise AttributeError(command, 'does not support Update.')
 
+    # Passes replies to the command waiting on them
+    def __ReceiveData(self, interface, data):
+        self.Transactions.Receive(data)
+
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
     # have the update method.
@@ -2750,83 +2713,26 @@ class DeviceSerialClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ', command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ', command)
 
@@ -8,12 +8,16 @@ from struct import pack, unpack
 from itertools import cycle
 
 import utilityFunctions
+from hardware.statusStore import StatusStore
+from hardware.transactionQueue import TransactionQueue, PortName
 
 class DeviceClass:
     def __init__(self):
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
+        self.ReceiveData = self.__ReceiveData
         self.Subscription = {}
         self.counter = 0
         self.connectionFlag = True
@@ -41,6 +45,7 @@ class DeviceClass:
             'VideoMute': {'Status': {}},
             'Volume': {'Status': {}},
         }
+        self.StatusStore = StatusStore(self.Commands)
       
         if self.Unidirectional == 'False':
             self.SetRegAspectRatio = re.compile(b'(\xA3\x10[\x00-\xFF]{6}|\x23\x10[\x00-\xFF]{6})')
@@ -108,6 +113,8 @@ class DeviceClass:
         utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
         for TP in self.GUIHost.TPs:
             TP.DispCtl.DisplayPowerFeedback(hardware.Id, value)
+        if hasattr(self.GUIHost, 'ActCtl'):
+            self.GUIHost.ActCtl.DisplayPowerFeedback(hardware.Id, value)
         
     # def VolumeStatusHandler(self, command, value, qualifier, hardware=None):
     #     utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
@@ -536,7 +543,7 @@ class DeviceClass:
             self.Send(commandstring)
             return ''
         else:
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliRex=self.SetDelim[command])
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliRex=self.SetDelim[command]).Result()
             if not res:
                 self.Error(['{}: Invalid/Unexpected Response'.format(command)])
             else:
@@ -556,7 +563,7 @@ class DeviceClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
                 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliRex=self.UpdateDelim[command])
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliRex=self.UpdateDelim[command]).Result()
             if not res:
                 return ''
             else:
@@ -570,6 +577,7 @@ class DeviceClass:
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
 
     ######################################################    
     # RECOMMENDED not to modify the code below this point
@@ -579,7 +587,7 @@ class DeviceClass:
     def Set(self, command, value, qualifier=None):
         method = getattr(self, 'Set%s' % command, None)
         if method is not None and callable(method):
-            method(value, qualifier)
+            self.Transactions.Submit(method, value, qualifier, priority=True)
         else:
             raise AttributeError(command + 'does not support Set.')
 
@@ -588,10 +596,14 @@ class DeviceClass:
     def Update(self, command, qualifier=None):
         method = getattr(self, 'Update%s' % command, None)
         if method is not None and callable(method):
-            method(None, qualifier)
+            self.Transactions.Submit(method, None, qualifier)
         else:
             raise AttributeError(command + 'does not support Update.')
 
+    # Passes replies to the command waiting on them
+    def __ReceiveData(self, interface, data):
+        self.Transactions.Receive(data)
+
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
     # have the update method.
@@ -599,83 +611,26 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command, None)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             raise KeyError('Invalid command for SubscribeStatus ' + command)
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
         Command = self.Commands.get(command, None)
         if Command:
-            Status = Command['Status']
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Status = Status[qualifier[Parameter]]
-                    except KeyError:
-                        return None
-            try:
-                return Status['Live']
-            except:
-                return None
+            return self.StatusStore.Read(command, qualifier)
         else:
             raise KeyError('Invalid command for ReadStatus: ' + command)
 
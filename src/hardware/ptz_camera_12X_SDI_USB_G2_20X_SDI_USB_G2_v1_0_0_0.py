@@ -4,6 +4,7 @@ if TYPE_CHECKING: # pragma: no cover
 
 from extronlib.interface import SerialInterface, EthernetClientInterface
 from struct import pack
+from hardware.transactionQueue import TransactionQueue, PortName
 
 class DeviceClass:
 
@@ -12,6 +13,8 @@ class DeviceClass:
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
+        self.ReceiveData = self.__ReceiveData
         self._compile_list = {}
         self.Subscription = {}
         self.counter = 0
@@ -262,7 +265,7 @@ class DeviceClass:
         if self.Unidirectional == 'True' or self.cameraID == b'\x88':
             self.Send(commandstring)
         else:
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF').Result()
             if not res:
                 print('No Response')
             else:
@@ -282,7 +285,7 @@ class DeviceClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
                 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF').Result()
             if not res:
                 return ''
             else:
@@ -296,6 +299,7 @@ class DeviceClass:
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
     
     ######################################################    
     # RECOMMENDED not to modify the code below this point
@@ -304,17 +308,21 @@ class DeviceClass:
     def Set(self, command, value, qualifier=None):
         method = 'Set%s' % command
         if hasattr(self, method) and callable(getattr(self, method)):
-            getattr(self, method)(value, qualifier)
+            self.Transactions.Submit(getattr(self, method), value, qualifier, priority=True)
         else:
             print(command, 'does not support Set.')
     # Send Update Commands
     def Update(self, command, qualifier=None):
         method = 'Update%s' % command
         if hasattr(self, method) and callable(getattr(self, method)):
-            getattr(self, method)(None, qualifier)
+            self.Transactions.Submit(getattr(self, method), None, qualifier)
         else:
             print(command, 'does not support Update.') 
 
+    # Passes replies to the command waiting on them
+    def __ReceiveData(self, interface, data):
+        self.Transactions.Receive(data)
+
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
     # have the update method.
@@ -4,6 +4,7 @@ if TYPE_CHECKING: # pragma: no cover
 
 from extronlib.interface import SerialInterface, EthernetClientInterface
 import re
+from hardware.transactionQueue import TransactionQueue, PortName
 
 class DeviceClass:
     def __init__(self):
@@ -11,6 +12,8 @@ class DeviceClass:
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
+        self.ReceiveData = self.__ReceiveData
         self.Subscription = {}
         self.counter = 0
         self.connectionFlag = True
@@ -296,7 +299,7 @@ class DeviceClass:
         if self.Unidirectional == 'True':
             self.Send(commandstring)
         else:
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF').Result()
             if not res:
                 self.Error(['{}: Invalid/unexpected response'.format(command)])
             else:
@@ -317,7 +320,7 @@ class DeviceClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF').Result()
             if not res:
                 return ''
             else:
@@ -331,6 +334,7 @@ class DeviceClass:
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
 
     ######################################################    
     # RECOMMENDED not to modify the code below this point
@@ -340,7 +344,7 @@ class DeviceClass:
     def Set(self, command, value, qualifier=None):
         method = getattr(self, 'Set%s' % command, None)
         if method is not None and callable(method):
-            method(value, qualifier)
+            self.Transactions.Submit(method, value, qualifier, priority=True)
         else:
             raise AttributeError(command + 'does not support Set.')
 
@@ -349,10 +353,14 @@ class DeviceClass:
     def Update(self, command, qualifier=None):
         method = getattr(self, 'Update%s' % command, None)
         if method is not None and callable(method):
-            method(None, qualifier)
+            self.Transactions.Submit(method, None, qualifier)
         else:
             raise AttributeError(command + 'does not support Update.')
 
+    # Passes replies to the command waiting on them
+    def __ReceiveData(self, interface, data):
+        self.Transactions.Receive(data)
+
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
     # have the update method.
@@ -0,0 +1,242 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import Callable, List
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+import heapq
+import re
+import threading
+try:
+    from re import _parser as sre_parse
+except ImportError: # Python < 3.11
+    import sre_parse
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class ReceiveDispatcher:
+    def __init__(self, maxBufferSize: int=4096, overlap: bool=False) -> None:
+        """Shared receive buffer and match dispatcher for driver __ReceiveData
+        handlers. Drivers register patterns with AddMatchString and pass incoming
+        data to Receive.
+
+        Patterns are indexed by their literal prefix, only patterns whose prefix
+        is present in the buffer are searched. In the default (consume) mode
+        matches are dispatched in buffer order with an advancing offset, so each
+        byte is dispatched to at most one callback. In overlap mode every
+        pattern is searched independently, for devices which send replies
+        containing other replies (eg. a status dump including individual status
+        lines).
+
+        Args:
+            maxBufferSize (int, optional): Maximum unmatched data retained.
+                Defaults to 4096.
+            overlap (bool, optional): Allow matches to overlap. Defaults to False.
+        """
+        self.MaxBufferSize = maxBufferSize
+        self.Overlap = overlap
+
+        self.PacketCount = 0
+        self.MatchCount = 0
+
+        self.__Buffer = b''
+        self.__Lock = threading.RLock()
+        self.__Patterns = {}  # pattern: (callback, arg)
+        self.__Order = []
+
+        # dispatch tables, rebuilt lazily after patterns are added
+        self.__Dirty = True
+        self.__Entries = ()     # (pattern, callback, arg) in registration order
+        self.__PrefixTable = () # (prefix, entry indexes)
+        self.__Unprefixed = ()  # entry indexes searched for every packet
+
+    @property
+    def Buffer(self) -> bytes:
+        return self.__Buffer
+
+    @property
+    def PatternCount(self) -> int:
+        return len(self.__Order)
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    @staticmethod
+    def _LiteralPrefix(pattern) -> bytes:
+        """Returns the literal bytes every match of pattern must start with"""
+        if pattern.flags & re.IGNORECASE or type(pattern.pattern) is not bytes:
+            return b''
+
+        def walk(parsed, prefix) -> bool:
+            # returns True if every item of parsed was literal
+            for op, av in parsed:
+                if op is sre_parse.LITERAL:
+                    prefix.append(av)
+                elif op is sre_parse.SUBPATTERN:
+                    # (group, pattern) or (group, add_flags, del_flags, pattern)
+                    if len(av) > 2 and (av[1] or av[2]):
+                        return False
+                    if not walk(av[-1], prefix):
+                        return False
+                else:
+                    return False
+            return True
+
+        prefix = bytearray()
+        try:
+            walk(sre_parse.parse(pattern.pattern, pattern.flags), prefix)
+        except Exception: # pragma: no cover
+            return b''
+        return bytes(prefix)
+
+    def __Build(self) -> None:
+        with self.__Lock:
+            if not self.__Dirty:
+                return
+
+            entries = []
+            prefixes = {}
+            unprefixed = []
+            for i, pattern in enumerate(self.__Order):
+                callback, arg = self.__Patterns[pattern]
+                entries.append((pattern, callback, arg))
+                prefix = self._LiteralPrefix(pattern)
+                if prefix:
+                    prefixes.setdefault(prefix, []).append(i)
+                else:
+                    unprefixed.append(i)
+
+            self.__Entries = tuple(entries)
+            self.__PrefixTable = tuple((prefix, tuple(idx)) for prefix, idx in prefixes.items())
+            self.__Unprefixed = tuple(unprefixed)
+            self.__Dirty = False
+
+    def __Candidates(self, buffer: bytes) -> List[int]:
+        candidates = list(self.__Unprefixed)
+        for prefix, indexes in self.__PrefixTable:
+            if prefix in buffer:
+                candidates.extend(indexes)
+        return candidates
+
+    def __DispatchConsume(self, buffer: bytes) -> int:
+        entries = self.__Entries
+        # next match of each candidate pattern, ordered by position then
+        # registration order
+        pending = []
+        for i in self.__Candidates(buffer):
+            result = entries[i][0].search(buffer)
+            if result is not None:
+                pending.append((result.start(), i, result))
+        heapq.heapify(pending)
+
+        pos = 0
+        consumed = 0
+        while pending:
+            start, i, result = heapq.heappop(pending)
+            pattern, callback, arg = entries[i]
+            if start >= pos:
+                self.MatchCount += 1
+                callback(result, arg)
+                consumed = result.end()
+                # guard against zero width matches
+                pos = consumed if consumed > start else start + 1
+            # overlapping matches are searched again past the last dispatched match
+            result = pattern.search(buffer, pos)
+            if result is not None:
+                heapq.heappush(pending, (result.start(), i, result))
+        return consumed
+
+    def __DispatchOverlap(self, buffer: bytes) -> int:
+        entries = self.__Entries
+        furthest = 0
+        for i in sorted(self.__Candidates(buffer)):
+            pattern, callback, arg = entries[i]
+            result = pattern.search(buffer)
+            if result is not None:
+                if result.end() > furthest:
+                    furthest = result.end()
+                self.MatchCount += 1
+                callback(result, arg)
+        return furthest
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def AddMatchString(self, pattern, callback: Callable, arg) -> None:
+        """Registers a compiled pattern. Patterns already registered are ignored.
+
+        Args:
+            pattern (Pattern): compiled bytes regular expression
+            callback (Callable): called with (match, arg) for each match
+            arg (Any): passed to callback
+        """
+        if type(pattern) in [bytes, str]:
+            pattern = re.compile(pattern if type(pattern) is bytes else pattern.encode())
+        with self.__Lock:
+            if pattern not in self.__Patterns:
+                self.__Patterns[pattern] = (callback, arg)
+                self.__Order.append(pattern)
+                self.__Dirty = True
+
+    def Receive(self, data: bytes) -> int:
+        """Appends data to the buffer and dispatches all matches
+
+        Args:
+            data (bytes): received data
+
+        Returns:
+            int: number of matches dispatched
+        """
+        with self.__Lock:
+            self.__Build()
+            self.PacketCount += 1
+            startCount = self.MatchCount
+            buffer = self.__Buffer + data
+
+            if self.Overlap:
+                index = self.__DispatchOverlap(buffer)
+            else:
+                index = self.__DispatchConsume(buffer)
+
+            if index:
+                # Clear out any data that has already been matched.
+                buffer = buffer[index:]
+            # In rare cases, the buffer could be filled with garbage quickly.
+            # Make sure the buffer is capped.
+            self.__Buffer = buffer[-self.MaxBufferSize:]
+
+            return self.MatchCount - startCount
+
+    def Clear(self) -> None:
+        with self.__Lock:
+            self.__Buffer = b''
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
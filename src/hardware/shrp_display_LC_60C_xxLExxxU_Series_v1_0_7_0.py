@@ -2,6 +2,8 @@ from extronlib.interface import SerialInterface, EthernetClientInterface
 from extronlib.system import ProgramLog
 from re import compile, search
 import utilityFunctions
+from hardware.statusStore import StatusStore
+from hardware.transactionQueue import TransactionQueue, PortName
 
 class DeviceClass:
     def __init__(self):
@@ -9,6 +11,7 @@ class DeviceClass:
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
         self._compile_list = {}
         self.Subscription = {}
         self.ReceiveData = self.__ReceiveData
@@ -49,6 +52,7 @@ class DeviceClass:
             'SetChannelTVDiscrete': { 'Status': {}},   
             'Volume': { 'Status': {}}, 
             }
+        self.StatusStore = StatusStore(self.Commands)
         if 'Serial' not in self.ConnectionType:
             self.AddMatchString(compile(b'Login:'), self.__MatchUsername, None)
             self.AddMatchString(compile(b'enter password :'), self.__MatchPassword, None)
@@ -72,6 +76,8 @@ class DeviceClass:
         utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
         for TP in self.GUIHost.TPs:
             TP.DispCtl.DisplayPowerFeedback(hardware.Id, value)
+        if hasattr(self.GUIHost, 'ActCtl'):
+            self.GUIHost.ActCtl.DisplayPowerFeedback(hardware.Id, value)
         
     def VolumeStatusHandler(self, command, value, qualifier, hardware=None):
         utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
@@ -435,7 +441,7 @@ class DeviceClass:
         if self.Unidirectional == 'True':  
             self.Send(commandstring)       
         else: 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r') 
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\r').Result() 
             if not res:
                 self.Error(['Invalid/Unexpected Response'])
             else: 
@@ -455,7 +461,7 @@ class DeviceClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\r').Result()
             if not res:
                 return ''
             else:
@@ -469,6 +475,7 @@ class DeviceClass:
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
 
     ######################################################    
     # RECOMMENDED not to modify the code below this point
@@ -477,7 +484,7 @@ class DeviceClass:
     def Set(self, command, value, qualifier=None):
         method = getattr(self, 'Set%s' % command)
         if method is not None and callable(method):
-            method(value, qualifier)
+            self.Transactions.Submit(method, value, qualifier, priority=True)
         else:
             print(command, 'does not support Set.')
 
@@ -485,7 +492,7 @@ class DeviceClass:
     def Update(self, command, qualifier=None):
         method = getattr(self, 'Update%s' % command)
         if method is not None and callable(method):
-            method(None, qualifier)
+            self.Transactions.Submit(method, None, qualifier)
         else:
             print(command, 'does not support Update.')
 
@@ -496,86 +503,28 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             print(command, 'does not exist in the module')
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    return None
-        try:
-            return Status['Live']
-        except:
-            return None
+        return self.StatusStore.Read(command, qualifier)
 
     def __ReceiveData(self, interface, data):
-    # handling incoming unsolicited data
-        self._ReceiveBuffer += data
+    # handling incoming unsolicited data, replies go to the command waiting on them
+        self._ReceiveBuffer += self.Transactions.Receive(data)
         # check incoming data if it matched any expected data from device module
         if self.CheckMatchedString() and len(self._ReceiveBuffer) > 10000:
             self._ReceiveBuffer = b''
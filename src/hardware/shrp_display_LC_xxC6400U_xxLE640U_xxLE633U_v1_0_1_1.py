@@ -1,6 +1,8 @@
 from extronlib.interface import SerialInterface, EthernetClientInterface
 
 import utilityFunctions
+from hardware.statusStore import StatusStore
+from hardware.transactionQueue import TransactionQueue, PortName
 
 class DeviceClass:
 
@@ -9,6 +11,8 @@ class DeviceClass:
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
+        self.ReceiveData = self.__ReceiveData
         self._compile_list = {}
         self.Subscription = {}
         self.counter = 0
@@ -36,6 +40,7 @@ class DeviceClass:
             'Power': {'Status': {}},
             'Volume': {'Status': {}}
             }
+        self.StatusStore = StatusStore(self.Commands)
 
         self.InitialStart = True
 
@@ -52,6 +57,8 @@ class DeviceClass:
         utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
         for TP in self.GUIHost.TPs:
             TP.DispCtl.DisplayPowerFeedback(hardware.Id, value)
+        if hasattr(self.GUIHost, 'ActCtl'):
+            self.GUIHost.ActCtl.DisplayPowerFeedback(hardware.Id, value)
         
     def VolumeStatusHandler(self, command, value, qualifier, hardware=None):
         utilityFunctions.Log('{} {} Callback; Value: {}; Qualifier {}'.format(hardware.Name, command, value, qualifier))
@@ -318,7 +325,7 @@ class DeviceClass:
         if self.Unidirectional == 'True':
             self.Send(commandstring)
         else:
-            res = self.SendAndWait(commandstring, CmdDefaultResponseTimeout, deliTag=b'\r')
+            res = self.Transactions.Request(command, commandstring, CmdDefaultResponseTimeout, deliTag=b'\r').Result()
             if not res:
                 self.Error(['Invalid/unexpected response for' + command])
             else:
@@ -338,7 +345,7 @@ class DeviceClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\r')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\r').Result()
             if not res:
                 return ''
             else:
@@ -352,6 +359,7 @@ class DeviceClass:
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
         self.InitialStart = True
 
     ######################################################
@@ -361,7 +369,7 @@ class DeviceClass:
     def Set(self, command, value, qualifier=None):
         method = 'Set%s' % command
         if hasattr(self, method) and callable(getattr(self, method)):
-            getattr(self, method)(value, qualifier)
+            self.Transactions.Submit(getattr(self, method), value, qualifier, priority=True)
         else:
             print(command, 'does not support Set.')
 
@@ -369,10 +377,14 @@ class DeviceClass:
     def Update(self, command, qualifier=None):
         method = 'Update%s' % command
         if hasattr(self, method) and callable(getattr(self, method)):
-            getattr(self, method)(None, qualifier)
+            self.Transactions.Submit(getattr(self, method), None, qualifier)
         else:
             print(command, 'does not support Update.') 
 
+    # Passes replies to the command waiting on them
+    def __ReceiveData(self, interface, data):
+        self.Transactions.Receive(data)
+
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
     # have the update method.
@@ -380,82 +392,24 @@ class DeviceClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             print(command, 'does not exist in the module')
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)            
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    return None
-        try:
-            return Status['Live']
-        except:
-            return None
+        return self.StatusStore.Read(command, qualifier)
 
 
 class SerialClass(SerialInterface, DeviceClass):
@@ -7,6 +7,7 @@ import re
 from extronlib.system import Wait, ProgramLog
 
 import utilityFunctions
+from hardware.receiveDispatch import ReceiveDispatcher
 
 class DeviceClass:
     def __init__(self):
@@ -16,9 +17,8 @@ class DeviceClass:
         self.DefaultResponseTimeout = 0.3
         self.Subscription = {}
         self.ReceiveData = self.__ReceiveData
-        self.__receiveBuffer = b''
         self.__maxBufferSize = 2048
-        self.__matchStringDict = {}
+        self.__Dispatcher = ReceiveDispatcher(self.__maxBufferSize)
         self.counter = 0
         self.connectionFlag = True
         self.initializationChk = True
@@ -972,33 +972,12 @@ class DeviceClass:
             raise KeyError('Invalid command for ReadStatus: ' + command)
 
     def __ReceiveData(self, interface, data):
-        # Handle incoming data
-        self.__receiveBuffer += data
-        index = 0    # Start of possible good data
-        
-        #check incoming data if it matched any expected data from device module
-        for regexString, CurrentMatch in self.__matchStringDict.items():
-            while True:
-                result = re.search(regexString, self.__receiveBuffer)
-                if result:
-                    index = result.start()
-                    CurrentMatch['callback'](result, CurrentMatch['para'])
-                    self.__receiveBuffer = self.__receiveBuffer[:result.start()] + self.__receiveBuffer[result.end():]
-                else:
-                    break
-                    
-        if index: 
-            # Clear out any junk data that came in before any good matches.
-            self.__receiveBuffer = self.__receiveBuffer[index:]
-        else:
-            # In rare cases, the buffer could be filled with garbage quickly.
-            # Make sure the buffer is capped.  Max buffer size set in init.
-            self.__receiveBuffer = self.__receiveBuffer[-self.__maxBufferSize:]
+        # Handle incoming data, all match strings are scanned in a single pass
+        self.__Dispatcher.Receive(data)
 
     # Add regular expression so that it can be check on incoming data from device.
     def AddMatchString(self, regex_string, callback, arg):
-        if regex_string not in self.__matchStringDict:
-            self.__matchStringDict[regex_string] = {'callback': callback, 'para':arg}
+        self.__Dispatcher.AddMatchString(regex_string, callback, arg)
 
 class EthernetClass(EthernetClientInterface, DeviceClass):
 
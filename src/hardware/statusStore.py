@@ -0,0 +1,287 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple, Union
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+from itertools import repeat
+from operator import itemgetter
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+# marks a status which has not been written, None is a valid status value
+_Unset = object()
+
+class StatusStore:
+    def __init__(self, commands: Dict) -> None:
+        """Flat status and subscription storage for driver WriteStatus,
+        ReadStatus, NewStatus, and SubscribeStatus methods.
+
+        Each command's qualifier is reduced to a tuple of its 'Parameters'
+        values by a key function built once per command, status values and
+        subscriptions are stored in dicts keyed by (command, key). Behaves the
+        same as the nested 'Status' dict walk used by the driver templates,
+        including subscriptions made with a partial or no qualifier receiving
+        status for any qualifier below them.
+
+        Args:
+            commands (Dict): the driver's Commands dict. Commands added to the
+                dict after the store is created are picked up when first used.
+        """
+        self.__Commands = commands
+        self.__KeyFunctions = {}
+        self.__Status = {}     # (command, key): value
+        self.__Callbacks = {}  # (command, key): callback
+        self.__Nodes = set()   # (command, key prefix) for each subscribed key
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Parameters(self, command: str) -> Tuple:
+        return tuple(self.__Commands[command].get('Parameters', ()))
+
+    def __KeyFunction(self, command: str) -> Callable:
+        keyFn = self.__KeyFunctions.get(command)
+        if keyFn is None:
+            params = self.__Parameters(command)
+            if len(params) == 0:
+                def keyFn(qualifier):
+                    return ()
+            else:
+                getter = itemgetter(*params)
+                single = len(params) == 1
+
+                def keyFn(qualifier):
+                    if not qualifier:
+                        return ()
+                    try:
+                        key = getter(qualifier)
+                    except KeyError:
+                        # qualifier is missing a parameter
+                        return None
+                    return (key,) if single else key
+            self.__KeyFunctions[command] = keyFn
+        return keyFn
+
+    def __Notify(self, command: str, value: Any, qualifier: Dict) -> None:
+        # walk to the deepest subscribed node, as the nested template does
+        nodes = self.__Nodes
+        node = ()
+        if qualifier:
+            for param in self.__Parameters(command):
+                if param not in qualifier or (command, node + (qualifier[param],)) not in nodes:
+                    break
+                node += (qualifier[param],)
+        callback = self.__Callbacks.get((command, node))
+        if callback:
+            callback(command, value, qualifier)
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Key(self, command: str, qualifier: Dict=None) -> Tuple:
+        """Returns the status key for a qualifier, or None if the qualifier
+        does not include every command parameter"""
+        return self.__KeyFunction(command)(qualifier)
+
+    def Read(self, command: str, qualifier: Dict=None) -> Any:
+        keyFn = self.__KeyFunctions.get(command) or self.__KeyFunction(command)
+        key = keyFn(qualifier)
+        if key is None:
+            return None
+        return self.__Status.get((command, key))
+
+    def ReadMany(self, command: str, qualifiers: Iterable[Dict]) -> List:
+        """Reads a command's status for several qualifiers
+
+        Args:
+            command (str): the command
+            qualifiers (Iterable[Dict]): qualifiers to read
+
+        Returns:
+            List: status values, in qualifier order, None where not set
+        """
+        status = self.__Status
+        params = self.__Parameters(command)
+        qualifiers = list(qualifiers)
+        if len(params) > 1:
+            # itemgetter returns the key tuple directly, so the whole read runs
+            # without a Python level call per qualifier
+            try:
+                return list(map(status.get, zip(repeat(command), map(itemgetter(*params), qualifiers))))
+            except (KeyError, TypeError):
+                # a qualifier is empty or missing a parameter
+                pass
+        keyFn = self.__KeyFunction(command)
+        return [status.get((command, keyFn(qualifier))) for qualifier in qualifiers]
+
+    def Write(self, command: str, value: Any, qualifier: Dict=None) -> bool:
+        """Stores a status value, notifying subscribers if it has changed.
+
+        Returns:
+            bool: True if the value changed
+        """
+        keyFn = self.__KeyFunctions.get(command) or self.__KeyFunction(command)
+        key = keyFn(qualifier)
+        if key is None:
+            return False
+        statusKey = (command, key)
+        status = self.__Status
+        if status.get(statusKey, _Unset) == value:
+            return False
+        status[statusKey] = value
+        callback = self.__Callbacks.get(statusKey)
+        if callback is not None:
+            callback(command, value, qualifier)
+        elif (command, ()) in self.__Nodes:
+            self.__Notify(command, value, qualifier)
+        return True
+
+    def WriteMany(self, command: str, values: Iterable[Tuple[Any, Dict]]) -> int:
+        """Stores several status values for a command
+
+        Args:
+            command (str): the command
+            values (Iterable[Tuple[Any, Dict]]): (value, qualifier) pairs
+
+        Returns:
+            int: the number of values which changed
+        """
+        changed = 0
+        for value, qualifier in values:
+            if self.Write(command, value, qualifier):
+                changed += 1
+        return changed
+
+    def Subscribe(self, command: str, qualifier: Dict, callback: Callable) -> bool:
+        """Registers a status callback, replacing any previous callback for the
+        same command and qualifier.
+
+        Returns:
+            bool: False if the qualifier is missing a command parameter
+        """
+        params = self.__Parameters(command)
+        key = ()
+        if qualifier:
+            for param in params:
+                if param not in qualifier:
+                    return False
+                key += (qualifier[param],)
+        for i in range(len(key) + 1):
+            self.__Nodes.add((command, key[:i]))
+        self.__Callbacks[(command, key)] = callback
+        return True
+
+    def Subscription(self, command: str, qualifier: Dict=None) -> Callable:
+        """Returns the callback subscribed for a command and qualifier, None if
+        there is no subscription"""
+        key = self.Key(command, qualifier)
+        if key is None:
+            return None
+        return self.__Callbacks.get((command, key))
+
+    def Notify(self, command: str, value: Any, qualifier: Dict=None) -> None:
+        """Calls the callback of the most specific subscription for a status"""
+        if (command, ()) in self.__Nodes:
+            self.__Notify(command, value, qualifier)
+
+    def Clear(self, command: str=None) -> None:
+        """Clears stored status values, subscriptions are kept"""
+        if command is None:
+            self.__Status.clear()
+        else:
+            for statusKey in [k for k in self.__Status if k[0] == command]:
+                del self.__Status[statusKey]
+
+class ResponseFingerprints:
+    def __init__(self) -> None:
+        """Raw reply change detection for commands which build large status
+        values from a single device reply.
+
+        The last raw reply for each command is kept as its fingerprint.
+        Comparing bytes or str checks the length before the content, so an
+        identical reply is detected without hashing or parsing it and a
+        changed reply can never be mistaken for an unchanged one.
+        """
+        self.__Fingerprints = {} # (command, key): raw reply
+        self.__Hits = {}
+        self.__Misses = {}
+
+    @property
+    def Stats(self) -> Dict[str, Dict]:
+        """Per command hit, miss, and hit rate counts"""
+        return {command: {'Hits': self.__Hits.get(command, 0),
+                          'Misses': self.__Misses.get(command, 0),
+                          'HitRate': self.HitRate(command)}
+                for command in set(self.__Hits) | set(self.__Misses)}
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Unchanged(self, command: str, response: Union[bytes, str], key: Hashable=None) -> bool:
+        """Checks a raw reply against the previous reply for a command and
+        stores it as the new fingerprint.
+
+        Args:
+            command (str): the command
+            response (Union[bytes, str]): the raw device reply
+            key (Hashable, optional): distinguishes replies for different
+                qualifiers of the same command. Defaults to None.
+
+        Returns:
+            bool: True if the reply is identical to the previous reply and
+                does not need to be parsed again
+        """
+        fpKey = (command, key)
+        if self.__Fingerprints.get(fpKey) == response:
+            self.__Hits[command] = self.__Hits.get(command, 0) + 1
+            return True
+        self.__Fingerprints[fpKey] = response
+        self.__Misses[command] = self.__Misses.get(command, 0) + 1
+        return False
+
+    def HitRate(self, command: str) -> float:
+        """Returns the fraction of replies for a command which were unchanged"""
+        hits = self.__Hits.get(command, 0)
+        total = hits + self.__Misses.get(command, 0)
+        if total == 0:
+            return 0.0
+        return hits / total
+
+    def Reset(self, command: str=None) -> None:
+        """Forgets stored fingerprints so the next reply is always parsed,
+        eg. after a parse error or a disconnect. Hit counts are kept."""
+        if command is None:
+            self.__Fingerprints.clear()
+        else:
+            for fpKey in [k for k in self.__Fingerprints if k[0] == command]:
+                del self.__Fingerprints[fpKey]
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
@@ -0,0 +1,338 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import Callable, Dict, Union
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+from collections import deque
+import threading
+import time
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class Transaction:
+    def __init__(self, command: str, data: Union[bytes, str], timeout: float, deliTag: Union[bytes, str]=None, deliRex=None, callback: Callable=None) -> None:
+        """A command sent to a device and the reply it is waiting for. The
+        reply ends at deliTag or at the end of a deliRex match, as with
+        SendAndWait.
+
+        Args:
+            command (str): command name used for logging and statistics
+            data (Union[bytes, str]): the data sent
+            timeout (float): seconds to wait for the reply
+            deliTag (Union[bytes, str], optional): reply delimiter. Defaults to None.
+            deliRex (Pattern, optional): compiled bytes pattern matching the
+                end of the reply. Defaults to None.
+            callback (Callable, optional): called with the Transaction when it
+                completes or times out. Defaults to None.
+        """
+        self.Command = command
+        self.Data = data
+        self.Timeout = timeout
+        self.DeliTag = deliTag.encode() if type(deliTag) is str else deliTag
+        self.DeliRex = deliRex
+        self.Callback = callback
+
+        self.Response = b''
+        self.TimedOut = False
+        self.Sent = None
+        self.Latency = None
+
+        self.__Event = threading.Event()
+
+    @property
+    def Done(self) -> bool:
+        return self.__Event.is_set()
+
+    def _Match(self, buffer: bytes) -> int:
+        """Returns the length of the reply at the start of buffer, 0 if the
+        reply is not complete"""
+        if self.DeliTag is not None:
+            index = buffer.find(self.DeliTag)
+            return 0 if index < 0 else index + len(self.DeliTag)
+        if self.DeliRex is not None:
+            match = self.DeliRex.search(buffer)
+            return 0 if match is None else match.end()
+        return len(buffer)
+
+    def _Complete(self, response: bytes, timedOut: bool=False) -> bool:
+        if self.__Event.is_set():
+            return False
+        self.Response = response
+        self.TimedOut = timedOut
+        self.Latency = time.monotonic() - self.Sent
+        if self.Callback is not None:
+            self.Callback(self)
+        self.__Event.set()
+        return True
+
+    def Result(self) -> bytes:
+        """Waits for the reply
+
+        Returns:
+            bytes: the reply, including its delimiter. Empty if the device did
+                not reply before the timeout.
+        """
+        if not self.__Event.wait(self.Timeout):
+            self._Complete(b'', timedOut=True)
+        return self.Response
+
+class TransactionQueue:
+    def __init__(self, send: Callable, name: str='', max_queue: int=32) -> None:
+        """Per port request/reply queue for drivers of stop-and-wait devices,
+        replacing SendAndWait.
+
+        Set and Update calls are submitted to the port's worker thread, so
+        callers return immediately. Set calls are submitted as priority calls,
+        which are never dropped and run ahead of waiting Update calls. An
+        Update call matching one already waiting is not queued a second time.
+        Calls of the same priority run in the order submitted. Commands on the
+        worker send with Request and wait on the returned Transaction.
+        Received data is passed to Receive, which completes the waiting
+        Transaction once its delimiter arrives.
+
+        Args:
+            send (Callable): sends data to the device
+            name (str, optional): port name for the worker thread and logs,
+                see PortName. Defaults to ''.
+            max_queue (int, optional): maximum non-priority calls waiting for
+                the worker, calls submitted while full are dropped. Defaults to 32.
+        """
+        self.Name = name
+        self.MaxQueue = max_queue
+
+        self.Submitted = 0
+        self.Completed = 0
+        self.Dropped = 0
+        self.Merged = 0
+        self.Requests = 0
+        self.Responses = 0
+        self.Timeouts = 0
+
+        self.__Send = send
+        self.__Priority = deque()
+        self.__Pending = deque()
+        self.__Cond = threading.Condition()
+        self.__Thread = None
+        self.__Lock = threading.RLock()
+        self.__Current = None
+        self.__Buffer = b''
+        self.__TotalLatency = 0.0
+        self.__MaxLatency = 0.0
+
+    @property
+    def QueueDepth(self) -> int:
+        return len(self.__Priority) + len(self.__Pending)
+
+    @property
+    def Stats(self) -> Dict:
+        with self.__Lock:
+            requests = self.Responses + self.Timeouts
+            return {
+                'depth': self.QueueDepth,
+                'submitted': self.Submitted,
+                'completed': self.Completed,
+                'dropped': self.Dropped,
+                'merged': self.Merged,
+                'requests': self.Requests,
+                'responses': self.Responses,
+                'timeouts': self.Timeouts,
+                'avg_latency': self.__TotalLatency / requests if requests > 0 else 0.0,
+                'max_latency': self.__MaxLatency,
+                # transactions per second of time spent waiting on the device
+                'throughput': self.Responses / self.__TotalLatency if self.__TotalLatency > 0 else 0.0
+            }
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Run(self) -> None: # pragma: no cover
+        while True:
+            with self.__Cond:
+                while len(self.__Priority) == 0 and len(self.__Pending) == 0:
+                    self.__Cond.wait()
+                if len(self.__Priority) > 0:
+                    function, args = self.__Priority.popleft()
+                else:
+                    function, args = self.__Pending.popleft()
+            try:
+                function(*args)
+            except Exception as inst:
+                Log('{} {} raised an exception. Exception ({}): {}', 'error',
+                    fmtArgs=(self.Name, getattr(function, '__name__', function), type(inst), inst))
+            with self.__Lock:
+                self.Completed += 1
+
+    def __Finished(self, transaction: Transaction) -> None:
+        with self.__Lock:
+            if self.__Current is transaction:
+                self.__Current = None
+                self.__Buffer = b''
+            if transaction.TimedOut:
+                self.Timeouts += 1
+            else:
+                self.Responses += 1
+            self.__TotalLatency += transaction.Latency
+            if transaction.Latency > self.__MaxLatency:
+                self.__MaxLatency = transaction.Latency
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Start(self) -> None:
+        if self.__Thread is None:
+            self.__Thread = threading.Thread(target=self.__Run,
+                                             name='TransactionQueue-{}'.format(self.Name),
+                                             daemon=True)
+            self.__Thread.start()
+
+    def Submit(self, function: Callable, *args, priority: bool=False) -> bool:
+        """Queues a call on the port's worker thread
+
+        Args:
+            function (Callable): the call to run on the worker
+            *args: arguments for function
+            priority (bool, optional): run ahead of non-priority calls and
+                never drop the call, used for Set calls. Defaults to False.
+                Non-priority calls with the same function and arguments as a
+                waiting call are merged with it.
+
+        Returns:
+            bool: False if the queue was full and the call was dropped
+        """
+        self.Start()
+        with self.__Cond:
+            # eg. a repeated poll of a device which is slow to reply
+            merged = not priority and (function, args) in self.__Pending
+            full = not priority and not merged and len(self.__Pending) >= self.MaxQueue
+            if priority:
+                self.__Priority.append((function, args))
+            elif not merged and not full:
+                self.__Pending.append((function, args))
+            self.__Cond.notify()
+        if full:
+            with self.__Lock:
+                self.Dropped += 1
+            Log('{} transaction queue full, {} dropped', 'warning',
+                fmtArgs=(self.Name, getattr(function, '__name__', function)))
+            return False
+        with self.__Lock:
+            if merged:
+                self.Merged += 1
+            else:
+                self.Submitted += 1
+        return True
+
+    def Request(self, command: str, data: Union[bytes, str], timeout: float, deliTag: Union[bytes, str]=None, deliRex=None, callback: Callable=None) -> Transaction:
+        """Sends data and returns the Transaction waiting on its reply. A
+        Transaction still waiting on a reply is finished first, so replies are
+        never attributed to the wrong command.
+
+        Args:
+            command (str): command name used for statistics
+            data (Union[bytes, str]): the data to send
+            timeout (float): seconds to wait for the reply
+            deliTag (Union[bytes, str], optional): reply delimiter. Defaults to None.
+            deliRex (Pattern, optional): compiled pattern matching the end of
+                the reply. Defaults to None.
+            callback (Callable, optional): called with the Transaction when it
+                completes. Defaults to None.
+
+        Returns:
+            Transaction: the pending transaction
+        """
+        current = self.__Current
+        if current is not None:
+            current.Result()
+
+        def Finished(trans: Transaction) -> None:
+            self.__Finished(trans)
+            if callback is not None:
+                callback(trans)
+
+        transaction = Transaction(command, data, timeout, deliTag, deliRex, Finished)
+        with self.__Lock:
+            self.Requests += 1
+            self.__Current = transaction
+            self.__Buffer = b''
+            transaction.Sent = time.monotonic()
+            self.__Send(data)
+        return transaction
+
+    def Receive(self, data: bytes) -> bytes:
+        """Passes received data to the Transaction waiting on a reply
+
+        Returns:
+            bytes: data which is not part of a reply, eg. unsolicited status
+        """
+        with self.__Lock:
+            transaction = self.__Current
+            if transaction is None:
+                return data
+            buffer = self.__Buffer + data
+            length = transaction._Match(buffer)
+            if length == 0:
+                self.__Buffer = buffer
+                return b''
+            self.__Current = None
+            self.__Buffer = b''
+        transaction._Complete(buffer[:length])
+        return buffer[length:]
+
+    def Clear(self) -> int:
+        """Discards calls waiting for the worker and times out the waiting
+        Transaction, eg. when the connection is lost
+
+        Returns:
+            int: the number of calls discarded
+        """
+        with self.__Cond:
+            cleared = len(self.__Priority) + len(self.__Pending)
+            self.__Priority.clear()
+            self.__Pending.clear()
+        current = self.__Current
+        if current is not None:
+            current._Complete(b'', timedOut=True)
+        return cleared
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+def PortName(interface) -> str:
+    """Names a driver's port by host and port, eg. '10.0.0.1:7142' or
+    'ProcessorAlias:COM1', so each port's queue can be told apart in logs,
+    thread names, and statistics.
+    """
+    hostname = getattr(interface, 'Hostname', None)
+    if hostname is not None:
+        return '{}:{}'.format(hostname, getattr(interface, 'IPPort', ''))
+    host = getattr(interface, 'Host', None)
+    return '{}:{}'.format(getattr(host, 'DeviceAlias', host), getattr(interface, 'Port', ''))
+
+## End Function Definitions ----------------------------------------------------
@@ -2,6 +2,8 @@ from extronlib.interface import SerialInterface, EthernetClientInterface
 from extronlib.system import ProgramLog
 from struct import pack, unpack
 from struct import pack
+from hardware.statusStore import StatusStore
+from hardware.transactionQueue import TransactionQueue, PortName
 
 class DeviceSerialClass:
 
@@ -10,6 +12,8 @@ class DeviceSerialClass:
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
+        self.ReceiveData = self.__ReceiveData
         self._compile_list = {}
         self.Subscription = {}
         self.counter = 0
@@ -40,6 +44,7 @@ class DeviceSerialClass:
             'Shutter': { 'Status': {}},
             'Zoom': {'Parameters':['Zoom Speed'], 'Status': {}},
             }
+        self.StatusStore = StatusStore(self.Commands)
 
     @property
     def DeviceID(self):
@@ -320,7 +325,7 @@ class DeviceSerialClass:
         if self.Unidirectional == 'True':
             self.Send(commandstring)
         else:
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF').Result()
             if not res:
                 res = ''
             else:
@@ -340,7 +345,7 @@ class DeviceSerialClass:
             if self.counter > self.connectionCounter and self.connectionFlag:
                 self.OnDisconnected()
 
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF').Result()
             if not res:
                 return ''
             else:
@@ -354,6 +359,7 @@ class DeviceSerialClass:
     def OnDisconnected(self):
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
 
     ######################################################
     # RECOMMENDED not to modify the code below this point
@@ -363,7 +369,7 @@ class DeviceSerialClass:
     def Set(self, command, value, qualifier=None):
         method = getattr(self, 'Set%s' % command)
         if method is not None and callable(method):
-            method(value, qualifier)
+            self.Transactions.Submit(method, value, qualifier, priority=True)
         else:
             print(command, 'does not support Set.')
 
@@ -371,10 +377,14 @@ class DeviceSerialClass:
     def Update(self, command, qualifier=None):
         method = getattr(self, 'Update%s' % command)
         if method is not None and callable(method):
-            method(None, qualifier)
+            self.Transactions.Submit(method, None, qualifier)
         else:
             print(command, 'does not support Update.')
 
+    # Passes replies to the command waiting on them
+    def __ReceiveData(self, interface, data):
+        self.Transactions.Receive(data)
+
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
     # have the update method.
@@ -382,82 +392,24 @@ class DeviceSerialClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             print(command, 'does not exist in the module')
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    return None
-        try:
-            return Status['Live']
-        except:
-            return None
+        return self.StatusStore.Read(command, qualifier)
 
 
 class DeviceEthernetClass:
@@ -467,6 +419,8 @@ class DeviceEthernetClass:
         self.Unidirectional = 'False'
         self.connectionCounter = 15
         self.DefaultResponseTimeout = 0.3
+        self.Transactions = TransactionQueue(lambda data: self.Send(data), PortName(self))
+        self.ReceiveData = self.__ReceiveData
         self._compile_list = {}
         self.Subscription = {}
         self.counter = 0
@@ -497,6 +451,7 @@ class DeviceEthernetClass:
             'Shutter': { 'Status': {}},
             'Zoom': {'Parameters':['Zoom Speed'], 'Status': {}},
             }
+        self.StatusStore = StatusStore(self.Commands)
 
     def SetAutoExposure(self, value, qualifier):
 
@@ -756,7 +711,7 @@ class DeviceEthernetClass:
         if self.Unidirectional == 'True':
             self.Send(commandstring)
         else:
-            res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF')
+            res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF').Result()
             if not res:
                 res = ''
             else:
@@ -772,7 +727,7 @@ class DeviceEthernetClass:
         if self.counter > self.connectionCounter and self.connectionFlag:
             self.OnDisconnected()
 
-        res = self.SendAndWait(commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF')
+        res = self.Transactions.Request(command, commandstring, self.DefaultResponseTimeout, deliTag=b'\xFF').Result()
         if not res:
             return ''
         else:
@@ -788,6 +743,7 @@ class DeviceEthernetClass:
         self.SequenceNum = 1
         self.WriteStatus('ConnectionStatus', 'Disconnected')
         self.connectionFlag = False
+        self.Transactions.Clear()
 
     ######################################################
     # RECOMMENDED not to modify the code below this point
@@ -797,7 +753,7 @@ class DeviceEthernetClass:
     def Set(self, command, value, qualifier=None):
         method = getattr(self, 'Set%s' % command)
         if method is not None and callable(method):
-            method(value, qualifier)
+            self.Transactions.Submit(method, value, qualifier, priority=True)
         else:
             print(command, 'does not support Set.')
 
@@ -805,10 +761,14 @@ class DeviceEthernetClass:
     def Update(self, command, qualifier=None):
         method = getattr(self, 'Update%s' % command)
         if method is not None and callable(method):
-            method(None, qualifier)
+            self.Transactions.Submit(method, None, qualifier)
         else:
             print(command, 'does not support Update.')
 
+    # Passes replies to the command waiting on them
+    def __ReceiveData(self, interface, data):
+        self.Transactions.Receive(data)
+
     # This method is to tie an specific command with a parameter to a call back method
     # when its value is updated. It sets how often the command will be query, if the command
     # have the update method.
@@ -816,82 +776,24 @@ class DeviceEthernetClass:
     def SubscribeStatus(self, command, qualifier, callback):
         Command = self.Commands.get(command)
         if Command:
-            if command not in self.Subscription:
-                self.Subscription[command] = {'method':{}}
-        
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-        
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        if Parameter in qualifier:
-                            Method[qualifier[Parameter]] = {}
-                            Method = Method[qualifier[Parameter]]
-                        else:
-                            return
-        
-            Method['callback'] = callback
-            Method['qualifier'] = qualifier    
+            self.StatusStore.Subscribe(command, qualifier, callback)
         else:
             print(command, 'does not exist in the module')
 
     # This method is to check the command with new status have a callback method then trigger the callback
     def NewStatus(self, command, value, qualifier):
-        if command in self.Subscription :
-            Subscribe = self.Subscription[command]
-            Method = Subscribe['method']
-            Command = self.Commands[command]
-            if qualifier:
-                for Parameter in Command['Parameters']:
-                    try:
-                        Method = Method[qualifier[Parameter]]
-                    except:
-                        break
-            if 'callback' in Method and Method['callback']:
-                Method['callback'](command, value, qualifier)  
+        self.StatusStore.Notify(command, value, qualifier)
 
     # Save new status to the command
     def WriteStatus(self, command, value, qualifier=None):
         self.counter = 0
         if not self.connectionFlag:
             self.OnConnected()
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    if Parameter in qualifier:
-                        Status[qualifier[Parameter]] = {}
-                        Status = Status[qualifier[Parameter]]
-                    else:
-                        return  
-        try:
-            if Status['Live'] != value:
-                Status['Live'] = value
-                self.NewStatus(command, value, qualifier)
-        except:
-            Status['Live'] = value
-            self.NewStatus(command, value, qualifier)
+        self.StatusStore.Write(command, value, qualifier)
 
     # Read the value from a command.
     def ReadStatus(self, command, qualifier=None):
-        Command = self.Commands[command]
-        Status = Command['Status']
-        if qualifier:
-            for Parameter in Command['Parameters']:
-                try:
-                    Status = Status[qualifier[Parameter]]
-                except KeyError:
-                    return None
-        try:
-            return Status['Live']
-        except:
-            return None
+        return self.StatusStore.Read(command, qualifier)
 
 
 class SerialClass(SerialInterface, DeviceSerialClass):
@@ -23,17 +23,17 @@ if TYPE_CHECKING: # pragma: no cover
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
 from extronlib.ui import Button
-from extronlib.system import Timer
 
 ## End ControlScript Import ----------------------------------------------------
 ##
 ## Begin Python Imports --------------------------------------------------------
+import threading
 
 ## End Python Imports ----------------------------------------------------------
 ##
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
-from utilityFunctions import Log, TimeIntToStr
+from utilityFunctions import Log, TimeIntToStr, ScheduledTimer
 from hardware.mersive_solstice_pod import PodFeedbackHelper
 #### Extron Global Scripter Modules
 
@@ -50,6 +50,11 @@ class ActivityController:
             "adv_share": "Adv. Sharing",
             "group_work": "Group Work"
         }
+    __PowerStates = \
+        {
+            'On': ['On', 'on', 'Power On', 'ON', 'Power on', 'POWER ON'],
+            'Off': ['Off', 'off', 'Power Off', 'Standby (Power Save)', 'Suspend (Power Save)', 'OFF', 'Power off', 'POWER OFF']
+        }
     def __init__(self, GUIHost: 'GUIController') -> None:
         
         self.GUIHost = GUIHost
@@ -112,19 +117,27 @@ class ActivityController:
             tp.ShowPopup('Menu-Activity-{}'.format(self.GUIHost.ActivityMode))
             tp.ShowPopup('Menu-Activity-open-{}'.format(self.GUIHost.ActivityMode))
         
-        self.__ConfirmationTimer = Timer(1, self.__ConfirmationHandler)
+        self.__ConfirmationTimer = ScheduledTimer(1, self.__ConfirmationHandler)
         self.__ConfirmationTimer.Stop()
         
-        self.__SwitchTimer = Timer(1, self.__SwitchTimerHandler)
+        self.__SwitchTimer = ScheduledTimer(1, self.__SwitchTimerHandler)
         self.__SwitchTimer.Stop()
         
-        self.__StartTimer = Timer(1, self.__StartUpTimerHandler)
+        # display power verification for the startup and shutdown transitions,
+        # states are cached from status feedback so timer ticks never wait on
+        # a device
+        self.__PowerLock = threading.RLock()
+        self.__PowerTarget = None
+        self.__PowerStatus = {}
+        self.__PowerCount = 0
+        
+        self.__StartTimer = ScheduledTimer(1, self.__StartUpTimerHandler)
         self.__StartTimer.Stop()
         
-        self.__ShutdownTimer = Timer(1, self.__ShutdownTimerHandler)
+        self.__ShutdownTimer = ScheduledTimer(1, self.__ShutdownTimerHandler)
         self.__ShutdownTimer.Stop()
         
-        self.__InitPageTimer = Timer(60, self.__InitPageTimerHandler)
+        self.__InitPageTimer = ScheduledTimer(60, self.__InitPageTimerHandler)
         self.__InitPageTimer.TriggerTime = self.GUIHost.Timers['initPage']
         self.__InitPageTimer.LastInactivity = {}
         self.__InitPageTimer.PanelInactivity = {}
@@ -135,11 +148,11 @@ class ActivityController:
         
         self.__ActivitySplashTimerList = []
         for i in range(len(self.GUIHost.TPs)):
-            self.__ActivitySplashTimerList.insert(i, Timer(1, self.__ActivitySplashWaitHandler))
+            self.__ActivitySplashTimerList.insert(i, ScheduledTimer(1, self.__ActivitySplashWaitHandler))
             self.__ActivitySplashTimerList[i].TPIndex = i
             self.__ActivitySplashTimerList[i].Stop()
         
-        self.__StatusTimer = Timer(5, self.__StatusTimerHandler)
+        self.__StatusTimer = ScheduledTimer(5, self.__StatusTimerHandler)
         self.__StatusTimer.Stop()
         
         for set in self.__ActivityBtns['select']:
@@ -155,9 +168,9 @@ class ActivityController:
         def CancelShutdown(button: 'Button', action: str):
             self.__CancelShutdown(button, action)
         
-        @event(self.__SwitchTimer, 'StateChanged') # pragma: no cover
-        def SwitchTimerStateHandler(timer: 'Timer', state: str):
+        def SwitchTimerStateHandler(timer: 'ScheduledTimer', state: str): # pragma: no cover
             self.__SwitchTimerStateHandler(timer, state)
+        self.__SwitchTimer.StateChanged = SwitchTimerStateHandler
 
         @event(self.__AllSplashBtns, ['Pressed', 'Released']) # pragma: no cover
         def SplashScreenHandler(button: 'Button', action: str):
@@ -248,7 +261,7 @@ class ActivityController:
             for tp in self.GUIHost.TPs:
                 tp.HidePopup("Shutdown-Confirmation")
     
-    def __SwitchTimerStateHandler(self, timer: 'Timer', state: str):
+    def __SwitchTimerStateHandler(self, timer: 'ScheduledTimer', state: str):
         if state == 'Stopped':
             if self.CurrentActivity == 'share' or self.CurrentActivity == 'group_work':
                 for timer in self.__ActivitySplashTimerList:
@@ -258,7 +271,7 @@ class ActivityController:
         for tp in self.GUIHost.TPs:
             tp.ShowPage('Opening')
         
-    def __CloseTipHandler(self, timer: Timer):
+    def __CloseTipHandler(self, timer: 'ScheduledTimer'):
         timer.Stop()
         page = self.GUIHost.TPs[timer.TPIndex].SrcCtl.SelectedSource.SourceControlPage 
         if page == 'PC':
@@ -267,7 +280,7 @@ class ActivityController:
             PodFeedbackHelper(self.GUIHost.TPs[timer.TPIndex], self.GUIHost.TPs[timer.TPIndex].SrcCtl.SelectedSource.Id, blank_on_fail=True)
         self.GUIHost.TPs[timer.TPIndex].ShowPopup("Source-Control-{}".format(page))
     
-    def __StatusTimerHandler(self, timer: Timer, count: int):
+    def __StatusTimerHandler(self, timer: 'ScheduledTimer', count: int):
         if self.CurrentActivity == 'share':
             for tp in self.GUIHost.TPs:
                 tp.SrcCtl.SourceAlertHandler()
@@ -279,14 +292,14 @@ class ActivityController:
             for tp in self.GUIHost.TPs:
                 tp.SrcCtl.SourceAlertHandler()
     
-    def __ActivitySplashWaitHandler(self, timer: Timer, count: int):
+    def __ActivitySplashWaitHandler(self, timer: 'ScheduledTimer', count: int):
         timeTillClose = self.__SplashTime - count
         self.GUIHost.TPs[timer.TPIndex].Btns['Activity-Splash-Close'].SetText('Close Tip ({})'.format(timeTillClose))
         
         if count > self.__SplashTime:
             self.__CloseTipHandler(timer)
     
-    def __ConfirmationHandler(self, timer: Timer, count: int) -> None:
+    def __ConfirmationHandler(self, timer: 'ScheduledTimer', count: int) -> None:
         timeTillShutdown = self.__ConfirmationTime - count
 
         for i in range(len(self.GUIHost.TPs)):
@@ -296,35 +309,32 @@ class ActivityController:
             timer.Stop()
             self.SystemShutdown()
     
-    def __StartUpTimerHandler(self, timer: Timer, count: int) -> None:
+    def __StartUpTimerHandler(self, timer: 'ScheduledTimer', count: int) -> None:
         timeRemaining = self.__StartupTime - count
 
         for i in range(len(self.GUIHost.TPs)):
             self.__Transition['count'][i].SetText(TimeIntToStr(timeRemaining))
             self.__Transition['level'][i].SetLevel(count)
 
-        destStatus = True
-        for dest in self.GUIHost.Destinations:
-            if dest['type'] not in ['conf', 'aud']:
-                self.GUIHost.Hardware[dest['id']].interface.Update('Power')
-                curStatus = self.GUIHost.Hardware[dest['id']].interface.ReadStatus('Power')
-                if curStatus not in ['On', 'on', 'Power On', 'ON', 'Power on', 'POWER ON']:
-                    destStatus = False
-        
-        # TIME SYNCED SWITCH ITEMS HERE - function in main
-        if destStatus:
-            destStatus = self.__Transition['start']['sync'](count, wrapup=True)
-        else:
-            self.__Transition['start']['sync'](count)
+        with self.__PowerLock:
+            if self.__PowerTarget != 'On':
+                # already completed by power feedback
+                return
+            self.__PowerCount = count
+            destStatus = self.__PowerTick()
+            
+            # TIME SYNCED SWITCH ITEMS HERE - function in main
+            if destStatus:
+                destStatus = self.__Transition['start']['sync'](count, wrapup=True)
+            else:
+                self.__Transition['start']['sync'](count)
 
-        # feedback can be used here to jump out of the startup process early
+            # feedback can be used here to jump out of the startup process early
 
-        if count >= self.__StartupTime or destStatus:
-            timer.Stop()
-            # Log('System started in {} mode'.format(self.CurrentActivity))
-            self.SystemSwitch(self.CurrentActivity)
+            if count >= self.__StartupTime or destStatus:
+                self.__StartupComplete()
                 
-    def __SwitchTimerHandler(self, timer: Timer, count: int) -> None:
+    def __SwitchTimerHandler(self, timer: 'ScheduledTimer', count: int) -> None:
         timeRemaining = self.__SwitchTime - count
 
         for i in range(len(self.GUIHost.TPs)):
@@ -339,36 +349,32 @@ class ActivityController:
                 tp.HidePopup('Power-Transition')
             # Log('System configured in {} mode'.format(self.CurrentActivity))
     
-    def __ShutdownTimerHandler(self, timer: Timer, count: int) -> None:
+    def __ShutdownTimerHandler(self, timer: 'ScheduledTimer', count: int) -> None:
         timeRemaining = self.__ShutdownTime - count
 
         for i in range(len(self.GUIHost.TPs)):
             self.__Transition['count'][i].SetText(TimeIntToStr(timeRemaining))
             self.__Transition['level'][i].SetLevel(count)
 
-        destStatus = True
-        for dest in self.GUIHost.Destinations:
-            if dest['type'] not in ['conf', 'aud']:
-                self.GUIHost.Hardware[dest['id']].interface.Update('Power')
-                curStatus = self.GUIHost.Hardware[dest['id']].interface.ReadStatus('Power')
-                if curStatus not in ['Off', 'off', 'Power Off', 'Standby (Power Save)', 'Suspend (Power Save)', 'OFF', 'Power off', 'POWER OFF']:
-                    destStatus = False
-        
-        # TIME SYNCED SHUTDOWN ITEMS HERE - function in main
-        if destStatus:
-            destStatus = self.__Transition['shutdown']['sync'](count, wrapup=True)
-        else:
-            self.__Transition['shutdown']['sync'](count)
+        with self.__PowerLock:
+            if self.__PowerTarget != 'Off':
+                # already completed by power feedback
+                return
+            self.__PowerCount = count
+            destStatus = self.__PowerTick()
+            
+            # TIME SYNCED SHUTDOWN ITEMS HERE - function in main
+            if destStatus:
+                destStatus = self.__Transition['shutdown']['sync'](count, wrapup=True)
+            else:
+                self.__Transition['shutdown']['sync'](count)
 
-        # feedback can be used here to jump out of the shutdown process early
+            # feedback can be used here to jump out of the shutdown process early
 
-        if count >= self.__ShutdownTime or destStatus:
-            timer.Stop()
-            for tp in self.GUIHost.TPs:
-                tp.HidePopup('Power-Transition')
-            # Log('System shutdown')
+            if count >= self.__ShutdownTime or destStatus:
+                self.__ShutdownComplete()
     
-    def __InitPageTimerHandler(self, timer: Timer, count: int) -> None:
+    def __InitPageTimerHandler(self, timer: 'ScheduledTimer', count: int) -> None:
         for tp in self.GUIHost.TPs:
             if self.CurrentActivity == 'off':
                 if tp.InactivityTime > timer.LastInactivity[tp.Id]:
@@ -385,6 +391,53 @@ class ActivityController:
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    def __PowerDisplays(self):
+        for dest in self.GUIHost.Destinations:
+            if dest['type'] not in ['conf', 'aud'] and dest['id'] in self.GUIHost.Hardware:
+                yield dest['id'], self.GUIHost.Hardware[dest['id']]
+    
+    def __StartPowerVerification(self, target: str) -> None:
+        with self.__PowerLock:
+            self.__PowerTarget = target
+            self.__PowerCount = 0
+            self.__PowerStatus = {}
+            for hwId, hw in self.__PowerDisplays():
+                self.__PowerStatus[hwId] = hw.interface.ReadStatus('Power')
+                # fan out, replies arrive through the display's status feedback
+                self.GUIHost.PollCtl.PollNow(hw.interface, 'Power')
+    
+    def __PowerVerified(self) -> bool:
+        targetStates = self.__PowerStates[self.__PowerTarget]
+        for state in self.__PowerStatus.values():
+            if state not in targetStates:
+                return False
+        return True
+    
+    def __PowerTick(self) -> bool:
+        # refresh from the interface status cache, this picks up displays
+        # which do not have a power feedback subscription, and re-request any
+        # display not yet in the target state. Neither waits on the device.
+        targetStates = self.__PowerStates[self.__PowerTarget]
+        for hwId, hw in self.__PowerDisplays():
+            if self.__PowerStatus.get(hwId) not in targetStates:
+                self.__PowerStatus[hwId] = hw.interface.ReadStatus('Power')
+            if self.__PowerStatus[hwId] not in targetStates:
+                self.GUIHost.PollCtl.PollNow(hw.interface, 'Power')
+        return self.__PowerVerified()
+    
+    def __StartupComplete(self) -> None:
+        self.__PowerTarget = None
+        self.__StartTimer.Stop()
+        # Log('System started in {} mode'.format(self.CurrentActivity))
+        self.SystemSwitch(self.CurrentActivity)
+    
+    def __ShutdownComplete(self) -> None:
+        self.__PowerTarget = None
+        self.__ShutdownTimer.Stop()
+        for tp in self.GUIHost.TPs:
+            tp.HidePopup('Power-Transition')
+        # Log('System shutdown')
+    
     def __ActivitySwitchTPConfiguration(self, activity, touchPanel: 'ExUIDevice'):
         index = self.GUIHost.TPs.index(touchPanel)
         
@@ -466,6 +519,29 @@ class ActivityController:
     
     # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    def DisplayPowerFeedback(self, HwID: str, state: str) -> None:
+        """Records display power feedback during the startup and shutdown
+        transitions. The transition completes as soon as every display reports
+        the target power state and the synced actions allow it.
+
+        Args:
+            HwID (str): the display hardware ID
+            state (str): the reported power state
+        """
+        with self.__PowerLock:
+            if self.__PowerTarget is None or HwID not in self.__PowerStatus:
+                return
+            self.__PowerStatus[HwID] = state
+            if not self.__PowerVerified():
+                return
+            
+            if self.__PowerTarget == 'On':
+                if self.__Transition['start']['sync'](self.__PowerCount, wrapup=True):
+                    self.__StartupComplete()
+            elif self.__PowerTarget == 'Off':
+                if self.__Transition['shutdown']['sync'](self.__PowerCount, wrapup=True):
+                    self.__ShutdownComplete()
+    
     def ShowActivityTip(self):
         for touchPanel in self.GUIHost.TPs:
             # show activity splash screen, will be updated config.activitySplash
@@ -507,6 +583,7 @@ class ActivityController:
             tp.SrcCtl.SelectSource(self.GUIHost.DefaultSourceId)
             tp.SrcCtl.SwitchSources(tp.SrcCtl.SelectedSource, 'All')
 
+        self.__StartPowerVerification('On')
         self.__StartTimer.Restart()
 
         # STARTUP ONLY ITEMS HERE
@@ -560,7 +637,8 @@ class ActivityController:
             tp.HidePopup("Shutdown-Confirmation")
             tp.ShowPage('Opening')
 
-        self.__ShutdownTimer.Restart()        
+        self.__StartPowerVerification('Off')
+        self.__ShutdownTimer.Restart()
         
         # SHUTDOWN ITEMS HERE - function in main
         self.__Transition['shutdown']['init']()
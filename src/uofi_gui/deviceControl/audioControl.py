@@ -26,6 +26,7 @@ from extronlib.ui import Button, Label, Level
 ##
 ## Begin Python Imports --------------------------------------------------------
 
+import functools
 import math
 
 ## End Python Imports ----------------------------------------------------------
@@ -296,7 +297,7 @@ class AudioController:
         hwCmd = getattr(hw, cmd['HwCmd'])
         qual = hwCmd.get('qualifier', None)
         
-        hw.interface.Set(hwCmd['command'], Value, qual)
+        self.GUIHost.ThrottleCtl.Send(hw.interface, hwCmd['command'], Value, qual)
     
     @property
     def ProgMute(self)->bool:
@@ -335,7 +336,7 @@ class AudioController:
         hwCmd = self.DSP.ProgramLevelCommand
         qual = hwCmd.get('qualifier', None)
         
-        self.DSP.interface.Set(hwCmd['command'], Level, qual)
+        self.GUIHost.ThrottleCtl.Send(self.DSP.interface, hwCmd['command'], Level, qual)
     
     @property
     def __InputCount(self) -> int:
@@ -436,6 +437,11 @@ class AudioController:
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    def __LevelConfirmed(self, hw, hwCmd: Dict, value: Union[int, float], tag: Tuple) -> bool:
+        # level buttons keep showing the requested level until the DSP reports it
+        return self.GUIHost.ThrottleCtl.Confirm(hw.interface, hwCmd['command'], value, hwCmd.get('qualifier', None),
+                                                functools.partial(self.AudioLevelFeedback, tag))
+    
     def __UpdatePagination(self):
         if self.__GainPageCount == 1:
             # No page flips. Show no pagination
@@ -737,14 +743,18 @@ class AudioController:
         self.__ShowInputState()
     
     def AudioLevelFeedback(self, tag: Tuple, value: int):
-        Log("Audio Level Feedback - Tag: {}; Value: {}".format(tag, value))
+        Log("Audio Level Feedback - Tag: {}; Value: {}", 'debug', fmtArgs=(tag, value))
         if tag[0] == 'prog':
             # Log('Prog Level Feedback')
-            if not (self.__Controls[tag[0]]['up'].PressedState or self.__Controls[tag[0]]['down'].PressedState):
+            if not (self.__Controls[tag[0]]['up'].PressedState or self.__Controls[tag[0]]['down'].PressedState) \
+                    and self.__LevelConfirmed(self.DSP, self.DSP.ProgramLevelCommand, value, tag):
                 self.__Levels[tag[0]].SetLevel(int(value))
         elif tag[0] == 'mics':
             # Log('Mic Level Feedback')
-            if not (self.__Controls[tag[0]][str(tag[1])]['up'].PressedState or self.__Controls[tag[0]][str(tag[1])]['down'].PressedState):
+            cmd = self.Microphones[str(tag[1])]['Control']['level']
+            hw = self.GUIHost.Hardware[cmd['HwId']]
+            if not (self.__Controls[tag[0]][str(tag[1])]['up'].PressedState or self.__Controls[tag[0]][str(tag[1])]['down'].PressedState) \
+                    and self.__LevelConfirmed(hw, getattr(hw, cmd['HwCmd']), value, tag):
                 self.__Levels[tag[0]][str(tag[1])].SetLevel(int(value))
     
     def AudioMuteFeedback(self, tag: Tuple[str, Union[str, int]], state: Union[str, int, bool]):
@@ -28,7 +28,6 @@ from extronlib.system import File
 ## End ControlScript Import ----------------------------------------------------
 ##
 ## Begin Python Imports --------------------------------------------------------
-import re
 import functools
 import json
 
@@ -37,7 +36,7 @@ import json
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
 from uofi_gui.systemHardware import SystemHardwareController
-from utilityFunctions import DictValueSearchByKey, Log
+from utilityFunctions import ControlNameIndex, Log
 
 ## End User Import -------------------------------------------------------------
 ##
@@ -67,8 +66,7 @@ class CameraController:
             self.__DefaultCamera = None
             self.__SelectBtns = self.UIHost.Btn_Grps['Camera-Select']
             for selBtn in self.__SelectBtns.Objects:
-                re_match = re.match(r'Ctl-Camera-Select-(\d+)', selBtn.Name)
-                camNum = int(re_match.group(1))
+                camNum = ControlNameIndex.ParseName(selBtn.Name)[1]
                 cam = [cam for cam in self.Cameras.values() if camNum == cam['Number']][0]
                 # Log('Cam selection: {} ({})'.format(cam, type(cam)))
                         
@@ -84,22 +82,24 @@ class CameraController:
 
         
                 
-        self.__PresetBtns = DictValueSearchByKey(self.UIHost.Btns, r'Ctl-Camera-Preset-\d+', regex=True)
-        for preBtn in self.__PresetBtns:
-            re_match = re.match(r'Ctl-Camera-Preset-(\d+)', preBtn.Name)
-            defaultBtnText = 'Preset {}'.format(re_match.group(1))
+        self.__PresetBtns = []
+        for presetNum, preBtn in sorted(self.UIHost.BtnIndex.GetFamily('Ctl-Camera-Preset').items()):
+            self.__PresetBtns.append(preBtn)
+            defaultBtnText = 'Preset {}'.format(presetNum)
             preBtn.defaultText = defaultBtnText
-            preBtn.PresetValue = int(re_match.group(1))
+            preBtn.PresetValue = presetNum
             preBtn.SetText(defaultBtnText)
             
         self.__HomeBtn = self.UIHost.Btns['Ctl-Camera-Home']
         self.__HomeBtn.PresetValue = 0
                 
-        self.__ControlsBtns = DictValueSearchByKey(self.UIHost.Btns, r'Ctl-Camera-[TPZ]-(?:Up|Dn|L|R|In|Out)', regex=True)
-        for ctlBtn in self.__ControlsBtns:
-            re_match = re.match(r'Ctl-Camera-([TPZ])-(Up|Dn|L|R|In|Out)', ctlBtn.Name)
-            ctlBtn.moveMode = re_match.group(1)
-            ctlBtn.moveDir = re_match.group(2)
+        self.__ControlsBtns = []
+        for moveMode in ['T', 'P', 'Z']:
+            for moveDir, ctlBtn in self.UIHost.BtnIndex.GetFamily('Ctl-Camera-{}'.format(moveMode)).items():
+                if moveDir in ['Up', 'Dn', 'L', 'R', 'In', 'Out']:
+                    self.__ControlsBtns.append(ctlBtn)
+                    ctlBtn.moveMode = moveMode
+                    ctlBtn.moveDir = moveDir
             
         self.__ControlMirrorBtn = self.UIHost.Btns['Ctl-Camera-MirrorCtls']
         self.__ControlMirrorBtn.SetState(1)
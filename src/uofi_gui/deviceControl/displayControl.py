@@ -28,12 +28,13 @@ from extronlib.ui import Button, Slider
 ## End ControlScript Import ----------------------------------------------------
 ##
 ## Begin Python Imports --------------------------------------------------------
+import functools
 
 ## End Python Imports ----------------------------------------------------------
 ##
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
-from utilityFunctions import DictValueSearchByKey, Log
+from utilityFunctions import Log
 from uofi_gui.sourceControls import Destination
 
 ## End User Import -------------------------------------------------------------
@@ -54,13 +55,13 @@ class DisplayController:
             }
         self.__Controls = {}
         for k in self.__Labels:
-            self.__Labels[k] = DictValueSearchByKey(self.UIHost.Lbls, r'DisplayCtl-{}-(\d+)'.format(k), regex=True, capture_dict=True)
+            self.__Labels[k] = {str(i): lbl for i, lbl in self.UIHost.LblIndex.GetFamily('DisplayCtl-{}'.format(k)).items() if type(i) is int}
             if k != 'scn':  
                 self.__Controls[k] = {}
                 for i in range(1, len(self.__Labels[k])+1):
-                    self.__Controls[k][str(i)] = DictValueSearchByKey(self.UIHost.Btns, r'Tech-Display-{}-{}-(\w+)'.format(k, str(i)), regex=True, capture_dict=True)
+                    self.__Controls[k][str(i)] = self.UIHost.BtnIndex.GetFamily('Tech-Display-{}-{}'.format(k, str(i)))
                     if k == 'proj':
-                        self.__Controls[k][str(i)].update(DictValueSearchByKey(self.UIHost.Btns, r'Tech-Display-scn-{}-(\w+)'.format(str(i)), regex=True, capture_dict=True))
+                        self.__Controls[k][str(i)].update(self.UIHost.BtnIndex.GetFamily('Tech-Display-scn-{}'.format(str(i))))
                     if k == 'mon':
                         self.__Controls[k][str(i)].update({'Vol': self.UIHost.Slds['Tech-Display-mon-{}-Vol'.format(str(i))]})
         
@@ -163,6 +164,11 @@ class DisplayController:
                 self.Destinations[dest['id']]['ctl_group'] = str(aud_assign)
                 aud_assign += 1
         
+        # control group for each destination, used by the feedback handlers
+        self.__DestControls = {}
+        for destId, dest in self.Destinations.items():
+            self.__DestControls[destId] = self.__Controls.get(dest['hw_type'], {}).get(dest['ctl_group'], {})
+        
         @event([ctl for ctl in self.__ControlList if type(ctl) is Slider], ['Changed']) # pragma: no cover
         def sliderFillHandler(control: 'Slider', action: str, value: float):
             self.__SliderFillHandler(control, action, value)
@@ -232,14 +238,17 @@ class DisplayController:
             
         qual = Hw.VolumeCommand.get('qualifier', None)
             
-        Log('Send Command - Command: {}, Value: {}, Qualifier: {}'.format(Hw.VolumeCommand['command'], value, qual))
-        Hw.interface.Set(Hw.VolumeCommand['command'], value, qual)   
+        Log('Send Command - Command: {}, Value: {}, Qualifier: {}', 'debug', fmtArgs=(Hw.VolumeCommand['command'], value, qual))
+        self.GUIHost.ThrottleCtl.Send(Hw.interface, Hw.VolumeCommand['command'], value, qual)
 
     # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
     def __SliderFillHandler(self, control: 'Slider', action: str, value: float):
         if type(control) == Slider:
             control.SetFill(value)
+            if control.Enabled and control.CtlType == 'Vol':
+                # volume follows the slider while dragging, rate limited by ThrottleCtl
+                self.DisplayVolume = (control.DestID, value)
                 
     def __DisplayControlButtonHandler(self, control: Union['Button', 'Slider'], action: str, value: float=None):
         if control.Enabled is False:
@@ -370,6 +379,7 @@ class DisplayController:
     def DisplayPowerFeedback(self, HwID: str, state: str):
         # Log('Feedback Display - Display Power - Hardware: {}, State: {}'.format(HwID, state))
         dest = self.Destinations[HwID]
+        controls = self.__DestControls[HwID]
         StateMap = \
             {
                 'On': ['On', 'on', 'Power On', 'ON', 'Power on', 'POWER ON'],
@@ -379,38 +389,47 @@ class DisplayController:
             }
         if state in StateMap['On']:
             # Log('Show button state On')
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['On'].SetState(1)
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['Off'].SetState(0)
+            controls['On'].SetState(1)
+            controls['Off'].SetState(0)
         elif state in StateMap['Off']:
             # Log('Show button state Off')
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['On'].SetState(0)
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['Off'].SetState(1)
+            controls['On'].SetState(0)
+            controls['Off'].SetState(1)
         elif state in StateMap['Warming']:
             # Log('Show button state Warming')
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['On'].SetBlinking('Medium', [0,1])
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['Off'].SetState(0)
+            controls['On'].SetBlinking('Medium', [0,1])
+            controls['Off'].SetState(0)
         elif state in StateMap['Cooling']:
             # Log('Show button state Cooling')
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['On'].SetState(0)
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['Off'].SetBlinking('Medium', [0,1])
+            controls['On'].SetState(0)
+            controls['Off'].SetBlinking('Medium', [0,1])
         else:
             raise ValueError('An unexpected state value has been provided - {}'.format(state))
         
     def DisplayMuteFeedback(self, HwID: str, state: Union[str, int, bool]):
         # Log('Feedback Display - Display Mute - Hardware: {}, State: {}'.format(HwID, state))
         dest = self.Destinations[HwID]
+        controls = self.__DestControls[HwID]
         if state in ['on', 'On', 'ON', 1, True, 'Mute', 'mute', 'MUTE']:
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['Mute'].SetState(1)
+            controls['Mute'].SetState(1)
             dest['mute'] = True
         else:
-            self.__Controls[dest['hw_type']][dest['ctl_group']]['Mute'].SetState(0)
+            controls['Mute'].SetState(0)
             dest['mute'] = False
             
     def DisplayVolumeFeedback(self, HwID: str, value: int):
         # Log('Feedback Display - Display Volume - Hardware: {}, Value: {}'.format(HwID, value))
         dest = self.Destinations[HwID]
+        Hw = dest['hw']
+        if not self.GUIHost.ThrottleCtl.Confirm(Hw.interface,
+                                                Hw.VolumeCommand['command'],
+                                                int(value),
+                                                Hw.VolumeCommand.get('qualifier', None),
+                                                functools.partial(self.DisplayVolumeFeedback, HwID)):
+            # keep the slider where the user left it until the display catches up
+            return
         dest['volume'] = int(value)
-        self.__Controls[dest['hw_type']][dest['ctl_group']]['Vol'].SetFill(int(value))
+        self.__DestControls[HwID]['Vol'].SetFill(int(value))
 
 
 ## End Class Definitions -------------------------------------------------------
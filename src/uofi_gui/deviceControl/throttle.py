@@ -0,0 +1,237 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import Any, Callable, Dict, Tuple
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+import threading
+import time
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class _ThrottleEntry:
+    __slots__ = ('Interface', 'Command', 'Qualifier', 'LastSent', 'SentValue',
+                 'SentSeq', 'Seq', 'Pending', 'Timer', 'Target', 'TargetTime',
+                 'Held', 'ConfirmTimer', 'SendLock')
+
+    def __init__(self, interface, command: str, qualifier: Dict) -> None:
+        self.Interface = interface
+        self.Command = command
+        self.Qualifier = qualifier
+        self.LastSent = None
+        self.SentValue = None
+        self.SentSeq = 0
+        self.Seq = 0
+        self.Pending = None   # (value, seq) waiting for the interval to pass
+        self.Timer = None
+        self.Target = None    # (value,) last requested, until confirmed
+        self.TargetTime = 0
+        self.Held = None      # (value, callback) feedback not yet shown
+        self.ConfirmTimer = None
+        self.SendLock = threading.Lock()
+
+class ThrottledSender:
+    def __init__(self, interval: float=0.2, confirmTimeout: float=2) -> None:
+        """Rate limited Set for continuous controls, eg. volume sliders and
+        level ramp buttons. Sends are coalesced per interface, command, and
+        qualifier: at most one Set is sent per interval, a value waiting to be
+        sent is replaced by newer values, and the last requested value is
+        always sent.
+
+        Args:
+            interval (float, optional): minimum seconds between Sets for the
+                same command and qualifier. Defaults to 0.2.
+            confirmTimeout (float, optional): seconds after the last request
+                before device feedback is used even if it does not match the
+                requested value. Defaults to 2.
+        """
+        self.Interval = interval
+        self.ConfirmTimeout = confirmTimeout
+
+        self.Requested = 0
+        self.Sent = 0
+        self.Dropped = 0
+
+        self.__Entries = {}
+        self.__Lock = threading.Lock()
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    @staticmethod
+    def __Key(interface, command: str, qualifier: Dict) -> Tuple:
+        if qualifier:
+            qualifier = tuple(sorted(qualifier.items()))
+        else:
+            qualifier = None
+        return (id(interface), command, qualifier)
+
+    def __Deliver(self, key: Tuple) -> None:
+        with self.__Lock:
+            entry = self.__Entries[key]
+            entry.Timer = None
+            if entry.Pending is None:
+                return
+            value, seq = entry.Pending
+            entry.Pending = None
+            entry.LastSent = time.monotonic()
+        self.__Transmit(entry, value, seq)
+
+    def __Recheck(self, key: Tuple) -> None:
+        with self.__Lock:
+            entry = self.__Entries[key]
+            entry.ConfirmTimer = None
+            held = entry.Held
+            entry.Held = None
+        if held is not None and self.Confirm(entry.Interface, entry.Command, held[0], entry.Qualifier, held[1]):
+            held[1](held[0])
+
+    def __Transmit(self, entry: _ThrottleEntry, value: Any, seq: int) -> None:
+        with entry.SendLock:
+            with self.__Lock:
+                if seq < entry.SentSeq:
+                    # a newer value has already been sent
+                    self.Dropped += 1
+                    return
+                entry.SentSeq = seq
+                entry.SentValue = value
+                self.Sent += 1
+            entry.Interface.Set(entry.Command, value, entry.Qualifier)
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Send(self, interface, command: str, value: Any, qualifier: Dict=None) -> bool:
+        """Requests a Set. The value is sent immediately if the interval has
+        passed since the last Set of this command and qualifier, otherwise it
+        is sent when the interval ends unless replaced by a newer value.
+
+        Args:
+            interface: the device interface
+            command (str): the Set command
+            value (Any): the Set value
+            qualifier (Dict, optional): the Set qualifier. Defaults to None.
+
+        Returns:
+            bool: True if the value was sent immediately
+        """
+        key = self.__Key(interface, command, qualifier)
+        now = time.monotonic()
+        with self.__Lock:
+            self.Requested += 1
+            entry = self.__Entries.get(key)
+            if entry is None:
+                entry = _ThrottleEntry(interface, command, qualifier)
+                self.__Entries[key] = entry
+
+            entry.Target = (value,)
+            entry.TargetTime = now
+
+            if (entry.Pending is None and entry.Timer is None and entry.SentValue == value and
+                entry.SentSeq > 0 and now - entry.LastSent < self.Interval):
+                # eg. the release of a slider at the last value it sent. Only
+                # while the control is in use, the device may since have been
+                # changed elsewhere.
+                return False
+
+            entry.Seq += 1
+            seq = entry.Seq
+            if entry.Timer is None and (entry.LastSent is None or now - entry.LastSent >= self.Interval):
+                entry.LastSent = now
+                sendNow = True
+            else:
+                if entry.Pending is not None:
+                    self.Dropped += 1
+                entry.Pending = (value, seq)
+                if entry.Timer is None:
+                    entry.Timer = threading.Timer(self.Interval - (now - entry.LastSent), self.__Deliver, (key,))
+                    entry.Timer.daemon = True
+                    entry.Timer.start()
+                sendNow = False
+
+        if sendNow:
+            self.__Transmit(entry, value, seq)
+        return sendNow
+
+    def Confirm(self, interface, command: str, value: Any, qualifier: Dict=None, callback: Callable[[Any], None]=None) -> bool:
+        """Checks device feedback against the values requested with Send. UI
+        feedback should only be updated when this returns True, so controls
+        keep showing the value the user set until the device reports it.
+
+        Args:
+            interface: the device interface
+            command (str): the Set command
+            value (Any): the device's reported value
+            qualifier (Dict, optional): the Set qualifier. Defaults to None.
+            callback (Callable[[Any], None], optional): called with the value
+                if feedback held back now is shown once the confirm timeout
+                has passed, eg. for a device which rounds the requested value
+                and sends no further feedback. Defaults to None.
+
+        Returns:
+            bool: True if feedback should be shown
+        """
+        key = self.__Key(interface, command, qualifier)
+        with self.__Lock:
+            entry = self.__Entries.get(key)
+            if entry is None or entry.Target is None:
+                return True
+            now = time.monotonic()
+            if entry.Pending is None and entry.Timer is None:
+                if (entry.Target[0] == value or
+                    now - entry.TargetTime >= self.ConfirmTimeout):
+                    entry.Target = None
+                    entry.Held = None
+                    return True
+            if callback is not None:
+                entry.Held = (value, callback)
+                if entry.ConfirmTimer is None:
+                    delay = max(entry.TargetTime + self.ConfirmTimeout - now, self.Interval)
+                    entry.ConfirmTimer = threading.Timer(delay, self.__Recheck, (key,))
+                    entry.ConfirmTimer.daemon = True
+                    entry.ConfirmTimer.start()
+            return False
+
+    def Flush(self) -> None:
+        """Sends all waiting values immediately"""
+        with self.__Lock:
+            keys = []
+            for key, entry in self.__Entries.items():
+                if entry.Timer is not None:
+                    entry.Timer.cancel()
+                    keys.append(key)
+        for key in keys:
+            self.__Deliver(key)
+        Log('Throttled sends - requested: {}, sent: {}, dropped: {}', 'debug',
+            fmtArgs=(self.Requested, self.Sent, self.Dropped))
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
@@ -18,12 +18,18 @@
 from extronlib.device import ProcessorDevice
 ## End ControlScript Import ----------------------------------------------------
 
-from typing import List, Union
+from typing import Dict, List, Union
 
-from utilityFunctions import Log
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from utilityFunctions import Log, SetLogLevel, StartLogSink
 
 from uofi_gui.uiObjects import ExUIDevice
 from uofi_gui.activityControls import ActivityController
+from uofi_gui.sourceControls.routing import RouteController
+from uofi_gui.sourceControls.alerts import AlertManager
+from uofi_gui.deviceControl.throttle import ThrottledSender
 from uofi_gui.systemHardware import (SystemHardwareController,
                                      SystemPollingController, 
                                      VirtualDeviceInterface)
@@ -47,6 +53,11 @@ class GUIController:
                  ButtonPanels: Union[str, List]=None) -> None:
         ## Begin Settings Properties -------------------------------------------
         
+        if hasattr(Settings, 'logLevel'):
+            SetLogLevel(Settings.logLevel)
+        if not hasattr(Settings, 'logAsync') or Settings.logAsync:
+            StartLogSink()
+        
         Log('CtlProcs: {}'.format(CtlProcs))
         Log('TouchPanels: {}'.format(TouchPanels))
         
@@ -84,6 +95,15 @@ class GUIController:
         self.PrimaryDSPId = Settings.primaryDSP
         
         # Additional settings go here
+        if hasattr(Settings, 'connectWorkers'):
+            self.ConnectWorkers = Settings.connectWorkers
+        else:
+            self.ConnectWorkers = 8
+        if hasattr(Settings, 'connectDeadline'):
+            self.ConnectDeadline = Settings.connectDeadline
+        else:
+            self.ConnectDeadline = 30
+        self.ConnectTimings = {}
 
         ## Processor Definition ------------------------------------------------
         if type(CtlProcs) is str:
@@ -110,10 +130,17 @@ class GUIController:
         ## Poll Control Module - needs to exist before creating hardware controllers
         self.PollCtl = SystemPollingController()
 
+        ## Rate limits continuous controls (sliders, ramps) across all panels
+        self.ThrottleCtl = ThrottledSender()
+
         ## Create Hardware interfaces ------------------------------------------
+        # modules are imported and interfaces constructed first, connections
+        # are then opened concurrently so one unreachable device does not
+        # hold up the rest of startup
         self.Hardware = {}
         for hw in Settings.hardware:
-            self.Hardware[hw['Id']] = SystemHardwareController(self, **hw)
+            self.Hardware[hw['Id']] = SystemHardwareController(self, DeferConnect=True, **hw)
+        self.ConnectHardware()
         
         ## Touch Panel Definition ----------------------------------------------
         
@@ -249,6 +276,8 @@ class GUIController:
         ## Create Controllers --------------------------------------------------
         # Log(['Button: {} ({}, {})'.format(btn.Name, btn.ID, btn) for btn in self.TPs[0].Btn_Grps['Activity-Select'].Objects])
         self.ActCtl = ActivityController(self)
+        self.RouteCtl = RouteController(self)
+        self.AlertCtl = AlertManager(self)
         
         for tp in self.TPs:
             tp.InitializeUIControllers()
@@ -282,6 +311,49 @@ class GUIController:
             tp.BlinkLights(Rate='Fast', StateList=['Green', 'Red'], Timeout=2.5)
             tp.Click(5, 0.2)
             
+    def ConnectHardware(self, workers: int=None, deadline: Union[int, float]=None) -> Dict[str, float]:
+        """Opens hardware connections concurrently on a bounded pool of threads.
+        Connections still pending at the deadline continue in the background.
+
+        Args:
+            workers (int, optional): Maximum concurrent connection attempts.
+                Defaults to self.ConnectWorkers.
+            deadline (Union[int, float], optional): Seconds to wait for all
+                connections. Defaults to self.ConnectDeadline.
+
+        Returns:
+            Dict[str, float]: connection time in seconds by hardware Id, for the
+                hardware which finished connecting before the deadline
+        """
+        if workers is None:
+            workers = self.ConnectWorkers
+        if deadline is None:
+            deadline = self.ConnectDeadline
+        
+        start = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=max(1, workers))
+        futures = {pool.submit(hw.Connect): hw for hw in self.Hardware.values()}
+        done, pending = wait(list(futures.keys()), timeout=deadline)
+        # do not wait for connections still pending at the deadline
+        pool.shutdown(wait=False)
+        
+        for future in done:
+            hw = futures[future]
+            if hw.ConnectTime is not None:
+                self.ConnectTimings[hw.Id] = hw.ConnectTime
+        
+        Log('Hardware connections opened in {:.3f}s; {} of {} complete; slowest: {}',
+            fmtArgs=(time.monotonic() - start,
+                     len(done),
+                     len(futures),
+                     ', '.join('{} ({:.2f}s)'.format(id, t) for id, t in sorted(self.ConnectTimings.items(), key=lambda item: item[1], reverse=True)[:3])))
+        if len(pending) > 0:
+            Log('Hardware connections pending at deadline: {}',
+                'warning',
+                fmtArgs=(', '.join(futures[future].Id for future in pending),))
+        
+        return self.ConnectTimings
+    
     @classmethod
     def GetErrorStr(cls, Error: str, *args, **kwargs):
         return cls.errorMap[Error].format(*args, **kwargs)
\ No newline at end of file
@@ -22,7 +22,6 @@ if TYPE_CHECKING: # pragma: no cover
 
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
-from extronlib.system import Timer
 
 ## End ControlScript Import ----------------------------------------------------
 ##
@@ -32,7 +31,7 @@ from extronlib.system import Timer
 ##
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
-from utilityFunctions import DictValueSearchByKey, Log, RunAsync, debug
+from utilityFunctions import DictValueSearchByKey, Log, RunAsync, debug, ScheduledTimer
 
 #### Extron Global Scripter Modules
 
@@ -123,7 +122,7 @@ class KeyboardController:
         
         self.__Cursor = ('\u2502','\u2588')
         self.__Pos = 0
-        self.__CursorTimer = Timer(0.5, self.__CursorTimerHandler)
+        self.__CursorTimer = ScheduledTimer(0.5, self.__CursorTimerHandler)
         self.__CursorTimer.Stop()
         
         @event(self.__CharBtns, ['Pressed', 'Released']) # pragma: no cover
@@ -245,7 +244,7 @@ class KeyboardController:
             button.SetState(0)
             self.Close()
     
-    def __CursorTimerHandler(self, timer: 'Timer', count: int):
+    def __CursorTimerHandler(self, timer: 'ScheduledTimer', count: int):
         self.__TextLbl.SetText(self.__CursorString(count % 2))
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
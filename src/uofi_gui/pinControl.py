@@ -31,7 +31,7 @@ from extronlib import event
 ##
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
-from utilityFunctions import DictValueSearchByKey, Log, RunAsync, debug
+from utilityFunctions import Log, RunAsync, debug
 
 #### Extron Global Scripter Modules
 
@@ -53,7 +53,7 @@ class PINController:
         self.__CurrentPIN = ""
         self.__PINPadBtns = \
             {
-                "numPad": DictValueSearchByKey(self.UIHost.Btns, r'PIN-\d', regex=True),
+                "numPad": self.UIHost.BtnIndex.GetFamilyList('PIN'),
                 "backspace": self.UIHost.Btns['PIN-Del'],
                 "cancel": self.UIHost.Btns['PIN-Cancel']
             }
@@ -37,7 +37,7 @@ from uofi_gui.sourceControls.matrix import MatrixController
 
 from hardware.mersive_solstice_pod import PodFeedbackHelper
 
-from utilityFunctions import RunAsync, DictValueSearchByKey, Log
+from utilityFunctions import RunAsync, Log
 
 #### Extron Global Scripter Modules
 
@@ -54,7 +54,8 @@ class SourceController:
         # Log('Set Public Properties')
         self.UIHost = UIHost
         self.GUIHost = self.UIHost.GUIHost
-        self.UIHost.Lbls['SourceAlertLabel'].SetText('')
+        self.__AlertLabelText = None
+        self.SetAlertLabel('')
         
         self.Sources = []
         for src in self.GUIHost.Sources:
@@ -85,6 +86,13 @@ class SourceController:
                 dest['destObj'] = {}
             dest['destObj'][self.UIHost.Id] = destObj
         
+        # lookup indexes, rebuilt if a list changes length
+        self.__SourceIndex = None
+        self.__DestinationIndex = None
+        self.__DisplaySrcIndex = {}
+        self.__IndexSources()
+        self.__IndexDestinations()
+        
         self.PrimaryDestination = self.GetDestination(id = self.GUIHost.PrimaryDestinationId)
         self.SelectedSource = None
         self.OpenControlPopup = None
@@ -109,11 +117,11 @@ class SourceController:
         self.__DisplaySrcList = []
         self.__Privacy = False
         self.__Matrix = MatrixController(self,
-                                        DictValueSearchByKey(self.UIHost.Btns, r'Tech-Matrix-\d+,\d+', regex=True),
+                                        self.UIHost.BtnIndex.GetFamilyList('Tech-Matrix'),
                                         self.UIHost.Btn_Grps['Tech-Matrix-Mode'],
                                         self.UIHost.Btns['Tech-Matrix-DeleteTies'],
-                                        DictValueSearchByKey(self.UIHost.Lbls, r'MatrixLabel-In-\d+', regex=True),
-                                        DictValueSearchByKey(self.UIHost.Lbls, r'MatrixLabel-Out-\d+', regex=True))
+                                        self.UIHost.LblIndex.GetFamilyList('MatrixLabel-In'),
+                                        self.UIHost.LblIndex.GetFamilyList('MatrixLabel-Out'))
         self.__SystemAudioFollowDestination = self.PrimaryDestination
         # Log("Destinations: {}".format(self.Destinations))
         self.__SystemAudioOutputDestination = self.GetDestinationByOutput(self.__Matrix.Hardware.SystemAudioOuput)
@@ -185,11 +193,9 @@ class SourceController:
         audDest.AssignMatrixByInput(audInput, 'Aud')
         
         # Assign Audio per Source as SystemAudioDestination
-        self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                             value=None,
-                                             qualifier={'Input': audInput, 
-                                                        'Output': audDest.Output,
-                                                        'Tie Type': 'Audio'})
+        self.__SendTies([{'Input': audInput, 
+                          'Output': audDest.Output,
+                          'Tie Type': 'Audio'}])
         
         # Update destination buttons
         if self.GUIHost.ActCtl.CurrentActivity == 'adv_share':
@@ -235,7 +241,7 @@ class SourceController:
     # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
     def __SourceBtnHandler(self, button: 'Button', action: str):
-        self.UIHost.Lbls['SourceAlertLabel'].SetText('')
+        self.SetAlertLabel('')
         
         # capture last character of button.Name and convert to index
         btnIndex = int(button.Name[-1:]) - 1
@@ -367,6 +373,38 @@ class SourceController:
                 
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
+    def __IndexSources(self) -> Dict:
+        # first match wins, as with the list scans these replace
+        index = {'id': {}, 'name': {}, 'input': {}, 'count': len(self.Sources)}
+        for src in self.Sources:
+            index['id'].setdefault(src.Id, src)
+            index['name'].setdefault(src.Name, src)
+            index['input'].setdefault(src.Input, src)
+        self.__SourceIndex = index
+        return index
+    
+    def __IndexDestinations(self) -> Dict:
+        index = {'id': {}, 'name': {}, 'output': {}, 'position': {}, 'count': len(self.Destinations)}
+        for i, dest in enumerate(self.Destinations):
+            index['id'].setdefault(dest.Id, dest)
+            index['name'].setdefault(dest.Name, dest)
+            index['output'].setdefault(dest.Output, dest)
+            index['position'].setdefault(dest.Id, i)
+        self.__DestinationIndex = index
+        return index
+    
+    def __Sources(self) -> Dict:
+        index = self.__SourceIndex
+        if index is None or index['count'] != len(self.Sources):
+            index = self.__IndexSources()
+        return index
+    
+    def __Destinations(self) -> Dict:
+        index = self.__DestinationIndex
+        if index is None or index['count'] != len(self.Destinations):
+            index = self.__IndexDestinations()
+        return index
+    
     def __GetUIForAdvDest(self, dest: Destination) -> Dict[str, Button]:
         
         destDict = {}
@@ -391,6 +429,13 @@ class SourceController:
         except:
             raise KeyError("At least one destination button not found.")
     
+    def __SendTies(self, ties: List[Dict]) -> None:
+        # the room's route controller drops ties already made by this or
+        # another panel. A switch of a single output is always sent, so
+        # pressing a source again retries a tie which did not take effect.
+        force = len(set(tie['Output'] for tie in ties)) == 1
+        self.GUIHost.RouteCtl.Apply(ties, force=force)
+    
     def __GetSystemAudioInput(self) -> int:
         if self.SystemAudioFollowDestination is None:
             return 0
@@ -411,9 +456,15 @@ class SourceController:
         # Does currently selected source have an alert flag
         if self.SelectedSource is not None and self.SelectedSource.AlertFlag:
             txt = self.SelectedSource.AlertText
-            self.UIHost.Lbls['SourceAlertLabel'].SetText(txt)
         else:
-            self.UIHost.Lbls['SourceAlertLabel'].SetText('')
+            txt = ''
+        self.SetAlertLabel(txt)
+    
+    def SetAlertLabel(self, txt: str) -> None:
+        # only send the label when the visible alert changes
+        if txt != self.__AlertLabelText:
+            self.__AlertLabelText = txt
+            self.UIHost.Lbls['SourceAlertLabel'].SetText(txt)
     
     def TogglePrivacy(self) -> None:
         self.Privacy = not self.Privacy
@@ -440,20 +491,17 @@ class SourceController:
     def GetDestination(self, id: str=None, name: str=None) -> Destination:
         if id == None and name == None:
             raise ValueError("Either Id or Name must be provided")
-        if id != None:
-            for dest in self.Destinations:
-                if dest.Id == id:
-                    return dest
-        if name != None:
-            for dest in self.Destinations:
-                if dest.Name == name:
-                    return dest
+        index = self.__Destinations()
+        if id != None and id in index['id']:
+            return index['id'][id]
+        if name != None and name in index['name']:
+            return index['name'][name]
         raise LookupError('Provided Name ({}) or Id ({}) not found'.format(name, id))
     
     def GetDestinationByOutput(self, outputNum: int) -> Destination:
-        for dest in self.Destinations:
-            if dest.Output == outputNum:
-                return dest
+        dest = self.__Destinations()['output'].get(outputNum)
+        if dest is not None:
+            return dest
         raise LookupError("Provided Output ({}) is not configured to a destination".format(outputNum))
     
     def GetDestinationIndexByID(self, id: str) -> int:
@@ -468,31 +516,28 @@ class SourceController:
         Returns:
             int: Returns destination dict index
         """    
-        for dest in self.Destinations:
-            if id == dest.Id:
-                return self.Destinations.index(dest)
+        position = self.__Destinations()['position'].get(id)
+        if position is not None:
+            return position
         ## if we get here then there was no valid index for the id
         raise LookupError("Provided ID ({}) not found".format(id))
                 
     def GetSource(self, id: str=None, name: str=None) -> Source:
         if id == None and name == None:
             raise ValueError("Either Id or Name must be provided")
-        if id != None:
-            for src in self.Sources:
-                if src.Id == id:
-                    return src
-        if name != None:
-            for src in self.Sources:
-                if src.Name == name:
-                    return src
+        index = self.__Sources()
+        if id != None and id in index['id']:
+            return index['id'][id]
+        if name != None and name in index['name']:
+            return index['name'][name]
         raise LookupError('Provided Name ({}) or Id ({}) not found'.format(name, id))
                 
     def GetSourceByInput(self, inputNum: int) -> Source:
         if inputNum == 0:
             return self.BlankSource
-        for src in self.Sources:
-            if src.Input == inputNum:
-                return src
+        src = self.__Sources()['input'].get(inputNum)
+        if src is not None:
+            return src
         raise LookupError("Provided Input ({}) is not configured to a source".format(inputNum))
     
     def GetSourceIndexByID(self, id: str) -> int:
@@ -507,11 +552,9 @@ class SourceController:
         Returns:
             int: Returns source list index
         """    
-        i = 0
-        for src in self.__DisplaySrcList:
-            if id == src.Id:
-                return i
-            i += 1
+        i = self.__DisplaySrcIndex.get(id)
+        if i is not None:
+            return i
         ## if we get here then there was no valid index for the id
         raise LookupError("Provided Id ({}) not found".format(id))
     
@@ -546,6 +589,9 @@ class SourceController:
         srcList.extend(self.Sources)
         
         self.__DisplaySrcList = srcList
+        self.__DisplaySrcIndex = {}
+        for i, src in enumerate(srcList):
+            self.__DisplaySrcIndex.setdefault(src.Id, i)
         
         self.__UpdateOffset()
         
@@ -652,6 +698,7 @@ class SourceController:
         else:
             raise TypeError("Destination must either be 'All' or a list of Destination objects, names, IDs, or switcher output integers")
         
+        ties = []
         for d in destList:
             if type(d) == Destination:
                 dObj = d
@@ -661,40 +708,26 @@ class SourceController:
             if dObj is self.__SystemAudioOutputDestination:
                 dObj.AssignMatrixBySource(srcObj, 'Vid')
                 # Assign Video normally
-                self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                                     value=None,
-                                                     qualifier={'Input': srcObj.Input, 
-                                                                'Output': dObj.Output,
-                                                                'Tie Type': 'Video'})
+                ties.append({'Input': srcObj.Input, 'Output': dObj.Output, 'Tie Type': 'Video'})
                 # Don't assign audio
             elif dObj is self.__SystemAudioFollowDestination:
                 dObj.AssignSource(srcObj)
-                self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                                     value=None,
-                                                     qualifier={'Input': srcObj.Input, 
-                                                                'Output': dObj.Output,
-                                                                'Tie Type': 'Audio/Video'})
+                ties.append({'Input': srcObj.Input, 'Output': dObj.Output, 'Tie Type': 'Audio/Video'})
                 
                 audInput = self.__GetSystemAudioInput() # not sure this is needed. Fairly sure srcObj.Input is always going to be the same when this method runs.
                 self.__SystemAudioOutputDestination.AssignMatrixByInput(audInput, 'Aud')
                 # Assign Source Audio from SystemAudioFollowDestination to SystemAudioOutputDestination
-                self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                                     value=None,
-                                                     qualifier={'Input': audInput, 
-                                                                'Output': self.__SystemAudioOutputDestination.Output,
-                                                                'Tie Type': 'Audio'})
+                ties.append({'Input': audInput, 'Output': self.__SystemAudioOutputDestination.Output, 'Tie Type': 'Audio'})
                 
             else: # no special case, assign as normal
                 dObj.AssignSource(srcObj)
-                self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                                     value=None,
-                                                     qualifier={'Input': srcObj.Input, 
-                                                                'Output': dObj.Output,
-                                                                'Tie Type': 'Audio/Video'})
+                ties.append({'Input': srcObj.Input, 'Output': dObj.Output, 'Tie Type': 'Audio/Video'})
             
             if self.GUIHost.ActCtl.CurrentActivity in ['adv_share']:
                 dObj.AdvSourceAlertHandler()
         
+        self.__SendTies(ties)
+        
         if self.GUIHost.ActCtl.CurrentActivity in ['share', 'group_work']:
             self.SourceAlertHandler()
 
@@ -739,6 +772,7 @@ class SourceController:
         else:
             raise TypeError("Destination must either be 'All' or a list of Destination objects, names, IDs, or switcher output integers")
 
+        ties = []
         for d in destList:
             if type(d) == Destination:
                 destObj = d
@@ -751,15 +785,13 @@ class SourceController:
                 raise LookupError('No destination object found for output {}'.format(d))
             
             destObj.AssignMatrixBySource(srcObj, mode)
-            self.__Matrix.Hardware.interface.Set('MatrixTieCommand', 
-                                                 value=None, 
-                                                 qualifier={'Input': cmdInput, 
-                                                            'Output': destObj.Output,
-                                                            'Tie Type': cmdTieType})
+            ties.append({'Input': cmdInput, 'Output': destObj.Output, 'Tie Type': cmdTieType})
             
             if self.GUIHost.ActCtl.CurrentActivity in ['adv_share']:
                 destObj.AdvSourceAlertHandler()
         
+        self.__SendTies(ties)
+        
         if self.GUIHost.ActCtl.CurrentActivity in ['share', 'group_work']:
             self.SourceAlertHandler()
 
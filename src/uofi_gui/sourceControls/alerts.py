@@ -0,0 +1,263 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, List, Set
+if TYPE_CHECKING: # pragma: no cover
+    from uofi_gui import GUIController
+    from uofi_gui.sourceControls.sources import Source
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+import heapq
+import threading
+import time
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log, ScheduledTimer
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class AlertManager:
+    def __init__(self, GUIHost: 'GUIController') -> None:
+        """Room level source alert storage shared by every touch panel's
+        Source objects.
+
+        Alerts are stored per source Id in the order they were raised, which
+        is the order panels cycle through them. Alerts with a timeout are kept
+        in a heap of absolute expiry times and a single timer wakes when the
+        earliest alert expires, so no work is done while alerts are waiting.
+        Panels are refreshed only when a source's alerts change.
+
+        Args:
+            GUIHost (GUIController): the room's GUIController
+        """
+        self.GUIHost = GUIHost
+
+        self.__Alerts = {}      # source id: [msg, ...] in cycle order
+        self.__Expiry = {}      # (source id, msg): seq of live heap entry
+        self.__Heap = []        # (expiry time, seq, source id, msg)
+        self.__Seq = 0
+        self.__InputIndex = None # input: [Source, ...] across all panels
+        self.__Lock = threading.RLock()
+
+        self.__ExpiryTimer = ScheduledTimer(1, self.__ExpiryHandler)
+        self.__ExpiryTimer.Stop()
+
+    # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __ExpiryHandler(self, timer: 'ScheduledTimer', count: int) -> None:
+        self.Expire()
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __NextExpiry(self) -> float:
+        # called with self.__Lock held
+        while len(self.__Heap) > 0:
+            expiry, seq, srcId, msg = self.__Heap[0]
+            if self.__Expiry.get((srcId, msg)) == seq:
+                return expiry
+            # stale entry left behind by a clear or a new timeout
+            heapq.heappop(self.__Heap)
+        return None
+
+    def __Reschedule(self) -> None:
+        # called with self.__Lock held
+        expiry = self.__NextExpiry()
+        if expiry is None:
+            self.__ExpiryTimer.Stop()
+        else:
+            self.__ExpiryTimer.Change(max(expiry - time.monotonic(), 0.01))
+            self.__ExpiryTimer.Restart()
+
+    def __Remove(self, srcId: str, msg: str) -> bool:
+        # called with self.__Lock held
+        alerts = self.__Alerts.get(srcId)
+        if alerts is None or msg not in alerts:
+            return False
+        alerts.remove(msg)
+        if len(alerts) == 0:
+            del self.__Alerts[srcId]
+        self.__Expiry.pop((srcId, msg), None)
+        return True
+
+    def __Refresh(self, srcIds: Set[str]) -> None:
+        # update only the panels showing an alert for a changed source
+        if len(srcIds) == 0 or not hasattr(self.GUIHost, 'TPs') or not hasattr(self.GUIHost, 'ActCtl'):
+            return
+        activity = self.GUIHost.ActCtl.CurrentActivity
+        for tp in self.GUIHost.TPs:
+            srcCtl = getattr(tp, 'SrcCtl', None)
+            if srcCtl is None:
+                continue
+            if activity in ['share', 'group_work']:
+                if srcCtl.SelectedSource is not None and srcCtl.SelectedSource.Id in srcIds:
+                    srcCtl.SourceAlertHandler()
+            elif activity == 'adv_share':
+                for dest in srcCtl.Destinations:
+                    if dest.Type != 'aud' and dest.AssignedSource is not None and dest.AssignedSource.Vid.Id in srcIds:
+                        dest.AdvSourceAlertHandler()
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Append(self, srcId: str, msg: str, timeout: int=0) -> bool:
+        """Raises an alert for a source. Raising an alert which is already
+        active replaces its timeout.
+
+        Args:
+            srcId (str): source Id
+            msg (str): alert text
+            timeout (int, optional): seconds until the alert is cleared, 0 or
+                less for an alert which must be cleared. Defaults to 0.
+
+        Returns:
+            bool: True if the alert was not already active
+        """
+        with self.__Lock:
+            alerts = self.__Alerts.setdefault(srcId, [])
+            new = msg not in alerts
+            if new:
+                alerts.append(msg)
+            if timeout > 0:
+                self.__Seq += 1
+                self.__Expiry[(srcId, msg)] = self.__Seq
+                heapq.heappush(self.__Heap, (time.monotonic() + timeout, self.__Seq, srcId, msg))
+            else:
+                self.__Expiry.pop((srcId, msg), None)
+            self.__Reschedule()
+        if new:
+            self.__Refresh({srcId})
+        return new
+
+    def Clear(self, srcId: str, msg: str) -> bool:
+        """Clears an alert
+
+        Returns:
+            bool: True if the alert was active
+        """
+        with self.__Lock:
+            removed = self.__Remove(srcId, msg)
+        if removed:
+            self.__Refresh({srcId})
+        return removed
+
+    def Reset(self, srcId: str) -> None:
+        """Clears all alerts for a source"""
+        with self.__Lock:
+            alerts = self.__Alerts.pop(srcId, [])
+            for msg in alerts:
+                self.__Expiry.pop((srcId, msg), None)
+        if len(alerts) > 0:
+            self.__Refresh({srcId})
+
+    def Expire(self, now: float=None) -> Set[str]:
+        """Clears alerts whose timeout has passed
+
+        Args:
+            now (float, optional): time.monotonic time to expire alerts at.
+                Defaults to the current time.
+
+        Returns:
+            Set[str]: Ids of sources whose alerts changed
+        """
+        if now is None:
+            now = time.monotonic()
+        changed = set()
+        with self.__Lock:
+            while len(self.__Heap) > 0 and self.__Heap[0][0] <= now:
+                expiry, seq, srcId, msg = heapq.heappop(self.__Heap)
+                if self.__Expiry.get((srcId, msg)) != seq:
+                    continue
+                self.__Remove(srcId, msg)
+                changed.add(srcId)
+            self.__Reschedule()
+        if len(changed) > 0:
+            Log('Source alerts expired for {}', 'debug', fmtArgs=(sorted(changed),))
+            self.__Refresh(changed)
+        return changed
+
+    def Messages(self, srcId: str) -> List[str]:
+        """Returns a source's active alerts in cycle order"""
+        with self.__Lock:
+            return list(self.__Alerts.get(srcId, []))
+
+    def Count(self, srcId: str) -> int:
+        alerts = self.__Alerts.get(srcId)
+        return 0 if alerts is None else len(alerts)
+
+    def MessageAt(self, srcId: str, index: int) -> str:
+        """Returns the alert at a position in a source's cycle order, the
+        index wraps around the number of active alerts. Returns an empty
+        string if the source has no alerts."""
+        with self.__Lock:
+            alerts = self.__Alerts.get(srcId)
+            if not alerts:
+                return ''
+            return alerts[index % len(alerts)]
+
+    def IndexSources(self) -> None:
+        """Rebuilds the input to Source index from every panel's sources"""
+        index = {}
+        for tp in getattr(self.GUIHost, 'TPs', []):
+            srcCtl = getattr(tp, 'SrcCtl', None)
+            if srcCtl is None:
+                continue
+            for src in srcCtl.Sources:
+                index.setdefault(src.Input, []).append(src)
+        self.__InputIndex = index
+
+    def SourcesByInput(self, input: int) -> List['Source']:
+        """Returns the Source objects for a switcher input from every panel
+
+        Raises:
+            LookupError: raised if the input is not configured to a source
+        """
+        if self.__InputIndex is None:
+            self.IndexSources()
+        sources = self.__InputIndex.get(input)
+        if sources is None:
+            raise LookupError("Provided Input ({}) is not configured to a source".format(input))
+        return sources
+
+    def InputSignal(self, input: int, active: bool) -> None:
+        """Raises or clears the default alert for the source on a switcher
+        input from signal status feedback. Alerts are stored per source Id,
+        so each signal change is handled once for the room.
+
+        Args:
+            input (int): switcher input number
+            active (bool): True if the input has a signal
+        """
+        src = self.SourcesByInput(input)[0]
+        if active:
+            src.ClearAlert()
+        else:
+            src.AppendAlert()
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
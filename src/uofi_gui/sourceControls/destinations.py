@@ -55,6 +55,7 @@ class Destination:
         self.__AdvCtlBtn = None
         self.__AdvAudBtn = None
         self.__AdvAlertBtn = None
+        self.__AdvAlertShown = False
         self.__AdvScnBtn = None
         self.__AdvLabel = None
         self.__MatrixRow = None
@@ -147,7 +148,7 @@ class Destination:
                 self.SourceController.UIHost.Click(1)
     
     def __AlertHandler(self, button: 'Button', action: str):
-        self.SourceController.UIHost.Lbls['SourceAlertLabel'].SetText(self.AssignedSource.Vid.AlertBlock)
+        self.SourceController.SetAlertLabel(self.AssignedSource.Vid.AlertBlock)
         self.SourceController.UIHost.ShowPopup('Modal-SrcErr')
     
     def __ScreenHandler(self, button: 'Button', action: str):
@@ -283,6 +284,7 @@ class Destination:
             # Destination Alert Buttons
             self.__AdvAlertBtn.SetVisible(False)
             self.__AdvAlertBtn.SetEnable(False)
+            self.__AdvAlertShown = False
             
             @event(self.__AdvAlertBtn, 'Pressed') # pragma: no cover
             def advAlertHandler(button: 'Button', action: str):
@@ -315,7 +317,12 @@ class Destination:
             
     def AdvSourceAlertHandler(self) -> None:
         if self.Type != 'aud':
-            if self.AssignedSource is not None and self.AssignedSource.Vid.AlertFlag:
+            alert = self.AssignedSource is not None and self.AssignedSource.Vid.AlertFlag
+            # only update the button when the alert flag changes
+            if alert == self.__AdvAlertShown:
+                return
+            self.__AdvAlertShown = alert
+            if alert:
                 self.__AdvAlertBtn.SetVisible(True)
                 self.__AdvAlertBtn.SetEnable(True)
                 self.__AdvAlertBtn.SetBlinking('Medium', [0,1])
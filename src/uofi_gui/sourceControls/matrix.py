@@ -26,9 +26,8 @@ from extronlib import event
 from extronlib.system import Wait
 from extronlib.ui import Button
 
-import re
 
-from utilityFunctions import Log
+from utilityFunctions import Log, ControlNameIndex
 
 class MatrixController:
     def __init__(self,
@@ -48,7 +47,7 @@ class MatrixController:
         # Log('Create Matrix Rows')
         matrixRows = {}
         for btn in matrixBtns:
-            row = int(btn.Name[-1])
+            row = ControlNameIndex.ParseName(btn.Name)[1][1]
             if row not in matrixRows:
                 matrixRows[row] = [btn]
             else:
@@ -77,19 +76,19 @@ class MatrixController:
         
         for inLbl in self.__InputLbls:
             inLbl.SetText('Not Connected')
+        inLblIndex = {ControlNameIndex.ParseName(inLbl.Name)[1]: inLbl for inLbl in self.__InputLbls}
         for src in self.SourceController.Sources:
             src = cast('Source', src)
-            for inLbl in self.__InputLbls:
-                if inLbl.Name.endswith(str(src.Input)):
-                    inLbl.SetText(src.Name)
+            if src.Input in inLblIndex:
+                inLblIndex[src.Input].SetText(src.Name)
             
         for outLbl in self.__OutputLbls:
             outLbl.SetText('Not Connected')
+        outLblIndex = {ControlNameIndex.ParseName(outLbl.Name)[1]: outLbl for outLbl in self.__OutputLbls}
         for dest in self.SourceController.Destinations:
             dest = cast('Destination', dest)
-            for outLbl in self.__OutputLbls:
-                if outLbl.Name.endswith(str(dest.Output)):
-                    outLbl.SetText(dest.Name)
+            if dest.Output in outLblIndex:
+                outLblIndex[dest.Output].SetText(dest.Name)
         
         @event(self.__CtlsSet.Objects, 'Pressed') # pragma: no cover
         def MatrixModeHandler(button: 'Button', action: str):
@@ -136,10 +135,8 @@ class MatrixRow:
         
         # Overload matrix row buttons with Input property
         for btn in self.Objects:
-            regex = r"Tech-Matrix-(\d+),(\d+)"
-            re_match = re.match(regex, btn.Name)
-            # 0 is full match, 1 is input, 2 is output
-            btn.Input = int(re_match.group(1))
+            # name key is (input, output)
+            btn.Input = ControlNameIndex.ParseName(btn.Name)[1][0]
         
         @event(self.Objects, 'Pressed') # pragma: no cover
         def matrixSelectHandler(button: 'Button', action: str):
@@ -0,0 +1,185 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import TYPE_CHECKING, Dict, Iterable, List
+if TYPE_CHECKING: # pragma: no cover
+    from uofi_gui import GUIController
+
+## Begin ControlScript Import --------------------------------------------------
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+import threading
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+from utilityFunctions import Log
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+class RouteController:
+    TieTypes = \
+        {
+            'Video': ('Video',),
+            'Audio': ('Audio',),
+            'Audio/Video': ('Video', 'Audio')
+        }
+
+    def __init__(self, GUIHost: 'GUIController', hardware=None) -> None:
+        """Room level route state for the primary switcher. All touch panels
+        switch through this controller, requested ties are compared against
+        the current tie state and only ties which change a route are sent to
+        the switcher.
+
+        Args:
+            GUIHost (GUIController): the room's GUIController
+            hardware (SystemHardwareController, optional): switcher hardware.
+                Defaults to the GUIHost's primary switcher.
+        """
+        self.GUIHost = GUIHost
+        if hardware is None:
+            hardware = self.GUIHost.Hardware[self.GUIHost.PrimarySwitcherId]
+        self.Hardware = hardware
+
+        self.TiesRequested = 0
+        self.TiesSent = 0
+
+        # (output, 'Video' or 'Audio'): input
+        self.__Routes = {}
+        self.__Lock = threading.RLock()
+
+    @property
+    def Routes(self) -> Dict:
+        with self.__Lock:
+            return dict(self.__Routes)
+
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def __Diff(self, ties: Iterable[Dict], force: bool=False) -> List[Dict]:
+        # requested routes, later ties in the request replace earlier ones
+        requested = {}
+        outputs = []
+        for tie in ties:
+            self.TiesRequested += 1
+            output = tie['Output']
+            if output not in requested:
+                requested[output] = {}
+                outputs.append(output)
+            for tieType in self.TieTypes[tie['Tie Type']]:
+                requested[output][tieType] = tie['Input']
+
+        changes = []
+        for output in outputs:
+            changed = {tieType: input for tieType, input in requested[output].items()
+                       if force or self.__Routes.get((output, tieType)) != input}
+            if len(changed) == 0:
+                continue
+            if len(changed) == 2 and changed['Video'] == changed['Audio']:
+                changes.append({'Input': changed['Video'], 'Output': output, 'Tie Type': 'Audio/Video'})
+            else:
+                for tieType in ('Video', 'Audio'):
+                    if tieType in changed:
+                        changes.append({'Input': changed[tieType], 'Output': output, 'Tie Type': tieType})
+        return changes
+
+    def __Send(self, ties: List[Dict]) -> None:
+        interface = self.Hardware.interface
+        if 'MatrixTieBatchCommand' in getattr(interface, 'Commands', {}):
+            interface.Set('MatrixTieBatchCommand', value=ties, qualifier=None)
+        else:
+            for tie in ties:
+                interface.Set('MatrixTieCommand', value=None, qualifier=tie)
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def Apply(self, ties: Iterable[Dict], force: bool=False) -> List[Dict]:
+        """Routes a set of ties. Ties which match the current route state are
+        dropped unless forced.
+
+        Args:
+            ties (Iterable[Dict]): MatrixTieCommand qualifiers ('Input',
+                'Output', 'Tie Type')
+            force (bool, optional): send every requested tie, eg. for a
+                switch the user has explicitly requested. Defaults to False.
+
+        Returns:
+            List[Dict]: the ties sent to the switcher
+        """
+        with self.__Lock:
+            changes = self.__Diff(ties, force)
+            if len(changes) == 0:
+                return changes
+
+            for tie in changes:
+                for tieType in self.TieTypes[tie['Tie Type']]:
+                    self.__Routes[(tie['Output'], tieType)] = tie['Input']
+            self.TiesSent += len(changes)
+
+            # sent while locked so that ties from different panels reach the
+            # switcher in the order their routes were recorded
+            self.__Send(changes)
+            Log('Routed {} of {} requested ties', 'debug', fmtArgs=(len(changes), self.TiesRequested))
+            return changes
+
+    def GetRoute(self, output: int, tieType: str='Video') -> int:
+        """Returns the input currently routed to an output, or None if unknown"""
+        if tieType not in ['Video', 'Audio']:
+            raise ValueError("tieType must be 'Video' or 'Audio'")
+        with self.__Lock:
+            return self.__Routes.get((output, tieType))
+
+    def TieFeedback(self, output: int, tieType: str, input: int) -> None:
+        """Updates the route state from switcher tie feedback. Called for
+        every tie refresh, so routes recorded for ties which did not take
+        effect are corrected.
+
+        Args:
+            output (int): switcher output
+            tieType (str): 'Video', 'Audio', or 'Audio/Video'
+            input (int): the input tied to the output
+        """
+        with self.__Lock:
+            for t in self.TieTypes[tieType]:
+                self.__Routes[(output, t)] = input
+
+    def Invalidate(self, outputs: Iterable[int]=None) -> None:
+        """Clears the route state so the next tie to each output is always
+        sent, eg. after the switcher or an output device has reconnected.
+
+        Args:
+            outputs (Iterable[int], optional): outputs to clear. Defaults to
+                all outputs.
+        """
+        with self.__Lock:
+            if outputs is None:
+                self.__Routes.clear()
+            else:
+                for output in outputs:
+                    self.__Routes.pop((output, 'Video'), None)
+                    self.__Routes.pop((output, 'Audio'), None)
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+## End Function Definitions ----------------------------------------------------
@@ -19,8 +19,9 @@ if TYPE_CHECKING: # pragma: no cover
     from uofi_gui import GUIController
     from uofi_gui.uiObjects import ExUIDevice
     from uofi_gui.sourceControls import SourceController
+    from uofi_gui.sourceControls.alerts import AlertManager
 
-from extronlib.system import Timer, Wait
+from extronlib.system import Wait
 from utilityFunctions import Log, RunAsync, debug
 
 class Source:
@@ -42,30 +43,28 @@ class Source:
         self.SourceControlPage = srcCtl
         self.AdvSourceControlPage = advSrcCtl
         
-        self.__AlertText = {}
         self.__AlertIndex = 0
         self.__OverrideAlert = None
         self.__OverrideState = False
         self.__DefaultAlert = alert
-        
-        self.__AlertTimer = Timer(1, self.__AlertTimerHandler)
-        self.__AlertTimer.Stop()
+    
+    @property
+    def AlertManager(self) -> 'AlertManager':
+        return self.SourceController.GUIHost.AlertCtl
 
     @property
     def AlertText(self):
         if not self.__OverrideState:
-            if len(self.__AlertText) > 0:
-                txt =  list(self.__AlertText.keys())[self.__AlertIndex]
+            txt = self.AlertManager.MessageAt(self.Id, self.__AlertIndex)
+            if txt != '':
                 self.CycleAlert()
-            else:
-                txt = ''
         else:
             txt = self.__OverrideAlert
         return txt
     
     @property
     def AlertBlock(self):
-        block = '\n'.join(self.__AlertText)
+        block = '\n'.join(self.AlertManager.Messages(self.Id))
         block = block.strip()
         if self.__OverrideState:
             block = '{}\n{}'.format(self.__OverrideAlert, block)
@@ -73,14 +72,14 @@ class Source:
     
     @property
     def Alerts(self):
-        count = len(self.__AlertText)
+        count = self.AlertManager.Count(self.Id)
         if self.__OverrideState:
             count += 1
         return count
     
     @property
     def AlertFlag(self):
-        if len(self.__AlertText) > 0:
+        if self.AlertManager.Count(self.Id) > 0:
             return True
         elif self.__OverrideState:
             return True
@@ -91,34 +90,18 @@ class Source:
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    def __AlertTimerHandler(self, timer: 'Timer', count: int):
-        iterList = list(self.__AlertText.keys())
-        for msg in iterList:
-            if self.__AlertText[msg] > 0:
-                self.__AlertText[msg] -= 1
-            elif self.__AlertText[msg] == 0:
-                self.__AlertText.pop(msg)
-        if len(self.__AlertText) == 0:
-            timer.Stop()
-    
     # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
     def CycleAlert(self):
         self.__AlertIndex += 1
-        if self.__AlertIndex >= len(self.__AlertText):
+        if self.__AlertIndex >= self.AlertManager.Count(self.Id):
             self.__AlertIndex = 0
     
     def AppendAlert(self, msg: str=None, timeout: int=0) -> None:
         if msg is None:
             msg = self.__DefaultAlert
-            
-        if timeout > 0:
-            self.__AlertText[msg] = timeout
-        else: 
-            self.__AlertText[msg] = -1
         
-        if self.__AlertTimer.State in ['Paused', 'Stopped']:
-            self.__AlertTimer.Restart()
+        self.AlertManager.Append(self.Id, msg, timeout)
         
     def OverrideAlert(self, msg: str, timeout: int=60) -> None:
         self.__OverrideAlert = msg
@@ -135,13 +118,8 @@ class Source:
     def ClearAlert(self, msg: str=None):
         if msg is None:
             msg = self.__DefaultAlert
-            
-        self.__AlertText.pop(msg)
         
-        if len(self.__AlertText) == 0:
-            self.__AlertTimer.Stop()
+        self.AlertManager.Clear(self.Id, msg)
     
     def ResetAlert(self) -> None:
-        self.__AlertText = {}
-        self.__AlertTimer.Stop()
-        
\ No newline at end of file
+        self.AlertManager.Reset(self.Id)
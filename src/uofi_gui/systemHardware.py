@@ -14,7 +14,7 @@
 # limitations under the License.
 ################################################################################
 
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 if TYPE_CHECKING: # pragma: no cover
     from uofi_gui import GUIController
     from uofi_gui.uiObjects import ExUIDevice
@@ -23,8 +23,6 @@ if TYPE_CHECKING: # pragma: no cover
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
 
-from extronlib.system import Timer
-
 ## End ControlScript Import ----------------------------------------------------
 ##
 ## Begin Python Imports --------------------------------------------------------
@@ -32,6 +30,12 @@ from datetime import datetime
 import importlib
 import math
 import functools
+import heapq
+import itertools
+import time
+import threading
+import queue
+from collections import OrderedDict
 
 ## End Python Imports ----------------------------------------------------------
 ##
@@ -39,7 +43,7 @@ import functools
 #### Custom Code Modules
 
 from ConnectionHandler import GetConnectionHandler
-from utilityFunctions import Log, DictValueSearchByKey, SortKeys
+from utilityFunctions import Log, SortKeys, GetLogSink, ScheduledTimer
 
 #### Extron Global Scripter Modules
 
@@ -62,7 +66,7 @@ class VirtualDeviceInterface:
                         value[getattr(Hw, key)] = Hw
 
 class SystemHardwareController:
-    def __init__(self, GUIHost: 'GUIController', Id: str, Name: str, Manufacturer: str, Model: str, Interface: Dict, Subscriptions: Dict, Polling: Dict, Options: Dict=None) -> None:
+    def __init__(self, GUIHost: 'GUIController', Id: str, Name: str, Manufacturer: str, Model: str, Interface: Dict, Subscriptions: Dict, Polling: Dict, Options: Dict=None, DeferConnect: bool=False) -> None:
         self.GUIHost = GUIHost
         self.Id = Id
         self.Name = Name
@@ -70,6 +74,12 @@ class SystemHardwareController:
         self.Model = Model
         self.ConnectionStatus = 'Not Connected'
         self.LastStatusChange = None
+        self.ConnectTime = None
+        self.ConnectResult = None
+        self.__ConnectionProbe = True
+        self.__ConnectPending = False
+        self.__Subscriptions = {}   # (command, instance tag): fallback poll settings
+        self.__FallbackPolls = set() # (command, instance tag) currently polled
         
         if Options is not None:
             for key in Options:
@@ -98,7 +108,9 @@ class SystemHardwareController:
             self.interface = GetConnectionHandler(self.__Constructor(**Interface['interface_configuration']),
                                                   **Interface['ConnectionHandler'])
             
-            connInfo = self.interface.Connect()
+            # the connection handler sends its own keep alive while disconnected
+            self.__ConnectionProbe = False
+            self.__ConnectPending = True
         else:
             # Log(Interface)
             self.interface = self.__Constructor(**Interface['interface_configuration'])
@@ -147,29 +159,117 @@ class SystemHardwareController:
                 inactInt = None
             
             for qp in qualPoll:
-                self.GUIHost.PollCtl.AddPolling(self.interface,
-                                                poll['command'],
-                                                qualifier=qp,
-                                                active_duration=actInt,
-                                                inactive_duration=inactInt)
+                if self.__CanSubscribe(poll['command'], qp):
+                    # a single device subscription reports every channel of the
+                    # instance tag, the tag is only polled while it is not subscribed
+                    key = (poll['command'], qp['Instance Tag'])
+                    if key not in self.__Subscriptions:
+                        self.__Subscriptions[key] = {
+                            'qualifier': qp,
+                            'active_duration': actInt,
+                            'inactive_duration': inactInt
+                        }
+                else:
+                    self.GUIHost.PollCtl.AddPolling(self.interface,
+                                                    poll['command'],
+                                                    qualifier=qp,
+                                                    active_duration=actInt,
+                                                    inactive_duration=inactInt)
                 
                 # To prevent the need to duplicate polling and subscriptions in settings
                 # if a callback is included in the poll, a subscription will automatically
                 # be created on the interface
                 if 'callback' in poll:
                     self.AddSubscription(poll, qp)
+        
+        if len(self.__Subscriptions) > 0:
+            self.interface.SubscribeStatus('SubscriptionStatus', None, self.__SubscriptionStatus)
+            # the fallback poll of an unconfirmed tag is what requests its
+            # subscription, it is dropped once the device publishes the tag
+            for key in self.__Subscriptions:
+                self.__AddFallbackPolling(key)
+        
+        # subscriptions are in place before connecting so that no status
+        # received on connection is missed
+        if not DeferConnect:
+            self.Connect()
                     
     # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
     def __ConnectionStatus(self, command, value, qualifier):
-        Log('{} {} Callback; Value: {}; Qualifier {}'.format(self.Name, command, value, qualifier))
+        Log('{} {} Callback; Value: {}; Qualifier {}', 'debug', fmtArgs=(self.Name, command, value, qualifier))
         if value != self.ConnectionStatus:
+            Log('{} Connection Status: {}', fmtArgs=(self.Name, value))
             self.ConnectionStatus = value
             self.LastStatusChange = datetime.now()
+            self.GUIHost.PollCtl.SetInterfaceConnection(self.interface, value, probe=self.__ConnectionProbe)
+            if value == 'Connected' and hasattr(self.GUIHost, 'RouteCtl'):
+                routeCtl = self.GUIHost.RouteCtl
+                if routeCtl.Hardware is self:
+                    # switcher ties may not have survived the disconnect
+                    routeCtl.Invalidate()
+                elif getattr(self, 'MatrixAssignment', None) == routeCtl.Hardware.Id and hasattr(self, 'MatrixOutput'):
+                    # nor may the tie of a virtual matrix output device
+                    routeCtl.Invalidate([self.MatrixOutput])
+    
+    def __SubscriptionStatus(self, command, value, qualifier):
+        Log('{} {} Callback; Value: {}; Qualifier {}', 'debug', fmtArgs=(self.Name, command, value, qualifier))
+        key = (qualifier['Command'], qualifier['Instance Tag'])
+        if key not in self.__Subscriptions:
+            return
+        if value == 'Subscribed':
+            self.__RemoveFallbackPolling(key)
+        else:
+            Log('{} subscription lost for {} ({}), polling until resubscribed', fmtArgs=(self.Name, key[0], key[1]))
+            self.__AddFallbackPolling(key)
+    
+    def __CanSubscribe(self, command: str, qualifier: Dict) -> bool:
+        return (hasattr(self.interface, 'SubscribeCommands') and
+                command in self.interface.SubscribeCommands and
+                type(qualifier) is dict and
+                'Instance Tag' in qualifier)
+    
+    def __AddFallbackPolling(self, key: Tuple[str, str]) -> None:
+        if key in self.__FallbackPolls:
+            return
+        sub = self.__Subscriptions[key]
+        self.__FallbackPolls.add(key)
+        self.GUIHost.PollCtl.AddPolling(self.interface,
+                                        key[0],
+                                        qualifier=sub['qualifier'],
+                                        active_duration=sub['active_duration'],
+                                        inactive_duration=sub['inactive_duration'])
+    
+    def __RemoveFallbackPolling(self, key: Tuple[str, str]) -> None:
+        if key not in self.__FallbackPolls:
+            return
+        self.__FallbackPolls.remove(key)
+        self.GUIHost.PollCtl.RemovePolling(self.interface, key[0], self.__Subscriptions[key]['qualifier'])
     
     # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def Connect(self) -> str:
+        """Opens the interface connection, if the interface is managed by a
+        connection handler, and records how long the attempt took.
+
+        Returns:
+            str: the connection handler's Connect result, None if there is
+                nothing to connect or the connection was already attempted
+        """
+        if not self.__ConnectPending:
+            return None
+        self.__ConnectPending = False
+        
+        start = time.monotonic()
+        try:
+            self.ConnectResult = self.interface.Connect()
+        except Exception as inst:
+            self.ConnectResult = 'Error: {}'.format(inst)
+            Log('{} connection failed. Exception ({}): {}', 'error', fmtArgs=(self.Name, type(inst), inst))
+        self.ConnectTime = time.monotonic() - start
+        return self.ConnectResult
 
     def GetQualifierList(self, subscription):
         qualList = [None]
@@ -203,86 +303,383 @@ class SystemHardwareController:
                                        qualifier,
                                        callbackFn)
     
-class SystemPollingController:
-    def __init__(self, active_duration: int=5, inactive_duration: int=300) -> None:
-        self.Polling = []
+class PollingWorker:
+    def __init__(self, interface, pollFunction: Callable, max_queue: int=16) -> None:
+        self.Interface = interface
+        self.MaxQueue = max_queue
+        
+        self.Submitted = 0
+        self.Completed = 0
+        self.Dropped = 0
+        self.LastWait = 0.0
+        self.MaxWait = 0.0
+        
+        self.__PollFunction = pollFunction
+        self.__Queue = queue.Queue(max_queue)
+        self.__Pending = set()
+        self.__Lock = threading.Lock()
+        self.__TotalWait = 0.0
+        self.__Thread = None
+    
+    @property
+    def QueueDepth(self) -> int:
+        return self.__Queue.qsize()
+    
+    @property
+    def AverageWait(self) -> float:
+        if self.Completed == 0:
+            return 0.0
+        return self.__TotalWait / self.Completed
+    
+    @property
+    def Stats(self) -> Dict:
+        return {
+            'depth': self.QueueDepth,
+            'submitted': self.Submitted,
+            'completed': self.Completed,
+            'dropped': self.Dropped,
+            'last_wait': self.LastWait,
+            'avg_wait': self.AverageWait,
+            'max_wait': self.MaxWait
+        }
+    
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    @staticmethod
+    def __PendingKey(command: str, qualifier: Dict=None) -> Tuple:
+        if qualifier is None:
+            return (command, None)
+        return (command, tuple(sorted(qualifier.items())))
+    
+    def __Run(self) -> None: # pragma: no cover
+        while True:
+            command, qualifier, queued = self.__Queue.get()
+            with self.__Lock:
+                self.__Pending.discard(self.__PendingKey(command, qualifier))
+            
+            wait = time.monotonic() - queued
+            self.__PollFunction(self.Interface, command, qualifier)
+            
+            with self.__Lock:
+                self.Completed += 1
+                self.LastWait = wait
+                self.__TotalWait += wait
+                if wait > self.MaxWait:
+                    self.MaxWait = wait
+            self.__Queue.task_done()
+    
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def Start(self) -> None:
+        if self.__Thread is None:
+            self.__Thread = threading.Thread(target=self.__Run,
+                                             name='PollingWorker-{}'.format(type(self.Interface).__name__),
+                                             daemon=True)
+            self.__Thread.start()
+    
+    def Clear(self) -> int:
+        """Discards any polls waiting in the queue.
+
+        Returns:
+            int: the number of polls discarded
+        """
+        cleared = 0
+        with self.__Lock:
+            while True:
+                try:
+                    self.__Queue.get_nowait()
+                except queue.Empty:
+                    break
+                self.__Queue.task_done()
+                cleared += 1
+            self.__Pending.clear()
+        return cleared
+    
+    def Submit(self, command: str, qualifier: Dict=None) -> bool:
+        """Queues a poll for this worker's interface.
         
+        A poll already waiting in the queue is not queued a second time, and
+        polls submitted while the queue is full are dropped.
+
+        Args:
+            command (str): the interface command to update
+            qualifier (Dict, optional): the command qualifier. Defaults to None.
+
+        Returns:
+            bool: True if the poll was queued, False if it was merged or dropped
+        """
+        key = self.__PendingKey(command, qualifier)
+        with self.__Lock:
+            if key in self.__Pending:
+                return False
+            try:
+                self.__Queue.put_nowait((command, qualifier, time.monotonic()))
+            except queue.Full:
+                self.Dropped += 1
+                return False
+            self.__Pending.add(key)
+            self.Submitted += 1
+        
+        self.Start()
+        return True
+
+class SystemPollingController:
+    def __init__(self, active_duration: int=5, inactive_duration: int=300, threaded: bool=True, max_queue: int=64, backoff_min: int=5, backoff_max: int=300, clock: Callable[[], float]=time.monotonic) -> None:
         self.__PollingState = 'stopped'
+        self.__Clock = clock
         
         self.__DefaultActiveDur = active_duration
         self.__DefaultInactiveDur = inactive_duration
         
-        self.__InactivePolling = Timer(1, self.__InactivePollingHandler)
-        self.__InactivePolling.Stop()
-        self.__ActivePolling = Timer(1, self.__ActivePollingHandler)
-        self.__ActivePolling.Stop()
+        self.__BackoffMin = backoff_min
+        self.__BackoffMax = backoff_max
+        # interface -> liveness probe dict (or None) for disconnected interfaces
+        self.__Disconnected = {}
+        
+        self.Threaded = threaded
+        self.__MaxQueue = max_queue
+        self.__Workers = {}
+        
+        # (interface, command) -> list of polling dicts, in order added
+        self.__PollIndex = OrderedDict()
+        # heap of [due, seq, poll]; an item is live only while its seq matches
+        # the seq recorded for the poll in __PollSeq
+        self.__Schedule = []
+        self.__PollSeq = {}
+        self.__SeqCounter = itertools.count()
+        self.__PhaseCounters = {}
+        
+        # connection status changes and subscription fallbacks arrive on
+        # interface threads, so every change to the schedule takes this lock
+        self.__ScheduleLock = threading.RLock()
+        
+        self.__PollingTimer = ScheduledTimer(1, self.__PollingHandler)
+        self.__PollingTimer.Stop()
     
-    # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    @property
+    def Polling(self) -> List[Dict]:
+        with self.__ScheduleLock:
+            return [poll for pollList in self.__PollIndex.values() for poll in pollList]
     
-    def __ActivePollingHandler(self, timer: 'Timer', count: int):
-        for poll in self.Polling:
-            if (count % poll['active_duration']) == 0:
-                self.__PollInterface(poll['interface'], poll['command'], poll['qualifier'])
+    @Polling.setter
+    def Polling(self, val: List[Dict]) -> None:
+        with self.__ScheduleLock:
+            self.__PollIndex = OrderedDict()
+            for poll in val:
+                self.__PollIndex.setdefault((poll['interface'], poll['command']), []).append(poll)
+            self.__RebuildSchedule()
     
-    def __InactivePollingHandler(self, timer: 'Timer', count: int):
-        for poll in self.Polling:
-            if (count % poll['inactive_duration']) == 0:
-                self.__PollInterface(poll['interface'], poll['command'], poll['qualifier'])
+    # Event Handlers +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def __PollingHandler(self, timer: 'ScheduledTimer', count: int):
+        with self.__ScheduleLock:
+            duePolls = self.__RunSchedule(self.__Clock())
+        # polled without the lock, a slow device in non-threaded mode must not
+        # hold up connection changes or other callers of the schedule
+        for interface, command, qualifier in duePolls:
+            self.__PollInterface(interface, command, qualifier)
     
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     
-    def __PollInterface(self, interface, command, qualifier=None): # pragma: no cover
+    def __RunSchedule(self, now: float) -> List[Tuple]:
+        # reschedules due polls, returning the (interface, command, qualifier)
+        # of each to be polled
+        duePolls = []
+        while len(self.__Schedule) > 0 and self.__Schedule[0][0] <= now:
+            due, seq, poll = heapq.heappop(self.__Schedule)
+            if self.__PollSeq.get(id(poll)) != seq:
+                # stale item left behind by a remove or update
+                continue
+            if 'backoff' in poll:
+                duePolls.append((poll['interface'], poll['command'], poll['qualifier']))
+                self.__BackoffProbe(poll, now)
+                continue
+            if poll['interface'] in self.__Disconnected:
+                # suspended until the interface reconnects
+                self.__UnschedulePoll(poll)
+                continue
+            duePolls.append((poll['interface'], poll['command'], poll['qualifier']))
+            
+            nextDue = due + self.__GetDuration(poll)
+            if nextDue <= now:
+                # fell behind by more than one period, don't try to catch up
+                nextDue = now + self.__GetDuration(poll)
+            self.__SchedulePoll(poll, nextDue)
+        return duePolls
+    
+    def __PollInterface(self, interface, command, qualifier=None):
+        if self.Threaded:
+            self.__GetWorker(interface).Submit(command, qualifier)
+        else:
+            self.__UpdateInterface(interface, command, qualifier)
+    
+    def __GetWorker(self, interface) -> PollingWorker:
+        worker = self.__Workers.get(interface)
+        if worker is None:
+            worker = PollingWorker(interface, self.__UpdateInterface, self.__MaxQueue)
+            self.__Workers[interface] = worker
+        return worker
+    
+    def __UpdateInterface(self, interface, command, qualifier=None): # pragma: no cover
         try:
             interface.Update(command, qualifier=qualifier)
         except Exception as inst:
-            Log('An error occured attempting to poll. {} ({})\n    Exception ({}):\n        {}'.format(command, qualifier, type(inst), inst), 'error')
+            Log('An error occured attempting to poll. {} ({})\n    Exception ({}):\n        {}',
+                'error',
+                fmtArgs=(command, qualifier, type(inst), inst),
+                key='Poll {} {}'.format(id(interface), command))
     
-    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def __GetDuration(self, poll: Dict) -> int:
+        if self.__PollingState == 'active':
+            return poll['active_duration']
+        return poll['inactive_duration']
+    
+    def __GetPhase(self, duration: int) -> float:
+        # Successive polls sharing a duration are offset by the golden ratio
+        # fraction of the period so they spread evenly rather than firing on
+        # the same tick
+        n = self.__PhaseCounters.get(duration, 0)
+        self.__PhaseCounters[duration] = n + 1
+        return ((n * 0.6180339887498949) % 1) * duration
+    
+    def __SchedulePoll(self, poll: Dict, due: float) -> None:
+        seq = next(self.__SeqCounter)
+        self.__PollSeq[id(poll)] = seq
+        heapq.heappush(self.__Schedule, [due, seq, poll])
+    
+    def __SchedulePhased(self, poll: Dict) -> None:
+        duration = self.__GetDuration(poll)
+        self.__SchedulePoll(poll, self.__Clock() + self.__GetPhase(duration))
     
-    def PollEverything(self):
+    def __UnschedulePoll(self, poll: Dict) -> None:
+        self.__PollSeq.pop(id(poll), None)
+    
+    def __RebuildSchedule(self) -> None:
+        self.__Schedule = []
+        self.__PollSeq = {}
+        self.__PhaseCounters = {}
         for poll in self.Polling:
+            if poll['interface'] not in self.__Disconnected:
+                self.__SchedulePhased(poll)
+        for probe in self.__Disconnected.values():
+            if probe is not None:
+                self.__SchedulePoll(probe, self.__Clock() + probe['backoff'])
+    
+    def __GetInterfacePolls(self, interface) -> List[Dict]:
+        return [poll for poll in self.Polling if poll['interface'] is interface]
+    
+    def __BackoffProbe(self, probe: Dict, now: float) -> None:
+        probe['backoff'] = min(probe['backoff'] * 2, self.__BackoffMax)
+        self.__SchedulePoll(probe, now + probe['backoff'])
+    
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def PollEverything(self, interface=None):
+        if interface is None:
+            pollList = self.Polling
+        else:
+            pollList = self.__GetInterfacePolls(interface)
+        for poll in pollList:
             self.__PollInterface(poll['interface'], poll['command'], poll['qualifier'])
+
+    def PollNow(self, interface, command: str, qualifier: Dict=None) -> None:
+        """Requests an immediate, out of schedule, update of an interface command.
+
+        When threaded, the update is queued on the interface's polling worker
+        and this returns without waiting for the device to reply. Results are
+        delivered through the interface's status subscriptions.
+
+        Args:
+            interface (object): the interface to update
+            command (str): the interface command to update
+            qualifier (Dict, optional): the command qualifier. Defaults to None.
+        """
+        self.__PollInterface(interface, command, qualifier)
+
+    def SetInterfaceConnection(self, interface, status: str, probe: bool=True) -> None:
+        """Suspends or resumes polling of an interface based on its connection status.
+        
+        While disconnected, the interface's polls are suspended and, if probe is
+        True, only its first polled command is sent on an exponential backoff.
+        On reconnection its full poll set is resumed, starting with a catch-up
+        poll of everything for that interface.
+
+        Args:
+            interface (object): the polled interface
+            status (str): the interface's ConnectionStatus value
+            probe (bool, optional): send a liveness probe while disconnected. Defaults to True.
+        """
+        with self.__ScheduleLock:
+            reconnected = self.__SetInterfaceConnection(interface, status, probe)
+        if reconnected:
+            self.PollEverything(interface)
+    
+    def __SetInterfaceConnection(self, interface, status: str, probe: bool) -> bool:
+        # returns True if the interface has reconnected and needs a catch-up poll
+        if status == 'Disconnected':
+            if interface in self.__Disconnected:
+                return False
+            
+            probePoll = None
+            pollList = self.__GetInterfacePolls(interface)
+            if probe and len(pollList) > 0:
+                probePoll = {
+                    'interface': interface,
+                    'command': pollList[0]['command'],
+                    'qualifier': pollList[0]['qualifier'],
+                    'backoff': self.__BackoffMin
+                }
+                self.__SchedulePoll(probePoll, self.__Clock() + probePoll['backoff'])
+            self.__Disconnected[interface] = probePoll
+            
+            if interface in self.__Workers:
+                self.__Workers[interface].Clear()
+            return False
+        elif status == 'Connected' and interface in self.__Disconnected:
+            probePoll = self.__Disconnected.pop(interface)
+            if probePoll is not None:
+                self.__UnschedulePoll(probePoll)
+            
+            for poll in self.__GetInterfacePolls(interface):
+                self.__SchedulePhased(poll)
+            return True
+        return False
+    
+    def GetQueueStats(self) -> Dict:
+        """Returns the work queue statistics of each interface polled in threaded mode.
+
+        Returns:
+            Dict: PollingWorker.Stats dictionaries keyed by interface
+        """
+        return {interface: worker.Stats for interface, worker in self.__Workers.items()}
             
     def StartPolling(self, mode: str='inactive'):
-        if mode == 'inactive': 
-            self.__InactivePolling.Restart()
-            self.__ActivePolling.Stop()
-            self.__PollingState = 'inactive'
-        elif mode == 'active':
-            self.__ActivePolling.Restart()
-            self.__InactivePolling.Stop()
-            self.__PollingState = 'active'
-        else:
+        if mode not in ['inactive', 'active']:
             raise ValueError("Mode must be 'inactive' or 'active'")
+        
+        with self.__ScheduleLock:
+            self.__PollingState = mode
+            self.__RebuildSchedule()
+        self.__PollingTimer.Restart()
             
     def StopPolling(self):
-        self.__InactivePolling.Stop()
-        self.__ActivePolling.Stop()
+        self.__PollingTimer.Stop()
         self.__PollingState = 'stopped'
         
     def TogglePollingMode(self):
         if self.__PollingState == 'inactive':
-            self.__InactivePolling.Stop()
-            self.__ActivePolling.Restart()
-            self.__PollingState = 'active'
+            self.SetPollingMode('active')
         elif self.__PollingState == 'active':
-            self.__ActivePolling.Stop()
-            self.__InactivePolling.Restart()
-            self.__PollingState = 'inactive'
+            self.SetPollingMode('inactive')
             
     def SetPollingMode(self, mode: str):
-        if mode == 'inactive':
-            if self.__ActivePolling.State == 'Running':
-                self.__InactivePolling.Restart()
-            self.__ActivePolling.Stop()
-            self.__PollingState = 'inactive'
-        elif mode == 'active':
-            if self.__InactivePolling.State == 'Running':
-                self.__ActivePolling.Restart()
-            self.__InactivePolling.Stop()
-            self.__PollingState = 'active'
-        else:
+        if mode not in ['inactive', 'active']:
             raise ValueError("Mode must be 'inactive' or 'active'")
+        
+        with self.__ScheduleLock:
+            self.__PollingState = mode
+            if self.__PollingTimer.State == 'Running':
+                self.__RebuildSchedule()
     
     def AddPolling(self, interface, command, qualifier=None, active_duration: int=None, inactive_duration: int=None):
         if active_duration is not None:
@@ -294,34 +691,52 @@ class SystemPollingController:
             inact_dur = inactive_duration
         else:
             inact_dur = self.__DefaultInactiveDur
-            
-        self.Polling.append({
+        
+        poll = {
             'interface': interface,
             'command': command,
             'qualifier': qualifier,
             'active_duration': act_dur,
             'inactive_duration': inact_dur
-        })
+        }
+        with self.__ScheduleLock:
+            self.__PollIndex.setdefault((interface, command), []).append(poll)
+            self.__SchedulePhased(poll)
         
-    def RemovePolling(self, interface, command):
-        for i in range(len(self.Polling)):
-            if interface is self.Polling[i]['interface'] and command == self.Polling[i]['command']:
-                self.Polling.pop(i)
-                break
+    def RemovePolling(self, interface, command, qualifier: Dict=None):
+        with self.__ScheduleLock:
+            pollList = self.__PollIndex.get((interface, command))
+            if pollList:
+                index = 0
+                if qualifier is not None:
+                    for index, poll in enumerate(pollList):
+                        if poll['qualifier'] == qualifier:
+                            break
+                    else:
+                        return
+                self.__UnschedulePoll(pollList.pop(index))
+                if len(pollList) == 0:
+                    del self.__PollIndex[(interface, command)]
             
     def UpdatePolling(self, interface, command, qualifier={}, active_duration: int=None, inactive_duration: int=None):
-        for i in range(len(self.Polling)):
-            if interface is self.Polling[i]['interface'] and command == self.Polling[i]['command']:
-                if active_duration is not None and self.Polling[i]['active_duration'] != active_duration:
-                    self.Polling[i]['active_duration'] = active_duration
-                    
-                if inactive_duration is not None and self.Polling[i]['inactive_duration'] != inactive_duration:
-                    self.Polling[i]['inactive_duration'] = inactive_duration
-                
-                if self.Polling[i]['qualifier'] != qualifier and qualifier != {}:
-                    self.Polling[i]['qualifier'] =  qualifier
+        with self.__ScheduleLock:
+            pollList = self.__PollIndex.get((interface, command))
+            if pollList:
+                poll = pollList[0]
+                reschedule = False
+                if active_duration is not None and poll['active_duration'] != active_duration:
+                    poll['active_duration'] = active_duration
+                    reschedule = True
                 
-                break
+                if inactive_duration is not None and poll['inactive_duration'] != inactive_duration:
+                    poll['inactive_duration'] = inactive_duration
+                    reschedule = True
+            
+                if poll['qualifier'] != qualifier and qualifier != {}:
+                    poll['qualifier'] =  qualifier
+            
+                if reschedule:
+                    self.__SchedulePhased(poll)
     
 class SystemStatusController:
     def __init__(self, UIHost: 'ExUIDevice') -> None:
@@ -331,10 +746,8 @@ class SystemStatusController:
         self.Hardware = list(self.GUIHost.Hardware.values())
         self.Hardware.sort(key=SortKeys.HardwareSort)
         
-        self.__StatusIcons = DictValueSearchByKey(self.UIHost.Btns, r'DeviceStatusIcon-\d+', regex=True)
-        self.__StatusIcons.sort(key=SortKeys.StatusSort)
-        self.__StatusLabels = DictValueSearchByKey(self.UIHost.Lbls, r'DeviceStatusLabel-\d+', regex=True)
-        self.__StatusLabels.sort(key=SortKeys.StatusSort)
+        self.__StatusIcons = self.UIHost.BtnIndex.GetFamilyList('DeviceStatusIcon')
+        self.__StatusLabels = self.UIHost.LblIndex.GetFamilyList('DeviceStatusLabel')
         self.__Arrows = \
             {
                 'prev': self.UIHost.Btns['DeviceStatus-PageDown'],
@@ -346,10 +759,11 @@ class SystemStatusController:
                 'total': self.UIHost.Lbls['DeviceStatusPage-Total'],
                 'div': self.UIHost.Lbls['PaginationSlash']
             }
+        self.__LogStatsLabel = self.UIHost.Lbls['DeviceStatus-LogStats']
         
         self.__CurrentPageIndex = 0
         
-        self.UpdateTimer = Timer(15, self.__UpdateHandler)
+        self.UpdateTimer = ScheduledTimer(15, self.__UpdateHandler)
         self.UpdateTimer.Stop()
         
         self.__ClearStatusIcons()
@@ -389,7 +803,7 @@ class SystemStatusController:
             self.__UpdatePagination()
             self.__ShowStatusIcons()
             
-    def __UpdateHandler(self, timer: 'Timer', count: int):
+    def __UpdateHandler(self, timer: 'ScheduledTimer', count: int):
         self.UpdateStatusIcons()
 
     # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -428,7 +842,13 @@ class SystemStatusController:
             ico.SetState(self.__GetStatusState(hw))
             ico.SetVisible(True)
             ico.HW = hw
-            lbl.SetText(hw.Name)
+            lbl.SetText(self.__GetStatusLabelStr(hw))
+    
+    def __GetStatusLabelStr(self, hw) -> str:
+        # startup connection time follows the name once the device has connected
+        if getattr(hw, 'ConnectTime', None) is None:
+            return hw.Name
+        return '{} ({:.2f}s)'.format(hw.Name, hw.ConnectTime)
     
     def __GetStatusState(self, hw) -> int: # pragma: no cover
         if hw.ConnectionStatus == 'Connected':
@@ -517,6 +937,14 @@ class SystemStatusController:
         for ico in self.__StatusIcons:
             if ico.HW is not None:
                 ico.SetState(self.__GetStatusState(ico.HW))
+        self.UpdateLogStats()
+    
+    def UpdateLogStats(self):
+        sink = GetLogSink()
+        if sink is None:
+            self.__LogStatsLabel.SetText('Log: direct')
+        else:
+            self.__LogStatsLabel.SetText('Log: {written} written; {dropped} dropped; {suppressed} suppressed'.format(**sink.Stats))
 
     
 
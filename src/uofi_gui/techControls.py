@@ -26,7 +26,7 @@ if TYPE_CHECKING: # pragma: no cover
 
 ## Begin ControlScript Import --------------------------------------------------
 from extronlib import event
-from extronlib.system import MESet, Timer
+from extronlib.system import MESet
 
 ## End ControlScript Import ----------------------------------------------------
 ##
@@ -39,7 +39,7 @@ from math import floor as roundDown
 ##
 ## Begin User Import -----------------------------------------------------------
 #### Custom Code Modules
-from utilityFunctions import DictValueSearchByKey, Log, RunAsync, debug
+from utilityFunctions import Log, RunAsync, debug, ScheduledTimer
 
 #### Extron Global Scripter Modules
 
@@ -56,11 +56,12 @@ class TechMenuController:
         self.TechMenuOpen = False
         
         # Private Properties
-        self.__AboutUpdateTimer = Timer(5, self.__AboutUpdateHandler)
+        self.__AboutUpdateTimer = ScheduledTimer(5, self.__AboutUpdateHandler)
         self.__AboutUpdateTimer.Stop()
         
-        self.__AboutLabels = DictValueSearchByKey(self.UIHost.Lbls, r'Proc(?:Info|Status)Label-(\w+)', regex=True, capture_dict=True)
-        self.__PanelLabels = DictValueSearchByKey(self.UIHost.Lbls, r'PanelInfoLabel-(\w+)', regex=True, capture_dict=True)
+        self.__AboutLabels = self.UIHost.LblIndex.GetFamily('ProcInfoLabel')
+        self.__AboutLabels.update(self.UIHost.LblIndex.GetFamily('ProcStatusLabel'))
+        self.__PanelLabels = self.UIHost.LblIndex.GetFamily('PanelInfoLabel')
         self.__PanelControls = \
             {
                 'sleep': 
@@ -111,7 +112,7 @@ class TechMenuController:
         self.__MenuBtns = MESet([])
         self.__DefaultPage = 'Tech-SystemStatus'
         self.__DefaultBtn = None
-        for btn in DictValueSearchByKey(self.UIHost.Btns, r'Tech-\w+$', regex=True):
+        for btn in self.UIHost.BtnIndex.GetFamily('Tech').values():
             if btn.Name in self.__PageSelects.keys():
                 btn.Page = self.__PageSelects[btn.Name]()
             else:
@@ -263,7 +264,7 @@ class TechMenuController:
         slider.SetFill(value)
         self.UIHost.SetVolume('Master', int(value))
     
-    def __AboutUpdateHandler(self, timer: Timer, count: int):
+    def __AboutUpdateHandler(self, timer: 'ScheduledTimer', count: int):
         used = roundDown(self.GUIHost.CtlProc_Main.UserUsage[0]/1024)
         total = roundDown(self.GUIHost.CtlProc_Main.UserUsage[1]/1024)
         self.__AboutLabels['Storage'].SetText('{}/{} MB'.format(used, total))
@@ -324,6 +325,7 @@ class TechMenuController:
     def __StatusUpdate(self, show: bool=False):
         if show:
             self.UIHost.StatusCtl.ResetPages()
+            self.UIHost.StatusCtl.UpdateLogStats()
             self.UIHost.StatusCtl.UpdateTimer.Restart()
         else:
             self.UIHost.StatusCtl.UpdateTimer.Stop()
@@ -0,0 +1,175 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+from typing import Dict, Tuple
+
+## Begin ControlScript Import --------------------------------------------------
+from extronlib.system import File
+
+## End ControlScript Import ----------------------------------------------------
+##
+## Begin Python Imports --------------------------------------------------------
+import json
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+
+## End Python Imports ----------------------------------------------------------
+##
+## Begin User Import -----------------------------------------------------------
+#### Custom Code Modules
+
+#### Extron Global Scripter Modules
+
+## End User Import -------------------------------------------------------------
+##
+## Begin Class Definitions -----------------------------------------------------
+
+ControlDef = namedtuple('ControlDef', ['Name', 'ID', 'holdTime', 'repeatTime'])
+ControlDef.__new__.__defaults__ = (None, None)
+
+GroupDef = namedtuple('GroupDef', ['Name', 'Buttons'])
+
+class UILayout:
+    ControlTypes = ('buttons', 'knobs', 'labels', 'levels', 'sliders')
+
+    def __init__(self, jsonObj: Dict) -> None:
+        """Read-only view of a controls.json layout, indexed by control name,
+        control ID, and button group.
+
+        Args:
+            jsonObj (Dict): parsed controls.json contents
+        """
+        controls = {}
+        byName = {}
+        byID = {}
+        for ctlType in self.ControlTypes:
+            ctlList = tuple(ControlDef(**ctl) for ctl in jsonObj.get(ctlType, []))
+            controls[ctlType] = ctlList
+            byName[ctlType] = MappingProxyType({ctl.Name: ctl for ctl in ctlList})
+            byID[ctlType] = MappingProxyType({ctl.ID: ctl for ctl in ctlList})
+
+        groupList = tuple(GroupDef(grp['Name'], tuple(grp['Buttons'])) for grp in jsonObj.get('buttonGroups', []))
+        groupOf = {}
+        for grp in groupList:
+            for btn in grp.Buttons:
+                groupOf[btn] = grp.Name
+
+        self.__Controls = MappingProxyType(controls)
+        self.__ByName = MappingProxyType(byName)
+        self.__ByID = MappingProxyType(byID)
+        self.__Groups = MappingProxyType({grp.Name: grp for grp in groupList})
+        self.__GroupList = groupList
+        self.__GroupOf = MappingProxyType(groupOf)
+
+    @property
+    def Buttons(self) -> Tuple[ControlDef]:
+        return self.__Controls['buttons']
+
+    @property
+    def ButtonGroups(self) -> Tuple[GroupDef]:
+        return self.__GroupList
+
+    @property
+    def Knobs(self) -> Tuple[ControlDef]:
+        return self.__Controls['knobs']
+
+    @property
+    def Labels(self) -> Tuple[ControlDef]:
+        return self.__Controls['labels']
+
+    @property
+    def Levels(self) -> Tuple[ControlDef]:
+        return self.__Controls['levels']
+
+    @property
+    def Sliders(self) -> Tuple[ControlDef]:
+        return self.__Controls['sliders']
+
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+
+    def GetControl(self, ctlType: str, name: str) -> ControlDef:
+        return self.__ByName[ctlType][name]
+
+    def GetControlByID(self, ctlType: str, id: int) -> ControlDef:
+        return self.__ByID[ctlType][id]
+
+    def GetGroup(self, name: str) -> GroupDef:
+        return self.__Groups[name]
+
+    def GetButtonGroup(self, btnName: str) -> str:
+        """Returns the name of the button group containing a button, or None"""
+        return self.__GroupOf.get(btnName)
+
+## End Class Definitions -------------------------------------------------------
+##
+## Begin Function Definitions --------------------------------------------------
+
+_LayoutCache = {}
+_LayoutLock = threading.Lock()
+
+def LoadLayout(jsonPath: str) -> UILayout:
+    """Returns the layout for a controls.json file, parsing the file only the
+    first time it is requested.
+
+    Args:
+        jsonPath (str): path to the controls.json file
+
+    Raises:
+        ValueError: if specified file at jsonPath does not exist
+
+    Returns:
+        UILayout: the shared, read-only layout
+    """
+    with _LayoutLock:
+        if jsonPath not in _LayoutCache:
+            if not File.Exists(jsonPath):
+                raise ValueError('Specified file does not exist')
+            jsonFile = File(jsonPath)
+            jsonStr = jsonFile.read()
+            jsonFile.close()
+            _LayoutCache[jsonPath] = UILayout(json.loads(jsonStr))
+        return _LayoutCache[jsonPath]
+
+def GetLayout(jsonObj: Dict = {}, jsonPath: str = '') -> UILayout:
+    """Returns a layout from a json object or file
+
+    Args (only one json arg required, jsonObj takes precedence over jsonPath):
+        jsonObj (Dict, optional): The json object containing control information.
+            Defaults to {}.
+        jsonPath (str, optional): The path to the file containing json formatted
+            control information. Defaults to "".
+
+    Raises:
+        ValueError: if specified file at jsonPath does not exist
+        ValueError: if neither jsonObj or jsonPath are specified
+
+    Returns:
+        UILayout: the layout
+    """
+    if isinstance(jsonObj, UILayout):
+        return jsonObj
+    elif jsonObj == {} and jsonPath != '':
+        return LoadLayout(jsonPath)
+    elif jsonObj == {} and jsonPath == '':
+        raise ValueError('Either jsonObj or jsonPath must be specified')
+    return UILayout(jsonObj)
+
+def ClearLayoutCache() -> None:
+    with _LayoutLock:
+        _LayoutCache.clear()
+
+## End Function Definitions ----------------------------------------------------
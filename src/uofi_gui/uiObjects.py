@@ -22,12 +22,12 @@ if TYPE_CHECKING: # pragma: no cover
 from extronlib import event
 from extronlib.device import UIDevice
 from extronlib.ui import Button, Knob, Label, Level, Slider
-from extronlib.system import MESet, File
+from extronlib.system import MESet
 from extronlib.system import Wait
 ## End ControlScript Import ----------------------------------------------------
 ##
 ## Begin Python Imports --------------------------------------------------------
-import json
+import time
 
 ## End Python Imports ----------------------------------------------------------
 ##
@@ -41,10 +41,11 @@ from uofi_gui.pinControl import PINController
 from uofi_gui.keyboardControl import KeyboardController
 from uofi_gui.deviceControl import CameraController, DisplayController, AudioController
 from uofi_gui.scheduleControls import AutoScheduleController
+from uofi_gui.uiLayout import GetLayout
 
 #### Extron Global Scripter Modules
 
-from utilityFunctions import Log, RunAsync, debug
+from utilityFunctions import Log, RunAsync, debug, ControlNameIndex
 
 ## End User Import -------------------------------------------------------------
 ##
@@ -61,6 +62,10 @@ class ExUIDevice(UIDevice):
         self.Lvls = {}
         self.Slds = {}
         self.Lbls = {}
+        self.Layout = None
+        self.BuildTime = None
+        self.__BtnIndex = None
+        self.__LblIndex = None
         
         self.ModalPageList = \
             [
@@ -94,6 +99,18 @@ class ExUIDevice(UIDevice):
             ]
         
         self.HideAllPopups()
+    
+    @property
+    def BtnIndex(self) -> ControlNameIndex:
+        if self.__BtnIndex is None:
+            self.__BtnIndex = ControlNameIndex(self.Btns)
+        return self.__BtnIndex
+    
+    @property
+    def LblIndex(self) -> ControlNameIndex:
+        if self.__LblIndex is None:
+            self.__LblIndex = ControlNameIndex(self.Lbls)
+        return self.__LblIndex
         
     def InitializeUIControllers(self):        
         #### Source Control Module
@@ -162,12 +179,20 @@ class ExUIDevice(UIDevice):
     
     def BuildAll(self, jsonObj: Dict = {}, jsonPath: str = '') -> None:
         # Log('Build All Buttons for TP: {}'.format(self.Id))
-        self.BuildButtons(jsonObj=jsonObj, jsonPath=jsonPath)
-        self.BuildButtonGroups(jsonObj=jsonObj, jsonPath=jsonPath)
-        self.BuildKnobs(jsonObj=jsonObj, jsonPath=jsonPath)
-        self.BuildLevels(jsonObj=jsonObj, jsonPath=jsonPath)
-        self.BuildSliders(jsonObj=jsonObj, jsonPath=jsonPath)
-        self.BuildLabels(jsonObj=jsonObj, jsonPath=jsonPath)
+        startTime = time.monotonic()
+        
+        self.Layout = GetLayout(jsonObj, jsonPath)
+        self.BuildButtons(jsonObj=self.Layout)
+        self.BuildButtonGroups(jsonObj=self.Layout)
+        self.BuildKnobs(jsonObj=self.Layout)
+        self.BuildLevels(jsonObj=self.Layout)
+        self.BuildSliders(jsonObj=self.Layout)
+        self.BuildLabels(jsonObj=self.Layout)
+        
+        self.BuildTime = time.monotonic() - startTime
+        Log('Built {} controls for TP: {} in {:.3f}s'.format(len(self.Btns) + len(self.Knobs) + len(self.Lvls) + len(self.Slds) + len(self.Lbls),
+                                                           self.Id,
+                                                           self.BuildTime))
         
     def BuildButtons(self,
                     jsonObj: Dict = {},
@@ -187,24 +212,15 @@ class ExUIDevice(UIDevice):
         
         ## do not expect both jsonObj and jsonPath
         ## jsonObj should take priority over jsonPath
-        if jsonObj == {} and jsonPath != "": # jsonObj is empty and jsonPath not blank
-            if File.Exists(jsonPath): # jsonPath is valid, so load jsonObj from path
-                jsonFile = File(jsonPath)
-                jsonStr = jsonFile.read()
-                jsonFile.close()
-                jsonObj = json.loads(jsonStr)
-            else: ## jsonPath was invalid, so return none (error)
-                raise ValueError('Specified file does not exist')
-        elif jsonObj == {} and jsonPath == "":
-            raise ValueError('Either jsonObj or jsonPath must be specified')
+        layout = GetLayout(jsonObj, jsonPath)
+        self.__BtnIndex = None
         
         ## format button info into self.Btns
-        for button in jsonObj['buttons']:
-            btnName = button['Name']
-            button.pop('Name')
-            self.Btns[btnName] = Button(self, **button)
-            self.Btns[btnName].holdTime = button['holdTime']
-            self.Btns[btnName].repeatTime = button['repeatTime']
+        for button in layout.Buttons:
+            btnName = button.Name
+            self.Btns[btnName] = Button(self, button.ID, holdTime=button.holdTime, repeatTime=button.repeatTime)
+            self.Btns[btnName].holdTime = button.holdTime
+            self.Btns[btnName].repeatTime = button.repeatTime
             
             self.Btns[btnName].SetState(0)
             
@@ -229,26 +245,17 @@ class ExUIDevice(UIDevice):
             ValueError: if neither jsonObj or jsonPath are specified
         """
         ## do not expect both jsonObj and jsonPath
-        ## jsonObj should take priority over jsonPath        
-        if jsonObj == {} and jsonPath != "": # jsonObj is empty and jsonPath not blank
-            if File.Exists(jsonPath): # jsonPath is valid, so load jsonObj from path
-                jsonFile = File(jsonPath)
-                jsonStr = jsonFile.read()
-                jsonFile.close()
-                jsonObj = json.loads(jsonStr)
-            else: ## jsonPath was invalid, so return none (error)
-                raise ValueError('Specified file does not exist')
-        elif jsonObj == {} and jsonPath == "":
-            raise ValueError('Either jsonObj or jsonPath must be specified')
+        ## jsonObj should take priority over jsonPath
+        layout = GetLayout(jsonObj, jsonPath)
 
         ## create MESets and build self.Btn_Grps
-        for group in jsonObj['buttonGroups']:
-            ## reset btnList and populate it from the jsonObj
+        for group in layout.ButtonGroups:
+            ## reset btnList and populate it from the layout
             btnList = []
-            for btn in group['Buttons']:
+            for btn in group.Buttons:
                 ## get button objects from Dict and add to list
                 btnList.append(self.Btns[btn])
-            self.Btn_Grps[group['Name']] = MESet(btnList)
+            self.Btn_Grps[group.Name] = MESet(btnList)
             
         # Log(['Button: {} ({}, {})'.format(btn.Name, btn.ID, btn) for btn in self.Btn_Grps['Activity-Select'].Objects])
 
@@ -270,22 +277,12 @@ class ExUIDevice(UIDevice):
         
         ## do not expect both jsonObj and jsonPath
         ## jsonObj should take priority over jsonPath
-
-        if jsonObj == {} and jsonPath != "": # jsonObj is empty and jsonPath not blank
-            if File.Exists(jsonPath): # jsonPath is valid, so load jsonObj from path
-                jsonFile = File(jsonPath)
-                jsonStr = jsonFile.read()
-                jsonFile.close()
-                jsonObj = json.loads(jsonStr)
-            else: ## jsonPath was invalid, so return none (error)
-                raise ValueError('Specified file does not exist')
-        elif jsonObj == {} and jsonPath == "":
-            raise ValueError('Either jsonObj or jsonPath must be specified')
+        layout = GetLayout(jsonObj, jsonPath)
         
         
         ## format knob info into self.Knobs
-        for knob in jsonObj['knobs']:
-            self.Knobs[knob['Name']] = Knob(self, knob['ID'])
+        for knob in layout.Knobs:
+            self.Knobs[knob.Name] = Knob(self, knob.ID)
 
     def BuildLevels(self,
                     jsonObj: Dict = {},
@@ -305,20 +302,11 @@ class ExUIDevice(UIDevice):
         
         ## do not expect both jsonObj and jsonPath
         ## jsonObj should take priority over jsonPath
-        if jsonObj == {} and jsonPath != "": # jsonObj is empty and jsonPath not blank
-            if File.Exists(jsonPath): # jsonPath is valid, so load jsonObj from path
-                jsonFile = File(jsonPath)
-                jsonStr = jsonFile.read()
-                jsonFile.close()
-                jsonObj = json.loads(jsonStr)
-            else: ## jsonPath was invalid, so return none (error)
-                raise ValueError('Specified file does not exist')
-        elif jsonObj == {} and jsonPath == "":
-            raise ValueError('Either jsonObj or jsonPath must be specified')
+        layout = GetLayout(jsonObj, jsonPath)
         
         ## format level info into self.Lvls
-        for lvl in jsonObj['levels']:
-            self.Lvls[lvl['Name']] = Level(self, lvl['ID'])
+        for lvl in layout.Levels:
+            self.Lvls[lvl.Name] = Level(self, lvl.ID)
 
     def BuildSliders(self,
                     jsonObj: Dict = {},
@@ -338,20 +326,11 @@ class ExUIDevice(UIDevice):
         
         ## do not expect both jsonObj and jsonPath
         ## jsonObj should take priority over jsonPath
-        if jsonObj == {} and jsonPath != "": # jsonObj is empty and jsonPath not blank
-            if File.Exists(jsonPath): # jsonPath is valid, so load jsonObj from path
-                jsonFile = File(jsonPath)
-                jsonStr = jsonFile.read()
-                jsonFile.close()
-                jsonObj = json.loads(jsonStr)
-            else: ## jsonPath was invalid, so return none (error)
-                raise ValueError('Specified file does not exist')
-        elif jsonObj == {} and jsonPath == "":
-            raise ValueError('Either jsonObj or jsonPath must be specified')
+        layout = GetLayout(jsonObj, jsonPath)
             
         ## format slider info into self.Slds
-        for slider in jsonObj['sliders']:
-            self.Slds[slider['Name']] = Slider(self, slider['ID'])
+        for slider in layout.Sliders:
+            self.Slds[slider.Name] = Slider(self, slider.ID)
 
     def BuildLabels(self,
                     jsonObj: Dict = {},
@@ -371,19 +350,11 @@ class ExUIDevice(UIDevice):
         
         ## do not expect both jsonObj and jsonPath
         ## jsonObj should take priority over jsonPath
-        if jsonObj == {} and jsonPath != "": # jsonObj is empty and jsonPath not blank
-            if File.Exists(jsonPath): # jsonPath is valid, so load jsonObj from path
-                jsonFile = File(jsonPath)
-                jsonStr = jsonFile.read()
-                jsonFile.close()
-                jsonObj = json.loads(jsonStr)
-            else: ## jsonPath was invalid, so return none (error)
-                raise ValueError('Specified file does not exist')
-        elif jsonObj == {} and jsonPath == "":
-            raise ValueError('Either jsonObj or jsonPath must be specified')
+        layout = GetLayout(jsonObj, jsonPath)
+        self.__LblIndex = None
         
         ## format label info into self.Lbls
-        for lbl in jsonObj['labels']:
-            self.Lbls[lbl['Name']] = Label(self, lbl['ID'])
+        for lbl in layout.Labels:
+            self.Lbls[lbl.Name] = Label(self, lbl.ID)
 
 ## End Function Definitions ----------------------------------------------------
@@ -14,7 +14,7 @@
 # limitations under the License.
 ################################################################################
 
-from typing import TYPE_CHECKING, Dict, List, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Union
 if TYPE_CHECKING: # pragma: no cover
     from extronlib.ui import Button, Label
     from uofi_gui.systemHardware import SystemHardwareController
@@ -28,7 +28,11 @@ from extronlib.system import Wait
 import inspect
 import re
 import functools
+import heapq
 import traceback
+import threading
+import time
+from collections import deque
 
 ## End Python Imports ----------------------------------------------------------
 ##
@@ -47,11 +51,10 @@ class SortKeys:
     def StatusSort(cls, sortItem: Union['Button', 'Label']) -> int:
         if not hasattr(sortItem, 'Name'):
             raise IndexError('Sort item has no attribute Name')
-        res = re.match(r'DeviceStatus(?:Icon|Label)-(\d+)', sortItem.Name)
-        if res is None:
+        family, key = ControlNameIndex.ParseName(sortItem.Name)
+        if family not in ['DeviceStatusIcon', 'DeviceStatusLabel'] or type(key) is not int:
             raise ValueError('Sort item does not match regex')
-        sortInt = int(res.group(1))
-        return sortInt
+        return key
     
     @classmethod
     def HardwareSort(cls, sortItem: 'SystemHardwareController') -> str:
@@ -76,27 +79,554 @@ class SortKeys:
         elif sortItem == 'Sunday':
             return 6
 
+class ControlNameIndex:
+    __NameRegex = re.compile(r'^(.+)-(?:(\d+),(\d+)|(\d+)|([^-]+))$')
+    
+    def __init__(self, controls: Dict) -> None:
+        """Indexes UI controls by name family, parsed once from control names.
+        
+        Names of the form Prefix-Row,Col are keyed (Row, Col), Prefix-N are
+        keyed N, and any other Prefix-Suffix are keyed by the Suffix string.
+
+        Args:
+            controls (Dict): control objects keyed by name, such as ExUIDevice.Btns
+        """
+        self.__Families = {}
+        for name, ctl in controls.items():
+            family, key = self.ParseName(name)
+            if family is not None:
+                self.__Families.setdefault(family, {})[key] = ctl
+        
+        self.__Sorted = {}
+        for family, members in self.__Families.items():
+            numKeys = [key for key in members if type(key) is not str]
+            numKeys.sort()
+            self.__Sorted[family] = [members[key] for key in numKeys]
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def ParseName(cls, name: str) -> Tuple:
+        """Splits a control name into a family prefix and a key
+
+        Args:
+            name (str): control name
+
+        Returns:
+            Tuple: (family, key) where key is an int, a (row, col) tuple of
+                ints, or a str. (None, None) if the name has no family prefix
+        """
+        res = cls.__NameRegex.match(name)
+        if res is None:
+            return (None, None)
+        if res.group(2) is not None:
+            return (res.group(1), (int(res.group(2)), int(res.group(3))))
+        if res.group(4) is not None:
+            return (res.group(1), int(res.group(4)))
+        return (res.group(1), res.group(5))
+    
+    def GetFamily(self, family: str) -> Dict:
+        """Returns the controls of a family keyed by the parsed name key
+
+        Args:
+            family (str): control name prefix
+
+        Returns:
+            Dict: controls keyed by int, (row, col), or str. Empty if the family
+                does not exist
+        """
+        return dict(self.__Families.get(family, {}))
+    
+    def GetFamilyList(self, family: str) -> List:
+        """Returns the numerically keyed controls of a family sorted by key
+
+        Args:
+            family (str): control name prefix
+
+        Returns:
+            List: controls sorted by N or (row, col)
+        """
+        return list(self.__Sorted.get(family, []))
+
+class LogSink:
+    def __init__(self,
+                 capacity: int=512,
+                 flushInterval: float=0.5,
+                 batchSize: int=32,
+                 rateLimit: int=5,
+                 rateWindow: float=10) -> None:
+        """Background writer for ProgramLog. Messages are held in a bounded ring
+        buffer and written in batches by a single worker thread. Messages are
+        rate limited per key, messages over the limit within a window are
+        suppressed and reported as a single summary line.
+
+        Args:
+            capacity (int, optional): Maximum buffered messages, the oldest
+                message is dropped when full. Defaults to 512.
+            flushInterval (float, optional): Maximum seconds between flushes.
+                Defaults to 0.5.
+            batchSize (int, optional): Buffered messages which trigger an early
+                flush, also the maximum messages joined into a single ProgramLog
+                write. Defaults to 32.
+            rateLimit (int, optional): Messages allowed per key in each window.
+                Defaults to 5.
+            rateWindow (float, optional): Rate limit window, in seconds.
+                Defaults to 10.
+        """
+        self.Capacity = capacity
+        self.FlushInterval = flushInterval
+        self.BatchSize = batchSize
+        self.RateLimit = rateLimit
+        self.RateWindow = rateWindow
+        
+        self.Written = 0
+        self.Dropped = 0
+        self.Suppressed = 0
+        
+        self.__Buffer = deque()
+        self.__Cond = threading.Condition()
+        self.__RateKeys = {} # key: [window start, count, suppressed, level]
+        self.__Running = False
+        self.__Thread = None
+    
+    @property
+    def Running(self) -> bool:
+        return self.__Running
+    
+    @property
+    def QueueDepth(self) -> int:
+        return len(self.__Buffer)
+    
+    @property
+    def Stats(self) -> Dict:
+        return {
+            'depth': self.QueueDepth,
+            'written': self.Written,
+            'dropped': self.Dropped,
+            'suppressed': self.Suppressed
+        }
+    
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def __Append(self, message: str, level: str) -> None:
+        # called with self.__Cond held
+        if len(self.__Buffer) >= self.Capacity:
+            self.__Buffer.popleft()
+            self.Dropped += 1
+        self.__Buffer.append((message, level))
+    
+    def __Summarize(self, key: str, state: List) -> None:
+        # called with self.__Cond held
+        if state[2] > 0:
+            self.__Append('Suppressed {} similar messages from {}'.format(state[2], key), state[3])
+    
+    def __SweepRateKeys(self, now: float) -> None:
+        # called with self.__Cond held
+        for key in [k for k, state in self.__RateKeys.items() if now - state[0] >= self.RateWindow]:
+            self.__Summarize(key, self.__RateKeys.pop(key))
+    
+    def __Drain(self) -> List:
+        with self.__Cond:
+            self.__SweepRateKeys(time.monotonic())
+            batch = list(self.__Buffer)
+            self.__Buffer.clear()
+        return batch
+    
+    def __WriteBatch(self, batch: List) -> None:
+        # consecutive messages of the same level are joined into one write
+        i = 0
+        while i < len(batch):
+            level = batch[i][1]
+            j = i + 1
+            while j < len(batch) and j - i < self.BatchSize and batch[j][1] == level:
+                j += 1
+            try:
+                ProgramLog('\n'.join(msg for msg, lvl in batch[i:j]), level)
+            except Exception as inst: # pragma: no cover
+                print('LogSink write failed: {}'.format(inst))
+            self.Written += j - i
+            i = j
+    
+    def __Run(self) -> None:
+        while self.__Running:
+            with self.__Cond:
+                if len(self.__Buffer) < self.BatchSize:
+                    self.__Cond.wait(self.FlushInterval)
+            self.__WriteBatch(self.__Drain())
+    
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def Start(self) -> None:
+        if self.__Running:
+            return
+        self.__Running = True
+        self.__Thread = threading.Thread(target=self.__Run, name='LogSink', daemon=True)
+        self.__Thread.start()
+    
+    def Stop(self, timeout: float=None) -> None:
+        """Stops the worker thread and writes any buffered messages"""
+        self.__Running = False
+        with self.__Cond:
+            self.__Cond.notify()
+        if self.__Thread is not None:
+            self.__Thread.join(timeout)
+            self.__Thread = None
+        self.Flush()
+    
+    def Flush(self) -> None:
+        """Writes all buffered messages, including pending suppression summaries,
+        on the calling thread"""
+        with self.__Cond:
+            for key in list(self.__RateKeys.keys()):
+                self.__Summarize(key, self.__RateKeys.pop(key))
+        self.__WriteBatch(self.__Drain())
+    
+    def Write(self, message: str, level: str='info', key: str=None) -> bool:
+        """Buffers a message for the worker thread
+
+        Args:
+            message (str): formatted log message
+            level (str, optional): ProgramLog level. Defaults to 'info'.
+            key (str, optional): rate limiting key, messages without a key are
+                not rate limited. Defaults to None.
+
+        Returns:
+            bool: False if the message was suppressed by the rate limit
+        """
+        with self.__Cond:
+            if key is not None:
+                now = time.monotonic()
+                state = self.__RateKeys.get(key)
+                if state is None or now - state[0] >= self.RateWindow:
+                    if state is not None:
+                        self.__Summarize(key, state)
+                    state = [now, 0, 0, level]
+                    self.__RateKeys[key] = state
+                if state[1] >= self.RateLimit:
+                    state[2] += 1
+                    self.Suppressed += 1
+                    return False
+                state[1] += 1
+            
+            self.__Append(message, level)
+            if len(self.__Buffer) >= self.BatchSize:
+                self.__Cond.notify()
+        return True
+
+class TickScheduler:
+    def __init__(self) -> None:
+        """Runs every ScheduledTimer from a single thread. Running timers are
+        kept in a heap ordered by their next tick, the thread sleeps until the
+        earliest tick is due and is woken when a timer is started or changed.
+        Stopped and paused timers are removed from the heap, so they use no
+        thread time at all, and the thread waits indefinitely when no timer is
+        running.
+        
+        Timer functions are called on the scheduler thread one at a time. A
+        function which runs longer than a tick delays the other timers, work
+        which may block on a device should be handed off to a worker.
+        """
+        self.Ticks = 0
+        self.Late = 0
+        self.Errors = 0
+        
+        self.__Heap = []   # (due, seq, timer)
+        self.__Seqs = {}   # id(timer): seq of the timer's live heap entry
+        self.__Seq = 0
+        self.__Cond = threading.Condition()
+        self.__Running = False
+        self.__Thread = None
+    
+    @property
+    def Running(self) -> bool:
+        return self.__Running
+    
+    @property
+    def Scheduled(self) -> int:
+        """The number of running timers"""
+        return len(self.__Seqs)
+    
+    @property
+    def Stats(self) -> Dict:
+        return {
+            'scheduled': self.Scheduled,
+            'ticks': self.Ticks,
+            'late': self.Late,
+            'errors': self.Errors
+        }
+    
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def __Push(self, timer: 'ScheduledTimer', due: float) -> None:
+        # called with self.__Cond held
+        self.__Seq += 1
+        self.__Seqs[id(timer)] = self.__Seq
+        heapq.heappush(self.__Heap, (due, self.__Seq, timer))
+    
+    def __NextDue(self) -> Tuple:
+        # called with self.__Cond held, returns (due, seq, timer) or None
+        while len(self.__Heap) > 0:
+            due, seq, timer = self.__Heap[0]
+            if self.__Seqs.get(id(timer)) == seq:
+                return self.__Heap[0]
+            # stale entry left behind by a cancel or reschedule
+            heapq.heappop(self.__Heap)
+        return None
+    
+    def __Run(self) -> None:
+        while self.__Running:
+            with self.__Cond:
+                item = self.__NextDue()
+                if item is None:
+                    self.__Cond.wait()
+                    continue
+                now = time.monotonic()
+                if item[0] > now:
+                    self.__Cond.wait(item[0] - now)
+                    continue
+                due, seq, timer = heapq.heappop(self.__Heap)
+                nextDue = due + timer.Interval
+                if nextDue <= now:
+                    # fell behind by more than one interval, don't try to catch up
+                    self.Late += 1
+                    nextDue = now + timer.Interval
+                self.__Push(timer, nextDue)
+                seq = self.__Seq
+                self.Ticks += 1
+            try:
+                timer._Tick(seq)
+            except Exception as inst:
+                self.Errors += 1
+                Log('Scheduled timer function failed ({}): {}', 'error',
+                    fmtArgs=(type(inst).__name__, inst))
+    
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def Start(self) -> None:
+        if self.__Running:
+            return
+        self.__Running = True
+        self.__Thread = threading.Thread(target=self.__Run, name='TickScheduler', daemon=True)
+        self.__Thread.start()
+    
+    def Stop(self, timeout: float=None) -> None:
+        """Stops the scheduler thread, running timers are kept and will tick
+        again if the scheduler is restarted"""
+        self.__Running = False
+        with self.__Cond:
+            self.__Cond.notify()
+        if self.__Thread is not None:
+            self.__Thread.join(timeout)
+            self.__Thread = None
+    
+    def Register(self, timer: 'ScheduledTimer', delay: float) -> None:
+        """Schedules a timer's next tick, replacing any tick already scheduled
+        for the timer.
+
+        Args:
+            timer (ScheduledTimer): the timer
+            delay (float): seconds until the next tick
+        """
+        with self.__Cond:
+            self.__Push(timer, time.monotonic() + delay)
+            if self.__Heap[0][1] == self.__Seq:
+                # new earliest tick, wake the thread to shorten its wait
+                self.__Cond.notify()
+    
+    def Cancel(self, timer: 'ScheduledTimer') -> None:
+        """Removes a timer from the schedule. The heap entry is discarded when
+        it reaches the top of the heap."""
+        with self.__Cond:
+            self.__Seqs.pop(id(timer), None)
+    
+    def IsCurrent(self, timer: 'ScheduledTimer', seq: int) -> bool:
+        """Returns False if a timer was cancelled or rescheduled after the
+        tick with seq was taken from the heap"""
+        return self.__Seqs.get(id(timer)) == seq
+
+class ScheduledTimer:
+    def __init__(self, Interval: float, Function: Callable=None, Scheduler: TickScheduler=None) -> None:
+        """Drop in replacement for the Extron Timer, run by the shared
+        TickScheduler instead of its own thread. Supports the Timer Interval,
+        Count, State, and Function attributes, the Change, Pause, Restart,
+        Resume, and Stop methods, and a StateChanged callback. Function is
+        called with the timer and count each Interval seconds while the timer
+        is running.
+
+        As with the Extron Timer, the timer is running once created.
+
+        Args:
+            Interval (float): seconds between calls of Function
+            Function (Callable, optional): handler called with (timer, count).
+                Defaults to None.
+            Scheduler (TickScheduler, optional): the scheduler which runs the
+                timer. Defaults to the shared scheduler.
+        """
+        self.Interval = Interval
+        self.Function = Function
+        self.Count = 0
+        self.State = 'Running'
+        self.StateChanged = None
+        
+        self.__Scheduler = Scheduler if Scheduler is not None else GetScheduler()
+        self.__Scheduler.Register(self, Interval)
+    
+    def __call__(self, Function: Callable) -> Callable:
+        # supports the Extron decorator form, @ScheduledTimer(5)
+        self.Function = Function
+        return Function
+    
+    # Private Methods ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def __SetState(self, state: str) -> None:
+        if state == self.State:
+            return
+        self.State = state
+        if callable(self.StateChanged):
+            self.StateChanged(self, state)
+    
+    def _Tick(self, seq: int) -> None:
+        # called by the scheduler thread, the tick is skipped if the timer was
+        # stopped or restarted after it was taken from the heap
+        if not self.__Scheduler.IsCurrent(self, seq):
+            return
+        self.Count += 1
+        if callable(self.Function):
+            self.Function(self, self.Count)
+    
+    # Public Methods +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    
+    def Change(self, Interval: float) -> None:
+        """Sets a new Interval, used from the next tick"""
+        self.Interval = Interval
+    
+    def Pause(self) -> None:
+        """Stops calling Function without resetting Count"""
+        self.__Scheduler.Cancel(self)
+        self.__SetState('Paused')
+    
+    def Restart(self) -> None:
+        """Resets Count and calls Function in Interval seconds"""
+        self.Count = 0
+        self.__Scheduler.Register(self, self.Interval)
+        self.__SetState('Running')
+    
+    def Resume(self) -> None:
+        """Resumes a paused or stopped timer"""
+        if self.State == 'Running':
+            return
+        self.__Scheduler.Register(self, self.Interval)
+        self.__SetState('Running')
+    
+    def Stop(self) -> None:
+        """Stops calling Function and resets Count"""
+        self.__Scheduler.Cancel(self)
+        self.Count = 0
+        self.__SetState('Stopped')
+
 ## End Class Definitions -------------------------------------------------------
 ##
 ## Begin Function Definitions --------------------------------------------------
 
-def Log(content, level: str='info', stack: bool=False) -> None:
+LOG_LEVELS = {'debug': 0, 'info': 1, 'warning': 2, 'error': 3}
+_LogThreshold = LOG_LEVELS['info']
+_LogPathRegex = re.compile(r"^(?:\/var\/nortxe\/proj\/eup\/|\/var\/nortxe\/uf\/admin\/modules\/|\/usr\/lib\/python3.5\/)?(.+)\.py$")
+
+def SetLogLevel(level: str) -> None:
+    """Sets the minimum level which will be written by Log. Messages below this
+    level are discarded before any formatting is done.
+
+    Args:
+        level (str): Log level. May be 'debug', 'info', 'warning', or 'error'.
+
+    Raises:
+        ValueError: if level is not a valid log level
+    """
+    global _LogThreshold
+    if level not in LOG_LEVELS:
+        raise ValueError('level must be one of {}'.format(list(LOG_LEVELS.keys())))
+    _LogThreshold = LOG_LEVELS[level]
+
+def GetLogLevel() -> str:
+    for level, val in LOG_LEVELS.items():
+        if val == _LogThreshold:
+            return level
+
+def LogEnabled(level: str) -> bool:
+    """Returns True if a message of level would be written by Log"""
+    return LOG_LEVELS.get(level, LOG_LEVELS['error']) >= _LogThreshold
+
+@functools.lru_cache(maxsize=256)
+def _ModuleFromFile(fileName: str) -> str:
+    re_match = _LogPathRegex.match(fileName)
+    if re_match is None:
+        return fileName
+    return re_match.group(1).replace('/', '.')
+
+_LogSink = None
+
+def StartLogSink(**kwargs) -> LogSink:
+    """Routes Log output through a background LogSink. Keyword arguments are
+    passed to LogSink. Returns the running sink."""
+    global _LogSink
+    if _LogSink is None or not _LogSink.Running:
+        _LogSink = LogSink(**kwargs)
+        _LogSink.Start()
+    return _LogSink
+
+def StopLogSink() -> None:
+    """Flushes the background LogSink and returns Log to synchronous writes"""
+    global _LogSink
+    sink = _LogSink
+    _LogSink = None
+    if sink is not None:
+        sink.Stop()
+
+def GetLogSink() -> LogSink:
+    return _LogSink
+
+_Scheduler = None
+_SchedulerLock = threading.Lock()
+
+def GetScheduler() -> TickScheduler:
+    """Returns the shared TickScheduler used by ScheduledTimer, starting it
+    on first use"""
+    global _Scheduler
+    with _SchedulerLock:
+        if _Scheduler is None or not _Scheduler.Running:
+            if _Scheduler is None:
+                _Scheduler = TickScheduler()
+            _Scheduler.Start()
+    return _Scheduler
+
+def Log(content, level: str='info', stack: bool=False, fmtArgs: Tuple=None, key: str=None) -> None:
     """Logs data with Extron ProgramLog. Included helpful troubleshooting log header.
+    
+    Messages below the level set with SetLogLevel return before the caller frame
+    is read or the message is formatted. For deferred formatting, pass either a
+    format string with fmtArgs or a callable returning the content.
 
     Args:
-        content (Any): Content to log. Must be a string or printable as a string.
-        level (str, optional): Log level. May be 'info', 'warning', or 'error'. Defaults to 'info'.
+        content (Any): Content to log. Must be a string or printable as a string,
+            or a callable returning the content.
+        level (str, optional): Log level. May be 'debug', 'info', 'warning', or 'error'. Defaults to 'info'.
         stack (bool, optional): Whether or not to print the function call stack. Defaults to False.
+        fmtArgs (Tuple, optional): Arguments for content.format(), only applied
+            if the message is written. Defaults to None.
+        key (str, optional): Rate limiting key used when a LogSink is running.
+            Defaults to the calling module and line with the formatted content.
     """    
     
-    curframe = inspect.currentframe()
-    calframe = inspect.getouterframes(curframe, 2)
+    if LOG_LEVELS.get(level, LOG_LEVELS['error']) < _LogThreshold:
+        return
     
-    regex = r"^(?:\/var\/nortxe\/proj\/eup\/|\/var\/nortxe\/uf\/admin\/modules\/|\/usr\/lib\/python3.5\/)?(.+)\.py$"
+    if callable(content):
+        content = content()
+    elif fmtArgs is not None:
+        content = str(content).format(*fmtArgs)
     
-    re_match = re.match(regex, calframe[1].filename)
-    fileName = re_match.group(1)
-    mod = fileName.replace('/', '.')
+    # only the caller's frame is needed, avoid building full frame records
+    calframe = inspect.currentframe().f_back
+    mod = _ModuleFromFile(calframe.f_code.co_filename)
     ws = '    '
     
     content = str(content).replace('\n', '\n{0}'.format(ws))
@@ -105,44 +635,49 @@ def Log(content, level: str='info', stack: bool=False) -> None:
         # show call stack back to main
         message = 'Logging from {module} - {func} ({line})\n'.format(
                        module = mod,
-                       func = calframe[1].function,
-                       line = calframe[1].lineno
+                       func = calframe.f_code.co_name,
+                       line = calframe.f_lineno
                     )
         message = message + '{w}Stack:\n'.format(w=ws)
-        i = 2
-        while i < len(calframe):
-            parent = calframe[i]
-            loop_match = re.match(regex, parent.filename)
-            if loop_match == None:
-                parent_mod = parent.filename                                    # pragma: no cover
-            else:
-                parent_fn = loop_match.group(1)
-                parent_mod = parent_fn.replace('/','.')
+        parent = calframe.f_back
+        while parent is not None:
+            parent_mod = _ModuleFromFile(parent.f_code.co_filename)
             message = message + '{w}{module} - {func} ({line})\n'.format(
                 w = ws+ws,
                 module = parent_mod,
-                func = parent.function,
-                line = parent.lineno
+                func = parent.f_code.co_name,
+                line = parent.f_lineno
             )
-            i += 1
-            if ((parent_mod == 'main' and parent.function == '<module>')
-                 or (parent_mod == 'extronlib.system.Timer' and parent.function == '__callback')
-                 or (parent_mod == 'Extron.ButtonObject' and parent.function == '_handleMsgAcquired')):
+            if ((parent_mod == 'main' and parent.f_code.co_name == '<module>')
+                 or (parent_mod == 'extronlib.system.Timer' and parent.f_code.co_name == '__callback')
+                 or (parent_mod == 'Extron.ButtonObject' and parent.f_code.co_name == '_handleMsgAcquired')):
                 break                                                           # pragma: no cover
+            parent = parent.f_back
         
         message = message + '{w}{content}'.format(w = ws, content = content)
     else:
         message = ("Logging from {module} - {func} ({line})\n{w}{content}".
                    format(
                        module = mod,
-                       func = calframe[1].function,
-                       line = calframe[1].lineno,
+                       func = calframe.f_code.co_name,
+                       line = calframe.f_lineno,
                        w = ws,
                        content = content
                     )
                    )
     
-    ProgramLog(message, level)
+    # ProgramLog only accepts info, warning, and error
+    level = 'info' if level == 'debug' else level
+    sink = _LogSink
+    if sink is not None and sink.Running:
+        if key is None:
+            # only repeats of the same message are similar, distinct messages
+            # from one call site (e.g. per device status) are all written
+            key = '{} ({}) {}'.format(mod, calframe.f_lineno, content)
+        sink.Write(message, level, key)
+    else:
+        ProgramLog(message, level)
+    del calframe
 
 def TimeIntToStr(time: int, units: bool = True) -> str:
     """Converts integer seconds to human readable string
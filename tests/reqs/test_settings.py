@@ -27,6 +27,7 @@ primaryProcessor = 'CTL001'   # Primary Control Processor
 techMatrixSize = (8,4)        # (inputs, outputs) - size of the virtual matrix to display in Tech Menu
 camSwitcher = 'DEC001'        # ID of hardware device to switch between cameras
 primaryDSP = 'DSP001'         # Primary DSP for audio control
+logAsync = False              # Log directly to the program log, the tests read it as soon as Log returns
 
 # Icon Map
 #     0 - no source
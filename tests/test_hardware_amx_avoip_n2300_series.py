@@ -0,0 +1,141 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from hardware import amx_avoip_n2300_series as n2300
+from hardware.amx_avoip_n2300_series import DeviceStatusRecord, EncoderStatusFields
+
+## -----------------------------------------------------------------------------
+
+def EncoderStatus(name=b'Encoder 1', stream=b'12'):
+    return (b'SVSI_TXGEN2:N2312\rNAME:' + name + b'\rMAC:00:11:22:33:44:66\rIP:10.0.1.1\r'
+            b'NM:255.255.255.0\rGW:10.0.1.254\rIPTRIAL:0\rIPMODE:Static\rID:0\rrel:2023-01-01\r'
+            b'SWVER:1.0\rWEBVER:1.0\rUPDATE:0\rUPDTRY:1\rUPDFAILED:0\rMEDIAPORT0:on\r'
+            b'MEDIAPORT1:off\rDIVASEN:off\rDIVASIP:0.0.0.0\rMUTE:0\rPORTSD1:no\r'
+            b'DVICEVTDLY:0\rDVIDEVTDLY:5\rUSERMCMODE:off\rUSERMCIP:0.0.0.0\rPLAYMODE:live\r'
+            b'STREAM:' + stream + b'\rSAMPLE:48000\rHDMIAUDIO:auto\rvidDetectMode:auto\r'
+            b'PLAYLIST:1\rDVIINPUT:connected\rMODE:auto\rLINEINVOL_L:50\rLINEINVOL_R:40\r'
+            b'LIVEAUDIOHP:off\r')
+
+def LegacyEncoderStatus(match):
+    # eager decode as implemented prior to DeviceStatusRecord
+    return {
+        'Name': str(match.group(2), 'UTF-8'),
+        'SerialNumber': str(match.group(1), 'UTF-8'),
+        'DeviceNetwork': {
+            'MAC': str(match.group(3), 'UTF-8'),
+            'IP': str(match.group(4), 'UTF-8'),
+            'Netmask': str(match.group(5), 'UTF-8'),
+            'Gateway': str(match.group(6), 'UTF-8'),
+            'IPMode': str(match.group(8), 'UTF-8'),
+            'IPTrailMode': bool(int(match.group(7)))
+        },
+        'ID': str(match.group(9), 'UTF-8'),
+        'Firmware': {
+            'Version': str(match.group(10), 'UTF-8'),
+            'Date': str(match.group(11), 'UTF-8'),
+            'WebVersion': str(match.group(12), 'UTF-8'),
+            'Update': {
+                'Updating': bool(int(match.group(13))),
+                'Tries': int(match.group(14)),
+                'Fails': int(match.group(15))
+            }
+        },
+        'MulticastTraffic': (
+            (True if str(match.group(16), 'UTF-8') == 'on' else False),
+            (True if str(match.group(17), 'UTF-8') == 'on' else False)
+        ),
+        "P1Disabled": (False if str(match.group(20), 'UTF-8') == 'yes' else True),
+        'NActEventDelay': {
+            'connect': int(match.group(21)),
+            'disconnect': int(match.group(22))
+        },
+        'UserMulticast': (True if str(match.group(23), 'UTF-8') == 'on' else False),
+        'UserMulticastAddr': str(match.group(24), 'UTF-8'),
+        'Stream': int(match.group(25)),
+        'AudioSampleRate': int(match.group(26)),
+        'HDMIAudioMode': str(match.group(27), 'UTF-8'),
+        'VideoDetectionMode': str(match.group(28), 'UTF-8'),
+        'Mode': str(match.group(30), 'UTF-8'),
+        'LineInVol': (int(match.group(31)), int(match.group(32))),
+        'LiveAudioInHostPlay': (True if str(match.group(33), 'UTF-8') == 'on' else False)
+    }
+
+class DeviceStatusRecord_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.Enc = n2300.EthernetClass(None, '10.0.1.1', 50002, Model='NMX-ENC-N2312')
+        self.Match = self.EncoderMatch(EncoderStatus())
+        return super().setUp()
+
+    def EncoderMatch(self, reply):
+        pattern = [p for p in self.Enc._DeviceClass__Dispatcher._ReceiveDispatcher__Order
+                   if p.pattern.startswith(b'SVSI_TXGEN2:(\\w+)')][0]
+        return pattern.search(reply)
+
+    def test_DeviceStatusRecord_Type(self):
+        record = DeviceStatusRecord(self.Match, EncoderStatusFields, streamGroup=25)
+        self.assertIsInstance(record, DeviceStatusRecord)
+        with self.assertRaises(AttributeError):
+            record.Other = 1
+
+    def test_DeviceStatusRecord_Lazy(self):
+        record = DeviceStatusRecord(self.Match, EncoderStatusFields, streamGroup=25)
+        self.assertEqual(record.Stream, 12)
+        self.assertEqual(record._DeviceStatusRecord__decoded, {'Stream': 12})
+
+        self.assertEqual(record['Firmware']['Update']['Tries'], 1)
+        self.assertIs(record['Firmware'], record['Firmware'])
+        self.assertEqual(set(record._DeviceStatusRecord__decoded), {'Stream', 'Firmware'})
+
+        with self.assertRaises(KeyError):
+            record['NotAField']
+
+    def test_DeviceStatusRecord_Fields(self):
+        record = DeviceStatusRecord(self.Match, EncoderStatusFields, streamGroup=25)
+        self.assertEqual(dict(record), LegacyEncoderStatus(self.Match))
+        self.assertEqual(record, LegacyEncoderStatus(self.Match))
+
+    def test_DeviceStatusRecord_Equality(self):
+        record = DeviceStatusRecord(self.Match, EncoderStatusFields, streamGroup=25)
+        testList = \
+            [
+                (EncoderStatus(), True),
+                (EncoderStatus(name=b'Encoder 2'), False),
+                (EncoderStatus(stream=b'13'), False)
+            ]
+        for reply, expected in testList:
+            with self.subTest(reply=reply):
+                other = DeviceStatusRecord(self.EncoderMatch(reply), EncoderStatusFields, streamGroup=25)
+                self.assertEqual(record == other, expected)
+                self.assertEqual(record != other, not expected)
+
+    def test_DeviceStatusRecord_Driver(self):
+        self.Enc.ReceiveData(self.Enc, EncoderStatus())
+        status = self.Enc.ReadStatus('DeviceStatus')
+        self.assertIsInstance(status, DeviceStatusRecord)
+        self.assertEqual(status.Stream, 12)
+        self.assertEqual(status['Stream'], 12)
+        self.assertEqual(status['Name'], 'Encoder 1')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,276 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import os
+import time
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from hardware.avoip_virtual_matrix import VirtualDeviceClass
+from hardware import amx_avoip_n2300_series as n2300
+from uofi_gui.sourceControls.routing import RouteController
+from utilityFunctions import Log
+
+from types import SimpleNamespace
+## -----------------------------------------------------------------------------
+
+MATRIX_SIZE = 32
+
+def BuildMatrix(size: int=MATRIX_SIZE) -> VirtualDeviceClass:
+    """Builds a simulated size x size SVSi N2300 system on the stub extronlib
+
+    Encoder n transmits on stream 100 + n, decoder n is tied to encoder
+    ((n + 1) % size) + 1.
+    """
+    hardware = {}
+    for i in range(1, size + 1):
+        enc = n2300.EthernetClass(None, '10.0.1.{}'.format(i), 50002, Model='NMX-ENC-N2312')
+        enc.WriteStatus('DeviceStatus', {'Stream': 100 + i})
+        hardware['ENC{:03}'.format(i)] = SimpleNamespace(Name='ENC{:03}'.format(i),
+                                                         Model='NMX-ENC-N2312',
+                                                         MatrixAssignment='VMX001',
+                                                         MatrixInput=i,
+                                                         interface=enc)
+
+        dec = n2300.EthernetClass(None, '10.0.2.{}'.format(i), 50002, Model='NMX-DEC-N2322')
+        dec.WriteStatus('Stream', 100 + ((i + 1) % size) + 1)
+        dec.WriteStatus('AudioStream', 0)
+        hardware['DEC{:03}'.format(i)] = SimpleNamespace(Name='DEC{:03}'.format(i),
+                                                         Model='NMX-DEC-N2322',
+                                                         MatrixAssignment='VMX001',
+                                                         MatrixOutput=i,
+                                                         interface=dec)
+
+    GUIHost = SimpleNamespace(Hardware=hardware)
+    vmx = VirtualDeviceClass(GUIHost, 'VMX001', 'MatrixAssignment', Model='AMX SVSi N2300')
+    vmx.RefreshDelay = 0
+    vmx.FindAssociatedHardware()
+    return vmx
+
+def LinearTieScan(vmx: VirtualDeviceClass):
+    # expected ties, every encoder's DeviceStatus is read for every decoder
+    ties = {}
+    for OutputHw in vmx.VirtualOutputDevices.values():
+        stream = OutputHw.interface.ReadStatus('Stream')
+        ties[OutputHw.MatrixOutput] = 0
+        for InputHw in vmx.VirtualInputDevices.values():
+            devStatus = InputHw.interface.ReadStatus('DeviceStatus')
+            if devStatus is not None and devStatus['Stream'] == stream:
+                ties[OutputHw.MatrixOutput] = InputHw.MatrixInput
+    return ties
+
+def LegacyUpdateAllMatrixTie(vmx: VirtualDeviceClass):
+    # UpdateAllMatrixTie prior to the stream index, for benchmark comparison
+    for OutputHw in vmx.VirtualOutputDevices.values():
+        OutputHw.interface.Update('Stream', None)
+    
+    for OutputHw in vmx.VirtualOutputDevices.values():
+        if OutputHw.Model == 'NMX-ATC-N4321':
+            StreamTuple = (None,
+                           OutputHw.interface.ReadStatus('Stream', {'Instance': 'Tx'}))
+        else:
+            StreamTuple = (OutputHw.interface.ReadStatus('Stream'),
+                           OutputHw.interface.ReadStatus('AudioStream'))
+        if StreamTuple != (None, None):
+            if StreamTuple[0] == StreamTuple[1] or StreamTuple[1] == 0: # Audio/Video
+                mInput = 0
+                for InputHw in vmx.VirtualInputDevices.values():
+                    devStatus = InputHw.interface.ReadStatus('DeviceStatus')
+                    if devStatus is not None:
+                        if InputHw.Model == 'NMX-ATC-N4321':
+                            inputStream = devStatus['Transmit']['Stream']
+                        else:
+                            inputStream = devStatus['Stream']
+                        
+                        mInput = None
+                        if inputStream == StreamTuple[0]:
+                            mInput = InputHw.MatrixInput
+                            vmx.WriteStatus('InputTieStatus', 'Audio/Video', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
+                        else:
+                            vmx.WriteStatus('InputTieStatus', 'Untied', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
+                vmx.WriteStatus('OutputTieStatus', mInput, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio/Video'})
+                vmx.WriteStatus('OutputTieStatus', mInput, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Video'})
+                vmx.WriteStatus('OutputTieStatus', mInput, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio'})
+            else: # individual audio and video
+                mInputA = 0
+                mInputV = 0
+                for InputHw in vmx.VirtualInputDevices.values():
+                    devStatus = InputHw.interface.ReadStatus('DeviceStatus')
+                    if devStatus is not None:
+                        if InputHw.Model == 'NMX-ATC-N4321':
+                            inputStream = devStatus['Transmit']['Stream']
+                        else:
+                            inputStream = devStatus['Stream']
+                        
+                        mInputV = None
+                        mInputA = None
+                        if inputStream == StreamTuple[0]:
+                            mInputV = InputHw.MatrixInput
+                            vmx.WriteStatus('InputTieStatus', 'Video', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
+                        elif inputStream == StreamTuple[1]:
+                            mInputA = InputHw.MatrixInput
+                            vmx.WriteStatus('InputTieStatus', 'Audio', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
+                        else:
+                            vmx.WriteStatus('InputTieStatus', 'Untied', {'Input': InputHw.MatrixInput, 'Output': OutputHw.MatrixOutput})
+                vmx.WriteStatus('OutputTieStatus', 0, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio/Video'})
+                vmx.WriteStatus('OutputTieStatus', mInputV, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Video'})
+                vmx.WriteStatus('OutputTieStatus', mInputA, {'Output': OutputHw.MatrixOutput, 'Tie Type': 'Audio'})
+
+def Ties(input, outputs, tieType='Audio/Video'):
+    return [{'Input': input, 'Output': o, 'Tie Type': tieType} for o in outputs]
+
+def RecordCalls(vmx: VirtualDeviceClass):
+    # records the Set and Update calls made to each decoder
+    calls = {}
+    for OutputHw in vmx.VirtualOutputDevices.values():
+        record = []
+        calls[OutputHw.MatrixOutput] = record
+        interface = OutputHw.interface
+        def Set(command, value, qualifier=None, record=record, Set=interface.Set):
+            record.append(('Set', command, value))
+            Set(command, value, qualifier)
+        def Update(command, qualifier=None, record=record, Update=interface.Update):
+            record.append(('Update', command))
+            Update(command, qualifier)
+        interface.Set = Set
+        interface.Update = Update
+    return calls
+
+class VirtualMatrix_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestMatrix = BuildMatrix()
+        return super().setUp()
+
+    def test_VirtualMatrix_MatrixSize(self):
+        self.assertEqual(self.TestMatrix.MatrixSize, (MATRIX_SIZE, MATRIX_SIZE))
+
+    def test_VirtualMatrix_StreamIndex(self):
+        self.assertEqual(len(self.TestMatrix.StreamIndex), MATRIX_SIZE)
+        for i in range(1, MATRIX_SIZE + 1):
+            with self.subTest(input=i):
+                self.assertEqual(self.TestMatrix.StreamIndex[100 + i], i)
+
+    def test_VirtualMatrix_StreamIndex_DeviceStatusChange(self):
+        enc = self.TestMatrix.VirtualInputDevices[1].interface
+        enc.WriteStatus('DeviceStatus', {'Stream': 500})
+
+        self.assertNotIn(101, self.TestMatrix.StreamIndex)
+        self.assertEqual(self.TestMatrix.StreamIndex[500], 1)
+
+    def test_VirtualMatrix_UpdateAllMatrixTie(self):
+        try:
+            self.TestMatrix.UpdateAllMatrixTie()
+        except Exception as inst:
+            self.fail('UpdateAllMatrixTie raised {} unexpectedly!'.format(type(inst)))
+
+        expected = LinearTieScan(self.TestMatrix)
+        for output, mInput in expected.items():
+            with self.subTest(output=output):
+                self.assertEqual(self.TestMatrix.ReadStatus('OutputTieStatus', {'Output': output, 'Tie Type': 'Audio/Video'}), mInput)
+                self.assertEqual(self.TestMatrix.ReadStatus('InputTieStatus', {'Input': mInput, 'Output': output}), 'Audio/Video')
+
+    def test_VirtualMatrix_StreamIndex_ChainedSubscription(self):
+        # DeviceStatus subscribed in the system settings before the index is built
+        vmx = BuildMatrix()
+        received = []
+        enc = vmx.VirtualInputDevices[1].interface
+        enc.SubscribeStatus('DeviceStatus', None, lambda command, value, qualifier: received.append(value))
+        vmx.BuildStreamIndex()
+        vmx.BuildStreamIndex()
+
+        enc.WriteStatus('DeviceStatus', {'Stream': 500})
+        self.assertEqual(vmx.StreamIndex[500], 1)
+        self.assertEqual(received, [{'Stream': 500}])
+
+    def test_VirtualMatrix_MatrixTieBatchCommand(self):
+        self.TestMatrix.UpdateAllMatrixTie()
+        calls = RecordCalls(self.TestMatrix)
+        ties = [{'Input': 1, 'Output': o, 'Tie Type': 'Audio/Video'} for o in range(1, 5)]
+        try:
+            self.TestMatrix.Set('MatrixTieBatchCommand', ties)
+        except Exception as inst:
+            self.fail('MatrixTieBatchCommand raised {} unexpectedly!'.format(type(inst)))
+
+        for output, record in calls.items():
+            with self.subTest(output=output):
+                if output <= 4:
+                    # tie sent, then a single refresh for the batch
+                    self.assertEqual(record, [('Set', 'Stream', 101),
+                                              ('Set', 'AudioStream', 101),
+                                              ('Update', 'Stream')])
+                else:
+                    self.assertEqual(record, [])
+
+    def test_VirtualMatrix_MatrixTieBatchCommand_Coalesced(self):
+        self.TestMatrix.UpdateAllMatrixTie()
+        self.TestMatrix.RefreshDelay = 0.1
+        calls = RecordCalls(self.TestMatrix)
+        self.TestMatrix.Set('MatrixTieBatchCommand', [{'Input': 1, 'Output': o, 'Tie Type': 'Audio/Video'} for o in range(1, 3)])
+        self.TestMatrix.Set('MatrixTieBatchCommand', [{'Input': 2, 'Output': o, 'Tie Type': 'Audio/Video'} for o in range(2, 5)])
+        for record in calls.values():
+            self.assertNotIn(('Update', 'Stream'), record)
+
+        # expire the refresh delay, both batches share one refresh of the
+        # outputs they touched
+        self.TestMatrix._DeviceClass__FlushRefresh()
+        for output, record in calls.items():
+            with self.subTest(output=output):
+                self.assertEqual(record.count(('Update', 'Stream')), 1 if output <= 4 else 0)
+
+    def test_VirtualMatrix_RouteController_FailedTie(self):
+        routeCtl = RouteController(self.TestMatrix.GUIHost, SimpleNamespace(Id='VMX001', interface=self.TestMatrix))
+        self.TestMatrix.GUIHost.RouteCtl = routeCtl
+        calls = RecordCalls(self.TestMatrix)
+
+        # decoder 1 is offline, its stream is unchanged by the tie
+        stream = self.TestMatrix.VirtualOutputDevices[1].interface.ReadStatus('Stream')
+        routeCtl.Apply(Ties(1, [1, 2]))
+        self.TestMatrix.VirtualOutputDevices[2].interface.WriteStatus('Stream', 101)
+        self.TestMatrix.VirtualOutputDevices[2].interface.WriteStatus('AudioStream', 101)
+        self.TestMatrix.UpdateAllMatrixTie()
+        self.assertEqual(routeCtl.GetRoute(1), self.TestMatrix.StreamIndex[stream])
+        self.assertEqual(routeCtl.GetRoute(2), 1)
+
+        # the re-request is sent for the output whose tie failed
+        del calls[1][:]
+        self.assertEqual(routeCtl.Apply(Ties(1, [1, 2])), Ties(1, [1]))
+        self.assertIn(('Set', 'Stream', 101), calls[1])
+
+    @unittest.skipUnless(os.environ.get('RUN_BENCHMARKS'), 'set RUN_BENCHMARKS=1 to run benchmarks')
+    def test_VirtualMatrix_Benchmark(self):
+        iterations = 50
+        legacyMatrix = BuildMatrix()
+
+        start = time.perf_counter()
+        for i in range(iterations):
+            LegacyUpdateAllMatrixTie(legacyMatrix)
+        legacyTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(iterations):
+            self.TestMatrix.UpdateAllMatrixTie()
+        indexedTime = time.perf_counter() - start
+
+        Log('{0}x{0} UpdateAllMatrixTie - legacy: {1:.2f} ms, indexed: {2:.2f} ms',
+            fmtArgs=(MATRIX_SIZE, legacyTime / iterations * 1000, indexedTime / iterations * 1000))
+
+if __name__ == '__main__':
+    unittest.main()
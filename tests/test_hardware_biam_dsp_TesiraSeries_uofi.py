@@ -0,0 +1,314 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from hardware import biam_dsp_TesiraSeries_uofi as tesira
+from uofi_gui.systemHardware import SystemHardwareController
+
+from types import SimpleNamespace
+## -----------------------------------------------------------------------------
+
+class RecordingPollController:
+    def __init__(self) -> None:
+        self.Polling = []
+        self.Connections = []
+
+    def AddPolling(self, interface, command, qualifier=None, active_duration=None, inactive_duration=None):
+        self.Polling.append((command, qualifier, active_duration, inactive_duration))
+
+    def RemovePolling(self, interface, command, qualifier=None):
+        for poll in self.Polling:
+            if poll[0] == command and (qualifier is None or poll[1] == qualifier):
+                self.Polling.remove(poll)
+                return
+
+    def SetInterfaceConnection(self, interface, status, probe=True):
+        self.Connections.append(status)
+
+def BuildDSP(window=1000):
+    # replies are only simulated by the pipeline tests, elsewhere the window
+    # is left wide open so every command is sent
+    dsp = tesira.SSHClass(None, '10.0.3.1', 22, Credentials=('default', ''), PipelineWindow=window)
+    dsp.Sent = []
+    dsp.Send = dsp.Sent.append
+    dsp.VerboseDisabled = False
+    return dsp
+
+class TesiraSubscription_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestDSP = BuildDSP()
+        self.Statuses = []
+        self.TestDSP.SubscribeStatus('SubscriptionStatus', None, self.Callback)
+        return super().setUp()
+
+    def Callback(self, command, value, qualifier):
+        self.Statuses.append((value, qualifier['Command'], qualifier['Instance Tag']))
+
+    def test_Tesira_SubscribeCommands(self):
+        # subscription labels must be '<Command>_<Instance Tag>' for the
+        # publish to confirm the subscription
+        for command, attribute in self.TestDSP.SubscribeCommands.items():
+            with self.subTest(command=command):
+                self.TestDSP.Sent.clear()
+                self.TestDSP.Update(command, {'Instance Tag': 'Block 1', 'Channel': '1'})
+                self.assertEqual(self.TestDSP.Sent[-1],
+                                 '"Block 1" subscribe {} "{}_Block 1" 100\n'.format(attribute, command))
+
+    def test_Tesira_SubscriptionStatus(self):
+        self.TestDSP.Update('LevelControl', {'Instance Tag': 'ProgLevel', 'Channel': '1'})
+        self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"LevelControl_ProgLevel" "value":[-10.000000 -20.000000]\r\n')
+        self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"LevelControl_ProgLevel" "value":[-12.000000 -20.000000]\r\n')
+
+        self.assertEqual(self.Statuses, [('Subscribed', 'LevelControl', 'ProgLevel')])
+        self.assertEqual(self.TestDSP.ReadStatus('LevelControl', {'Instance Tag': 'ProgLevel', 'Channel': '1'}), -12)
+        self.assertEqual(self.TestDSP.ReadStatus('LevelControl', {'Instance Tag': 'ProgLevel', 'Channel': '2'}), -20)
+
+        with self.subTest(param='not a subscribe command'):
+            self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"RoomCombinerOutputLevel_Combiner_1" "value":-10.000000\r\n')
+            self.assertEqual(len(self.Statuses), 1)
+
+    def test_Tesira_SubscriptionLost(self):
+        self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"MuteControl_ProgLevel" "value":[true false]\r\n')
+        self.TestDSP.OnDisconnected()
+        self.assertEqual(self.Statuses,
+                         [
+                             ('Subscribed', 'MuteControl', 'ProgLevel'),
+                             ('Not Subscribed', 'MuteControl', 'ProgLevel')
+                         ])
+        self.assertEqual(self.TestDSP.ReadStatus('ConnectionStatus'), 'Disconnected')
+
+        with self.subTest(param='resubscribed'):
+            # verbose mode is restored on reconnection before commands are sent
+            self.TestDSP.VerboseDisabled = False
+            self.TestDSP.Update('MuteControl', {'Instance Tag': 'ProgLevel', 'Channel': '1'})
+            self.assertEqual(self.TestDSP.Sent[-2:],
+                             [
+                                 '"ProgLevel" unsubscribe mutes "MuteControl_ProgLevel"\n',
+                                 '"ProgLevel" subscribe mutes "MuteControl_ProgLevel" 100\n'
+                             ])
+            self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"MuteControl_ProgLevel" "value":[true false]\r\n')
+            self.assertEqual(self.Statuses[-1], ('Subscribed', 'MuteControl', 'ProgLevel'))
+
+class TesiraUpdateMatch_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestDSP = BuildDSP()
+        self.Dispatcher = self.TestDSP._DeviceClass__Dispatcher
+        return super().setUp()
+
+    def test_Tesira_UpdateMatch_PatternCount(self):
+        initial = self.Dispatcher.PatternCount
+        for i in range(64):
+            self.TestDSP.Update('InputLevel', {'Instance Tag': 'Mixer{}'.format(i), 'Channel': '1'})
+            self.TestDSP.Update('InputMute', {'Instance Tag': 'Mixer{}'.format(i), 'Channel': '1'})
+        # one pattern per reply format regardless of the number of tags
+        self.assertEqual(self.Dispatcher.PatternCount, initial + 2)
+
+    def test_Tesira_UpdateMatch_Tags(self):
+        testList = [
+                ('InputLevel', {'Instance Tag': 'Mixer', 'Channel': '2'}, b'Mixer get inputLevel 2\r\n+OK "value":-12.000000\r\n', -12),
+                ('InputMute', {'Instance Tag': 'Program Mixer', 'Channel': '3'}, b'"Program Mixer" get inputMute 3\r\n+OK "value":true\r\n', 'On'),
+                ('TIReceiveLevel', {'Instance Tag': 'Phone'}, b'Phone get level\r\n+OK "value":-6.000000\r\n', -6),
+                ('VoIPReceiveLevel', {'Instance Tag': 'VoIP', 'Line': '1'}, b'VoIP get level 1\r\n+OK "value":-3.000000\r\n', -3)
+            ]
+        for command, qualifier, reply, value in testList:
+            with self.subTest(command=command):
+                self.TestDSP.Update(command, qualifier)
+                self.TestDSP.ReceiveData(self.TestDSP, reply)
+                self.assertEqual(self.TestDSP.ReadStatus(command, qualifier), value)
+
+    def test_Tesira_UpdateMatch_SharedFormat(self):
+        # AEC gain and graphic EQ band gain replies share a format and are told
+        # apart by instance tag
+        aec = {'Instance Tag': 'AecInput1', 'Channel': '1'}
+        geq = {'Instance Tag': 'GEQ', 'Band': '1'}
+        self.TestDSP.Update('AECGain', aec)
+        self.TestDSP.Update('GraphicEqualizerBandGain', geq)
+        self.TestDSP.ReceiveData(self.TestDSP, b'AecInput1 get gain 1\r\n+OK "value":24.000000\r\nGEQ get gain 1\r\n+OK "value":-3.000000\r\n')
+        self.assertEqual(self.TestDSP.ReadStatus('AECGain', aec), 24)
+        self.assertIsNone(self.TestDSP.ReadStatus('AECGain', {'Instance Tag': 'GEQ', 'Channel': '1'}))
+        self.assertIsNone(self.TestDSP.ReadStatus('GraphicEqualizerBandGain', {'Instance Tag': 'AecInput1', 'Band': '1'}))
+
+        with self.subTest(param='unknown tag'):
+            try:
+                self.TestDSP.ReceiveData(self.TestDSP, b'Other get gain 1\r\n+OK "value":6.000000\r\n')
+            except Exception as inst:
+                self.fail('ReceiveData raised {} unexpectedly!'.format(type(inst)))
+            self.assertEqual(self.Dispatcher.Buffer, b'')
+
+class TesiraPipeline_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestDSP = BuildDSP(window=2)
+        self.TestDSP.VerboseDisabled = True
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.TestDSP.Pipeline.Clear()
+        return super().tearDown()
+
+    def test_TesiraPipeline_Verbose(self):
+        self.TestDSP.Set('LevelControl', -10, {'Instance Tag': 'ProgLevel', 'Channel': '1'})
+        self.TestDSP.Set('LevelControl', -9, {'Instance Tag': 'ProgLevel', 'Channel': '1'})
+        # nothing follows the verbose handshake until it is answered
+        self.assertEqual(self.TestDSP.Sent, ['SESSION set verbose true\n'])
+        self.TestDSP.ReceiveData(self.TestDSP, b'SESSION set verbose true\r\n+OK\r\n')
+        self.assertFalse(self.TestDSP.VerboseDisabled)
+        self.assertEqual(self.TestDSP.Sent,
+                         [
+                             'SESSION set verbose true\n',
+                             'ProgLevel set level 1 -10\n',
+                             'ProgLevel set level 1 -9\n'
+                         ])
+
+    def test_TesiraPipeline_Replies(self):
+        self.TestDSP.VerboseDisabled = False
+        for i in range(1, 5):
+            self.TestDSP.Update('InputLevel', {'Instance Tag': 'Mixer', 'Channel': str(i)})
+        self.assertEqual(len(self.TestDSP.Sent), 2)
+
+        # replies split across packets
+        self.TestDSP.ReceiveData(self.TestDSP, b'Mixer get inputLevel 1\r\n+OK "val')
+        self.TestDSP.ReceiveData(self.TestDSP, b'ue":-12.000000\r\nMixer get inputLevel 2\r\n-ERR address not found: {"deviceId":0 "classCode":0 "instanceNum":0}\r\n')
+        self.assertEqual(self.TestDSP.Sent[2:], ['Mixer get inputLevel 3\n', 'Mixer get inputLevel 4\n'])
+        self.assertEqual(self.TestDSP.ReadStatus('InputLevel', {'Instance Tag': 'Mixer', 'Channel': '1'}), -12)
+
+        stats = self.TestDSP.Pipeline.Stats['InputLevel']
+        self.assertEqual(stats['sent'], 4)
+        self.assertEqual(stats['errors'], 1)
+
+        with self.subTest(param='publish'):
+            self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"LevelControl_ProgLevel" "value":[-10.000000]\r\n')
+            self.assertEqual(self.TestDSP.Pipeline.InFlight, 2)
+
+    def test_TesiraPipeline_Merge(self):
+        self.TestDSP.VerboseDisabled = False
+        qual = {'Instance Tag': 'Mixer', 'Channel': '1'}
+        for command in ['InputMute', 'InputLevel', 'InputLevel', 'InputLevel']:
+            self.TestDSP.Update(command, qual)
+        self.TestDSP.Update('InputLevel', {'Instance Tag': 'Mixer', 'Channel': '2'})
+        self.TestDSP.Update('InputLevel', {'Instance Tag': 'Mixer', 'Channel': '2'})
+        # the second level poll of channel 1 is queued behind the one in flight,
+        # the third is merged with it
+        self.assertEqual(self.TestDSP.Pipeline.Merged, 2)
+        self.assertEqual(self.TestDSP.Pipeline.QueueDepth, 2)
+
+    def test_TesiraPipeline_Disconnected(self):
+        for i in range(1, 5):
+            self.TestDSP.Update('InputLevel', {'Instance Tag': 'Mixer', 'Channel': str(i)})
+        self.TestDSP.OnDisconnected()
+        self.assertEqual(self.TestDSP.Pipeline.InFlight, 0)
+        self.assertEqual(self.TestDSP.Pipeline.QueueDepth, 0)
+
+class TesiraSubscriptionPolling_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.PollCtl = RecordingPollController()
+        GUIHost = SimpleNamespace(PollCtl=self.PollCtl)
+        self.TestHardware = SystemHardwareController(GUIHost,
+                                                     'DSP001',
+                                                     'Test DSP',
+                                                     'Biamp',
+                                                     'TesiraFORTE X 400',
+                                                     {
+                                                         'module': 'hardware.biam_dsp_TesiraSeries_uofi',
+                                                         'interface_class': 'SSHClass',
+                                                         'interface_configuration': {
+                                                             'Hostname': '10.0.3.1',
+                                                             'IPPort': 22,
+                                                             'Credentials': ('default', '')
+                                                         }
+                                                     },
+                                                     [],
+                                                     [
+                                                         {
+                                                             'command': 'LevelControl',
+                                                             'qualifier': [
+                                                                 {'Instance Tag': 'ProgLevel', 'Channel': '1'},
+                                                                 {'Instance Tag': 'ProgLevel', 'Channel': '2'},
+                                                                 {'Instance Tag': 'MicLevel', 'Channel': '1'}
+                                                             ],
+                                                             'active_int': 30,
+                                                             'inactive_int': 120
+                                                         },
+                                                         {
+                                                             'command': 'AECGain',
+                                                             'qualifier': [
+                                                                 {'Instance Tag': 'AecInput1', 'Channel': '1'},
+                                                                 {'Instance Tag': 'AecInput1', 'Channel': '2'}
+                                                             ],
+                                                             'active_int': 30,
+                                                             'inactive_int': 120
+                                                         }
+                                                     ],
+                                                     DeferConnect=True)
+        self.TestDSP = self.TestHardware.interface
+        return super().setUp()
+
+    def Commands(self):
+        return [(poll[0], poll[1]['Instance Tag']) for poll in self.PollCtl.Polling]
+
+    def test_SubscriptionPolling_Unconfirmed(self):
+        # one poll per instance tag for subscribe commands, per qualifier otherwise
+        self.assertEqual(sorted(self.Commands()),
+                         [
+                             ('AECGain', 'AecInput1'),
+                             ('AECGain', 'AecInput1'),
+                             ('LevelControl', 'MicLevel'),
+                             ('LevelControl', 'ProgLevel')
+                         ])
+        self.assertIn(('LevelControl', {'Instance Tag': 'ProgLevel', 'Channel': '1'}, 30, 120), self.PollCtl.Polling)
+
+    def test_SubscriptionPolling_Subscribed(self):
+        self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"LevelControl_ProgLevel" "value":[-10.000000 -20.000000]\r\n')
+        self.assertEqual(sorted(self.Commands()),
+                         [
+                             ('AECGain', 'AecInput1'),
+                             ('AECGain', 'AecInput1'),
+                             ('LevelControl', 'MicLevel')
+                         ])
+        self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"LevelControl_MicLevel" "value":[-10.000000]\r\n')
+        self.assertNotIn('LevelControl', [command for command, tag in self.Commands()])
+
+    def test_SubscriptionPolling_Fallback(self):
+        self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"LevelControl_ProgLevel" "value":[-10.000000 -20.000000]\r\n')
+        self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"LevelControl_MicLevel" "value":[-10.000000]\r\n')
+        self.TestDSP.OnDisconnected()
+        self.assertEqual(sorted(self.Commands()),
+                         [
+                             ('AECGain', 'AecInput1'),
+                             ('AECGain', 'AecInput1'),
+                             ('LevelControl', 'MicLevel'),
+                             ('LevelControl', 'ProgLevel')
+                         ])
+        self.assertEqual(self.PollCtl.Connections[-1], 'Disconnected')
+
+        with self.subTest(param='resubscribed'):
+            self.TestDSP.ReceiveData(self.TestDSP, b'! "publishToken":"LevelControl_ProgLevel" "value":[-10.000000 -20.000000]\r\n')
+            self.assertEqual(self.PollCtl.Connections[-1], 'Connected')
+            self.assertEqual(sorted(self.Commands()),
+                             [
+                                 ('AECGain', 'AecInput1'),
+                                 ('AECGain', 'AecInput1'),
+                                 ('LevelControl', 'MicLevel')
+                             ])
+
+if __name__ == '__main__':
+    unittest.main()
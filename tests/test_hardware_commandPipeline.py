@@ -0,0 +1,164 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import time
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from hardware.commandPipeline import CommandPipeline
+## -----------------------------------------------------------------------------
+
+class CommandPipeline_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.Sent = []
+        self.TestPipeline = CommandPipeline(self.Sent.append, window=2, timeout=0.5)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.TestPipeline.Clear()
+        return super().tearDown()
+
+    def test_CommandPipeline_Type(self):
+        self.assertIsInstance(self.TestPipeline, CommandPipeline)
+
+    def test_CommandPipeline_Window(self):
+        for i in range(5):
+            self.TestPipeline.Queue('Level', 'set level {}\n'.format(i))
+        self.assertEqual(self.Sent, ['set level 0\n', 'set level 1\n'])
+        self.assertEqual(self.TestPipeline.InFlight, 2)
+        self.assertEqual(self.TestPipeline.QueueDepth, 3)
+
+        for i in range(5):
+            self.TestPipeline.Reply(True, '+OK')
+        # sent in the order queued
+        self.assertEqual(self.Sent, ['set level {}\n'.format(i) for i in range(5)])
+        self.assertEqual(self.TestPipeline.InFlight, 0)
+        self.assertEqual(self.TestPipeline.Replies, 5)
+
+    def test_CommandPipeline_Reply(self):
+        results = []
+        callback = lambda ok, reply: results.append((ok, reply))
+        self.TestPipeline.Queue('Level', 'get level 1\n', callback=callback)
+        self.TestPipeline.Queue('Mute', 'get mute 1\n', callback=callback)
+        self.TestPipeline.Reply(True, '+OK "value":-10.000000')
+        self.TestPipeline.Reply(False, 'INVALID_PARAMETER')
+        self.assertEqual(results, [(True, '+OK "value":-10.000000'), (False, 'INVALID_PARAMETER')])
+
+        with self.subTest(param='unmatched'):
+            self.TestPipeline.Reply(True, '+OK')
+            self.assertEqual(self.TestPipeline.Unmatched, 1)
+
+    def test_CommandPipeline_Merge(self):
+        for i in range(3):
+            self.TestPipeline.Queue('Level', 'get level {}\n'.format(i), key='get level {}\n'.format(i))
+        # 'get level 2' is waiting for the window and is merged
+        self.assertFalse(self.TestPipeline.Queue('Level', 'get level 2\n', key='get level 2\n'))
+        # 'get level 0' has been sent and is queued again
+        self.assertTrue(self.TestPipeline.Queue('Level', 'get level 0\n', key='get level 0\n'))
+        self.assertTrue(self.TestPipeline.Pending('get level 1\n'))
+        self.assertEqual(self.TestPipeline.Merged, 1)
+        self.assertEqual(self.TestPipeline.QueueDepth, 2)
+
+    def test_CommandPipeline_Barrier(self):
+        self.TestPipeline.Queue('Level', 'set level 1\n')
+        self.TestPipeline.Queue('Level', 'set level 2\n')
+        self.TestPipeline.Queue('Level', 'set level 3\n')
+        self.TestPipeline.Queue('Verbose', 'SESSION set verbose true\n', barrier=True)
+        # queued ahead of 'set level 3', sent once the window is empty
+        self.assertEqual(self.Sent, ['set level 1\n', 'set level 2\n'])
+        self.TestPipeline.Reply(True)
+        self.assertEqual(len(self.Sent), 2)
+        self.TestPipeline.Reply(True)
+        self.assertEqual(self.Sent[-1], 'SESSION set verbose true\n')
+        self.assertEqual(self.TestPipeline.InFlight, 1)
+        self.TestPipeline.Reply(True)
+        self.assertEqual(self.Sent[-1], 'set level 3\n')
+
+    def test_CommandPipeline_Expire(self):
+        results = []
+        self.TestPipeline.Queue('Level', 'get level 1\n', callback=lambda ok, reply: results.append(ok))
+        self.TestPipeline.Queue('Level', 'get level 2\n')
+        self.TestPipeline.Queue('Level', 'get level 3\n')
+        self.assertEqual(self.TestPipeline.Expire(time.monotonic()), 0)
+        self.assertEqual(self.TestPipeline.Expire(time.monotonic() + 1), 2)
+        self.assertEqual(results, [False])
+        self.assertEqual(self.Sent[-1], 'get level 3\n')
+
+        with self.subTest(param='timer'):
+            time.sleep(1.2)
+            self.assertEqual(self.TestPipeline.InFlight, 0)
+            self.assertEqual(self.TestPipeline.Timeouts, 3)
+
+    def test_CommandPipeline_Expire_LateReply(self):
+        results = []
+        for i in range(1, 4):
+            self.TestPipeline.Queue('Level', 'get level {}\n'.format(i),
+                                    callback=lambda ok, reply, i=i: results.append((i, ok, reply)))
+        self.assertEqual(self.TestPipeline.Expire(time.monotonic() + 0.5), 2)
+
+        # the late reply to 'get level 1' is discarded, 'get level 3' gets its own reply
+        self.TestPipeline.Reply(True, '+OK "value":-1.000000')
+        self.TestPipeline.Reply(True, '+OK "value":-2.000000')
+        self.TestPipeline.Reply(True, '+OK "value":-3.000000')
+        self.assertEqual(results[2:], [(3, True, '+OK "value":-3.000000')])
+        self.assertEqual(self.TestPipeline.Unmatched, 2)
+
+        with self.subTest(param='not answered'):
+            self.TestPipeline.Queue('Level', 'get level 4\n', callback=lambda ok, reply: results.append((4, ok, reply)))
+            self.TestPipeline.Queue('Level', 'get level 5\n', callback=lambda ok, reply: results.append((5, ok, reply)))
+            self.TestPipeline.Expire(time.monotonic() + 0.5)
+            # no late replies within a further timeout, the next reply is matched
+            self.TestPipeline.Expire(time.monotonic() + 1.1)
+            self.TestPipeline.Queue('Level', 'get level 6\n', callback=lambda ok, reply: results.append((6, ok, reply)))
+            self.TestPipeline.Reply(True, '+OK "value":-6.000000')
+            self.assertEqual(results[-1], (6, True, '+OK "value":-6.000000'))
+
+    def test_CommandPipeline_Expire_Timer(self):
+        # expired within a fraction of the timeout, not up to twice the timeout
+        self.TestPipeline.Queue('Level', 'get level 1\n')
+        time.sleep(0.8)
+        self.assertEqual(self.TestPipeline.Timeouts, 1)
+
+    def test_CommandPipeline_Stats(self):
+        self.TestPipeline.Queue('Level', 'get level 1\n', key='get level 1\n')
+        self.TestPipeline.Queue('Level', 'get level 2\n', key='get level 2\n')
+        self.TestPipeline.Queue('Level', 'get level 3\n', key='get level 3\n')
+        self.TestPipeline.Queue('Level', 'get level 3\n', key='get level 3\n')
+        self.TestPipeline.Reply(True)
+        self.TestPipeline.Reply(False, 'INVALID_PARAMETER')
+        self.TestPipeline.Expire(time.monotonic() + 1)
+
+        stats = self.TestPipeline.Stats['Level']
+        self.assertEqual(stats['sent'], 3)
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertEqual(stats['merged'], 1)
+        self.assertGreaterEqual(stats['max_latency'], stats['avg_latency'])
+
+    def test_CommandPipeline_Clear(self):
+        for i in range(4):
+            self.TestPipeline.Queue('Level', 'get level {}\n'.format(i), key='get level {}\n'.format(i))
+        self.assertEqual(self.TestPipeline.Clear(), 4)
+        self.assertFalse(self.TestPipeline.Pending('get level 3\n'))
+        self.assertEqual(self.TestPipeline.InFlight, 0)
+
+if __name__ == '__main__':
+    unittest.main()
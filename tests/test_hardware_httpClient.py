@@ -0,0 +1,203 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import threading
+import time
+import json
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from hardware.httpClient import HTTPClient, GetHTTPClient
+import hardware.mgwl_sm_Pro_Convert_Series_v1_0_1_0 as MagewellDevice
+## -----------------------------------------------------------------------------
+
+class DeviceServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    Connections = 0
+    Requests = []
+    Delay = 0
+
+    def handle_error(self, request, client_address):
+        # clients closing a connection mid request are expected in these tests
+        pass
+
+class DeviceHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        self.server.Connections += 1
+        return super().setup()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.Requests.append((self.path, self.headers.get('Cookie')))
+        time.sleep(self.server.Delay)
+        body = json.dumps({'status': 0, 'name': 'Lobby'}).encode()
+        self.send_response(200)
+        if 'method=login' in self.path:
+            self.send_header('Set-Cookie', 'sid=1234; Path=/')
+        if self.path == '/close':
+            self.send_header('Connection', 'close')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path == '/drop':
+            # closed without telling the client, as a device dropping an idle connection
+            self.close_connection = True
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        self.server.Requests.append((self.path, self.rfile.read(length)))
+        time.sleep(self.server.Delay)
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+class HTTPClient_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.Server = DeviceServer(('127.0.0.1', 0), DeviceHandler)
+        self.Server.Requests = []
+        self.Port = self.Server.server_address[1]
+        self.ServerThread = threading.Thread(target=self.Server.serve_forever, daemon=True)
+        self.ServerThread.start()
+        self.TestClient = HTTPClient('http', '127.0.0.1', self.Port)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.TestClient.Close()
+        self.Server.shutdown()
+        self.Server.server_close()
+        return super().tearDown()
+
+    def test_HTTPClient_Type(self):
+        self.assertIsInstance(self.TestClient, HTTPClient)
+        with self.assertRaises(ValueError):
+            HTTPClient('ftp', '127.0.0.1')
+
+    def test_HTTPClient_KeepAlive(self):
+        for i in range(5):
+            res = self.TestClient.Request('GET', '/api/config', name='PodStatus')
+            self.assertEqual(res.status, 200)
+            self.assertEqual(json.loads(res.read().decode())['name'], 'Lobby')
+        self.assertEqual(self.Server.Connections, 1)
+        self.assertEqual(self.TestClient.Connects, 1)
+        self.assertEqual(self.TestClient.Reuses, 4)
+
+        with self.subTest(param='connection close'):
+            self.TestClient.Request('GET', '/close')
+            self.TestClient.Request('GET', '/api/config')
+            self.assertEqual(self.Server.Connections, 2)
+
+    def test_HTTPClient_Reconnect(self):
+        self.TestClient.Request('GET', '/drop')
+        time.sleep(0.05)
+        res = self.TestClient.Request('GET', '/api/config')
+        self.assertEqual(res.status, 200)
+        self.assertEqual(self.TestClient.Connects, 2)
+        self.assertEqual(self.TestClient.Errors, 0)
+
+    def test_HTTPClient_Reconnect_Once(self):
+        # both idle connections have been dropped by the host
+        self.Server.Delay = 0.1
+        drops = [threading.Thread(target=self.TestClient.Request, args=('GET', '/drop')) for i in range(2)]
+        for thread in drops:
+            thread.start()
+        for thread in drops:
+            thread.join()
+        self.Server.Delay = 0
+        time.sleep(0.05)
+
+        res = self.TestClient.Request('GET', '/api/config')
+        self.assertEqual(res.status, 200)
+        self.assertEqual(self.TestClient.Reuses, 1)
+        self.assertEqual(self.TestClient.Connects, 3)
+
+    def test_HTTPClient_Reconnect_NotIdempotent(self):
+        self.TestClient.Request('GET', '/drop')
+        time.sleep(0.05)
+        with self.assertRaises(OSError):
+            self.TestClient.Request('POST', '/api/control', body=b'value=1')
+        self.assertEqual(self.TestClient.Connects, 1)
+        self.assertEqual(self.TestClient.Errors, 1)
+
+    def test_HTTPClient_Timeout_NotRetried(self):
+        self.TestClient.ReadTimeout = 0.05
+        self.TestClient.Request('GET', '/api/config')
+        self.Server.Delay = 0.3
+        with self.assertRaises(OSError):
+            self.TestClient.Request('POST', '/api/control', body=b'value=1')
+        with self.assertRaises(OSError):
+            self.TestClient.Request('GET', '/api/config')
+        # each request reached the device once
+        self.assertEqual([req[0] for req in self.Server.Requests], ['/api/config', '/api/control', '/api/config'])
+        self.assertEqual(self.TestClient.Errors, 2)
+
+    def test_HTTPClient_Timeout(self):
+        self.Server.Delay = 0.3
+        self.TestClient.ReadTimeout = 0.05
+        with self.assertRaises(OSError):
+            self.TestClient.Request('GET', '/api/config', name='PodStatus')
+        self.assertEqual(self.TestClient.Errors, 1)
+        self.assertEqual(self.TestClient.Stats['PodStatus']['errors'], 1)
+
+        with self.subTest(param='connect'):
+            client = HTTPClient('http', '127.0.0.1', 1, connect_timeout=0.5)
+            with self.assertRaises(OSError):
+                client.Request('GET', '/')
+
+    def test_HTTPClient_Cookies(self):
+        self.TestClient.Request('GET', '/mwapi?method=login')
+        self.TestClient.Request('GET', '/mwapi?method=get-channel')
+        self.assertEqual(self.Server.Requests[-1], ('/mwapi?method=get-channel', 'sid=1234'))
+
+    def test_HTTPClient_Stats(self):
+        for i in range(4):
+            self.TestClient.Request('GET', '/api/config', name='PodStatus')
+        stats = self.TestClient.Stats['PodStatus']
+        self.assertEqual(stats['count'], 4)
+        self.assertEqual(sum(stats['histogram'].values()), 4)
+        self.assertIn('>10000', stats['histogram'])
+        self.assertGreaterEqual(stats['max_latency'], stats['avg_latency'])
+
+    def test_HTTPClient_Shared(self):
+        client = GetHTTPClient('HTTP', '127.0.0.1', str(self.Port))
+        self.assertIs(GetHTTPClient('http', '127.0.0.1', self.Port), client)
+        self.assertIsNot(GetHTTPClient('https', '127.0.0.1', self.Port), client)
+        self.assertEqual(GetHTTPClient('https', '127.0.0.2').Port, 443)
+
+    def test_HTTPClient_Driver(self):
+        device = MagewellDevice.HTTPClass(None, '127.0.0.1', self.Port, 'Admin', 'password')
+        device.HTTP = self.TestClient
+        device.Update('CurrentSelectedSourceStatus')
+        self.assertEqual(device.ReadStatus('CurrentSelectedSourceStatus'), 'Lobby')
+        # logged in when connected, the session cookie is sent with the poll
+        self.assertIn('method=login', self.Server.Requests[0][0])
+        self.assertEqual(self.Server.Requests[-1][1], 'sid=1234')
+        self.assertEqual(self.Server.Connections, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import re
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from hardware.receiveDispatch import ReceiveDispatcher
+from hardware import biam_dsp_TesiraSeries_uofi as tesira
+from hardware import amx_avoip_n2300_series as n2300
+## -----------------------------------------------------------------------------
+
+class ReceiveDispatcher_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.Matches = []
+        self.TestDispatcher = ReceiveDispatcher(64)
+        self.TestDispatcher.AddMatchString(re.compile(b'LEVEL (\\d+) ([-\\d.]+)\\r\\n'), self.Callback, 'level')
+        self.TestDispatcher.AddMatchString(re.compile(b'MUTE (\\d+) (true|false)\\r\\n'), self.Callback, 'mute')
+        return super().setUp()
+
+    def Callback(self, match, arg):
+        self.Matches.append((arg, match.groups()))
+
+    def test_ReceiveDispatcher_Type(self):
+        self.assertIsInstance(self.TestDispatcher, ReceiveDispatcher)
+        self.assertEqual(self.TestDispatcher.PatternCount, 2)
+
+    def test_ReceiveDispatcher_Receive(self):
+        count = self.TestDispatcher.Receive(b'LEVEL 1 -10.5\r\nMUTE 2 true\r\nLEVEL 3 0\r\n')
+        self.assertEqual(count, 3)
+        self.assertEqual(self.Matches,
+                         [
+                             ('level', (b'1', b'-10.5')),
+                             ('mute', (b'2', b'true')),
+                             ('level', (b'3', b'0'))
+                         ])
+        self.assertEqual(self.TestDispatcher.Buffer, b'')
+
+    def test_ReceiveDispatcher_Receive_Partial(self):
+        self.TestDispatcher.Receive(b'LEVEL 1 -10.5\r\nMUTE 2 tr')
+        self.assertEqual(len(self.Matches), 1)
+        self.assertEqual(self.TestDispatcher.Buffer, b'MUTE 2 tr')
+
+        self.TestDispatcher.Receive(b'ue\r\n')
+        self.assertEqual(self.Matches[-1], ('mute', (b'2', b'true')))
+        self.assertEqual(self.TestDispatcher.Buffer, b'')
+
+    def test_ReceiveDispatcher_BufferCap(self):
+        self.TestDispatcher.Receive(b'x' * 100)
+        self.assertEqual(len(self.TestDispatcher.Buffer), 64)
+
+    def test_ReceiveDispatcher_Duplicate(self):
+        self.TestDispatcher.AddMatchString(re.compile(b'MUTE (\\d+) (true|false)\\r\\n'), self.Callback, 'dup')
+        self.assertEqual(self.TestDispatcher.PatternCount, 2)
+
+    def test_ReceiveDispatcher_AddDuringCallback(self):
+        def AddingCallback(match, arg):
+            self.TestDispatcher.AddMatchString(re.compile(b'GAIN (\\d+)\\r\\n'), self.Callback, 'gain')
+        self.TestDispatcher.AddMatchString(re.compile(b'READY\\r\\n'), AddingCallback, None)
+
+        self.TestDispatcher.Receive(b'READY\r\nGAIN 4\r\n')
+        self.assertEqual(self.TestDispatcher.PatternCount, 4)
+        self.TestDispatcher.Receive(b'GAIN 5\r\n')
+        self.assertEqual(self.Matches[-1], ('gain', (b'5',)))
+
+    def test_ReceiveDispatcher_Order(self):
+        # matches are dispatched in buffer order and never overlap
+        self.TestDispatcher.AddMatchString(re.compile(b'MUTE (\\d+) '), self.Callback, 'partial')
+        self.TestDispatcher.Receive(b'MUTE 1 false\r\nLEVEL 1 -3\r\nMUTE 2 x')
+        self.assertEqual(self.Matches,
+                         [
+                             ('mute', (b'1', b'false')),
+                             ('level', (b'1', b'-3')),
+                             ('partial', (b'2',))
+                         ])
+        self.assertEqual(self.TestDispatcher.Buffer, b'x')
+
+    def test_ReceiveDispatcher_Overlap(self):
+        dispatcher = ReceiveDispatcher(64, overlap=True)
+        dispatcher.AddMatchString(re.compile(b'STATUS\\rSTREAM:(\\d+)\\rMUTE:(\\d)\\r'), self.Callback, 'status')
+        dispatcher.AddMatchString(re.compile(b'STREAM:(\\d+)\\r'), self.Callback, 'stream')
+        dispatcher.AddMatchString(re.compile(b'PLAYLIST:(\\d)\\r'), self.Callback, 'playlist')
+
+        dispatcher.Receive(b'STATUS\rSTREAM:12\rMUTE:0\r')
+        self.assertEqual(self.Matches, [('status', (b'12', b'0')), ('stream', (b'12',))])
+        self.assertEqual(dispatcher.Buffer, b'')
+
+    def test_ReceiveDispatcher_LiteralPrefix(self):
+        testList = \
+            [
+                (b'STREAM:(\\d+)\\r', b'STREAM:'),
+                (b'MUTES?:(\\d)', b'MUTE'),
+                (b'(tag) get level', b'tag get level'),
+                (b'(tag|other) get level', b''),
+                (b'\\! "publishToken"', b'! "publishToken"')
+            ]
+        for pattern, expected in testList:
+            with self.subTest(pattern=pattern):
+                self.assertEqual(ReceiveDispatcher._LiteralPrefix(re.compile(pattern)), expected)
+
+class ReceiveDispatcher_Driver_TestClass(unittest.TestCase):
+    def test_Tesira_Receive(self):
+        dsp = tesira.SSHClass(None, '10.0.3.1', 22, Credentials=('default', ''))
+        for i in range(1, 5):
+            dsp.Update('InputLevel', {'Instance Tag': 'Mixer', 'Channel': str(i)})
+            dsp.Update('InputMute', {'Instance Tag': 'Mixer', 'Channel': str(i)})
+
+        dsp.ReceiveData(dsp, b'Mixer get inputLevel 2\r\n+OK "value":-12.000000\r\nMixer get inputMute 3\r\n+OK "value":true\r\n')
+        self.assertEqual(dsp.ReadStatus('InputLevel', {'Instance Tag': 'Mixer', 'Channel': '2'}), -12)
+        self.assertEqual(dsp.ReadStatus('InputMute', {'Instance Tag': 'Mixer', 'Channel': '3'}), 'On')
+
+    def test_N2300_Receive(self):
+        dec = n2300.EthernetClass(None, '10.0.2.1', 50002, Model='NMX-DEC-N2322')
+        dec.ReceiveData(dec, b'STREAM:104\r')
+        self.assertEqual(dec.ReadStatus('Stream'), 104)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,231 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import json
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from hardware.statusStore import StatusStore, ResponseFingerprints
+from hardware import biam_dsp_TesiraSeries_uofi as tesira
+from hardware import amx_avoip_n2300_series as n2300
+from hardware import mersive_solstice_pod as solstice
+## -----------------------------------------------------------------------------
+
+class StatusStore_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.Commands = \
+            {
+                'Power': {'Status': {}},
+                'Level': {'Parameters': ['Instance Tag', 'Channel'], 'Status': {}},
+                'Mute': {'Parameters': ['Channel'], 'Status': {}}
+            }
+        self.TestStore = StatusStore(self.Commands)
+        self.Callbacks = []
+        return super().setUp()
+
+    def Callback(self, command, value, qualifier):
+        self.Callbacks.append((command, value, qualifier))
+
+    def test_StatusStore_Key(self):
+        testList = \
+            [
+                ('Power', None, ()),
+                ('Power', {'Channel': 1}, ()),
+                ('Mute', {'Channel': 1}, (1,)),
+                ('Level', {'Instance Tag': 'Mixer', 'Channel': 2}, ('Mixer', 2)),
+                ('Level', {'Channel': 2}, None),
+                ('Level', None, ())
+            ]
+        for command, qualifier, expected in testList:
+            with self.subTest(command=command, qualifier=qualifier):
+                self.assertEqual(self.TestStore.Key(command, qualifier), expected)
+
+    def test_StatusStore_ReadWrite(self):
+        self.assertIsNone(self.TestStore.Read('Power'))
+        self.assertTrue(self.TestStore.Write('Power', 'On'))
+        self.assertEqual(self.TestStore.Read('Power'), 'On')
+
+        self.assertTrue(self.TestStore.Write('Level', -10, {'Instance Tag': 'Mixer', 'Channel': 1}))
+        self.assertEqual(self.TestStore.Read('Level', {'Instance Tag': 'Mixer', 'Channel': 1}), -10)
+        self.assertIsNone(self.TestStore.Read('Level', {'Instance Tag': 'Mixer', 'Channel': 2}))
+        self.assertIsNone(self.TestStore.Read('Level', {'Channel': 1}))
+
+        with self.subTest(param='incomplete qualifier'):
+            self.assertFalse(self.TestStore.Write('Level', 0, {'Channel': 1}))
+
+        with self.subTest(param='unknown command'):
+            with self.assertRaises(KeyError):
+                self.TestStore.Read('NotACommand')
+
+    def test_StatusStore_Bulk(self):
+        quals = [{'Instance Tag': 'Mixer', 'Channel': c} for c in range(1, 9)]
+        changed = self.TestStore.WriteMany('Level', [(-c, q) for c, q in enumerate(quals)])
+        self.assertEqual(changed, 8)
+        self.assertEqual(self.TestStore.ReadMany('Level', quals), [-c for c in range(8)])
+        self.assertEqual(self.TestStore.WriteMany('Level', [(0, quals[0]), (5, quals[1])]), 1)
+
+    def test_StatusStore_Subscribe(self):
+        self.TestStore.Subscribe('Mute', {'Channel': 1}, self.Callback)
+
+        self.TestStore.Write('Mute', 'On', {'Channel': 1})
+        self.TestStore.Write('Mute', 'On', {'Channel': 1})
+        self.TestStore.Write('Mute', 'On', {'Channel': 2})
+        self.assertEqual(self.Callbacks, [('Mute', 'On', {'Channel': 1})])
+
+    def test_StatusStore_Subscribe_Partial(self):
+        # matches the nested template, a subscription without a qualifier
+        # receives status for qualifiers without a more specific subscription
+        def Specific(command, value, qualifier):
+            self.Callbacks.append(('specific', value))
+        self.TestStore.Subscribe('Level', None, self.Callback)
+        self.TestStore.Subscribe('Level', {'Instance Tag': 'Mixer', 'Channel': 1}, Specific)
+
+        self.TestStore.Write('Level', 1, {'Instance Tag': 'Mixer', 'Channel': 1})
+        self.TestStore.Write('Level', 2, {'Instance Tag': 'Other', 'Channel': 1})
+        # 'Mixer' exists as a node without a callback, as in the nested template
+        self.TestStore.Write('Level', 3, {'Instance Tag': 'Mixer', 'Channel': 2})
+        self.assertEqual(self.Callbacks,
+                         [
+                             ('specific', 1),
+                             ('Level', 2, {'Instance Tag': 'Other', 'Channel': 1})
+                         ])
+
+    def test_StatusStore_Subscribe_Incomplete(self):
+        self.assertFalse(self.TestStore.Subscribe('Level', {'Channel': 1}, self.Callback))
+
+    def test_StatusStore_Clear(self):
+        self.TestStore.Write('Power', 'On')
+        self.TestStore.Write('Mute', 'On', {'Channel': 1})
+        self.TestStore.Clear('Mute')
+        self.assertEqual(self.TestStore.Read('Power'), 'On')
+        self.assertIsNone(self.TestStore.Read('Mute', {'Channel': 1}))
+        self.TestStore.Clear()
+        self.assertIsNone(self.TestStore.Read('Power'))
+
+    def test_StatusStore_Driver(self):
+        dsp = tesira.SSHClass(None, '10.0.3.1', 22, Credentials=('default', ''))
+        qual = {'Instance Tag': 'Mixer', 'Channel': '2'}
+        dsp.SubscribeStatus('InputLevel', qual, self.Callback)
+        dsp.WriteStatus('InputLevel', -12, qual)
+        self.assertEqual(dsp.ReadStatus('InputLevel', qual), -12)
+        self.assertEqual(self.Callbacks, [('InputLevel', -12, qual)])
+
+def DecoderStatus(name):
+    return (b'SVSI_RXGEN2:N2322\rNAME:' + name + b'\rMAC:00:11:22:33:44:55\rIP:10.0.2.1\r'
+            b'NM:255.255.255.0\rGW:10.0.2.254\rIPTRIAL:0\rIPMODE:Static\rID:0\rrel:2023-01-01\r'
+            b'SWVER:1.0\rWEBVER:1.0\rUPDATE:0\rUPDTRY:0\rUPDFAILED:0\rMEDIAPORT0:on\r'
+            b'MEDIAPORT1:off\rDIVASEN:off\rDIVASIP:0.0.0.0\rSTREAM:104\rPORTSD1:no\r'
+            b'DVICEVTDLY:0\rDVIDEVTDLY:0\rUSERMCMODE:off\rUSERMCIP:0.0.0.0\rDVIINPUT:connected\r'
+            b'FCPC:abc\rMUTE:0\rLIVEAUDIOLP:off\rYUVOUT:off\rFRAMEHOLD:off\rVIDOFFNOSTRM:off\r'
+            b'PLAYMODE:live\rMODE:auto\r')
+
+class ResponseFingerprints_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestFingerprints = ResponseFingerprints()
+        return super().setUp()
+
+    def test_ResponseFingerprints_Unchanged(self):
+        self.assertFalse(self.TestFingerprints.Unchanged('PodStatus', '{"a": 1}'))
+        self.assertTrue(self.TestFingerprints.Unchanged('PodStatus', '{"a": 1}'))
+        self.assertFalse(self.TestFingerprints.Unchanged('PodStatus', '{"a": 2}'))
+
+        with self.subTest(param='key'):
+            self.assertFalse(self.TestFingerprints.Unchanged('PodStatus', '{"a": 2}', key='other'))
+
+        with self.subTest(param='stats'):
+            self.assertEqual(self.TestFingerprints.Stats,
+                             {'PodStatus': {'Hits': 1, 'Misses': 3, 'HitRate': 0.25}})
+            self.assertEqual(self.TestFingerprints.HitRate('NotACommand'), 0.0)
+
+    def test_ResponseFingerprints_Reset(self):
+        self.TestFingerprints.Unchanged('PodStatus', b'reply')
+        self.TestFingerprints.Unchanged('DeviceStatus', b'reply')
+        self.TestFingerprints.Reset('PodStatus')
+        self.assertFalse(self.TestFingerprints.Unchanged('PodStatus', b'reply'))
+        self.assertTrue(self.TestFingerprints.Unchanged('DeviceStatus', b'reply'))
+        self.TestFingerprints.Reset()
+        self.assertFalse(self.TestFingerprints.Unchanged('DeviceStatus', b'reply'))
+
+    def test_ResponseFingerprints_Driver(self):
+        dec = n2300.EthernetClass(None, '10.0.2.1', 50002, Model='NMX-DEC-N2322')
+        callbacks = []
+        dec.SubscribeStatus('DeviceStatus', None, lambda cmd, val, qual: callbacks.append(val['Name']))
+
+        for i in range(4):
+            dec.ReceiveData(dec, DecoderStatus(b'Decoder 1'))
+        dec.ReceiveData(dec, DecoderStatus(b'Decoder 2'))
+
+        self.assertEqual(callbacks, ['Decoder 1', 'Decoder 2'])
+        self.assertEqual(dec.ReadStatus('DeviceStatus')['Name'], 'Decoder 2')
+        self.assertEqual(dec.ResponseFingerprints.Stats['DeviceStatus'],
+                         {'Hits': 3, 'Misses': 2, 'HitRate': 0.6})
+
+    def test_ResponseFingerprints_Driver_Solstice(self):
+        class TestResponse:
+            status = 200
+            msg = 'OK'
+            def __init__(self, body):
+                self.body = body
+            def read(self):
+                return self.body
+
+        class TestHTTPClient:
+            def __init__(self):
+                self.Replies = {
+                    '/api/config': json.dumps({
+                        'm_displayInformation': {'m_displayName': 'Pod 1'},
+                        'm_networkCuration': {},
+                        'm_licenseCuration': {},
+                        'm_userGroupCuration': {},
+                        'm_systemCuration': {},
+                        'm_calendarCuration': {}
+                    }).encode(),
+                    '/api/stats': b'{"m_statistics": {"m_connectedUsers": 0}}'
+                }
+            def Request(self, method, path, body=None, headers=None, name=None):
+                return TestResponse(self.Replies[path.split('?')[0]])
+
+        pod = solstice.RESTClass(None, '10.0.2.2', 'https', '443', 'password')
+        pod.HTTP = TestHTTPClient()
+        stats = []
+        pod.SubscribeStatus('UsageStatistics', None, lambda cmd, val, qual: stats.append(val))
+
+        for i in range(3):
+            pod.Update('PodStatus')
+            pod.Update('UsageStatistics')
+
+        self.assertEqual(pod.ReadStatus('PodStatus')['m_displayInformation']['m_displayName'], 'Pod 1')
+        self.assertEqual(pod.ResponseFingerprints.Stats,
+                         {'PodStatus': {'Hits': 2, 'Misses': 1, 'HitRate': 2/3},
+                          'UsageStatistics': {'Hits': 2, 'Misses': 1, 'HitRate': 2/3}})
+
+        with self.subTest(reply='invalid'):
+            pod.HTTP.Replies['/api/stats'] = b'not json'
+            pod.Update('UsageStatistics')
+            pod.Update('UsageStatistics')
+            self.assertEqual(pod.ResponseFingerprints.Stats['UsageStatistics']['Hits'], 2)
+            pod.HTTP.Replies['/api/stats'] = b'{"m_statistics": {"m_connectedUsers": 1}}'
+            pod.Update('UsageStatistics')
+            self.assertEqual(stats[-1], {'m_statistics': {'m_connectedUsers': 1}})
+            self.assertEqual(pod.ResponseFingerprints.Stats['PodStatus']['Misses'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import threading
+import re
+import time
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from hardware.transactionQueue import TransactionQueue, Transaction, PortName
+import hardware.nec_display_C750Q_C860Q_v1_2_0_0 as NECDisplay
+## -----------------------------------------------------------------------------
+
+# NEC reply with the power state byte at index 23
+NEC_POWER_ON = b'\x01' + b'0' * 7 + b'00' + b'0' * 13 + b'1' + b'\r'
+
+class DelayedDevice:
+    # answers every command after a fixed delay
+    def __init__(self, delay: float, reply: bytes) -> None:
+        self.Delay = delay
+        self.Reply = reply
+        self.Receive = None
+        self.Sent = []
+
+    def Send(self, data):
+        self.Sent.append(data)
+        timer = threading.Timer(self.Delay, self.Receive, (self.Reply,))
+        timer.daemon = True
+        timer.start()
+
+class TransactionQueue_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.Sent = []
+        self.TestQueue = TransactionQueue(self.Sent.append, 'test', max_queue=4)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.TestQueue.Clear()
+        return super().tearDown()
+
+    def test_TransactionQueue_Type(self):
+        self.assertIsInstance(self.TestQueue, TransactionQueue)
+
+    def test_TransactionQueue_DeliTag(self):
+        trans = self.TestQueue.Request('Power', b'power?\r', 1, deliTag='\r')
+        self.assertIsInstance(trans, Transaction)
+        self.assertEqual(self.Sent, [b'power?\r'])
+        self.assertEqual(self.TestQueue.Receive(b'POWR'), b'')
+        self.assertFalse(trans.Done)
+        # data after the delimiter is not part of the reply
+        self.assertEqual(self.TestQueue.Receive(b'1\rINPS'), b'INPS')
+        self.assertTrue(trans.Done)
+        self.assertEqual(trans.Result(), b'POWR1\r')
+
+        with self.subTest(param='unsolicited'):
+            self.assertEqual(self.TestQueue.Receive(b'VOLM10\r'), b'VOLM10\r')
+
+    def test_TransactionQueue_DeliRex(self):
+        trans = self.TestQueue.Request('Power', b'\x00\xBF', 1, deliRex=re.compile(b'\x20\xBF[\x00-\xFF]{2}'))
+        self.TestQueue.Receive(b'\x20\xBF\x01')
+        self.assertFalse(trans.Done)
+        self.TestQueue.Receive(b'\x02')
+        self.assertEqual(trans.Result(), b'\x20\xBF\x01\x02')
+
+    def test_TransactionQueue_Callback(self):
+        results = []
+        self.TestQueue.Request('Power', b'power?\r', 1, deliTag=b'\r', callback=lambda trans: results.append(trans.Response))
+        self.TestQueue.Receive(b'POWR1\r')
+        self.assertEqual(results, [b'POWR1\r'])
+
+    def test_TransactionQueue_Timeout(self):
+        trans = self.TestQueue.Request('Power', b'power?\r', 0.05, deliTag=b'\r')
+        self.assertEqual(trans.Result(), b'')
+        self.assertTrue(trans.TimedOut)
+        self.assertEqual(self.TestQueue.Timeouts, 1)
+        # the late reply is not matched to the next command
+        self.assertEqual(self.TestQueue.Receive(b'POWR1\r'), b'POWR1\r')
+
+    def test_TransactionQueue_Submit(self):
+        results = []
+        release = threading.Event()
+        self.TestQueue.Submit(release.wait, 1)
+        time.sleep(0.05)
+        for i in range(4):
+            self.assertTrue(self.TestQueue.Submit(results.append, i))
+        # the worker is busy and the queue is full
+        self.assertFalse(self.TestQueue.Submit(results.append, 4))
+        self.assertEqual(self.TestQueue.Dropped, 1)
+        release.set()
+        for i in range(50):
+            if self.TestQueue.Completed == 5:
+                break
+            time.sleep(0.01)
+        self.assertEqual(results, [0, 1, 2, 3])
+        self.assertEqual(self.TestQueue.Stats['submitted'], 5)
+
+    def test_TransactionQueue_Submit_Priority(self):
+        results = []
+        release = threading.Event()
+        self.TestQueue.Submit(release.wait, 1)
+        time.sleep(0.05)
+        for i in range(4):
+            self.TestQueue.Submit(results.append, 'Update {}'.format(i))
+        # priority calls are not dropped when the queue is full, and run first
+        for i in range(2):
+            self.assertTrue(self.TestQueue.Submit(results.append, 'Set {}'.format(i), priority=True))
+        self.assertEqual(self.TestQueue.Dropped, 0)
+        self.assertEqual(self.TestQueue.QueueDepth, 6)
+        release.set()
+        for i in range(50):
+            if self.TestQueue.Completed == 7:
+                break
+            time.sleep(0.01)
+        self.assertEqual(results, ['Set 0', 'Set 1', 'Update 0', 'Update 1', 'Update 2', 'Update 3'])
+
+    def test_TransactionQueue_Submit_Merged(self):
+        results = []
+        release = threading.Event()
+        self.TestQueue.Submit(release.wait, 1)
+        time.sleep(0.05)
+        for i in range(10):
+            self.assertTrue(self.TestQueue.Submit(results.append, ('Power', None)))
+            self.assertTrue(self.TestQueue.Submit(results.append, ('Volume', {'Input': 'HDMI'})))
+        # Set calls are never merged
+        self.TestQueue.Submit(results.append, ('Set Power', 'On'), priority=True)
+        self.TestQueue.Submit(results.append, ('Set Power', 'On'), priority=True)
+        self.assertEqual(self.TestQueue.QueueDepth, 4)
+        self.assertEqual(self.TestQueue.Merged, 18)
+        self.assertEqual(self.TestQueue.Dropped, 0)
+        release.set()
+        for i in range(50):
+            if self.TestQueue.Completed == 5:
+                break
+            time.sleep(0.01)
+        self.assertEqual(results, [('Set Power', 'On'), ('Set Power', 'On'), ('Power', None), ('Volume', {'Input': 'HDMI'})])
+
+    def test_TransactionQueue_Clear(self):
+        release = threading.Event()
+        self.TestQueue.Submit(release.wait, 1)
+        time.sleep(0.05)
+        self.TestQueue.Submit(print, 'not run 1')
+        self.TestQueue.Submit(print, 'not run 2')
+        self.TestQueue.Submit(print, 'not run 3', priority=True)
+        trans = self.TestQueue.Request('Power', b'power?\r', 1, deliTag=b'\r')
+        self.assertEqual(self.TestQueue.Clear(), 3)
+        self.assertEqual(self.TestQueue.QueueDepth, 0)
+        self.assertTrue(trans.TimedOut)
+        release.set()
+
+    def test_TransactionQueue_Stats(self):
+        device = DelayedDevice(0.01, b'POWR1\r')
+        queue = TransactionQueue(device.Send, 'stats')
+        device.Receive = queue.Receive
+        for i in range(5):
+            queue.Request('Power', b'power?\r', 1, deliTag=b'\r').Result()
+        queue.Request('Power', b'power?\r', 0.001, deliTag=b'ERR\r').Result()
+
+        stats = queue.Stats
+        self.assertEqual(stats['requests'], 6)
+        self.assertEqual(stats['responses'], 5)
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertGreaterEqual(stats['max_latency'], stats['avg_latency'])
+        self.assertGreater(stats['throughput'], 0)
+
+class TransactionDriver_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestDevice = NECDisplay.SerialOverEthernetClass('10.0.0.1', 7142)
+        self.Device = DelayedDevice(0.05, NEC_POWER_ON)
+        self.Device.Receive = lambda data: self.TestDevice.ReceiveData(self.TestDevice, data)
+        self.TestDevice.Send = self.Device.Send
+        return super().setUp()
+
+    def test_TransactionDriver_Update(self):
+        start = time.perf_counter()
+        self.TestDevice.Update('Power')
+        # the caller does not wait on the reply
+        self.assertLess(time.perf_counter() - start, 0.05)
+        for i in range(50):
+            if self.TestDevice.ReadStatus('Power') is not None:
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.TestDevice.ReadStatus('Power'), 'On')
+        self.assertEqual(self.TestDevice.Transactions.Responses, 1)
+
+    def test_TransactionDriver_PortName(self):
+        self.assertEqual(self.TestDevice.Transactions.Name, '10.0.0.1:7142')
+        self.assertEqual(PortName(NECDisplay.SerialOverEthernetClass('10.0.0.2', 7142)), '10.0.0.2:7142')
+
+    def test_TransactionDriver_OnDisconnected(self):
+        release = threading.Event()
+        self.TestDevice.Transactions.Submit(release.wait, 1)
+        time.sleep(0.05)
+        for i in range(5):
+            self.TestDevice.Update('Power')
+        self.TestDevice.OnDisconnected()
+        self.assertEqual(self.TestDevice.ReadStatus('ConnectionStatus'), 'Disconnected')
+        self.assertEqual(self.TestDevice.Transactions.QueueDepth, 0)
+        release.set()
+
+    def test_TransactionDriver_Set(self):
+        with self.assertRaises(AttributeError):
+            self.TestDevice.Set('Brightness', 50)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -30,7 +30,8 @@ from uofi_gui.scheduleControls import AutoScheduleController
 import test_settings as settings
 
 from extronlib.ui import Button, Label, Level
-from extronlib.system import MESet, Clock, Timer
+from extronlib.system import MESet, Clock
+from utilityFunctions import ScheduledTimer
 ## -----------------------------------------------------------------------------
 
 class ActivityController_TestClass(unittest.TestCase): # rename for module to be tested
@@ -161,30 +162,30 @@ class ActivityController_TestClass(unittest.TestCase): # rename for module to be
         
         # __ConfirmationTimer
         with self.subTest(param='__ConfirmationTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__ConfirmationTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__ConfirmationTimer, ScheduledTimer)
         
         # __SwitchTimer
         with self.subTest(param='__SwitchTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__SwitchTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__SwitchTimer, ScheduledTimer)
         
         # __StartTimer
         with self.subTest(param='__StartTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__StartTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__StartTimer, ScheduledTimer)
         
         # __ActivitySplashTimerList
         with self.subTest(param='__ActivitySplashTimerList'):
             self.assertIsInstance(self.TestActivityController._ActivityController__ActivitySplashTimerList, list)
             for item in self.TestActivityController._ActivityController__ActivitySplashTimerList:
                 with self.subTest(iter=item):
-                    self.assertIsInstance(item, Timer)
+                    self.assertIsInstance(item, ScheduledTimer)
         
         # __StatusTimer
         with self.subTest(param='__StatusTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__StatusTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__StatusTimer, ScheduledTimer)
             
         # __InitPageTimer
         with self.subTest(param='__InitPageTimer'):
-            self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer, Timer)
+            self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer, ScheduledTimer)
             self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer.TriggerTime, int)
             self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer.LastInactivity, dict)
             self.assertIsInstance(self.TestActivityController._ActivityController__InitPageTimer.PanelInactivity, dict)
@@ -317,6 +318,7 @@ class ActivityController_TestClass(unittest.TestCase): # rename for module to be
         context = ['share', 'adv_share', 'group_work']
         for con in context:
             self.TestActivityController.CurrentActivity = con
+            self.TestActivityController._ActivityController__StartPowerVerification('On')
             for i in range(self.TestActivityController._ActivityController__StartupTime + 1):
                 with self.subTest(context=con, i=i):
                     try:
@@ -338,6 +340,7 @@ class ActivityController_TestClass(unittest.TestCase): # rename for module to be
     
     def test_ActivityController_EventHandler_ShutdownTimerHandler(self):
         self.init_ActCtl()
+        self.TestActivityController._ActivityController__StartPowerVerification('Off')
         
         for i in range(self.TestActivityController._ActivityController__ShutdownTime + 1):
             with self.subTest(i=i):
@@ -346,6 +349,65 @@ class ActivityController_TestClass(unittest.TestCase): # rename for module to be
                 except Exception as inst:
                     self.fail('__ShutdownTimerHandler raised {} unexpectedly!'.format(type(inst)))
     
+    def test_ActivityController_EventHandler_StartUpTimerHandler_NonBlocking(self):
+        self.init_ActCtl()
+        self.TestActivityController.CurrentActivity = 'share'
+        self.TestActivityController._ActivityController__StartPowerVerification('On')
+        
+        updates = []
+        for hwId, hw in self.TestActivityController._ActivityController__PowerDisplays():
+            hw.interface.Update = lambda *args, **kwargs: updates.append(args)
+        
+        polls = []
+        self.TestGUIController.PollCtl.PollNow = lambda interface, command, qualifier=None: polls.append((interface, command))
+        
+        self.TestActivityController._ActivityController__StartUpTimerHandler(self.TestActivityController._ActivityController__StartTimer, 1)
+        
+        # the tick only reads cached state and queues requests for displays
+        # which have not reached the target state
+        self.assertEqual(updates, [])
+        self.assertEqual(len(polls), len(self.TestActivityController._ActivityController__PowerStatus))
+        for interface, command in polls:
+            self.assertEqual(command, 'Power')
+    
+    def test_ActivityController_DisplayPowerFeedback(self):
+        self.init_ActCtl()
+        self.TestActivityController.CurrentActivity = 'share'
+        self.TestActivityController._ActivityController__StartPowerVerification('On')
+        self.TestActivityController._ActivityController__PowerCount = self.TestGUIController.Timers['startupMin'] + 1
+        
+        hwIds = list(self.TestActivityController._ActivityController__PowerStatus.keys())
+        self.assertGreater(len(hwIds), 0)
+        
+        with self.subTest(param='unknown display'):
+            self.TestActivityController.DisplayPowerFeedback('NOT-A-DISPLAY', 'On')
+            self.assertNotIn('NOT-A-DISPLAY', self.TestActivityController._ActivityController__PowerStatus)
+        
+        with self.subTest(param='partial'):
+            for hwId in hwIds[:-1]:
+                self.TestActivityController.DisplayPowerFeedback(hwId, 'On')
+            self.assertEqual(self.TestActivityController._ActivityController__PowerTarget, 'On')
+        
+        with self.subTest(param='complete'):
+            self.TestActivityController.DisplayPowerFeedback(hwIds[-1], 'Power On')
+            self.assertIsNone(self.TestActivityController._ActivityController__PowerTarget)
+        
+        with self.subTest(param='after complete'):
+            try:
+                self.TestActivityController.DisplayPowerFeedback(hwIds[0], 'Off')
+                self.TestActivityController._ActivityController__StartUpTimerHandler(self.TestActivityController._ActivityController__StartTimer, 2)
+            except Exception as inst:
+                self.fail('DisplayPowerFeedback raised {} unexpectedly!'.format(type(inst)))
+    
+    def test_ActivityController_DisplayPowerFeedback_Shutdown(self):
+        self.init_ActCtl()
+        self.TestActivityController._ActivityController__StartPowerVerification('Off')
+        self.TestActivityController._ActivityController__PowerCount = self.TestGUIController.Timers['shutdownMin'] + 1
+        
+        for hwId in list(self.TestActivityController._ActivityController__PowerStatus.keys()):
+            self.TestActivityController.DisplayPowerFeedback(hwId, 'Standby (Power Save)')
+        self.assertIsNone(self.TestActivityController._ActivityController__PowerTarget)
+    
     def test_ActivityController_PRIV_ActivitySwitchTPConfiguration(self):
         self.init_ActCtl()
         
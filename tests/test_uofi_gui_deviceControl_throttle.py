@@ -0,0 +1,140 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import time
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.deviceControl.throttle import ThrottledSender
+## -----------------------------------------------------------------------------
+
+class RecordingInterface:
+    def __init__(self) -> None:
+        self.Sent = []
+
+    def Set(self, command, value, qualifier=None):
+        self.Sent.append((command, value, qualifier))
+
+class ThrottledSender_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.Interval = 0.05
+        self.TestSender = ThrottledSender(interval=self.Interval, confirmTimeout=0.5)
+        self.Interface = RecordingInterface()
+        return super().setUp()
+
+    def Settle(self):
+        time.sleep(self.Interval * 3)
+
+    def test_ThrottledSender_Type(self):
+        self.assertIsInstance(self.TestSender, ThrottledSender)
+
+    def test_ThrottledSender_Send(self):
+        self.assertTrue(self.TestSender.Send(self.Interface, 'Volume', 10))
+        for value in range(11, 16):
+            self.assertFalse(self.TestSender.Send(self.Interface, 'Volume', value))
+        self.assertEqual(self.Interface.Sent, [('Volume', 10, None)])
+
+        self.Settle()
+        # superseded values are dropped, the last value is delivered
+        self.assertEqual(self.Interface.Sent, [('Volume', 10, None), ('Volume', 15, None)])
+        self.assertEqual(self.TestSender.Requested, 6)
+        self.assertEqual(self.TestSender.Sent, 2)
+        self.assertEqual(self.TestSender.Dropped, 4)
+
+    def test_ThrottledSender_Send_Qualifiers(self):
+        qual1 = {'Instance Tag': 'Level', 'Channel': '1'}
+        qual2 = {'Channel': '2', 'Instance Tag': 'Level'}
+        self.assertTrue(self.TestSender.Send(self.Interface, 'LevelControl', -10, qual1))
+        self.assertTrue(self.TestSender.Send(self.Interface, 'LevelControl', -10, qual2))
+        self.assertFalse(self.TestSender.Send(self.Interface, 'LevelControl', -7, dict(qual1)))
+        self.Settle()
+        self.assertEqual(self.Interface.Sent,
+                         [
+                             ('LevelControl', -10, qual1),
+                             ('LevelControl', -10, qual2),
+                             ('LevelControl', -7, qual1)
+                         ])
+
+    def test_ThrottledSender_Send_Repeated(self):
+        # eg. a slider released at the value it last sent
+        self.TestSender.Send(self.Interface, 'Volume', 10)
+        self.assertFalse(self.TestSender.Send(self.Interface, 'Volume', 10))
+        self.Settle()
+        self.assertEqual(len(self.Interface.Sent), 1)
+
+        with self.subTest(param='after the interval'):
+            # eg. a start up level, the device may have been changed elsewhere
+            self.assertTrue(self.TestSender.Send(self.Interface, 'Volume', 10))
+            self.assertEqual(len(self.Interface.Sent), 2)
+
+    def test_ThrottledSender_Send_Rate(self):
+        start = time.monotonic()
+        value = 0
+        while time.monotonic() - start < self.Interval * 10:
+            value += 1
+            self.TestSender.Send(self.Interface, 'Volume', value)
+            time.sleep(0.001)
+        self.Settle()
+
+        self.assertLessEqual(self.TestSender.Sent, 13)
+        self.assertEqual(self.Interface.Sent[-1], ('Volume', value, None))
+
+    def test_ThrottledSender_Confirm(self):
+        self.assertTrue(self.TestSender.Confirm(self.Interface, 'Volume', 5))
+
+        self.TestSender.Send(self.Interface, 'Volume', 10)
+        self.TestSender.Send(self.Interface, 'Volume', 20)
+        with self.subTest(param='pending'):
+            self.assertFalse(self.TestSender.Confirm(self.Interface, 'Volume', 10))
+
+        self.Settle()
+        with self.subTest(param='stale feedback'):
+            self.assertFalse(self.TestSender.Confirm(self.Interface, 'Volume', 10))
+        with self.subTest(param='confirmed'):
+            self.assertTrue(self.TestSender.Confirm(self.Interface, 'Volume', 20))
+            self.assertTrue(self.TestSender.Confirm(self.Interface, 'Volume', 25))
+
+    def test_ThrottledSender_Confirm_Timeout(self):
+        self.TestSender.Send(self.Interface, 'Volume', 10)
+        self.assertFalse(self.TestSender.Confirm(self.Interface, 'Volume', 9))
+        time.sleep(0.6)
+        self.assertTrue(self.TestSender.Confirm(self.Interface, 'Volume', 9))
+
+    def test_ThrottledSender_Confirm_Recheck(self):
+        # a device which rounds the requested value sends no further feedback
+        shown = []
+        self.TestSender.Send(self.Interface, 'Volume', 10.4)
+        self.assertFalse(self.TestSender.Confirm(self.Interface, 'Volume', 10, callback=shown.append))
+        self.assertEqual(shown, [])
+        time.sleep(0.7)
+        self.assertEqual(shown, [10])
+        self.assertTrue(self.TestSender.Confirm(self.Interface, 'Volume', 11))
+
+    def test_ThrottledSender_Flush(self):
+        self.TestSender.Send(self.Interface, 'Volume', 10)
+        self.TestSender.Send(self.Interface, 'Volume', 11)
+        self.TestSender.Flush()
+        self.assertEqual(self.Interface.Sent, [('Volume', 10, None), ('Volume', 11, None)])
+        self.Settle()
+        self.assertEqual(len(self.Interface.Sent), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -238,6 +238,22 @@ class GUIController_TestClass(unittest.TestCase):
         self.assertIsInstance(self.TestController.TP_Main, ExUIDevice)
         self.assertIsInstance(self.TestController.TP_Main, UIDevice)
         
+    def test_GUIController_ConnectHardware(self):
+        importlib.reload(settings)
+        self.TestController = GUIController(settings, self.TestCtls, self.TestTPs)
+        
+        self.assertIsInstance(self.TestController.ConnectTimings, dict)
+        for id, connTime in self.TestController.ConnectTimings.items():
+            with self.subTest(hardware=id):
+                self.assertIn(id, self.TestController.Hardware)
+                self.assertIsInstance(connTime, float)
+                self.assertEqual(connTime, self.TestController.Hardware[id].ConnectTime)
+        
+        # connections are only opened once
+        with self.subTest(param='reconnect'):
+            for hw in self.TestController.Hardware.values():
+                self.assertIsNone(hw.Connect())
+    
     def test_GUIController_StartupActions(self):
         self.InitializeController()
         
@@ -32,7 +32,7 @@ import test_settings as settings
 
 from extronlib.device import UIDevice
 from extronlib.ui import Button, Label
-from extronlib.system import Timer
+from utilityFunctions import ScheduledTimer
 
 ## -----------------------------------------------------------------------------
 
@@ -137,7 +137,7 @@ class KeyboardController_TestClass(unittest.TestCase): # rename for module to be
         
         # __CursorTimer
         with self.subTest(param='__CursorTimer'):
-            self.assertIsInstance(self.TestKeyboardController._KeyboardController__CursorTimer, Timer)
+            self.assertIsInstance(self.TestKeyboardController._KeyboardController__CursorTimer, ScheduledTimer)
     
     def test_KeyboardController_EventHandler_CharBtnHandler(self):
         btnList = self.TestKeyboardController._KeyboardController__CharBtns
@@ -24,6 +24,7 @@ sys.path.append(".\\tests\\reqs")
 
 from typing import Dict, Tuple, List, Callable, Union, cast
 import random
+import time
 
 ## test imports ----------------------------------------------------------------
 from uofi_gui import GUIController
@@ -34,7 +35,7 @@ from uofi_gui.systemHardware import SystemHardwareController
 import test_settings as settings
 
 from extronlib.ui import Button, Label
-from extronlib.system import MESet, Timer
+from extronlib.system import MESet
 
 from utilityFunctions import Log
 ## -----------------------------------------------------------------------------
@@ -845,10 +846,6 @@ class Source_TestClass(unittest.TestCase): # rename for module to be tested
         self.assertFalse(self.TestSource.AlertFlag)
     
     def test_Source_PRIV_Properties(self):
-        # __AlertText
-        with self.subTest(param='__AlertText'):
-            self.assertIsInstance(self.TestSource._Source__AlertText, dict)
-        
         # __AlertIndex
         with self.subTest(param='__AlertIndex'):
             self.assertIsInstance(self.TestSource._Source__AlertIndex, int)
@@ -864,20 +861,8 @@ class Source_TestClass(unittest.TestCase): # rename for module to be tested
         # __DefaultAlert
         with self.subTest(param='__DefaultAlert'):
             self.assertIsInstance(self.TestSource._Source__DefaultAlert, str)
-        
-        # __AlertTimer
-        with self.subTest(param='__AlertTimer'):
-            self.assertIsInstance(self.TestSource._Source__AlertTimer, Timer)
     
-    def test_Source_PRIV_AlertTimerHandler(self):
-        class testTimer:
-            def __init__(self):
-                self.Running = True
-            def Stop(self):
-                self.Running = False
-            
-        timer = testTimer()
-        
+    def test_Source_AlertExpiry(self):
         alertList = \
             [
                 ('Alert Text 1', 5),
@@ -885,15 +870,16 @@ class Source_TestClass(unittest.TestCase): # rename for module to be tested
                 ('Alert Text 3', 25),
                 ('Alert Text 4', 0)
             ]
+        start = time.monotonic()
         for alert in alertList:
             self.TestSource.AppendAlert(alert[0], alert[1])
             
         for i in range(1,31):
             with self.subTest(count=i):
                 try:
-                    self.TestSource._Source__AlertTimerHandler(timer, i)
+                    self.TestSource.AlertManager.Expire(start + i - 0.5)
                 except Exception as inst:
-                    self.fail('__AlertTimerHandler (dynamic property) raised {} unexpectedly!'.format(type(inst)))
+                    self.fail('AlertManager.Expire raised {} unexpectedly!'.format(type(inst)))
                 
                 if i <= 5:
                     self.assertEqual(self.TestSource.Alerts, 4)
@@ -906,8 +892,8 @@ class Source_TestClass(unittest.TestCase): # rename for module to be tested
         
         with self.subTest(count='clear'):
             self.TestSource.ResetAlert()
-            self.TestSource._Source__AlertTimerHandler(timer, 31)
-            self.assertFalse(timer.Running)
+            self.assertEqual(self.TestSource.Alerts, 0)
+            self.assertFalse(self.TestSource.AlertFlag)
     
     def test_Source_CycleAlert(self):
         alertList = \
@@ -946,7 +932,7 @@ class Source_TestClass(unittest.TestCase): # rename for module to be tested
                 except Exception as inst:
                     self.fail('AppendAlert raised {} unexpectedly!'.format(type(inst)))
                     
-                self.assertIn(alert[0], list(self.TestSource._Source__AlertText.keys()))
+                self.assertIn(alert[0], self.TestSource.AlertManager.Messages(self.TestSource.Id))
                 self.assertEqual(self.TestSource.Alerts, i)
                 i += 1
     
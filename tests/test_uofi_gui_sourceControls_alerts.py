@@ -0,0 +1,154 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import time
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.sourceControls.alerts import AlertManager
+
+from types import SimpleNamespace
+## -----------------------------------------------------------------------------
+
+class RecordingSource:
+    def __init__(self, manager, id, input, alert='No Signal') -> None:
+        self.Manager = manager
+        self.Id = id
+        self.Input = input
+        self.Alert = alert
+
+    def AppendAlert(self, msg=None, timeout=0):
+        self.Manager.Append(self.Id, msg or self.Alert, timeout)
+
+    def ClearAlert(self, msg=None):
+        self.Manager.Clear(self.Id, msg or self.Alert)
+
+class RecordingSourceController:
+    def __init__(self) -> None:
+        self.Sources = []
+        self.SelectedSource = None
+        self.Destinations = []
+        self.Refreshes = 0
+
+    def SourceAlertHandler(self):
+        self.Refreshes += 1
+
+class AlertManager_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TPs = [SimpleNamespace(SrcCtl=RecordingSourceController()) for i in range(2)]
+        GUIHost = SimpleNamespace(TPs=self.TPs, ActCtl=SimpleNamespace(CurrentActivity='share'))
+        self.TestAlertCtl = AlertManager(GUIHost)
+        for tp in self.TPs:
+            tp.SrcCtl.Sources = [RecordingSource(self.TestAlertCtl, 'SRC{:03}'.format(i), i) for i in range(1, 5)]
+            tp.SrcCtl.SelectedSource = tp.SrcCtl.Sources[0]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.TestAlertCtl._AlertManager__ExpiryTimer.Stop()
+        return super().tearDown()
+
+    def test_AlertManager_Type(self):
+        self.assertIsInstance(self.TestAlertCtl, AlertManager)
+
+    def test_AlertManager_Append(self):
+        self.assertTrue(self.TestAlertCtl.Append('SRC001', 'Alert 1'))
+        self.assertTrue(self.TestAlertCtl.Append('SRC001', 'Alert 2', 10))
+        self.assertFalse(self.TestAlertCtl.Append('SRC001', 'Alert 1'))
+        self.assertEqual(self.TestAlertCtl.Messages('SRC001'), ['Alert 1', 'Alert 2'])
+        self.assertEqual(self.TestAlertCtl.Count('SRC001'), 2)
+        self.assertEqual(self.TestAlertCtl.Count('SRC002'), 0)
+
+    def test_AlertManager_MessageAt(self):
+        self.assertEqual(self.TestAlertCtl.MessageAt('SRC001', 0), '')
+        for msg in ['Alert 1', 'Alert 2', 'Alert 3']:
+            self.TestAlertCtl.Append('SRC001', msg)
+        self.assertEqual([self.TestAlertCtl.MessageAt('SRC001', i) for i in range(5)],
+                         ['Alert 1', 'Alert 2', 'Alert 3', 'Alert 1', 'Alert 2'])
+
+    def test_AlertManager_Clear(self):
+        self.TestAlertCtl.Append('SRC001', 'Alert 1', 5)
+        self.TestAlertCtl.Append('SRC001', 'Alert 2')
+        with self.subTest(param='Clear'):
+            self.assertTrue(self.TestAlertCtl.Clear('SRC001', 'Alert 1'))
+            self.assertFalse(self.TestAlertCtl.Clear('SRC001', 'Alert 1'))
+            self.assertEqual(self.TestAlertCtl.Messages('SRC001'), ['Alert 2'])
+        with self.subTest(param='Reset'):
+            self.TestAlertCtl.Reset('SRC001')
+            self.assertEqual(self.TestAlertCtl.Count('SRC001'), 0)
+
+    def test_AlertManager_Expire(self):
+        start = time.monotonic()
+        self.TestAlertCtl.Append('SRC001', 'Alert 1', 5)
+        self.TestAlertCtl.Append('SRC002', 'Alert 2', 10)
+        self.TestAlertCtl.Append('SRC002', 'Alert 3')
+
+        self.assertEqual(self.TestAlertCtl.Expire(start + 4), set())
+        self.assertEqual(self.TestAlertCtl.Expire(start + 6), {'SRC001'})
+        with self.subTest(param='replaced timeout'):
+            self.TestAlertCtl.Append('SRC002', 'Alert 2', 20)
+            self.assertEqual(self.TestAlertCtl.Expire(start + 11), set())
+            self.assertEqual(self.TestAlertCtl.Expire(start + 21), {'SRC002'})
+        self.assertEqual(self.TestAlertCtl.Messages('SRC002'), ['Alert 3'])
+
+        with self.subTest(param='cleared before expiry'):
+            self.TestAlertCtl.Append('SRC003', 'Alert 4', 5)
+            self.TestAlertCtl.Clear('SRC003', 'Alert 4')
+            self.assertEqual(self.TestAlertCtl.Expire(time.monotonic() + 6), set())
+
+    def test_AlertManager_ExpiryTimer(self):
+        timer = self.TestAlertCtl._AlertManager__ExpiryTimer
+        self.assertEqual(timer.State, 'Stopped')
+        self.TestAlertCtl.Append('SRC001', 'Alert 1', 0.05)
+        self.assertEqual(timer.State, 'Running')
+        time.sleep(0.2)
+        self.assertEqual(self.TestAlertCtl.Count('SRC001'), 0)
+        self.assertEqual(timer.State, 'Stopped')
+
+    def test_AlertManager_Refresh(self):
+        self.TestAlertCtl.Append('SRC001', 'Alert 1')
+        self.TestAlertCtl.Append('SRC001', 'Alert 1')
+        self.TestAlertCtl.Append('SRC002', 'Alert 2')
+        # only changes to the selected source refresh the panels
+        self.assertEqual([tp.SrcCtl.Refreshes for tp in self.TPs], [1, 1])
+
+        self.TestAlertCtl.Clear('SRC001', 'Alert 1')
+        self.assertEqual([tp.SrcCtl.Refreshes for tp in self.TPs], [2, 2])
+
+    def test_AlertManager_SourcesByInput(self):
+        for i in range(1, 5):
+            with self.subTest(input=i):
+                sources = self.TestAlertCtl.SourcesByInput(i)
+                self.assertEqual(len(sources), 2)
+                self.assertTrue(all(src.Input == i for src in sources))
+        with self.assertRaises(LookupError):
+            self.TestAlertCtl.SourcesByInput(100)
+
+    def test_AlertManager_InputSignal(self):
+        self.TestAlertCtl.InputSignal(2, False)
+        self.assertEqual(self.TestAlertCtl.Messages('SRC002'), ['No Signal'])
+        self.TestAlertCtl.InputSignal(2, False)
+        self.assertEqual(self.TestAlertCtl.Count('SRC002'), 1)
+        self.TestAlertCtl.InputSignal(2, True)
+        self.TestAlertCtl.InputSignal(2, True)
+        self.assertEqual(self.TestAlertCtl.Count('SRC002'), 0)
+
+if __name__ == '__main__':
+    unittest.main()
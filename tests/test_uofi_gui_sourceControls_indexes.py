@@ -0,0 +1,131 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import time
+import os
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.sourceControls import SourceController
+from utilityFunctions import Log
+
+from types import SimpleNamespace
+## -----------------------------------------------------------------------------
+
+def BuildController(sources: int=64, destinations: int=32) -> SourceController:
+    # lookups only need the Sources and Destinations lists, so the controller
+    # is built without a touch panel
+    srcCtl = SourceController.__new__(SourceController)
+    srcCtl.Sources = [SimpleNamespace(Id='SRC{:03}'.format(i), Name='Source {}'.format(i), Input=i)
+                      for i in range(1, sources + 1)]
+    srcCtl.Destinations = [SimpleNamespace(Id='DEST{:03}'.format(i), Name='Destination {}'.format(i), Output=i)
+                           for i in range(1, destinations + 1)]
+    srcCtl.BlankSource = SimpleNamespace(Id='none', Name='None', Input=0)
+    srcCtl._SourceController__SourceIndex = None
+    srcCtl._SourceController__DestinationIndex = None
+    srcCtl._SourceController__DisplaySrcIndex = {src.Id: i for i, src in enumerate(srcCtl.Sources)}
+    return srcCtl
+
+def LinearGetSource(srcCtl, id=None, name=None):
+    if id != None:
+        for src in srcCtl.Sources:
+            if src.Id == id:
+                return src
+    if name != None:
+        for src in srcCtl.Sources:
+            if src.Name == name:
+                return src
+    raise LookupError
+
+def LinearGetDestinationByOutput(srcCtl, outputNum):
+    for dest in srcCtl.Destinations:
+        if dest.Output == outputNum:
+            return dest
+    raise LookupError
+
+class SourceControllerIndexes_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestSourceController = BuildController()
+        return super().setUp()
+
+    def test_SourceController_GetSource(self):
+        for src in self.TestSourceController.Sources:
+            with self.subTest(source=src.Id):
+                self.assertIs(self.TestSourceController.GetSource(id=src.Id), src)
+                self.assertIs(self.TestSourceController.GetSource(name=src.Name), src)
+                # SwitchSources passes the same string as both id and name
+                self.assertIs(self.TestSourceController.GetSource(id=src.Name, name=src.Name), src)
+        with self.assertRaises(LookupError):
+            self.TestSourceController.GetSource(id='SRC999')
+        with self.assertRaises(ValueError):
+            self.TestSourceController.GetSource()
+
+    def test_SourceController_GetSourceByInput(self):
+        self.assertIs(self.TestSourceController.GetSourceByInput(0), self.TestSourceController.BlankSource)
+        self.assertEqual(self.TestSourceController.GetSourceByInput(12).Id, 'SRC012')
+        with self.assertRaises(LookupError):
+            self.TestSourceController.GetSourceByInput(100)
+
+    def test_SourceController_GetDestination(self):
+        self.assertEqual(self.TestSourceController.GetDestination(id='DEST004').Output, 4)
+        self.assertEqual(self.TestSourceController.GetDestination(name='Destination 5').Output, 5)
+        self.assertEqual(self.TestSourceController.GetDestinationByOutput(32).Id, 'DEST032')
+        self.assertEqual(self.TestSourceController.GetDestinationIndexByID('DEST010'), 9)
+        self.assertEqual(self.TestSourceController.GetSourceIndexByID('SRC010'), 9)
+        for lookup, arg in [(self.TestSourceController.GetDestinationByOutput, 33),
+                            (self.TestSourceController.GetDestinationIndexByID, 'DEST999'),
+                            (self.TestSourceController.GetSourceIndexByID, 'SRC999')]:
+            with self.subTest(lookup=lookup.__name__):
+                with self.assertRaises(LookupError):
+                    lookup(arg)
+
+    def test_SourceController_Index_FirstMatch(self):
+        # duplicate keys resolve to the first item, as the list scans did
+        dup = SimpleNamespace(Id='SRC001', Name='Duplicate', Input=1)
+        self.TestSourceController.Sources.append(dup)
+        self.assertIsNot(self.TestSourceController.GetSource(id='SRC001'), dup)
+        self.assertIsNot(self.TestSourceController.GetSourceByInput(1), dup)
+        self.assertIs(self.TestSourceController.GetSource(name='Duplicate'), dup)
+
+    @unittest.skipUnless(os.environ.get('RUN_BENCHMARKS'), 'set RUN_BENCHMARKS=1 to run benchmarks')
+    def test_SourceController_Index_Benchmark(self):
+        srcCtl = self.TestSourceController
+        iterations = 20
+
+        t0 = time.perf_counter()
+        for i in range(iterations):
+            for dest in range(1, 33):
+                LinearGetSource(srcCtl, id='SRC064', name='SRC064')
+                LinearGetDestinationByOutput(srcCtl, dest)
+        linearTime = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for i in range(iterations):
+            for dest in range(1, 33):
+                srcCtl.GetSource(id='SRC064', name='SRC064')
+                srcCtl.GetDestinationByOutput(dest)
+        indexTime = time.perf_counter() - t0
+
+        Log('64 sources x 32 destinations - linear: {:.3f} ms, indexed: {:.3f} ms',
+            fmtArgs=(linearTime * 1000, indexTime * 1000))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.sourceControls.routing import RouteController
+
+from types import SimpleNamespace
+## -----------------------------------------------------------------------------
+
+class RecordingSwitcher:
+    def __init__(self, batch: bool=True) -> None:
+        self.Commands = {'MatrixTieCommand': {}}
+        if batch:
+            self.Commands['MatrixTieBatchCommand'] = {}
+        self.Sent = []
+
+    def Set(self, command, value, qualifier=None):
+        if command == 'MatrixTieBatchCommand':
+            self.Sent.extend(value)
+        else:
+            self.Sent.append(qualifier)
+
+def Ties(input, outputs, tieType='Audio/Video'):
+    return [{'Input': input, 'Output': o, 'Tie Type': tieType} for o in outputs]
+
+class RouteController_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.Switcher = RecordingSwitcher()
+        self.Hardware = SimpleNamespace(Id='VMX001', interface=self.Switcher)
+        GUIHost = SimpleNamespace(Hardware={'VMX001': self.Hardware}, PrimarySwitcherId='VMX001')
+        self.TestRouteCtl = RouteController(GUIHost)
+        return super().setUp()
+
+    def test_RouteController_Type(self):
+        self.assertIsInstance(self.TestRouteCtl, RouteController)
+        self.assertIs(self.TestRouteCtl.Hardware, self.Hardware)
+
+    def test_RouteController_Apply(self):
+        sent = self.TestRouteCtl.Apply(Ties(1, range(1, 5)))
+        self.assertEqual(sent, Ties(1, range(1, 5)))
+        self.assertEqual(self.Switcher.Sent, sent)
+        for o in range(1, 5):
+            with self.subTest(output=o):
+                self.assertEqual(self.TestRouteCtl.GetRoute(o, 'Video'), 1)
+                self.assertEqual(self.TestRouteCtl.GetRoute(o, 'Audio'), 1)
+
+    def test_RouteController_Apply_MultiplePanels(self):
+        # each panel requests the same routes, only the first reaches the switcher
+        for tp in range(3):
+            self.TestRouteCtl.Apply(Ties(2, range(1, 5)))
+        self.assertEqual(len(self.Switcher.Sent), 4)
+        self.assertEqual(self.TestRouteCtl.TiesRequested, 12)
+        self.assertEqual(self.TestRouteCtl.TiesSent, 4)
+
+    def test_RouteController_Apply_Partial(self):
+        self.TestRouteCtl.Apply(Ties(1, range(1, 5)))
+        self.Switcher.Sent.clear()
+
+        with self.subTest(param='changed outputs only'):
+            self.assertEqual(self.TestRouteCtl.Apply(Ties(1, [1, 2]) + Ties(3, [3, 4])), Ties(3, [3, 4]))
+
+        with self.subTest(param='changed tie type only'):
+            self.assertEqual(self.TestRouteCtl.Apply(Ties(3, [1], 'Video') + Ties(1, [1], 'Audio')),
+                             Ties(3, [1], 'Video'))
+            self.assertEqual(self.TestRouteCtl.Apply(Ties(3, [1])), Ties(3, [1], 'Audio'))
+
+        with self.subTest(param='last tie in request wins'):
+            self.assertEqual(self.TestRouteCtl.Apply(Ties(4, [2]) + Ties(1, [2])), [])
+
+    def test_RouteController_Apply_NoBatch(self):
+        switcher = RecordingSwitcher(batch=False)
+        routeCtl = RouteController(None, SimpleNamespace(interface=switcher))
+        routeCtl.Apply(Ties(1, [1, 2]))
+        self.assertEqual(switcher.Sent, Ties(1, [1, 2]))
+
+    def test_RouteController_TieFeedback(self):
+        self.TestRouteCtl.Apply(Ties(1, [1]))
+        self.Switcher.Sent.clear()
+
+        # switcher reports a different tie, the requested route is sent again
+        self.TestRouteCtl.TieFeedback(1, 'Video', 5)
+        self.assertEqual(self.TestRouteCtl.Apply(Ties(1, [1])), Ties(1, [1], 'Video'))
+
+    def test_RouteController_Apply_Force(self):
+        self.TestRouteCtl.Apply(Ties(1, [1, 2]))
+        self.Switcher.Sent.clear()
+        self.assertEqual(self.TestRouteCtl.Apply(Ties(1, [1]), force=True), Ties(1, [1]))
+        self.assertEqual(self.Switcher.Sent, Ties(1, [1]))
+
+    def test_RouteController_TieFeedback_Unchanged(self):
+        # the tie to output 1 failed, the refresh reports the previous input
+        self.TestRouteCtl.TieFeedback(1, 'Audio/Video', 5)
+        self.TestRouteCtl.Apply(Ties(1, [1, 2]))
+        self.TestRouteCtl.TieFeedback(1, 'Audio/Video', 5)
+        self.Switcher.Sent.clear()
+
+        self.assertEqual(self.TestRouteCtl.Apply(Ties(1, [1, 2])), Ties(1, [1]))
+        self.assertEqual(self.Switcher.Sent, Ties(1, [1]))
+
+    def test_RouteController_Invalidate(self):
+        self.TestRouteCtl.Apply(Ties(1, range(1, 5)))
+
+        with self.subTest(param='outputs'):
+            self.TestRouteCtl.Invalidate([1])
+            self.assertIsNone(self.TestRouteCtl.GetRoute(1))
+            self.assertEqual(self.TestRouteCtl.Apply(Ties(1, range(1, 5))), Ties(1, [1]))
+
+        with self.subTest(param='all'):
+            self.TestRouteCtl.Invalidate()
+            self.assertEqual(self.TestRouteCtl.Routes, {})
+
+    def test_RouteController_GetRoute_BadType(self):
+        with self.assertRaises(ValueError):
+            self.TestRouteCtl.GetRoute(1, 'Audio/Video')
+
+if __name__ == '__main__':
+    unittest.main()
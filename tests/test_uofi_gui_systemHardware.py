@@ -16,6 +16,9 @@
 
 import unittest
 import importlib
+import threading
+import time
+from typing import List
 
 import sys
 sys.path.append(".\\src")
@@ -26,13 +29,13 @@ sys.path.append(".\\tests\\reqs")
 ## test imports ----------------------------------------------------------------
 from uofi_gui import GUIController
 from uofi_gui.uiObjects import ExUIDevice
-from uofi_gui.systemHardware import SystemHardwareController, VirtualDeviceInterface, SystemPollingController, SystemStatusController
+from uofi_gui.systemHardware import SystemHardwareController, VirtualDeviceInterface, SystemPollingController, SystemStatusController, PollingWorker
 import test_settings as settings
 from ConnectionHandler import ConnectionHandler
 
 from extronlib.device import UIDevice
 from extronlib.ui import Button, Label
-from extronlib.system import Timer
+from utilityFunctions import ScheduledTimer
 from extronlib.interface import SerialInterface, EthernetClientInterface, ContactInterface, DanteInterface, DigitalInputInterface, DigitalIOInterface, FlexIOInterface, IRInterface, PoEInterface, RelayInterface
 
 from datetime import datetime
@@ -214,6 +217,18 @@ class SystemHardwareController_TestClass(unittest.TestCase):
         
         self.assertIsInstance(self.TestHardware, SystemHardwareController)
         
+    def test_SystemHardwareController_DeferConnect(self):
+        self.test_SystemHardwareController_Init()
+        self.HardwareDict['DeferConnect'] = True
+        TestHardware = SystemHardwareController(self.TestGUIController, **self.HardwareDict)
+        
+        self.assertIsNone(TestHardware.ConnectTime)
+        try:
+            TestHardware.Connect()
+        except Exception as inst:
+            self.fail('Connect raised {} unexpectedly!'.format(type(inst)))
+        self.assertIsInstance(TestHardware.ConnectTime, float)
+    
     def test_SystemHardwareController_Properties(self):
         self.test_SystemHardwareController_Init()
         
@@ -463,29 +478,34 @@ class SystemPollingController_TestClass(unittest.TestCase):
         with self.subTest(param='__DefaultInactiveDur'):
             self.assertIsInstance(self.TestPollController._SystemPollingController__DefaultInactiveDur, int)
         
-        # __InactivePolling
-        with self.subTest(param='__InactivePolling'):
-            self.assertIsInstance(self.TestPollController._SystemPollingController__InactivePolling, Timer)
+        # __PollingTimer
+        with self.subTest(param='__PollingTimer'):
+            self.assertIsInstance(self.TestPollController._SystemPollingController__PollingTimer, ScheduledTimer)
         
-        # __ActivePolling
-        with self.subTest(param='__ActivePolling'):
-            self.assertIsInstance(self.TestPollController._SystemPollingController__ActivePolling, Timer)
+        # __Schedule
+        with self.subTest(param='__Schedule'):
+            self.assertIsInstance(self.TestPollController._SystemPollingController__Schedule, list)
     
-    def test_SystemPollingController_EventHandler_ActivePollingHandler(self):
-        for i in range(121):
-            with self.subTest(iter=i):
-                try:
-                    self.TestPollController._SystemPollingController__ActivePollingHandler(self.TestPollController._SystemPollingController__ActivePolling, i)
-                except Exception as inst:
-                    self.fail("ActivePollingHandler raised {} unexpectedly!".format(type(inst)))
+    def test_SystemPollingController_EventHandler_PollingHandler(self):
+        contextList = ['inactive', 'active']
+        for con in contextList:
+            self.TestPollController.StartPolling(con)
+            for i in range(121):
+                with self.subTest(context=con, iter=i):
+                    try:
+                        self.TestPollController._SystemPollingController__PollingHandler(self.TestPollController._SystemPollingController__PollingTimer, i)
+                    except Exception as inst:
+                        self.fail("PollingHandler raised {} unexpectedly!".format(type(inst)))
     
-    def test_SystemPollingController_EventHandler_InactivePollingHandler(self):
-        for i in range(601):
-            with self.subTest(iter=i):
-                try:
-                    self.TestPollController._SystemPollingController__InactivePollingHandler(self.TestPollController._SystemPollingController__InactivePolling, i)
-                except Exception as inst:
-                    self.fail("ActivePollingHandler raised {} unexpectedly!".format(type(inst)))
+    def test_SystemPollingController_PRIV_RebuildSchedule(self):
+        self.TestPollController.StartPolling('active')
+        schedule = self.TestPollController._SystemPollingController__Schedule
+        self.assertEqual(len(schedule), len(self.TestPollController.Polling))
+        
+        # polls sharing a duration should not all be due at the same moment
+        dueTimes = [item[0] for item in schedule if item[2]['active_duration'] == 5]
+        if len(dueTimes) > 1:
+            self.assertGreater(len(set(dueTimes)), 1)
     
     # def test_SystemPollingController_PRIV_PollInterface(self):
     #     # this is going to be a difficult one to properly simulate in testing
@@ -497,6 +517,47 @@ class SystemPollingController_TestClass(unittest.TestCase):
         except Exception as inst:
             self.fail('PollEverything raised {} unexpectedly!'.format(type(inst)))
     
+    def test_SystemPollingController_PollNow(self):
+        TestHardware = self.TestGUIController.Hardware['MON001']
+        try:
+            self.TestPollController.PollNow(TestHardware.interface, 'Power')
+        except Exception as inst:
+            self.fail('PollNow raised {} unexpectedly!'.format(type(inst)))
+    
+    def test_SystemPollingController_SetInterfaceConnection(self):
+        TestHardware = self.TestGUIController.Hardware['MON001']
+        self.TestPollController.StartPolling('active')
+        disconnected = self.TestPollController._SystemPollingController__Disconnected
+        
+        with self.subTest(status='Disconnected'):
+            try:
+                self.TestPollController.SetInterfaceConnection(TestHardware.interface, 'Disconnected')
+            except Exception as inst:
+                self.fail('SetInterfaceConnection raised {} unexpectedly!'.format(type(inst)))
+            self.assertIn(TestHardware.interface, disconnected)
+            self.assertEqual(disconnected[TestHardware.interface]['command'], 'Power')
+        
+        with self.subTest(status='Connected'):
+            try:
+                self.TestPollController.SetInterfaceConnection(TestHardware.interface, 'Connected')
+            except Exception as inst:
+                self.fail('SetInterfaceConnection raised {} unexpectedly!'.format(type(inst)))
+            self.assertNotIn(TestHardware.interface, disconnected)
+    
+    def test_SystemPollingController_GetQueueStats(self):
+        self.TestPollController.PollEverything()
+        try:
+            stats = self.TestPollController.GetQueueStats()
+        except Exception as inst:
+            self.fail('GetQueueStats raised {} unexpectedly!'.format(type(inst)))
+        
+        self.assertIsInstance(stats, dict)
+        for interface, item in stats.items():
+            with self.subTest(interface=interface):
+                self.assertIsInstance(item, dict)
+                self.assertIn('depth', item)
+                self.assertIn('avg_wait', item)
+    
     def test_SystemPollingController_StartPolling(self):
         contextList = ['inactive', 'active']
         for con in contextList:
@@ -621,6 +682,15 @@ class SystemPollingController_TestClass(unittest.TestCase):
         except Exception as inst:
             self.fail('RemovePolling raised {} unexpectedly!'.format(type(inst)))
         self.assertEqual(len(self.TestPollController.Polling), 0)
+        
+        with self.subTest(param='qualifier'):
+            for i in range(1, 4):
+                self.TestPollController.AddPolling(TestHardware.interface,
+                                                    'AutoImage',
+                                                    qualifier={'Input': i})
+            self.TestPollController.RemovePolling(TestHardware.interface, 'AutoImage', {'Input': 2})
+            self.TestPollController.RemovePolling(TestHardware.interface, 'AutoImage', {'Input': 5})
+            self.assertEqual([poll['qualifier'] for poll in self.TestPollController.Polling], [{'Input': 1}, {'Input': 3}])
     
     def test_SystemPollingController_UpdatePolling(self):
         # importlib.reload(settings)
@@ -640,6 +710,208 @@ class SystemPollingController_TestClass(unittest.TestCase):
             
         self.assertEqual(self.TestPollController.Polling[0], {'interface': TestHardware.interface, 'command': 'AutoImage', 'qualifier': {'Input': 1}, 'active_duration': 10, 'inactive_duration': 15})
 
+    def test_SystemPollingController_AddRemovePolling_Threaded(self):
+        # fallback polls are added and removed from interface receive threads
+        # while the scheduler thread runs the schedule
+        class TestInterface:
+            def Update(self, command, qualifier=None):
+                pass
+
+        TestInterfaces = [TestInterface() for i in range(64)]
+        TestPollController = SystemPollingController(threaded=False)
+        TestPollController.Polling = []
+        for interface in TestInterfaces:
+            TestPollController.AddPolling(interface, 'Power', active_duration=0.001, inactive_duration=0.001)
+        TestPollController.StartPolling('active')
+        TestPollController.StopPolling()
+        TestPollController._SystemPollingController__PollingState = 'active'
+
+        errors = []
+        stop = threading.Event()
+
+        def RunSchedule():
+            count = 0
+            while not stop.is_set():
+                try:
+                    TestPollController._SystemPollingController__PollingHandler(None, count)
+                    TestPollController.SetInterfaceConnection(TestInterfaces[0], 'Disconnected' if count % 2 == 0 else 'Connected')
+                except Exception as inst:
+                    errors.append(inst)
+                count += 1
+            TestPollController.SetInterfaceConnection(TestInterfaces[0], 'Connected')
+
+        def ChangeFallbacks():
+            try:
+                for i in range(500):
+                    interface = TestInterfaces[i % len(TestInterfaces)]
+                    TestPollController.AddPolling(interface, 'Level', {'Tag': i}, 0.001, 0.001)
+                    TestPollController.UpdatePolling(interface, 'Level', active_duration=0.002)
+                    TestPollController.RemovePolling(interface, 'Level', {'Tag': i})
+            except Exception as inst:
+                errors.append(inst)
+
+        # switch threads often so unguarded heap updates would interleave
+        switchInterval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            runner = threading.Thread(target=RunSchedule)
+            changer = threading.Thread(target=ChangeFallbacks)
+            runner.start()
+            changer.start()
+            changer.join()
+            stop.set()
+            runner.join()
+        finally:
+            sys.setswitchinterval(switchInterval)
+
+        self.assertEqual(errors, [])
+        self.assertEqual([poll['command'] for poll in TestPollController.Polling], ['Power'] * len(TestInterfaces))
+
+        schedule = TestPollController._SystemPollingController__Schedule
+        pollSeq = TestPollController._SystemPollingController__PollSeq
+        for i in range(1, len(schedule)):
+            self.assertLessEqual(schedule[(i - 1) // 2], schedule[i])
+        live = [item[2] for item in schedule if pollSeq.get(id(item[2])) == item[1]]
+        self.assertEqual(sorted(id(poll) for poll in live), sorted(id(poll) for poll in TestPollController.Polling))
+
+class RecordingInterface:
+    def __init__(self, delay: threading.Event=None) -> None:
+        self.Updates = []
+        self.Delay = delay
+
+    def Update(self, command, qualifier=None):
+        if self.Delay is not None:
+            self.Delay.wait(5)
+        self.Updates.append((command, qualifier))
+
+class SystemPollingController_Schedule_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.Now = 1000.0
+        self.TestPollController = SystemPollingController(threaded=False, backoff_min=5, backoff_max=40, clock=lambda: self.Now)
+        return super().setUp()
+    
+    def RunUntil(self, interface: RecordingInterface, end: float) -> List[float]:
+        # runs the schedule each second, returning the times polls were sent
+        times = []
+        while self.Now < end:
+            self.Now += 1
+            count = len(interface.Updates)
+            self.TestPollController._SystemPollingController__PollingHandler(None, 0)
+            times.extend([self.Now] * (len(interface.Updates) - count))
+        return times
+    
+    def tearDown(self) -> None:
+        self.TestPollController.StopPolling()
+        return super().tearDown()
+    
+    def test_SystemPollingController_SlowDevice_Unlocked(self):
+        # non-threaded polls run on the scheduler thread, a device slow to
+        # reply must not hold the schedule lock
+        release = threading.Event()
+        SlowInterface = RecordingInterface(release)
+        OtherInterface = RecordingInterface()
+        self.TestPollController.AddPolling(SlowInterface, 'Power', active_duration=60, inactive_duration=60)
+        self.TestPollController.AddPolling(OtherInterface, 'Power')
+        
+        runner = threading.Thread(target=self.TestPollController._SystemPollingController__PollingHandler, args=(None, 1))
+        runner.start()
+        time.sleep(0.05)
+        
+        changer = threading.Thread(target=self.TestPollController.SetInterfaceConnection, args=(OtherInterface, 'Disconnected'))
+        changer.start()
+        changer.join(1)
+        blocked = changer.is_alive()
+        release.set()
+        runner.join()
+        changer.join()
+        
+        self.assertFalse(blocked)
+        self.assertEqual(SlowInterface.Updates, [('Power', None)])
+
+    def test_SystemPollingController_Disconnected_Backoff(self):
+        TestInterface = RecordingInterface()
+        self.TestPollController.AddPolling(TestInterface, 'Power', active_duration=10, inactive_duration=10)
+        self.TestPollController.AddPolling(TestInterface, 'Volume', active_duration=10, inactive_duration=10)
+        start = self.Now
+        self.TestPollController.SetInterfaceConnection(TestInterface, 'Disconnected')
+        
+        # only the first command is probed, the interval doubling up to backoff_max
+        times = self.RunUntil(TestInterface, start + 120)
+        self.assertEqual([t - start for t in times], [5, 15, 35, 75, 115])
+        self.assertEqual(set(TestInterface.Updates), {('Power', None)})
+        
+        with self.subTest(param='probe disabled'):
+            OtherInterface = RecordingInterface()
+            self.TestPollController.AddPolling(OtherInterface, 'Power', active_duration=10, inactive_duration=10)
+            self.TestPollController.SetInterfaceConnection(OtherInterface, 'Disconnected', probe=False)
+            self.assertEqual(self.RunUntil(OtherInterface, self.Now + 60), [])
+    
+    def test_SystemPollingController_Reconnected(self):
+        TestInterface = RecordingInterface()
+        self.TestPollController.AddPolling(TestInterface, 'Power', active_duration=10, inactive_duration=10)
+        self.TestPollController.AddPolling(TestInterface, 'Volume', active_duration=10, inactive_duration=10)
+        self.TestPollController.SetInterfaceConnection(TestInterface, 'Disconnected')
+        self.RunUntil(TestInterface, self.Now + 40)
+        del TestInterface.Updates[:]
+        
+        # everything is polled to catch up, then the schedule resumes
+        self.TestPollController.SetInterfaceConnection(TestInterface, 'Connected')
+        self.assertEqual(TestInterface.Updates, [('Power', None), ('Volume', None)])
+        self.RunUntil(TestInterface, self.Now + 10)
+        self.assertEqual(sorted(TestInterface.Updates[2:]), [('Power', None), ('Volume', None)])
+        
+        with self.subTest(param='backoff reset'):
+            start = self.Now
+            self.TestPollController.SetInterfaceConnection(TestInterface, 'Disconnected')
+            times = self.RunUntil(TestInterface, start + 20)
+            self.assertEqual([t - start for t in times], [5, 15])
+
+class PollingWorker_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestCtls = ['CTL001']
+        self.TestTPs = ['TP001']
+        importlib.reload(settings)
+        self.TestGUIController = GUIController(settings, self.TestCtls, self.TestTPs)
+        self.TestInterface = self.TestGUIController.Hardware['MON001'].interface
+        self.Polled = []
+        self.TestWorker = PollingWorker(self.TestInterface, self.PollFunction, 2)
+        return super().setUp()
+    
+    def PollFunction(self, interface, command, qualifier=None):
+        self.Polled.append((command, qualifier))
+    
+    def test_PollingWorker_Type(self):
+        self.assertIsInstance(self.TestWorker, PollingWorker)
+    
+    def test_PollingWorker_Properties(self):
+        # QueueDepth
+        with self.subTest(param='QueueDepth'):
+            self.assertIsInstance(self.TestWorker.QueueDepth, int)
+        
+        # AverageWait
+        with self.subTest(param='AverageWait'):
+            self.assertIsInstance(self.TestWorker.AverageWait, float)
+        
+        # Stats
+        with self.subTest(param='Stats'):
+            self.assertIsInstance(self.TestWorker.Stats, dict)
+    
+    def test_PollingWorker_Submit(self):
+        self.TestWorker.Submit('Power')
+        self.TestWorker._PollingWorker__Queue.join()
+        self.assertEqual(self.Polled, [('Power', None)])
+        self.assertEqual(self.TestWorker.Completed, 1)
+    
+    def test_PollingWorker_Submit_Dropped(self):
+        # worker thread is not started, so the queue fills
+        self.TestWorker.Start = lambda: None
+        self.assertTrue(self.TestWorker.Submit('Power'))
+        self.assertFalse(self.TestWorker.Submit('Power'))
+        self.assertTrue(self.TestWorker.Submit('Volume'))
+        self.assertFalse(self.TestWorker.Submit('AudioMute'))
+        self.assertEqual(self.TestWorker.Dropped, 1)
+        self.assertEqual(self.TestWorker.QueueDepth, 2)
+
 class SystemStatusController_TestClass(unittest.TestCase):
     def setUp(self) -> None:
         self.TestCtls = ['CTL001']
@@ -672,7 +944,7 @@ class SystemStatusController_TestClass(unittest.TestCase):
         
         # UpdateTimer
         with self.subTest(param='UpdateTimer'):
-            self.assertIsInstance(self.TestStatusController.UpdateTimer, Timer)
+            self.assertIsInstance(self.TestStatusController.UpdateTimer, ScheduledTimer)
     
     def test_SystemStatusController_PRIV_Properties(self):
         # __StatusIcons
@@ -738,6 +1010,13 @@ class SystemStatusController_TestClass(unittest.TestCase):
         except Exception as inst:
             self.fail('__UpdateHandler raised {} unexpectedly!'.format(type(inst)))
     
+    def test_SystemStatusController_UpdateLogStats(self):
+        try:
+            self.TestStatusController.UpdateLogStats()
+        except Exception as inst:
+            self.fail('UpdateLogStats raised {} unexpectedly!'.format(type(inst)))
+        self.assertTrue(self.TestUIController.Lbls['DeviceStatus-LogStats']._text.startswith('Log: '))
+    
     def test_SystemStatusController_PRIV_ClearStatusIcons(self):
         try:
             self.TestStatusController._SystemStatusController__ClearStatusIcons()
@@ -755,6 +1034,13 @@ class SystemStatusController_TestClass(unittest.TestCase):
                 except Exception as inst:
                     self.fail('__ShowStatusIcons raised {} unexpectedly!'.format(type(inst)))
     
+    def test_SystemStatusController_PRIV_GetStatusLabelStr(self):
+        hw = self.TestStatusController.Hardware[0]
+        hw.ConnectTime = None
+        self.assertEqual(self.TestStatusController._SystemStatusController__GetStatusLabelStr(hw), hw.Name)
+        hw.ConnectTime = 1.234
+        self.assertEqual(self.TestStatusController._SystemStatusController__GetStatusLabelStr(hw), '{} (1.23s)'.format(hw.Name))
+    
     # This is very difficult to test
     # def test_SystemStatusController_PRIV_GetStatusState(self):
     #     for hw in self.TestStatusController.Hardware:
@@ -31,7 +31,8 @@ import test_settings as settings
 
 from extronlib.device import UIDevice
 from extronlib.ui import Button, Label, Slider
-from extronlib.system import Timer, MESet
+from extronlib.system import MESet
+from utilityFunctions import ScheduledTimer
 ## -----------------------------------------------------------------------------
 
 class TechMenuController_TestClass(unittest.TestCase):
@@ -73,7 +74,7 @@ class TechMenuController_TestClass(unittest.TestCase):
     def test_TechMenuController_PRIV_Properties(self):
         # __AboutUpdateTimer
         with self.subTest(param='__AboutUpdateTimer'):
-            self.assertIsInstance(self.TestTechController._TechMenuController__AboutUpdateTimer, Timer)
+            self.assertIsInstance(self.TestTechController._TechMenuController__AboutUpdateTimer, ScheduledTimer)
         
         # __AboutLabels
         with self.subTest(param='__AboutLabels'):
@@ -0,0 +1,109 @@
+################################################################################
+# Copyright © 2023 The Board of Trustees of the University of Illinois
+#
+# Licensed under the MIT License (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://opensource.org/licenses/MIT
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+################################################################################
+
+import unittest
+import json
+
+import sys
+sys.path.append(".\\src")
+sys.path.append(".\\tests")
+sys.path.append(".\\tests\\reqs")
+
+## test imports ----------------------------------------------------------------
+from uofi_gui.uiLayout import UILayout, ControlDef, GroupDef, LoadLayout, GetLayout, ClearLayoutCache
+import test_settings as settings
+
+from extronlib.system import File
+## -----------------------------------------------------------------------------
+
+class UILayout_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        ClearLayoutCache()
+        jsonFile = File(settings.ctlJSON)
+        self.CtlDict = json.loads(jsonFile.read())
+        jsonFile.close()
+        self.TestLayout = UILayout(self.CtlDict)
+        return super().setUp()
+
+    def test_UILayout_Type(self):
+        self.assertIsInstance(self.TestLayout, UILayout)
+
+    def test_UILayout_Properties(self):
+        propList = \
+            [
+                ('Buttons', 'buttons'),
+                ('Knobs', 'knobs'),
+                ('Labels', 'labels'),
+                ('Levels', 'levels'),
+                ('Sliders', 'sliders')
+            ]
+        for prop, key in propList:
+            with self.subTest(param=prop):
+                ctlList = getattr(self.TestLayout, prop)
+                self.assertIsInstance(ctlList, tuple)
+                self.assertEqual(len(ctlList), len(self.CtlDict[key]))
+                for ctl in ctlList:
+                    self.assertIsInstance(ctl, ControlDef)
+
+        with self.subTest(param='ButtonGroups'):
+            self.assertIsInstance(self.TestLayout.ButtonGroups, tuple)
+            self.assertEqual(len(self.TestLayout.ButtonGroups), len(self.CtlDict['buttonGroups']))
+            for grp in self.TestLayout.ButtonGroups:
+                self.assertIsInstance(grp, GroupDef)
+
+    def test_UILayout_GetControl(self):
+        for btn in self.CtlDict['buttons']:
+            with self.subTest(button=btn['Name']):
+                ctl = self.TestLayout.GetControl('buttons', btn['Name'])
+                self.assertEqual(ctl.ID, btn['ID'])
+                self.assertIs(self.TestLayout.GetControlByID('buttons', btn['ID']), ctl)
+
+    def test_UILayout_GetGroup(self):
+        for grp in self.CtlDict['buttonGroups']:
+            with self.subTest(group=grp['Name']):
+                self.assertEqual(self.TestLayout.GetGroup(grp['Name']).Buttons, tuple(grp['Buttons']))
+                for btn in grp['Buttons']:
+                    self.assertEqual(self.TestLayout.GetButtonGroup(btn), grp['Name'])
+
+    def test_UILayout_ReadOnly(self):
+        with self.assertRaises(TypeError):
+            self.TestLayout.GetControl.__self__._UILayout__ByName['buttons']['foo'] = None
+        with self.assertRaises(AttributeError):
+            self.TestLayout.Buttons[0].ID = 0
+
+    def test_LoadLayout_Cached(self):
+        layout = LoadLayout(settings.ctlJSON)
+        self.assertIsInstance(layout, UILayout)
+        self.assertIs(LoadLayout(settings.ctlJSON), layout)
+
+    def test_LoadLayout_BadPath(self):
+        with self.assertRaises(ValueError):
+            LoadLayout('./bad/path/to/nonexistent.file')
+
+    def test_GetLayout(self):
+        with self.subTest(param='jsonObj'):
+            self.assertIsInstance(GetLayout(jsonObj=self.CtlDict), UILayout)
+        with self.subTest(param='jsonPath'):
+            self.assertIs(GetLayout(jsonPath=settings.ctlJSON), LoadLayout(settings.ctlJSON))
+        with self.subTest(param='UILayout'):
+            self.assertIs(GetLayout(jsonObj=self.TestLayout), self.TestLayout)
+
+    def test_GetLayout_Neither(self):
+        with self.assertRaises(ValueError):
+            GetLayout()
+
+if __name__ == '__main__':
+    unittest.main()
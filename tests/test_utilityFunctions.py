@@ -23,9 +23,10 @@ sys.path.append(".\\tests\\reqs")
 
 
 ## test imports ================================================================
-from utilityFunctions import TimeIntToStr, Log, DictValueSearchByKey, RunAsync, SortKeys
+from utilityFunctions import TimeIntToStr, Log, DictValueSearchByKey, RunAsync, SortKeys, ControlNameIndex, SetLogLevel, GetLogLevel, LogEnabled, LogSink, StartLogSink, StopLogSink, GetLogSink, TickScheduler, ScheduledTimer, GetScheduler
 from extronlib.system import _ReadProgramLog, _ClearProgramLog
 from datetime import datetime
+import time
 ## =============================================================================
 
 class UtilityFunctions_TimeIntToStr_TestCase(unittest.TestCase):
@@ -69,6 +70,11 @@ class UtilityFunctions_TimeIntToStr_TestCase(unittest.TestCase):
                 self.assertEqual(testOutput, expected[i])
 
 class UtilityFunctions_Log_TestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        # a sink or level left by an earlier test would defer or hide Log output
+        StopLogSink()
+        SetLogLevel('info')
+        return super().setUp()
     
     def test_Log(self):
         self.assertTrue(callable(Log))
@@ -108,6 +114,229 @@ class UtilityFunctions_Log_TestCase(unittest.TestCase):
                 self.assertIsInstance(logContent, str)
                 self.assertGreater(len(logContent), 0)
 
+    def test_Log_Header(self):
+        _ClearProgramLog()
+        Log('Header Test')
+        logContent = _ReadProgramLog()
+        self.assertIn('test_utilityFunctions - test_Log_Header', logContent)
+        self.assertIn('Header Test', logContent)
+    
+    def test_Log_Level(self):
+        try:
+            SetLogLevel('warning')
+            self.assertEqual(GetLogLevel(), 'warning')
+            self.assertFalse(LogEnabled('info'))
+            self.assertTrue(LogEnabled('error'))
+            
+            _ClearProgramLog()
+            Log('Below Level', 'info')
+            self.assertEqual(len(_ReadProgramLog()), 0)
+            
+            Log('At Level', 'warning')
+            self.assertIn('At Level', _ReadProgramLog())
+        finally:
+            SetLogLevel('info')
+    
+    def test_Log_BadLevel(self):
+        with self.assertRaises(ValueError):
+            SetLogLevel('verbose')
+    
+    def test_Log_Deferred(self):
+        calls = []
+        def content():
+            calls.append(True)
+            return 'Deferred Content'
+        
+        with self.subTest(param='callable'):
+            _ClearProgramLog()
+            Log(content, 'debug')
+            self.assertEqual(calls, [])
+            self.assertEqual(len(_ReadProgramLog()), 0)
+            
+            Log(content)
+            self.assertEqual(calls, [True])
+            self.assertIn('Deferred Content', _ReadProgramLog())
+        
+        with self.subTest(param='fmtArgs'):
+            _ClearProgramLog()
+            Log('Value: {}; Qualifier: {}', fmtArgs=(1, {'Output': 2}))
+            self.assertIn("Value: 1; Qualifier: {'Output': 2}", _ReadProgramLog())
+
+class UtilityFunctions_LogSink_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        StopLogSink()
+        SetLogLevel('info')
+        _ClearProgramLog()
+        # worker thread is not started so tests control when flushes happen
+        self.TestSink = LogSink(capacity=4, batchSize=2, rateLimit=2, rateWindow=60)
+        return super().setUp()
+    
+    def test_LogSink_Write(self):
+        self.assertTrue(self.TestSink.Write('Message 1'))
+        self.assertEqual(self.TestSink.QueueDepth, 1)
+        self.assertEqual(len(_ReadProgramLog()), 0)
+        
+        self.TestSink.Flush()
+        self.assertEqual(self.TestSink.QueueDepth, 0)
+        self.assertEqual(self.TestSink.Written, 1)
+        self.assertIn('Message 1', _ReadProgramLog())
+    
+    def test_LogSink_Dropped(self):
+        for i in range(6):
+            self.TestSink.Write('Message {}'.format(i))
+        self.assertEqual(self.TestSink.QueueDepth, 4)
+        self.assertEqual(self.TestSink.Dropped, 2)
+        
+        self.TestSink.Flush()
+        logContent = _ReadProgramLog()
+        self.assertNotIn('Message 1', logContent)
+        self.assertIn('Message 5', logContent)
+    
+    def test_LogSink_RateLimit(self):
+        results = [self.TestSink.Write('Poll Error', 'error', key='poll') for i in range(5)]
+        self.assertEqual(results, [True, True, False, False, False])
+        self.assertTrue(self.TestSink.Write('Other Message', 'error', key='other'))
+        self.assertEqual(self.TestSink.Suppressed, 3)
+        
+        self.TestSink.Flush()
+        self.assertIn('Suppressed 3 similar messages from poll', _ReadProgramLog())
+    
+    def test_LogSink_Log_DistinctMessages(self):
+        sink = StartLogSink(flushInterval=0.01, rateLimit=2, rateWindow=60)
+        try:
+            for i in range(20):
+                Log('{} Connection Status: {}', fmtArgs=('DEV{:03}'.format(i), 'Connected'))
+            for i in range(5):
+                Log('{} Connection Status: {}', fmtArgs=('DEV000', 'Connected'))
+        finally:
+            StopLogSink()
+        
+        logContent = _ReadProgramLog()
+        for i in range(20):
+            with self.subTest(device=i):
+                self.assertIn('DEV{:03} Connection Status: Connected'.format(i), logContent)
+        self.assertEqual(sink.Suppressed, 3)
+        self.assertIn('Suppressed 3 similar messages', logContent)
+    
+    def test_LogSink_Stats(self):
+        self.assertEqual(set(self.TestSink.Stats.keys()), {'depth', 'written', 'dropped', 'suppressed'})
+    
+    def test_LogSink_Thread(self):
+        sink = StartLogSink(flushInterval=0.01)
+        try:
+            self.assertIs(GetLogSink(), sink)
+            self.assertTrue(sink.Running)
+            Log('Threaded Message')
+        finally:
+            StopLogSink()
+        self.assertIsNone(GetLogSink())
+        self.assertFalse(sink.Running)
+        self.assertIn('Threaded Message', _ReadProgramLog())
+
+class UtilityFunctions_TickScheduler_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestScheduler = TickScheduler()
+        self.TestScheduler.Start()
+        self.Calls = []
+        return super().setUp()
+    
+    def tearDown(self) -> None:
+        self.TestScheduler.Stop(1)
+        return super().tearDown()
+    
+    def Handler(self, timer, count):
+        self.Calls.append((timer, count))
+    
+    def test_TickScheduler_Shared(self):
+        self.assertIs(GetScheduler(), GetScheduler())
+        self.assertTrue(GetScheduler().Running)
+        self.assertIsInstance(ScheduledTimer(1, self.Handler), ScheduledTimer)
+    
+    def test_ScheduledTimer_Tick(self):
+        timer = ScheduledTimer(0.02, self.Handler, Scheduler=self.TestScheduler)
+        self.assertEqual(timer.State, 'Running')
+        time.sleep(0.11)
+        timer.Stop()
+        self.assertGreaterEqual(len(self.Calls), 3)
+        self.assertEqual([count for t, count in self.Calls], list(range(1, len(self.Calls) + 1)))
+        self.assertIs(self.Calls[0][0], timer)
+    
+    def test_ScheduledTimer_Stop(self):
+        timer = ScheduledTimer(0.02, self.Handler, Scheduler=self.TestScheduler)
+        timer.Stop()
+        self.assertEqual(timer.State, 'Stopped')
+        self.assertEqual(self.TestScheduler.Scheduled, 0)
+        time.sleep(0.06)
+        self.assertEqual(self.Calls, [])
+        
+        with self.subTest(param='Restart'):
+            timer.Restart()
+            time.sleep(0.05)
+            timer.Stop()
+            self.assertGreaterEqual(len(self.Calls), 1)
+            self.assertEqual(self.Calls[0][1], 1)
+            self.assertEqual(timer.Count, 0)
+    
+    def test_ScheduledTimer_PauseResume(self):
+        timer = ScheduledTimer(0.02, self.Handler, Scheduler=self.TestScheduler)
+        time.sleep(0.05)
+        timer.Pause()
+        count = timer.Count
+        self.assertGreaterEqual(count, 1)
+        time.sleep(0.05)
+        self.assertEqual(timer.Count, count)
+        timer.Resume()
+        time.sleep(0.05)
+        timer.Stop()
+        self.assertEqual(self.Calls[count][1], count + 1)
+    
+    def test_ScheduledTimer_StopInHandler(self):
+        def Handler(timer, count):
+            self.Calls.append(count)
+            if count >= 2:
+                timer.Stop()
+        timer = ScheduledTimer(0.01, Handler, Scheduler=self.TestScheduler)
+        time.sleep(0.1)
+        self.assertEqual(self.Calls, [1, 2])
+        self.assertEqual(timer.State, 'Stopped')
+    
+    def test_ScheduledTimer_StateChanged(self):
+        states = []
+        timer = ScheduledTimer(1, self.Handler, Scheduler=self.TestScheduler)
+        timer.StateChanged = lambda t, state: states.append(state)
+        timer.Stop()
+        timer.Stop()
+        timer.Restart()
+        timer.Pause()
+        self.assertEqual(states, ['Stopped', 'Running', 'Paused'])
+    
+    def test_ScheduledTimer_Error(self):
+        def Handler(timer, count):
+            raise ValueError('bad tick')
+        timer = ScheduledTimer(0.01, Handler, Scheduler=self.TestScheduler)
+        time.sleep(0.05)
+        timer.Stop()
+        self.assertGreaterEqual(self.TestScheduler.Errors, 1)
+        self.assertTrue(self.TestScheduler.Running)
+    
+    def test_TickScheduler_Idle(self):
+        # stopped timers leave nothing for the scheduler thread to do
+        timers = [ScheduledTimer(0.01, self.Handler, Scheduler=self.TestScheduler) for i in range(200)]
+        for timer in timers:
+            timer.Stop()
+        time.sleep(0.05)
+        self.assertEqual(self.TestScheduler.Scheduled, 0)
+        self.assertEqual(self.TestScheduler.Ticks, 0)
+        self.assertEqual(self.Calls, [])
+    
+    def test_TickScheduler_ManyTimers(self):
+        timers = [ScheduledTimer(0.05, self.Handler, Scheduler=self.TestScheduler) for i in range(200)]
+        time.sleep(0.12)
+        for timer in timers:
+            timer.Stop()
+        self.assertTrue(all(len([c for c in self.Calls if c[0] is timer]) >= 1 for timer in timers))
+        self.assertEqual(set(self.TestScheduler.Stats.keys()), {'scheduled', 'ticks', 'late', 'errors'})
+
 class UtilityFunctions_RunAsync(unittest.TestCase):
     def setUp(self) -> None:
         self.test = False
@@ -359,5 +588,48 @@ class UtilityFunctions_SortKeys_TestClass(unittest.TestCase):
         with self.assertRaises(ValueError):
             unsortedList.sort(key = SortKeys.StatusSort)
 
+class UtilityFunctions_ControlNameIndex_TestClass(unittest.TestCase):
+    def setUp(self) -> None:
+        self.TestControls = \
+            {
+                'Tech-Matrix-2,1': 'mtx21',
+                'Tech-Matrix-1,2': 'mtx12',
+                'Tech-Matrix-1,1': 'mtx11',
+                'Tech-Matrix-DeleteTies': 'mtxDel',
+                'PIN-10': 'pin10',
+                'PIN-2': 'pin2',
+                'PIN-Del': 'pinDel',
+                'Tech-SystemStatus': 'techStatus',
+                'Splash': 'splash'
+            }
+        self.TestIndex = ControlNameIndex(self.TestControls)
+        return super().setUp()
+    
+    def test_ControlNameIndex_ParseName(self):
+        testList = \
+            [
+                ('Tech-Matrix-12,3', ('Tech-Matrix', (12, 3))),
+                ('DeviceStatusIcon-15', ('DeviceStatusIcon', 15)),
+                ('Tech-Display-mon-1-On', ('Tech-Display-mon-1', 'On')),
+                ('Splash', (None, None))
+            ]
+        for name, expected in testList:
+            with self.subTest(name=name):
+                self.assertEqual(ControlNameIndex.ParseName(name), expected)
+    
+    def test_ControlNameIndex_GetFamily(self):
+        self.assertEqual(self.TestIndex.GetFamily('PIN'), {10: 'pin10', 2: 'pin2', 'Del': 'pinDel'})
+        self.assertEqual(self.TestIndex.GetFamily('Tech'), {'SystemStatus': 'techStatus'})
+        self.assertEqual(self.TestIndex.GetFamily('Missing'), {})
+    
+    def test_ControlNameIndex_GetFamily_Copy(self):
+        self.TestIndex.GetFamily('PIN').clear()
+        self.assertEqual(len(self.TestIndex.GetFamily('PIN')), 3)
+    
+    def test_ControlNameIndex_GetFamilyList(self):
+        self.assertEqual(self.TestIndex.GetFamilyList('Tech-Matrix'), ['mtx11', 'mtx12', 'mtx21'])
+        self.assertEqual(self.TestIndex.GetFamilyList('PIN'), ['pin2', 'pin10'])
+        self.assertEqual(self.TestIndex.GetFamilyList('Missing'), [])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file